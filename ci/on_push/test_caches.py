@@ -0,0 +1,505 @@
+"""Tests of the caches used by EOReader."""
+
+import pytest
+from sertit import ci
+
+from eoreader.products.sar import snap_cache
+
+
+def _put_snap_entries(cache_dir, prefix: str, nb_entries: int) -> None:
+    """Register files in a SNAP cache (run in another process)"""
+    cache = snap_cache.SnapCache(cache_dir)
+    for idx in range(nb_entries):
+        file_path = cache_dir / f"{prefix}_{idx}.tif"
+        file_path.write_text("")
+        cache.put(f"{prefix}_{idx}", prefix, file_path, pixel_size=10.0)
+
+
+def test_snap_cache(tmp_path):
+    """Test the content-addressed SNAP cache"""
+    graph = tmp_path / "graph.xml"
+    graph.write_text("<graph/>")
+
+    base_fields = {
+        "product": "20191215T060906_S1_IW_GRD",
+        "band": "VV",
+        "graphs": [snap_cache.hash_file(graph)],
+    }
+    base_key = snap_cache.get_key(**base_fields)
+    key_10m = snap_cache.get_key(base_key=base_key, pixel_size=10.0, window="")
+    key_20m = snap_cache.get_key(base_key=base_key, pixel_size=20.0, window="")
+
+    # Write a processed file
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    ortho_10m = cache_dir / "20191215T060906_S1_IW_GRD_VV_10m.tif"
+    ortho_10m.write_text("")
+
+    cache = snap_cache.SnapCache(cache_dir)
+    ci.assert_val(cache.get(key_10m), None, "Empty cache")
+    cache.put(key_10m, base_key, ortho_10m, pixel_size=10.0)
+
+    # Exact hit and derivable hit (better resolution)
+    ci.assert_val(cache.get(key_10m), ortho_10m, "Exact hit")
+    ci.assert_val(cache.get_derivable(base_key, 20.0), ortho_10m, "Derivable hit")
+    ci.assert_val(cache.get_derivable(base_key, 5.0), None, "Worse resolution")
+    ci.assert_val(cache.get(key_20m), None, "Other pixel size")
+
+    # Another instance reads the index written on disk
+    ci.assert_val(
+        snap_cache.SnapCache(cache_dir).get(key_10m), ortho_10m, "Persisted index"
+    )
+
+    # Modifying the graph changes the key and makes the file stale
+    graph.write_text("<graph><node/></graph>")
+    new_base_key = snap_cache.get_key(
+        **{**base_fields, "graphs": [snap_cache.hash_file(graph)]}
+    )
+    new_key = snap_cache.get_key(base_key=new_base_key, pixel_size=10.0, window="")
+    assert new_key != key_10m
+    ci.assert_val(cache.get(new_key), None, "Modified graph")
+    ci.assert_val(cache.get_derivable(new_base_key, 20.0), None, "Modified graph")
+    assert cache.is_stale(ortho_10m, new_key)
+    assert not cache.is_stale(ortho_10m, key_10m)
+
+    # Shared cache: the file is copied into the cache directory with a unique name
+    shared_cache = snap_cache.SnapCache(tmp_path / "shared")
+    shared_path = shared_cache.put(key_10m, base_key, ortho_10m, pixel_size=10.0)
+    assert shared_path.parent == tmp_path / "shared"
+    assert shared_path.is_file()
+    ci.assert_val(shared_cache.get(key_10m), shared_path, "Shared hit")
+
+    # Deleted files are not returned
+    ortho_10m.unlink()
+    ci.assert_val(cache.get(key_10m), None, "Deleted file")
+
+
+def test_snap_cache_concurrent_writers(tmp_path):
+    """Test that processes sharing a SNAP cache don't lose each other's entries"""
+    import multiprocessing
+
+    cache_dir = tmp_path / "shared"
+    cache_dir.mkdir()
+
+    nb_procs = 4
+    nb_entries = 20
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_put_snap_entries, args=(cache_dir, f"proc{i}", nb_entries))
+        for i in range(nb_procs)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=120)
+        ci.assert_val(proc.exitcode, 0, "Writer exit code")
+
+    cache = snap_cache.SnapCache(cache_dir)
+    for i in range(nb_procs):
+        for idx in range(nb_entries):
+            ci.assert_val(
+                cache.get(f"proc{i}_{idx}"),
+                cache_dir / f"proc{i}_{idx}.tif",
+                "Entry written by another process",
+            )
+
+
+def test_archive_index(tmp_path):
+    """Test the persistent index of archived products"""
+    import os
+    import tarfile
+    import zipfile
+
+    import tempenv
+
+    from eoreader import archive_index
+    from eoreader.env_vars import ARCHIVE_INDEX_DIR
+
+    member = tmp_path / "LC08_B4.TIF"
+    member.write_bytes(b"0123456789")
+    mtd = tmp_path / "LC08_MTL.txt"
+    mtd.write_text("metadata")
+
+    tar_path = tmp_path / "product.tar"
+    with tarfile.open(tar_path, "w") as tar_ds:
+        tar_ds.add(mtd, arcname="LC08/LC08_MTL.txt")
+        tar_ds.add(member, arcname="LC08/LC08_B4.TIF")
+
+    zip_path = tmp_path / "product.zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_ds:
+        zip_ds.write(member, arcname="LC08/LC08_B4.TIF")
+
+    index_dir = tmp_path / "index"
+    with tempenv.TemporaryEnvironment({ARCHIVE_INDEX_DIR: str(index_dir)}):
+        # Build the index and persist it
+        index = archive_index.load_archive_index(tar_path)
+        ci.assert_val(
+            index.names, ["LC08/LC08_MTL.txt", "LC08/LC08_B4.TIF"], "Tar members"
+        )
+        ci.assert_val(len(os.listdir(index_dir)), 1, "Sidecar file")
+        ci.assert_val(index.get_path(r".*b4\."), "LC08/LC08_B4.TIF", "Archived path")
+
+        # Uncompressed tar members keep their names, but are opened by offset
+        rio_path = index.get_rio_path(r".*B4\.")
+        ci.assert_val(rio_path, f"/vsitar/{tar_path}/LC08/LC08_B4.TIF", "Tar rio path")
+        subfile_path = archive_index.get_subfile_path(rio_path)
+        assert subfile_path.startswith("/vsisubfile/"), subfile_path
+        ci.assert_val(
+            archive_index.get_subfile_path(f"/vsizip/{zip_path}/LC08/LC08_B4.TIF"),
+            f"/vsizip/{zip_path}/LC08/LC08_B4.TIF",
+            "Zip path",
+        )
+        offset, size = subfile_path.split("/")[2].split(",")[0].split("_")
+        with open(tar_path, "rb") as tar_file:
+            tar_file.seek(int(offset))
+            ci.assert_val(tar_file.read(int(size)), b"0123456789", "Member data")
+
+        # Zip members are read with /vsizip/
+        zip_index = archive_index.load_archive_index(zip_path)
+        ci.assert_val(
+            zip_index.get_rio_path(r".*B4\."),
+            f"/vsizip/{zip_path}/LC08/LC08_B4.TIF",
+            "Zip rio path",
+        )
+
+        # Member-level reads
+        ci.assert_val(
+            zip_index.read_member("LC08/LC08_B4.TIF"), b"0123456789", "Zip member"
+        )
+        ci.assert_val(index.read_member("LC08/LC08_MTL.txt"), b"metadata", "Tar member")
+
+        # The sidecar is reused... until the archive is modified
+        sidecar = archive_index._get_sidecar_path(tar_path)
+        stat = tar_path.stat()
+        ci.assert_val(
+            archive_index._read_sidecar(sidecar, stat.st_size, stat.st_mtime),
+            [list(member) for member in index.members],
+            "Valid sidecar",
+        )
+        with tarfile.open(tar_path, "a") as tar_ds:
+            tar_ds.add(mtd, arcname="LC08/LC08_ANG.txt")
+        ci.assert_val(
+            len(archive_index.load_archive_index(tar_path).names), 3, "Updated index"
+        )
+
+        with pytest.raises(FileNotFoundError):
+            index.get_path(r".*B5\.")
+
+
+def test_np_cache(tmp_path):
+    """Test the numpy pickles used as intermediate caches"""
+    import numpy as np
+    from affine import Affine
+
+    from eoreader import utils
+
+    arr = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    tr = Affine(10.0, 0.0, 500000.0, 0.0, -10.0, 5000000.0)
+    np_path = tmp_path / "mask_4x3.npy"
+    utils.save_np(arr, np_path, transform=tr, crs="EPSG:32631")
+
+    # Validation with the header
+    assert utils.is_valid_np(np_path)
+    assert utils.is_valid_np(np_path, shape=(3, 4), transform=tr, crs="EPSG:32631")
+    assert not utils.is_valid_np(np_path, shape=(4, 3))
+    assert not utils.is_valid_np(np_path, transform=tr @ Affine.translation(1, 0))
+    assert not utils.is_valid_np(np_path, crs="EPSG:4326")
+
+    # Pickles without header cannot be validated
+    legacy_path = tmp_path / "legacy.npy"
+    np.save(str(legacy_path), arr)
+    assert not utils.is_valid_np(legacy_path)
+
+    # Memory-mapped loading
+    loaded = utils.load_np(np_path, tmp_path)
+    np.testing.assert_array_equal(np.asarray(loaded), arr)
+    if utils.get_default_chunks() is not None:
+        assert hasattr(loaded, "dask")
+    else:
+        assert isinstance(loaded, np.memmap)
+
+
+def test_stac_prefetch(tmp_path):
+    """Test the concurrent reading of STAC assets"""
+    import asyncio
+    import os
+
+    import tempenv
+    from stac_asset import FilesystemClient
+
+    from eoreader.products import stac_product
+    from eoreader.stac import stac_cache
+
+    class FlakyClient(FilesystemClient):
+        """Local client failing once per href and tracking the number of concurrent reads"""
+
+        def __init__(self):
+            super().__init__()
+            self.failed = set()
+            self.running = 0
+            self.max_running = 0
+
+        async def open_url(self, url, *args, **kwargs):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                await asyncio.sleep(0.01)
+                if str(url) not in self.failed:
+                    self.failed.add(str(url))
+                    raise ConnectionError(f"Failed to read {url}")
+                async for chunk in super().open_url(url, *args, **kwargs):
+                    yield chunk
+            finally:
+                self.running -= 1
+
+    hrefs = []
+    for idx in range(10):
+        href = tmp_path / f"B{idx:02d}.tif"
+        href.write_bytes(bytes([idx]) * 100)
+        hrefs.append(str(href))
+
+    client = FlakyClient()
+    with tempenv.TemporaryEnvironment({"EOREADER_STAC_MAX_CONCURRENCY": "3"}):
+        hrefs_data = stac_product.read_hrefs(hrefs + hrefs[:2], clients=[client])
+
+    # Every href is read once (and retried once), with a bounded concurrency
+    ci.assert_val(list(hrefs_data.keys()), hrefs, "Read hrefs")
+    for idx, href in enumerate(hrefs):
+        ci.assert_val(hrefs_data[href], bytes([idx]) * 100, f"Data of {href}")
+    ci.assert_val(len(client.failed), len(hrefs), "Retried hrefs")
+    ci.assert_val(client.max_running, 3, "Max concurrency")
+
+    # Non-transient errors are not retried
+    with pytest.raises(FileNotFoundError):
+        stac_product.read_hrefs([str(tmp_path / "missing.tif")])
+
+    # The S3 clients and the pool of clients are reused between the reads
+    get_s3_client = stac_product.StacProduct.get_s3_client
+    ci.assert_val(
+        get_s3_client(None, "us-west-2") is get_s3_client(None, "us-west-2"),
+        True,
+        "Pooled S3 client",
+    )
+    pool = stac_product._get_clients_pool(clients=[client])
+    stac_product.read_hrefs(hrefs[:1], clients=[client])
+    ci.assert_val(
+        stac_product._get_clients_pool(clients=[client]) is pool, True, "Reused pool"
+    )
+
+    # Only the small remote assets are cached on disk, keyed by their href without the signing parameters
+    with tempenv.TemporaryEnvironment({"EOREADER_STAC_CACHE_DIR": str(tmp_path)}):
+        mtd_href = (
+            "https://example.com/granule_metadata.xml?version=1&se=2026-01-01&sig=abc"
+        )
+        signed_href = (
+            "https://example.com/granule_metadata.xml?version=1&se=2026-01-02&sig=def"
+        )
+        stac_cache.write_cached(mtd_href, b"<mtd/>")
+        ci.assert_val(
+            stac_product.read_hrefs([signed_href]),
+            {signed_href: b"<mtd/>"},
+            "Cached metadata (signed again)",
+        )
+        ci.assert_val(
+            stac_cache.read_cached(signed_href.replace("version=1", "version=2")),
+            None,
+            "Other version of the metadata",
+        )
+
+        band_href = "https://example.com/B02.tif"
+        stac_cache.write_cached(band_href, b"0" * (stac_cache.STAC_CACHE_MAX_SIZE + 1))
+        ci.assert_val(stac_cache.read_cached(band_href), None, "Uncached band")
+        ci.assert_val(stac_cache.read_cached(hrefs[0]), None, "Uncached local file")
+
+    # The least recently used files are evicted
+    cache_dir = tmp_path / "stac_cache"
+    with tempenv.TemporaryEnvironment({"EOREADER_STAC_CACHE_DIR": str(cache_dir)}):
+        old_hrefs = [f"https://example.com/mtd_{idx}.xml" for idx in range(3)]
+        for idx, href in enumerate(old_hrefs):
+            stac_cache.write_cached(href, b"0" * 100)
+            os.utime(stac_cache._get_cached_path(href), (idx, idx))
+        stac_cache.read_cached(old_hrefs[0])
+
+        stac_cache.evict(cache_dir, max_size=250)
+        ci.assert_val(
+            [stac_cache.read_cached(href) is not None for href in old_hrefs],
+            [True, False, True],
+            "Evicted files",
+        )
+
+
+def test_s3_nc_cache(monkeypatch):
+    """Test the in-memory cache of the decoded NetCDF variables of Sentinel-3 products"""
+    from collections import OrderedDict
+
+    import numpy as np
+    import xarray as xr
+
+    from eoreader.products.optical import s3_product
+    from eoreader.products.optical.s3_olci_product import S3OlciProduct
+
+    decoded = []
+
+    def _decode_nc(self, filename, subdataset=None, dtype=np.float32):
+        decoded.append(filename)
+        return xr.DataArray(
+            np.zeros((1, 16, 16), dtype=dtype), attrs={"name": filename}
+        )
+
+    # 1 KB per variable, at most 2 variables kept in memory
+    monkeypatch.setattr(S3OlciProduct, "_decode_nc", _decode_nc)
+    monkeypatch.setattr(s3_product, "NC_CACHE_MAX_SIZE", 2 * 1024)
+    prod = S3OlciProduct.__new__(S3OlciProduct)
+    prod._nc_cache = OrderedDict()
+
+    # Shallow and read-only copies of the cached variables
+    nc = prod._read_nc("geo_coordinates.nc", "latitude")
+    nc.attrs["name"] = "modified"
+    with pytest.raises(ValueError):
+        nc.data[0, 0, 0] = 1
+    ci.assert_val(
+        prod._read_nc("geo_coordinates.nc", "latitude").attrs["name"],
+        "geo_coordinates.nc",
+        "Cached attributes",
+    )
+
+    # Bounded by the size of the variables (the least recently used ones are evicted first)
+    prod._read_nc("tie_geo_coordinates.nc", "latitude")
+    prod._read_nc("geo_coordinates.nc", "latitude")
+    prod._read_nc("tie_geometries.nc", "SZA")
+    prod._read_nc("geo_coordinates.nc", "latitude")
+    prod._read_nc("tie_geo_coordinates.nc", "latitude")
+    ci.assert_val(
+        decoded,
+        [
+            "geo_coordinates.nc",
+            "tie_geo_coordinates.nc",
+            "tie_geometries.nc",
+            "tie_geo_coordinates.nc",
+        ],
+        "Decoded variables",
+    )
+
+    # Uncached variables are not shared
+    prod._read_nc("Oa01_radiance.nc", "Oa01_radiance", cache=False).data[0, 0, 0] = 1
+    ci.assert_val(len(prod._nc_cache), 2, "Cached variables")
+
+
+def test_dem_cache(tmp_path, monkeypatch):
+    """Test the local cache of the remote DEM tiles"""
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+    import rasterio
+    from rasterio import windows
+    from rasterio.transform import from_origin
+
+    from eoreader import dem_cache
+
+    rasterio_open = rasterio.open
+    dem_arr = (
+        np.random.default_rng(0).uniform(0, 3000, (1, 1000, 800)).astype(np.float32)
+    )
+    dem_tr = from_origin(300000, 5000000, 30, 30)
+    dem_path = tmp_path / "dem.tif"
+    with rasterio.open(
+        dem_path,
+        "w",
+        driver="GTiff",
+        width=800,
+        height=1000,
+        count=1,
+        dtype=np.float32,
+        crs="EPSG:32631",
+        transform=dem_tr,
+        nodata=-9999,
+    ) as dem_ds:
+        dem_ds.write(dem_arr)
+
+    cache_dir = tmp_path / "cache"
+    cache = dem_cache.DemTileCache(
+        dem_path, cache_dir, max_size=10 * 1024**2, tile_size=256
+    )
+
+    # Bounds in another CRS
+    win = windows.Window(300, 400, 200, 100)
+    bounds = rasterio.warp.transform_bounds(
+        "EPSG:32631", "EPSG:4326", *windows.bounds(win, dem_tr)
+    )
+
+    # Concurrent population of the same tiles
+    with ThreadPoolExecutor(4) as executor:
+        vrt_paths = list(
+            executor.map(lambda _: cache.get(bounds, "EPSG:4326"), range(4))
+        )
+    ci.assert_val(len(set(vrt_paths)), 1, "Same VRT")
+
+    # Only the tiles covering the bounds (with a margin) are cached
+    tiles = sorted(file for file in os.listdir(cache.tile_dir) if file.endswith(".tif"))
+    ci.assert_val(
+        tiles,
+        ["256_1_1.tif", "256_1_2.tif", "256_2_1.tif", "256_2_2.tif"],
+        "Cached tiles",
+    )
+    assert not any(file.endswith(".tmp") for file in os.listdir(cache.tile_dir))
+
+    # Cache hits don't open the DEM (its georeferencing is stored with the tiles)
+    opened = []
+    with monkeypatch.context() as mp:
+        mp.setattr(dem_cache, "_DEM_INFOS", {})
+        mp.setattr(
+            dem_cache.rasterio,
+            "open",
+            lambda *args, **kwargs: (
+                opened.append(args) or rasterio_open(*args, **kwargs)
+            ),
+        )
+        ci.assert_val(cache.get(bounds, "EPSG:4326"), vrt_paths[0], "Cache hit")
+    ci.assert_val(opened, [], "Opened DEM")
+
+    # Same data as the DEM
+    with rasterio.open(vrt_paths[0]) as vrt_ds:
+        ci.assert_val(vrt_ds.crs, rasterio.crs.CRS.from_epsg(32631), "CRS")
+        ci.assert_val(vrt_ds.nodata, -9999, "Nodata")
+        vrt_win = windows.from_bounds(*windows.bounds(win, dem_tr), vrt_ds.transform)
+        np.testing.assert_array_equal(
+            vrt_ds.read(window=vrt_win.round_offsets().round_lengths()),
+            dem_arr[:, 400:500, 300:500],
+        )
+
+    # Bounded size: the recently used tiles are not evicted (they may be read by warped DEMs)
+    dem_cache.DemTileCache(
+        dem_path, cache_dir, max_size=2 * 256 * 256 * 4, tile_size=256
+    ).get(windows.bounds(windows.Window(700, 900, 50, 50), dem_tr))
+    cached = [file for file in os.listdir(cache.tile_dir) if file.endswith(".tif")]
+    ci.assert_val(len(cached), 5, "Recently used tiles")
+    assert os.path.isfile(vrt_paths[0])
+
+    # The least recently used tiles are evicted, but not the ones being used
+    small_cache = dem_cache.DemTileCache(
+        dem_path, cache_dir, max_size=2 * 256 * 256 * 4, tile_size=256, min_age=0
+    )
+    other_vrt = small_cache.get(windows.bounds(windows.Window(0, 900, 50, 50), dem_tr))
+    cached = [file for file in os.listdir(cache.tile_dir) if file.endswith(".tif")]
+    assert "256_3_0.tif" in cached
+    assert len(cached) <= 2
+
+    # The VRTs mosaicking evicted tiles are evicted too
+    assert not os.path.isfile(vrt_paths[0])
+    assert os.path.isfile(other_vrt)
+    with rasterio.open(other_vrt) as vrt_ds:
+        np.testing.assert_array_equal(vrt_ds.read(), dem_arr[:, 768:, :256])
+
+    # Evicted tiles are downloaded again
+    with rasterio.open(cache.get(bounds, "EPSG:4326")) as vrt_ds:
+        assert vrt_ds.read().any()
+
+    # Local DEMs are not cached
+    ci.assert_val(
+        dem_cache.get_cached_dem(dem_path, windows.bounds(win, dem_tr)),
+        str(dem_path),
+        "Local DEM",
+    )
+    assert dem_cache.is_remote("https://example.com/dem.vrt")
+    assert dem_cache.is_remote("/vsis3/bucket/dem.vrt")
@@ -1,5 +1,6 @@
 """Other tests."""
 
+import logging
 import os
 import sys
 import tempfile
@@ -11,7 +12,7 @@ import tempenv
 import xarray as xr
 from rasterio.enums import Resampling
 from rasterio.windows import Window
-from sertit import AnyPath, ci, path, unistra
+from sertit import AnyPath, ci, path, rasters, unistra
 
 from ci.scripts_utils import (
     READER,
@@ -25,7 +26,7 @@ from ci.scripts_utils import (
     s3_env,
     sar_path,
 )
-from eoreader import utils
+from eoreader import EOREADER_NAME, utils
 from eoreader.bands import (
     BLUE,
     CA,
@@ -40,6 +41,7 @@ from eoreader.bands import (
     NARROW_NIR,
     NDVI,
     NIR,
+    PAN,
     RED,
     SLOPE,
     SWIR_1,
@@ -54,6 +56,7 @@ from eoreader.bands import (
     WV,
     SarBandMap,
     SarBandNames,
+    SpectralBand,
     SpectralBandMap,
     is_clouds,
     is_dem,
@@ -67,6 +70,8 @@ from eoreader.products import OpticalProduct, SensorType
 from eoreader.reader import Constellation
 from eoreader.utils import convert_glob_to_regex
 
+LOGGER = logging.getLogger(EOREADER_NAME)
+
 reduce_verbosity()
 
 
@@ -130,6 +135,99 @@ def test_alias():
         to_band(["WRONG_BAND"])
 
 
+def test_band_registry():
+    """Test the band and index registries (and their speed)"""
+    import timeit
+
+    from eoreader.bands import indices
+
+    # Indices overwritten by their names at import are still registered, with their needed bands
+    for idx in ["TCBRI", "TCGRE", "TCWET", "SCI"]:
+        assert is_index(idx)
+        assert idx in indices.get_eoreader_indices()
+        assert indices.get_needed_bands(idx)
+    assert indices.get_needed_bands("SCI") == [GREEN, RED]
+    assert indices.get_needed_bands("TCBRI") == [BLUE, GREEN, RED, NIR, SWIR_1, SWIR_2]
+
+    # Names and values are both converted, the first band names class wins
+    assert to_band(["CA", "COASTAL_AEROSOL", "RAW CLOUDS", "DEM"]) == [
+        CA,
+        CA,
+        CLOUDS.RAW_CLOUDS,
+        DEM,
+    ]
+    assert not is_sat_band(["GREEN"])
+
+    # Micro-benchmark: 200 mixed names
+    names = [NDVI, "NDVI", "GREEN", RED, "VV", "SLOPE", "CLOUDS", "SZA", "TCBRI", "AOT"]
+    names = names * 20
+    duration = min(timeit.repeat(lambda: to_band(names), number=10, repeat=3)) / 10
+    assert duration < 0.01, f"to_band is too slow: {duration * 1000:.2f} ms"
+
+
+def test_lazy_imports():
+    """Benchmark the import of EOReader, which shouldn't import the products and their heavy dependencies (in fresh interpreters)"""
+    import subprocess
+
+    def _import(code: str) -> tuple:
+        """Get the import time (in seconds, from python -X importtime) and the modules imported by the code"""
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                f"{code}import sys\nprint(','.join(sys.modules))\n",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Only sum the top-level imports (the nested ones are included in their cumulative time).
+        # The modules imported with importlib (i.e. the lazy products) are not timed, so the baseline is underestimated
+        duration = 0
+        for line in out.stderr.splitlines():
+            if line.startswith("import time:"):
+                _, cumulative, module = line.split("|")
+                if cumulative.strip().isdigit() and not module.startswith("  "):
+                    duration += int(cumulative) / 1e6
+
+        return duration, set(out.stdout.strip().split(","))
+
+    imports = "import eoreader.products\nfrom eoreader.reader import Reader\nfrom eoreader.bands import to_band, NDVI\n"
+
+    # Baseline: every product loaded (and the needed bands of every index computed)
+    eager_duration, eager_modules = _import(
+        f"{imports}"
+        "from eoreader.bands import NEEDED_BANDS\n"
+        "assert NEEDED_BANDS['NDVI']\n"
+        "for name in eoreader.products.__all__:\n"
+        "    getattr(eoreader.products, name)\n"
+    )
+    lazy_duration, lazy_modules = _import(imports)
+    LOGGER.info(
+        f"Import time: {lazy_duration * 1000:.0f} ms (every product loaded: {eager_duration * 1000:.0f} ms)"
+    )
+
+    heavy = {
+        "dask",
+        "eoreader.products.product",
+        "eoreader.products.optical.s2_product",
+        "eoreader.utils",
+        "sertit.rasters",
+    }
+    assert heavy <= eager_modules
+    assert not heavy & lazy_modules, (
+        f"Heavy modules imported with EOReader: {heavy & lazy_modules}"
+    )
+
+    # Generous relative bound (both measured on the same machine)
+    assert lazy_duration < 0.8 * eager_duration, (
+        f"Importing EOReader is too slow: {lazy_duration:.2f} s (every product loaded: {eager_duration:.2f} s)"
+    )
+
+
 @s3_env
 @dask_env
 def test_products():
@@ -610,6 +708,1070 @@ def test_regex_glob():
     ci.assert_val(convert_glob_to_regex("**/*_rgb.png"), r".*/.*_rgb\.png", "ASF regex")
 
 
+def test_interpolate_na():
+    """Test the chunked NaN interpolation against xarray's one"""
+    rng = np.random.default_rng(0)
+    arr = rng.random((1, 200, 150)).astype(np.float32)
+    arr[rng.random(arr.shape) < 0.3] = np.nan
+    arr[:, 50:90, :] = np.nan  # Gaps longer than the limit
+    arr[:, :, 30:60] = np.nan
+    arr[:, :5, :] = np.nan  # Nothing to interpolate from
+    xda = xr.DataArray(
+        arr,
+        dims=("band", "y", "x"),
+        coords={
+            "band": [1],
+            "y": np.arange(200)[::-1] * 10.0 + 5,
+            "x": np.arange(150) * 10.0 + 5,
+        },
+    )
+
+    # xarray only interpolates along increasing coordinates
+    ref = xda.reindex(y=xda.y[::-1]).interpolate_na(dim="y", limit=10)
+    ref = ref.reindex(y=xda.y).interpolate_na(dim="x", limit=10)
+
+    for chunks in [None, {"y": 17, "x": 23}]:
+        interp = xda if chunks is None else xda.chunk(chunks)
+        interp = utils.interpolate_na(interp, dim="y", limit=10)
+        interp = utils.interpolate_na(interp, dim="x", limit=10)
+        np.testing.assert_allclose(interp.values, ref.values, rtol=1e-5, equal_nan=True)
+
+
+def test_rpc_window():
+    """Test the computation of the raw window needed to orthorectify some bounds"""
+    from rasterio.rpc import RPC
+    from rasterio.transform import RPCTransformer
+
+    from eoreader.products import Product
+
+    # Simple RPCs: line = -lat, sample = lon (normalized)
+    zeros = [0.0] * 20
+    line_num = zeros.copy()
+    line_num[2] = -1.0
+    samp_num = zeros.copy()
+    samp_num[1] = 1.0
+    den = zeros.copy()
+    den[0] = 1.0
+    rpcs = RPC(
+        height_off=100,
+        height_scale=500,
+        lat_off=45,
+        lat_scale=0.05,
+        line_den_coeff=den,
+        line_num_coeff=line_num,
+        line_off=500,
+        line_scale=500,
+        long_off=7,
+        long_scale=0.05,
+        samp_den_coeff=den,
+        samp_num_coeff=samp_num,
+        samp_off=500,
+        samp_scale=500,
+    )
+
+    window = utils.get_rpc_window(
+        rpcs, (7.0, 45.0, 7.01, 45.01), "EPSG:4326", 1000, 1000, margin=0
+    )
+    ci.assert_val(window, Window(500, 400, 101, 101), "RPC window")
+    ci.assert_val(
+        utils.get_rpc_window(rpcs, (8.0, 46.0, 8.1, 46.1), "EPSG:4326", 1000, 1000),
+        None,
+        "Window outside the image",
+    )
+
+    # Shifted RPCs applied to the subset
+    with RPCTransformer(utils.shift_rpcs(rpcs, 400, 500)) as transformer:
+        row, col = transformer.rowcol(7.0, 45.01, zs=0, op=np.floor)
+    ci.assert_val((int(row), int(col)), (0, 0), "Shifted RPCs")
+
+    # Blocks of the ortho grid intersecting a window
+    blocks = Product._get_ortho_blocks(
+        2500, 1500, 1024, window=Window(1000, 10, 100, 20)
+    )
+    ci.assert_val(
+        [(row, col) for row, col, _ in blocks], [(0, 0), (0, 1)], "Ortho blocks"
+    )
+    ci.assert_val(blocks[1][2], Window(1024, 0, 1024, 1024), "Ortho block window")
+    ci.assert_val(
+        len(Product._get_ortho_blocks(2500, 1500, 1024)), 6, "Whole ortho grid"
+    )
+
+
+def test_pansharpening():
+    """Test the lazy pan-sharpening of multispectral bands"""
+    from affine import Affine
+
+    from eoreader.products.optical.pansharpening import (
+        PansharpeningMethod,
+        get_spectral_weights,
+        pansharpen,
+    )
+
+    def to_xda(arr, pixel_size):
+        transform = Affine(pixel_size, 0, 500000, 0, -pixel_size, 5000000)
+        xda = xr.DataArray(
+            arr[np.newaxis],
+            dims=["band", "y", "x"],
+            coords={
+                "band": [1],
+                "y": 5000000 - (np.arange(arr.shape[0]) + 0.5) * pixel_size,
+                "x": 500000 + (np.arange(arr.shape[1]) + 0.5) * pixel_size,
+            },
+        ).chunk({"y": 32, "x": 32})
+        xda.rio.write_crs("EPSG:32631", inplace=True)
+        xda.rio.write_transform(transform, inplace=True)
+        return xda
+
+    rng = np.random.default_rng(0)
+    pan = to_xda(rng.uniform(0.1, 0.5, (128, 128)).astype(np.float32), 1.0)
+    ms = {
+        band: to_xda(rng.uniform(0.1, 0.5, (32, 32)).astype(np.float32), 4.0)
+        for band in [BLUE, GREEN, RED]
+    }
+
+    for method in PansharpeningMethod.list_values():
+        sharp = pansharpen(ms, pan, method=method)
+        ci.assert_val(list(sharp.keys()), [BLUE, GREEN, RED], f"Bands ({method})")
+        for sharp_xda in sharp.values():
+            assert sharp_xda.chunks is not None, f"{method} should be lazy"
+            ci.assert_val(sharp_xda.shape, pan.shape, f"Shape ({method})")
+
+    # With Brovey, the intensity of the pan-sharpened bands is the panchromatic band (where valid)
+    sharp = pansharpen(ms, pan, method=PansharpeningMethod.BROVEY)
+    intensity = (sum(sharp.values()) / 3).compute()
+    valid = np.isfinite(intensity.data)
+    assert valid.mean() > 0.9
+    np.testing.assert_allclose(intensity.data[valid], pan.data.compute()[valid], 1e-5)
+
+    # Spectral weights
+    weights = get_spectral_weights(
+        {
+            BLUE: SpectralBand(
+                eoreader_name=BLUE,
+                name="B",
+                id=1,
+                center_wavelength=0.5,
+                full_width_half_max=0.1,
+            ),
+            NIR: SpectralBand(
+                eoreader_name=NIR,
+                name="N",
+                id=4,
+                center_wavelength=0.9,
+                full_width_half_max=0.1,
+            ),
+        },
+        SpectralBand(
+            eoreader_name=PAN,
+            name="P",
+            id=5,
+            center_wavelength=0.6,
+            full_width_half_max=0.3,
+        ),
+    )
+    ci.assert_val(weights[NIR], 0.0, "NIR weight")
+    assert weights[BLUE] > 0
+
+
+def test_tie_point_interpolation():
+    """Test the evaluation of tie-point splines on the image grid"""
+    from scipy.interpolate import RectBivariateSpline
+
+    from eoreader.products.optical.s3_slstr_product import _eval_spline
+
+    rng = np.random.default_rng(0)
+    spline = RectBivariateSpline(
+        np.linspace(0, 1000, 20), np.linspace(-500, 500, 30), rng.random((20, 30))
+    )
+
+    # Separable grid (with decreasing columns), evaluated on the tensor grid
+    fx, fy = np.meshgrid(np.linspace(500, -500, 300), np.linspace(0, 1000, 200))
+    np.testing.assert_allclose(_eval_spline(spline, fy, fx), spline.ev(fy, fx))
+
+    # Curvilinear grid, evaluated point by point
+    fx += rng.random(fx.shape)
+    np.testing.assert_allclose(_eval_spline(spline, fy, fx), spline.ev(fy, fx))
+
+
+def test_remote_io(tmp_path, monkeypatch):
+    """Test the remote I/O profile and its instrumentation against a local HTTP server handling range requests"""
+    import http.server
+    import threading
+
+    from rasterio.env import get_gdal_config, set_gdal_config
+    from rasterio.transform import from_origin
+
+    from eoreader import remote_io
+
+    requested = []
+
+    class RangeHandler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(tmp_path), **kwargs)
+
+        def log_message(self, *args):
+            pass
+
+        def do_HEAD(self):
+            self._send(with_body=False)
+
+        def do_GET(self):
+            self._send(with_body=True)
+
+        def _send(self, with_body):
+            file_path = self.translate_path(self.path.split("?")[0])
+            if not os.path.isfile(file_path):
+                self.send_error(404)
+                return
+
+            with open(file_path, "rb") as file:
+                data = file.read()
+
+            byte_ranges = self.headers.get("Range")
+            if byte_ranges is None:
+                body = data
+                self.send_response(200)
+            else:
+                ranges = [
+                    [int(val) for val in byte_range.split("-")]
+                    for byte_range in byte_ranges.removeprefix("bytes=").split(",")
+                ]
+                requested.append(ranges)
+                if len(ranges) == 1:
+                    start, end = ranges[0][0], min(ranges[0][1], len(data) - 1)
+                    body = data[start : end + 1]
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{end}/{len(data)}"
+                    )
+                else:
+                    body = b""
+                    for start, end in ranges:
+                        body += (
+                            (
+                                f"--SEP\r\nContent-Range: bytes {start}-{end}/{len(data)}\r\n\r\n"
+                            ).encode()
+                            + data[start : end + 1]
+                            + b"\r\n"
+                        )
+                    body += b"--SEP--\r\n"
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Type", "multipart/byteranges; boundary=SEP"
+                    )
+
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if with_body:
+                self.wfile.write(body)
+
+    # Write a COG
+    arr = np.random.default_rng(0).integers(0, 1000, (1, 2048, 2048), dtype=np.uint16)
+    with rasterio.open(
+        tmp_path / "cog.tif",
+        "w",
+        driver="COG",
+        width=2048,
+        height=2048,
+        count=1,
+        dtype=np.uint16,
+        crs="EPSG:32631",
+        transform=from_origin(500000, 5000000, 10, 10),
+        blocksize=256,
+    ) as ds:
+        ds.write(arr)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"/vsicurl/http://127.0.0.1:{server.server_port}/cog.tif?remote_io"
+        window = ((0, 600), (0, 1500))
+
+        with (
+            rasterio.Env(**remote_io.REMOTE_GDAL_OPTIONS),
+            remote_io.track_remote_io() as stats,
+        ):
+            with rasterio.open(url) as ds:
+                np.testing.assert_array_equal(
+                    ds.read(1, window=window), arr[0, :600, :1500]
+                )
+
+            # Every request issued by GDAL is tracked
+            ci.assert_val(stats.ranges, sum(len(rng) for rng in requested), "Ranges")
+            ci.assert_val(
+                stats.bytes,
+                sum(end - start + 1 for rng in requested for start, end in rng),
+                "Bytes",
+            )
+
+            # Only the needed tiles have been read
+            assert stats.bytes < arr.nbytes / 2
+
+            # The header is cached between two openings of the same file
+            nof_requests = stats.requests
+            nof_bytes = stats.bytes
+            with rasterio.open(url) as ds:
+                ds.read(1, window=window)
+            assert stats.requests - nof_requests < nof_requests
+            assert stats.bytes - nof_bytes < nof_bytes
+    finally:
+        server.shutdown()
+
+    # Opt-in profile, scoped to the remote paths and not overriding the user's options
+    monkeypatch.setattr(remote_io, "_READ_OPTIONS_SET", False)
+    with tempenv.TemporaryEnvironment(
+        {
+            "EOREADER_REMOTE_IO_PROFILE": "1",
+            "GDAL_HTTP_MAX_RETRY": "2",
+        }
+        | {
+            key: None
+            for key in remote_io.REMOTE_GDAL_OPTIONS
+            if key != "GDAL_HTTP_MAX_RETRY"
+        }
+    ):
+        try:
+            assert remote_io.is_remote_io_profile_enabled()
+            assert "GDAL_HTTP_MAX_RETRY" not in remote_io.get_remote_io_options()
+
+            with remote_io.remote_io_profile(tmp_path / "cog.tif"):
+                assert get_gdal_config("GDAL_DISABLE_READDIR_ON_OPEN") is None
+                assert get_gdal_config("GDAL_HTTP_MULTIRANGE") is None
+
+            with remote_io.remote_io_profile("https://example.com/cog.tif"):
+                ci.assert_val(
+                    get_gdal_config("GDAL_DISABLE_READDIR_ON_OPEN"),
+                    "EMPTY_DIR",
+                    "Profile option",
+                )
+                ci.assert_val(get_gdal_config("GDAL_HTTP_MAX_RETRY"), 2, "User option")
+
+                # Lazy load of a (local) band: its chunks are read later
+                band_xda = rasters.read(tmp_path / "cog.tif", chunks=[1, 512, 512])
+
+            # The open options are not leaked after the load
+            assert get_gdal_config("GDAL_DISABLE_READDIR_ON_OPEN") is None
+            for key in remote_io.REMOTE_GDAL_OPTIONS:
+                if key != "GDAL_HTTP_MAX_RETRY":
+                    assert key not in os.environ
+
+            # But the read options apply when the chunks are read by the dask workers
+            def _read_options(block):
+                options.append(
+                    {
+                        key: get_gdal_config(key, normalize=False)
+                        for key in remote_io.REMOTE_GDAL_READ_OPTIONS
+                    }
+                )
+                return block
+
+            options = []
+            band_xda.data.map_blocks(
+                _read_options, meta=np.array((), dtype=band_xda.dtype)
+            ).compute(scheduler="threads")
+            ci.assert_val(len(options), 16, "Read chunks")
+            for chunk_options in options:
+                for key in remote_io.REMOTE_GDAL_READ_OPTIONS:
+                    expected = (
+                        "2"
+                        if key == "GDAL_HTTP_MAX_RETRY"
+                        else remote_io.REMOTE_GDAL_OPTIONS[key]
+                    )
+                    ci.assert_val(chunk_options[key], expected, key)
+        finally:
+            for key in remote_io.REMOTE_GDAL_READ_OPTIONS:
+                set_gdal_config(key, None)
+
+
+def test_terrain():
+    """Test the terrain derivatives computed chunk by chunk"""
+    from rasterio.transform import from_origin
+
+    from eoreader.terrain import TerrainDerivative, compute_terrain
+
+    rows, cols = np.mgrid[0:300, 0:400]
+    dem = xr.DataArray(
+        (200 * np.sin(cols / 40) * np.cos(rows / 55) + 3 * cols)[np.newaxis].astype(
+            np.float32
+        ),
+        dims=("band", "y", "x"),
+        coords={
+            "band": [1],
+            "y": 5000000 - 10 * (np.arange(300) + 0.5),
+            "x": 300000 + 10 * (np.arange(400) + 0.5),
+        },
+    )
+    dem.rio.write_crs("EPSG:32631", inplace=True)
+    dem.rio.write_transform(from_origin(300000, 5000000, 10, 10), inplace=True)
+
+    derivatives = ["slope", "aspect", "hillshade"]
+    terrain = compute_terrain(dem, derivatives, azimuth=150, zenith=40)
+    terrain_dask = compute_terrain(
+        dem.chunk({"x": 64, "y": 50}), derivatives, azimuth=150, zenith=40
+    )
+
+    # Same result chunk by chunk (with a one-pixel halo)
+    for derivative in TerrainDerivative:
+        xr.testing.assert_allclose(terrain[derivative], terrain_dask[derivative])
+        deriv_arr = terrain[derivative].values[0]
+        assert np.isnan(deriv_arr[[0, -1], :]).all()
+        assert np.isnan(deriv_arr[:, [0, -1]]).all()
+        assert not np.isnan(deriv_arr[1:-1, 1:-1]).any()
+
+    # Same result as sertit
+    np.testing.assert_allclose(
+        terrain[TerrainDerivative.SLOPE][0, 1:-1, 1:-1],
+        rasters.slope(dem).values.squeeze()[1:-1, 1:-1],
+        atol=1e-3,
+    )
+    np.testing.assert_allclose(
+        terrain[TerrainDerivative.HILLSHADE][0, 1:-1, 1:-1],
+        rasters.hillshade(dem, 150, 40).values.squeeze()[1:-1, 1:-1],
+        atol=0.1,
+    )
+
+    # Aspect of a plane going down to the east
+    aspect = compute_terrain(dem.copy(data=-dem.x.values * dem.notnull()), ["aspect"])
+    np.testing.assert_allclose(aspect[TerrainDerivative.ASPECT][0, 1:-1, 1:-1], 90)
+
+    with pytest.raises(ValueError):
+        compute_terrain(dem, ["hillshade"])
+
+
+def test_angles():
+    """Test the per-pixel angle bands, interpolated from coarse angle grids"""
+    from rasterio.transform import from_origin
+
+    from eoreader.angles import circular_nanmean, interpolate_angle_grid
+    from eoreader.bands import SZA, LandsatMaskBandNames, is_angle, is_mask, to_band
+    from eoreader.env_vars import TILE_SIZE, USE_DASK
+    from eoreader.terrain import TerrainDerivative, compute_terrain
+
+    # Angle bands (the raw Landsat and HLS angle masks keep their own names)
+    assert to_band("SZA") == [SZA]
+    assert is_angle(SZA) and not is_mask(SZA)
+    assert not is_angle(LandsatMaskBandNames.SZA)
+
+    # 5 km grid (values located at the grid nodes), interpolated to 100 m
+    grid_tr = from_origin(300000, 5000000, 5000, 5000)
+    dst_tr = from_origin(300000, 5000000, 100, 100)
+    rows, cols = np.mgrid[0:4, 0:5]
+    zenith_grid = 30 + 2 * cols + 0.5 * rows
+    zenith_grid[0, 0] = np.nan  # Outside the swath
+
+    with tempenv.TemporaryEnvironment({USE_DASK: "1", TILE_SIZE: "64"}):
+        sza = interpolate_angle_grid(
+            zenith_grid, grid_tr, dst_tr, (150, 200), "EPSG:32631", name="SZA"
+        )
+        assert sza.chunks is not None
+        assert sza.shape == (1, 150, 200)
+        assert sza.rio.transform() == dst_tr
+        sza_arr = sza.values[0]
+
+    # Bilinear interpolation is exact for a linear field
+    pix_rows, pix_cols = np.mgrid[0:150, 0:200]
+    expected = 30 + 2 * (pix_cols + 0.5) / 50 + 0.5 * (pix_rows + 0.5) / 50
+    np.testing.assert_allclose(sza_arr[50:, 50:], expected[50:, 50:], atol=1e-4)
+    assert not np.isnan(sza_arr).any()
+
+    # Same result without dask
+    with tempenv.TemporaryEnvironment({USE_DASK: "0"}):
+        sza_np = interpolate_angle_grid(
+            zenith_grid, grid_tr, dst_tr, (150, 200), "EPSG:32631"
+        )
+        assert sza_np.chunks is None
+        np.testing.assert_allclose(sza_np.values[0], sza_arr, atol=1e-4)
+
+    # Azimuths wrap around 0
+    azimuth_grid = np.array([[350.0, 10.0], [350.0, 10.0]])
+    saa = interpolate_angle_grid(
+        azimuth_grid, grid_tr, dst_tr, (10, 50), "EPSG:32631", is_azimuth=True
+    ).values[0]
+    assert ((saa > 349) | (saa < 11)).all()
+    np.testing.assert_allclose(circular_nanmean(np.array([350, 20, np.nan])), 5)
+
+    # Hillshade lit by per-pixel angles: same result as the scalar angles if they are constant
+    rows, cols = np.mgrid[0:100, 0:120]
+    dem = xr.DataArray(
+        (200 * np.sin(cols / 40) * np.cos(rows / 55))[np.newaxis].astype(np.float32),
+        dims=("band", "y", "x"),
+        coords={
+            "band": [1],
+            "y": 5000000 - 10 * (np.arange(100) + 0.5),
+            "x": 300000 + 10 * (np.arange(120) + 0.5),
+        },
+    )
+    dem.rio.write_crs("EPSG:32631", inplace=True)
+    dem.rio.write_transform(from_origin(300000, 5000000, 10, 10), inplace=True)
+    azimuth = dem.copy(data=np.full(dem.shape, 150, dtype=np.float32))
+    zenith = dem.copy(data=np.full(dem.shape, 40, dtype=np.float32))
+
+    hillshade = compute_terrain(dem, ["hillshade"], azimuth=150, zenith=40)
+    for dem_xda in [dem, dem.chunk({"x": 50, "y": 30})]:
+        hillshade_px = compute_terrain(
+            dem_xda, ["hillshade"], azimuth=azimuth, zenith=zenith
+        )
+        xr.testing.assert_allclose(
+            hillshade[TerrainDerivative.HILLSHADE],
+            hillshade_px[TerrainDerivative.HILLSHADE],
+        )
+
+    # The light changes across the scene
+    zenith = zenith.copy(data=np.broadcast_to(np.linspace(20, 70, 120), dem.shape))
+    hillshade_px = compute_terrain(
+        dem.chunk({"x": 50, "y": 30}), ["hillshade"], azimuth=azimuth, zenith=zenith
+    )[TerrainDerivative.HILLSHADE].values[0]
+    hillshade = hillshade[TerrainDerivative.HILLSHADE].values[0]
+    assert not np.allclose(hillshade_px[1:-1, 1:-1], hillshade[1:-1, 1:-1])
+
+
+def test_snap_swath_workers():
+    """Test the number of swaths processed concurrently by SNAP and the split of the SNAP resources"""
+    from sertit import snap
+
+    from eoreader.env_vars import SNAP_MAX_SWATH_WORKERS
+    from eoreader.products import SarProduct
+
+    gib = 1024**3
+    with tempenv.TemporaryEnvironment(
+        {snap.SU_MAX_CORE: "16", snap.JAVA_OPTS_XMX: str(32 * gib)}
+    ):
+        # Bounded by the SNAP resources (2 cores and 4 GB per swath) and the number of swaths
+        ci.assert_val(SarProduct._get_nof_snap_workers(3), 3, "Nof workers")
+        ci.assert_val(SarProduct._get_nof_snap_workers(10), 8, "Nof workers")
+        with tempenv.TemporaryEnvironment({snap.JAVA_OPTS_XMX: str(8 * gib)}):
+            ci.assert_val(SarProduct._get_nof_snap_workers(3), 2, "Nof workers")
+        with tempenv.TemporaryEnvironment({SNAP_MAX_SWATH_WORKERS: "1"}):
+            ci.assert_val(SarProduct._get_nof_snap_workers(3), 1, "Nof workers")
+
+        # The resources are split between the workers, and restored afterwards
+        with SarProduct._split_snap_resources(4):
+            gpt_cli = snap.get_gpt_cli("graph.xml")
+            assert gpt_cli[3] == 4
+            assert "-J-Xmx8G" in gpt_cli[4]
+        assert os.environ[snap.SU_MAX_CORE] == "16"
+        assert os.environ[snap.JAVA_OPTS_XMX] == str(32 * gib)
+
+
+def test_multilook(tmp_path):
+    """Test the multilooked intensity of complex SAR data, computed chunk by chunk and geocoded with its GCPs"""
+    import rasterio
+    from rasterio.control import GroundControlPoint
+
+    from eoreader.env_vars import TILE_SIZE, USE_DASK
+    from eoreader.products.sar import multilook
+
+    assert multilook.get_looks(4) == (4, 4)
+    assert multilook.get_looks((2, 5)) == (2, 5)
+    with pytest.raises(ValueError):
+        multilook.get_looks((2, 0))
+
+    # Complex data with GCPs on its corners
+    height, width = 400, 300
+    rng = np.random.default_rng(0)
+    cplx = (
+        rng.normal(size=(height, width)) + 1j * rng.normal(size=(height, width))
+    ).astype(np.complex64)
+    cplx[:, :30] = 0  # Outside the swath
+    gcps = [
+        GroundControlPoint(row=0, col=0, x=7.0, y=48.1),
+        GroundControlPoint(row=0, col=width, x=7.03, y=48.1),
+        GroundControlPoint(row=height, col=width, x=7.03, y=48.06),
+        GroundControlPoint(row=height, col=0, x=7.0, y=48.06),
+    ]
+    cplx_path = tmp_path / "cplx.tif"
+    i_path = tmp_path / "i.tif"
+    q_path = tmp_path / "q.tif"
+    for arr, arr_path in [(cplx, cplx_path), (cplx.real, i_path), (cplx.imag, q_path)]:
+        with rasterio.open(
+            str(arr_path),
+            "w",
+            driver="GTiff",
+            height=height,
+            width=width,
+            count=1,
+            dtype=arr.dtype,
+            gcps=gcps,
+            crs="EPSG:4326",
+        ) as ds:
+            ds.write(arr, 1)
+
+    # Same result as the brute-force multilook, with chunks aligned on the looks (incomplete looks trimmed)
+    looks = (3, 7)
+    expected = (np.abs(cplx[: 57 * 7, :]) ** 2).reshape(57, 7, 100, 3).mean(axis=(1, 3))
+    expected[expected == 0] = np.nan
+    with tempenv.TemporaryEnvironment({USE_DASK: "1", TILE_SIZE: "64"}):
+        for paths in [[cplx_path], [i_path, q_path]]:
+            cplx_xda = multilook.read_complex(paths, looks)
+            assert all(chunk % 7 == 0 for chunk in cplx_xda.chunks[1][:-1])
+            assert all(chunk % 3 == 0 for chunk in cplx_xda.chunks[2][:-1])
+
+            ml_xda = multilook.multilook_intensity(cplx_xda, looks)
+            assert ml_xda.chunks is not None
+            ci.assert_val(ml_xda.shape, (1, 57, 100), "Multilooked shape")
+            np.testing.assert_allclose(ml_xda.values[0], expected, rtol=1e-5)
+
+    # Geocoded on the ellipsoid with the scaled GCPs
+    ml_gcps = multilook.scale_gcps(gcps, looks)
+    ci.assert_val((ml_gcps[2].row, ml_gcps[2].col), (height / 7, width / 3), "GCP")
+    geocoded = multilook.geocode(
+        ml_xda.compute(), ml_gcps, "EPSG:4326", "EPSG:32632", 20.0
+    )
+    ci.assert_val(geocoded.rio.crs.to_epsg(), 32632, "CRS")
+    ci.assert_val(geocoded.rio.resolution(), (20.0, -20.0), "Resolution")
+    np.testing.assert_allclose(float(geocoded.mean()), 2.0, rtol=0.05)
+
+
+def test_cosmo_h5(tmp_path):
+    """Test the metadata sidecar of the COSMO-SkyMed products without XML and the pool of opened HDF5 files"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import rasterio
+
+    from eoreader.env_vars import MTD_CACHE_DIR
+    from eoreader.exceptions import InvalidProductError
+    from eoreader.products.sar import cosmo_product
+    from eoreader.products.sar.cosmo_product import CosmoProduct
+
+    class _Cosmo:
+        """Minimal COSMO-SkyMed product, without XML metadata"""
+
+        def __init__(self, img_path):
+            self._img_path = img_path
+            self.nof_extractions = 0
+
+        def _read_mtd_xml(self, mtd_from_path):
+            raise InvalidProductError("Missing XML")
+
+        def _extract_h5_mtd(self):
+            self.nof_extractions += 1
+            return {"ProductName": "CSKS1_SCS_B", "ProductType": "SCS_B"}
+
+    img_path = tmp_path / "CSKS1_SCS_B.h5"
+    img_path.write_bytes(b"h5")
+    with tempenv.TemporaryEnvironment({MTD_CACHE_DIR: str(tmp_path / "mtd")}):
+        # The HDF5 attributes are extracted only once, then read from the sidecar
+        prods = [_Cosmo(img_path), _Cosmo(img_path)]
+        for prod in prods:
+            root, _ = CosmoProduct._read_mtd(prod)
+            ci.assert_val(root.findtext(".//ProductType"), "SCS_B", "Product type")
+        ci.assert_val([prod.nof_extractions for prod in prods], [1, 0], "Extractions")
+
+        # A modified file is extracted again
+        img_path.write_bytes(b"new h5")
+        prod = _Cosmo(img_path)
+        CosmoProduct._read_mtd(prod)
+        ci.assert_val(prod.nof_extractions, 1, "Extractions")
+
+    # The handles are reused, and the least recently used ones are closed
+    paths = []
+    for idx in range(cosmo_product.H5_POOL_SIZE + 1):
+        raster_path = tmp_path / f"{idx}.tif"
+        with rasterio.open(
+            str(raster_path),
+            "w",
+            driver="GTiff",
+            height=1,
+            width=1,
+            count=1,
+            dtype="uint8",
+        ) as ds:
+            ds.write(np.zeros((1, 1, 1), dtype=np.uint8))
+        paths.append(raster_path)
+
+    with cosmo_product._open_h5(paths[0]) as first_ds:
+        pass
+    with cosmo_product._open_h5(paths[0]) as ds:
+        assert ds is first_ds
+    for raster_path in paths[1:]:
+        with cosmo_product._open_h5(raster_path):
+            pass
+    assert first_ds.closed
+
+    with cosmo_product._open_h5(paths[-1]) as last_ds:
+        pass
+    cosmo_product._release_h5(paths[-1])
+    assert last_ds.closed
+
+    # The other files can be read while one file is used, and the files in use are not evicted
+    with cosmo_product._open_h5(paths[0]) as used_ds:
+
+        def _read(raster_path):
+            with cosmo_product._open_h5(raster_path) as ds:
+                return ds.read(1)
+
+        with ThreadPoolExecutor(2) as executor:
+            list(executor.map(_read, paths[1:], timeout=10))
+        assert not used_ds.closed
+    for raster_path in paths:
+        cosmo_product._release_h5(raster_path)
+
+
+def test_export_catalog(tmp_path, monkeypatch):
+    """Test the batch export of STAC Items, streamed to a newline-delimited JSON catalogue"""
+    import json
+
+    from eoreader.stac import export_catalog, stac_catalog
+
+    def _create_item_dict(prod_path, validate=True, **kwargs):
+        if "invalid" in str(prod_path):
+            return None
+        return {"type": "Feature", "id": str(prod_path), "validated": validate}
+
+    # Items streamed from a generator, skipping the invalid products
+    with monkeypatch.context() as mp:
+        mp.setattr(stac_catalog, "_create_item_dict", _create_item_dict)
+        catalog_path = tmp_path / "catalog.ndjson"
+        nof_items = export_catalog(
+            (f"prod_{idx}" for idx in range(5)),
+            catalog_path,
+            workers=1,
+            validate=False,
+        )
+        ci.assert_val(nof_items, 5, "Number of items")
+        export_catalog(["prod_0", "invalid"], tmp_path / "catalog_2.jsonl", workers=1)
+
+    with open(catalog_path) as catalog:
+        items = [json.loads(line) for line in catalog]
+    ci.assert_val(
+        [item["id"] for item in items], [f"prod_{idx}" for idx in range(5)], "Items"
+    )
+    assert not any(item["validated"] for item in items)
+    with open(tmp_path / "catalog_2.jsonl") as catalog:
+        ci.assert_val(len(catalog.readlines()), 1, "Number of items")
+
+    # Unrecognized products (in worker processes)
+    nof_items = export_catalog(
+        [tmp_path / "catalog.ndjson", tmp_path / "not_a_product"],
+        tmp_path / "empty.ndjson",
+        workers=2,
+    )
+    ci.assert_val(nof_items, 0, "Number of items")
+    assert (tmp_path / "empty.ndjson").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+    with pytest.raises(ValueError):
+        export_catalog([], tmp_path / "catalog.csv")
+
+
+def test_stac_validation(tmp_path, monkeypatch):
+    """Test the validation of STAC Items with cached schemas and validators (offline)"""
+    import json
+
+    from pystac.errors import STACValidationError
+
+    from eoreader.env_vars import STAC_CACHE_DIR, STAC_VALIDATION
+    from eoreader.stac import ValidationMode, stac_validation
+    from eoreader.stac.stac_cache import write_cached
+
+    monkeypatch.setenv(STAC_CACHE_DIR, str(tmp_path))
+    stac_validation._get_schema.cache_clear()
+    stac_validation._get_validator.cache_clear()
+
+    # Validation modes
+    ci.assert_val(
+        stac_validation.get_validation_mode(), ValidationMode.CACHED, "Default mode"
+    )
+    ci.assert_val(
+        stac_validation.get_validation_mode(False), ValidationMode.OFF, "Mode"
+    )
+    ci.assert_val(
+        stac_validation.get_validation_mode("full"), ValidationMode.FULL, "Mode"
+    )
+    with monkeypatch.context() as mp:
+        mp.setenv(STAC_VALIDATION, "off")
+        ci.assert_val(
+            stac_validation.get_validation_mode(True), ValidationMode.OFF, "Mode"
+        )
+
+    # Extension schema already cached on disk: no download needed
+    ext_uri = "https://stac-extensions.github.io/dummy/v1.0.0/schema.json"
+    ext_schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "required": ["properties"],
+        "properties": {"properties": {"type": "object", "required": ["dummy:value"]}},
+    }
+    write_cached(ext_uri, json.dumps(ext_schema).encode())
+
+    item = {
+        "type": "Feature",
+        "stac_version": "1.1.0",
+        "stac_extensions": [ext_uri],
+        "id": "item",
+        "geometry": {"type": "Point", "coordinates": [7.75, 48.58]},
+        "bbox": [7.75, 48.58, 7.75, 48.58],
+        "properties": {"datetime": "2020-01-01T00:00:00Z", "dummy:value": 1},
+        "links": [],
+        "assets": {},
+    }
+    for _ in range(3):
+        stac_validation.validate_item(item)
+
+    # Validators compiled only once (core schema and extension)
+    cache_info = stac_validation._get_validator.cache_info()
+    ci.assert_val(cache_info.misses, 2, "Compiled validators")
+    ci.assert_val(cache_info.hits, 4, "Reused validators")
+
+    # Invalid items
+    item["properties"].pop("dummy:value")
+    with pytest.raises(STACValidationError):
+        stac_validation.validate_item(item)
+
+    item.pop("geometry")
+    with pytest.raises(STACValidationError):
+        stac_validation.validate_item(item)
+
+
+def test_product_index(tmp_path, monkeypatch):
+    """Test the crawl of an archive and the GeoParquet index of its products"""
+    from datetime import datetime
+
+    from shapely.geometry import box
+
+    from eoreader import product_index
+
+    # Crawl: recognized products (not descended into), unrecognized folders crawled
+    archive_path = tmp_path / "archive"
+    s2_path = archive_path.joinpath(
+        "2020", "S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE"
+    )
+    l8_path = archive_path.joinpath(
+        "misc", "LC08_L1TP_200030_20201220_20210310_02_T1.tar"
+    )
+    (s2_path / "GRANULE").mkdir(parents=True)
+    l8_path.parent.mkdir(parents=True)
+    l8_path.touch()
+    (archive_path / "readme.txt").touch()
+    ci.assert_val(
+        list(product_index.crawl(archive_path)), [s2_path, l8_path], "Crawled products"
+    )
+
+    # Index (without opening products)
+    opened = []
+
+    def _get_product_record(prod_path, **kwargs):
+        opened.append(prod_path.name)
+        if prod_path.name == "invalid":
+            return None
+        idx = int(prod_path.name.split("_")[-1])
+        is_sar = idx % 2 == 1
+        return {
+            "path": str(AnyPath(prod_path)),
+            "name": f"prod_{idx}",
+            "condensed_name": f"prod_{idx}",
+            "datetime": datetime(2019 + idx % 3, 1 + idx % 12, 1),
+            "constellation": "S1" if is_sar else "S2",
+            "product_type": "GRD" if is_sar else "MSIL1C",
+            "tile_name": None if is_sar else "T30TTK",
+            "cloud_cover": None if is_sar else 10.0 * idx,
+            "orbit_direction": "ASCENDING" if is_sar else "DESCENDING",
+            "geometry": box(idx, 0, idx + 0.5, 1),
+        }
+
+    def _create_products(prods_path):
+        prods_path.mkdir()
+        for name in [f"prod_{idx}" for idx in range(8)] + ["invalid"]:
+            (prods_path / name).write_bytes(b"0")
+        return sorted(prods_path.iterdir())
+
+    monkeypatch.setattr(product_index, "_get_product_record", _get_product_record)
+
+    # Incremental refresh (index kept in memory)
+    prods_path = tmp_path / "prods"
+    prod_paths = _create_products(prods_path)
+    stored = {}
+    with monkeypatch.context() as mp:
+        mp.setattr(product_index, "_read_index", lambda _: stored.get("gdf"))
+        mp.setattr(product_index, "_write_index", lambda gdf, _: stored.update(gdf=gdf))
+
+        def _build(paths, **kwargs):
+            opened.clear()
+            return product_index.build_index(paths, "index", workers=1, **kwargs)
+
+        # Non-normalized paths (i.e. with a trailing slash, as the .SAFE directories)
+        ci.assert_val(
+            _build([f"{prod_path}/" for prod_path in prod_paths]),
+            8,
+            "Number of indexed products",
+        )
+        ci.assert_val(len(opened), 9, "Opened products")
+
+        # Only the products not indexed yet are opened again
+        ci.assert_val(_build(prod_paths), 8, "Number of indexed products")
+        ci.assert_val(opened, ["invalid"], "Opened products")
+
+        # Whatever the way their paths are given
+        ci.assert_val(
+            _build([f"{prod_path}/" for prod_path in prod_paths]),
+            8,
+            "Number of indexed products",
+        )
+        ci.assert_val(opened, ["invalid"], "Opened products")
+
+        # Modified, vanished and new products
+        (prods_path / "prod_1").write_bytes(b"modified")
+        (prods_path / "prod_2").unlink()
+        (prods_path / "prod_8").write_bytes(b"0")
+        ci.assert_val(_build(prods_path.iterdir()), 8, "Number of indexed products")
+        ci.assert_val(
+            sorted(opened), ["invalid", "prod_1", "prod_8"], "Opened products"
+        )
+        ci.assert_val(
+            sorted(AnyPath(prod_path).name for prod_path in stored["gdf"]["path"]),
+            [f"prod_{idx}" for idx in [0, 1, 3, 4, 5, 6, 7, 8]],
+            "Indexed products",
+        )
+
+        # Without update, every product is opened again
+        _build(prods_path.iterdir(), update=False)
+        ci.assert_val(len(opened), 9, "Opened products")
+
+    # GeoParquet index
+    pytest.importorskip("pyarrow")
+
+    index_path = tmp_path / "index.parquet"
+    prod_paths = _create_products(tmp_path / "prods_pq")
+    nof_products = product_index.build_index(prod_paths, index_path, workers=1)
+    ci.assert_val(nof_products, 8, "Number of indexed products")
+    assert (index_path / "constellation=S2" / "year=2019").is_dir()
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # The signatures are read back from the index
+    opened.clear()
+    product_index.build_index(prod_paths, index_path, workers=1)
+    ci.assert_val(opened, ["invalid"], "Opened products")
+
+    def _query(**kwargs):
+        return [
+            prod_path.name
+            for prod_path in product_index.query_index(index_path, **kwargs)
+        ]
+
+    ci.assert_val(len(_query()), 8, "All products")
+    ci.assert_val(
+        _query(constellation="S1"), ["prod_3", "prod_1", "prod_7", "prod_5"], "S1"
+    )
+    ci.assert_val(_query(aoi=box(2.2, 0.2, 3.2, 0.8)), ["prod_3", "prod_2"], "AOI")
+    ci.assert_val(
+        _query(start_datetime=datetime(2020, 1, 1), end_datetime=datetime(2020, 6, 1)),
+        ["prod_1", "prod_4"],
+        "Dates",
+    )
+    ci.assert_val(
+        _query(max_cloud_cover=25, orbit_direction="DESCENDING"),
+        ["prod_0", "prod_2"],
+        "Cloud cover",
+    )
+
+
+def test_cube(monkeypatch):
+    """Test the lazy time series cube of several products loaded on a common grid"""
+    from datetime import datetime
+
+    import geopandas as gpd
+    from rasterio.crs import CRS
+    from rasterio.transform import from_origin
+    from shapely.geometry import box
+
+    from eoreader import cube
+    from eoreader.env_vars import TILE_SIZE, USE_DASK
+
+    crs = CRS.from_epsg(32631)
+    loaded = []
+
+    class _Product:
+        def __init__(self, idx, left):
+            self.condensed_name = f"prod_{idx}"
+            self.constellation_id = "S2"
+            self.datetime = datetime(2020, 1 + idx, 1)
+            self.pixel_size = 10.0
+            self.idx = idx
+            self.bounds = (left, 5_000_000, left + 1000, 5_001_000)
+
+        def crs(self):
+            return crs
+
+        def footprint(self):
+            return gpd.GeoDataFrame(geometry=[box(*self.bounds)], crs=crs)
+
+        def to_band(self, bands):
+            return bands
+
+        def load(self, bands, pixel_size, window=None, **kwargs):
+            loaded.append(self.condensed_name)
+            assert window.crs == crs
+            size = int(1000 / pixel_size)
+            xda = xr.DataArray(
+                np.full((1, size, size), float(self.idx), dtype=np.float32),
+                dims=["band", "y", "x"],
+            )
+            xda = xda.rio.write_crs(crs).rio.write_transform(
+                from_origin(self.bounds[0], self.bounds[3], pixel_size, pixel_size)
+            )
+            return {band: xda for band in bands}
+
+    # Unsorted products, one not intersecting the bounds
+    products = [
+        _Product(2, 600_000),
+        _Product(0, 600_000),
+        _Product(1, 600_500),
+        _Product(3, 700_000),
+    ]
+    monkeypatch.setattr(cube, "_open_products", lambda prods, workers: list(prods))
+    monkeypatch.setenv(USE_DASK, "1")
+    monkeypatch.setenv(TILE_SIZE, "32")
+
+    cube_xda = cube.load(
+        products,
+        ["RED", "NIR"],
+        pixel_size=20,
+        bounds=(600_000, 5_000_000, 601_500, 5_001_000),
+    )
+
+    # Lazy cube, chunked by time
+    ci.assert_val(loaded, [], "Loaded products")
+    ci.assert_val(cube_xda.dims, ("time", "band", "y", "x"), "Dimensions")
+    ci.assert_val(cube_xda.shape, (3, 2, 50, 75), "Shape")
+    ci.assert_val(cube_xda.chunks[0], (1, 1, 1), "Time chunks")
+    assert cube_xda.chunks[2:] == ((32, 18), (32, 32, 11)), "Spatial chunks"
+    ci.assert_val(
+        list(cube_xda.condensed_name.values), ["prod_0", "prod_1", "prod_2"], "Time"
+    )
+    ci.assert_val(cube_xda.rio.crs, crs, "CRS")
+    ci.assert_val(
+        cube_xda.rio.transform(), from_origin(600_000, 5_001_000, 20, 20), "Transform"
+    )
+
+    # Only the products covering the computed chunks are loaded
+    cube_xda.isel(x=slice(64, None)).compute()
+    ci.assert_val(loaded, ["prod_1", "prod_1"], "Loaded products")
+
+    # Reprojected on the common grid
+    cube_arr = cube_xda.sel(band="NIR").compute()
+    ci.assert_val(
+        sorted(set(loaded)), ["prod_0", "prod_1", "prod_2"], "Loaded products"
+    )
+    ci.assert_val(float(cube_arr[2, 25, 10]), 2.0, "Value")
+    assert np.isnan(cube_arr[0, 25, 60])
+    ci.assert_val(float(cube_arr[1, 25, 60]), 1.0, "Value")
+
+    # Two cubes of the same products on different grids don't share their tasks
+    other_xda = cube.load(
+        products,
+        ["RED", "NIR"],
+        pixel_size=10,
+        bounds=(600_000, 5_000_000, 601_500, 5_001_000),
+    )
+    assert not set(cube_xda.data.__dask_graph__()) & set(
+        other_xda.data.__dask_graph__()
+    )
+
+    with pytest.raises(ValueError):
+        cube.load(products[-1:], ["RED"], bounds=(0, 0, 100, 100), crs=crs)
+
+
 def test_filename_window():
     prod_path = opt_path().joinpath("LT05_L1TP_200030_20111110_20200820_02_T1")
     window_path = others_path().joinpath(
@@ -0,0 +1,201 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Per-pixel acquisition angles (sun and viewing zenith and azimuth angles).
+
+The products give their angles on coarse grids (i.e. every 5 km for Sentinel-2):
+they are bilinearly interpolated onto the wanted pixel grid chunk by chunk with dask arrays,
+so the per-pixel angles are only computed where (and when) they are needed.
+
+The azimuth angles are interpolated through their sine and cosine, to handle their wrap-around.
+"""
+
+import logging
+
+import numpy as np
+import xarray as xr
+from affine import Affine
+
+from eoreader import EOREADER_NAME, utils
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+
+def fill_nan_nearest(grid: np.ndarray) -> np.ndarray:
+    """
+    Fill the NaNs of a grid with their nearest valid value (i.e. the grid points outside the swath),
+    so the interpolation stays valid up to the edges of the swath.
+
+    Args:
+        grid (np.ndarray): 2D grid
+
+    Returns:
+        np.ndarray: Filled grid (all NaN if the grid has no valid value)
+    """
+    nan_mask = np.isnan(grid)
+    if not nan_mask.any() or nan_mask.all():
+        return grid
+
+    # Import scipy here (long import)
+    from scipy.ndimage import distance_transform_edt
+
+    indices = distance_transform_edt(
+        nan_mask, return_distances=False, return_indices=True
+    )
+    return grid[tuple(indices)]
+
+
+def circular_nanmean(angles: np.ndarray, axis: int = 0) -> np.ndarray:
+    """
+    Mean of azimuth angles (in degrees) along an axis, ignoring the NaNs
+
+    Args:
+        angles (np.ndarray): Azimuth angles, in degrees
+        axis (int): Axis along which the mean is computed
+
+    Returns:
+        np.ndarray: Mean azimuth angles, in degrees (between 0 and 360, NaN where no angle is valid)
+    """
+    angles_rad = np.deg2rad(angles)
+    valid = np.any(~np.isnan(angles), axis=axis)
+    sin_sum = np.nansum(np.sin(angles_rad), axis=axis)
+    cos_sum = np.nansum(np.cos(angles_rad), axis=axis)
+    mean = np.mod(np.rad2deg(np.arctan2(sin_sum, cos_sum)), 360.0)
+    return np.where(valid, mean, np.nan)
+
+
+def _interpolate_block(
+    grid: np.ndarray,
+    grid_transform: Affine,
+    dst_transform: Affine,
+    is_azimuth: bool,
+    block_info: dict = None,
+    array_location: list = None,
+) -> np.ndarray:
+    """
+    Interpolate an angle grid onto a block of the destination pixel grid.
+
+    Args:
+        grid (np.ndarray): Angle grid (without NaN), in degrees
+        grid_transform (Affine): Transform of the grid (the grid values are located at :code:`grid_transform * (col, row)`)
+        dst_transform (Affine): Transform of the destination pixel grid
+        is_azimuth (bool): Is this grid an azimuth angle?
+        block_info (dict): Block information (given by dask)
+        array_location (list): Location of the block in the destination array, if not given by dask
+
+    Returns:
+        np.ndarray: Interpolated block, with shape (1, height, width)
+    """
+    # Import scipy here (long import)
+    from scipy.ndimage import map_coordinates
+
+    if block_info is not None:
+        array_location = block_info[None]["array-location"]
+    (row_start, row_stop), (col_start, col_stop) = array_location[-2:]
+
+    # Position of the pixel centers of this block in the grid
+    cols, rows = np.meshgrid(
+        np.arange(col_start, col_stop) + 0.5, np.arange(row_start, row_stop) + 0.5
+    )
+    tr = ~grid_transform @ dst_transform
+    coords = np.array(
+        [tr.d * cols + tr.e * rows + tr.f, tr.a * cols + tr.b * rows + tr.c]
+    )
+
+    if is_azimuth:
+        grid_rad = np.deg2rad(grid)
+        sin_block = map_coordinates(np.sin(grid_rad), coords, order=1, mode="nearest")
+        cos_block = map_coordinates(np.cos(grid_rad), coords, order=1, mode="nearest")
+        block = np.mod(np.rad2deg(np.arctan2(sin_block, cos_block)), 360.0)
+    else:
+        block = map_coordinates(grid, coords, order=1, mode="nearest")
+
+    return block[np.newaxis].astype(np.float32)
+
+
+def interpolate_angle_grid(
+    grid: np.ndarray,
+    grid_transform: Affine,
+    dst_transform: Affine,
+    dst_shape: tuple,
+    crs,
+    is_azimuth: bool = False,
+    name: str = None,
+) -> xr.DataArray:
+    """
+    Interpolate (bilinearly) a coarse angle grid onto a pixel grid.
+
+    With dask, the angles are computed lazily chunk by chunk.
+
+    .. code-block:: python
+
+        >>> # Sentinel-2 sun zenith angles, given every 5 km from the upper-left corner of the tile
+        >>> grid_tr = Affine(5000, 0, ulx, 0, -5000, uly)
+        >>> sza = interpolate_angle_grid(sza_grid, grid_tr, tr, (10980, 10980), crs, name="SZA")
+
+    Args:
+        grid (np.ndarray): 2D angle grid, in degrees (its NaNs are filled with their nearest valid value)
+        grid_transform (Affine): Transform of the grid (the grid values are located at :code:`grid_transform * (col, row)`)
+        dst_transform (Affine): Transform of the destination pixel grid
+        dst_shape (tuple): Shape (height, width) of the destination pixel grid
+        crs: CRS of the grid and of the destination pixel grid
+        is_azimuth (bool): Is this grid an azimuth angle? (interpolated through its sine and cosine)
+        name (str): Name of the output array
+
+    Returns:
+        xr.DataArray: Per-pixel angles, in degrees, with shape (1, height, width)
+    """
+    grid = fill_nan_nearest(np.asarray(grid, dtype=np.float64))
+    height, width = dst_shape
+    kwargs = {
+        "grid": grid,
+        "grid_transform": grid_transform,
+        "dst_transform": dst_transform,
+        "is_azimuth": is_azimuth,
+    }
+
+    chunks = utils.get_default_chunks()
+    if chunks is not None:
+        import dask.array as da
+
+        if isinstance(chunks, dict):
+            chunks = (1, chunks["y"], chunks["x"])
+        chunks = da.core.normalize_chunks(chunks, (1, height, width), dtype=np.float32)
+        angle_arr = da.map_blocks(
+            _interpolate_block, chunks=chunks, dtype=np.float32, **kwargs
+        )
+    else:
+        angle_arr = _interpolate_block(
+            array_location=[(0, 1), (0, height), (0, width)], **kwargs
+        )
+
+    # Pixel centers coordinates
+    x_coords = dst_transform.c + dst_transform.a * (np.arange(width) + 0.5)
+    y_coords = dst_transform.f + dst_transform.e * (np.arange(height) + 0.5)
+
+    angle_xda = xr.DataArray(
+        angle_arr,
+        coords={"band": [1], "y": y_coords, "x": x_coords},
+        dims=["band", "y", "x"],
+        name=name,
+    )
+    angle_xda = angle_xda.rio.write_transform(dst_transform)
+    angle_xda = angle_xda.rio.write_crs(crs)
+    angle_xda = angle_xda.rio.write_nodata(np.nan)
+    if name is not None:
+        angle_xda.attrs["long_name"] = name
+
+    return angle_xda
@@ -0,0 +1,503 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persistent index of the members of archived products (:code:`.zip` and :code:`.tar`).
+
+Listing a large archive (especially a tar, which has to be read entirely, or an archive stored on the cloud) is expensive.
+The list of the members (with their offset, size and compression) is therefore computed only once
+and stored in a sidecar JSON file (see :py:const:`eoreader.env_vars.ARCHIVE_INDEX_DIR`), keyed by the size and modification time of the archive.
+
+Uncompressed tar members can then be opened directly with GDAL's :code:`/vsisubfile/`, without scanning the tar headers again.
+Their public paths (i.e. the band paths) stay :code:`/vsitar/{tar_path}/{member}`, only converted when opening the files (see :py:func:`get_subfile_path`).
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import struct
+import tarfile
+import tempfile
+import threading
+import zipfile
+import zlib
+from functools import lru_cache
+
+from sertit import AnyPath, path
+from sertit.types import AnyPathStrType, AnyPathType
+
+from eoreader import EOREADER_NAME
+from eoreader.env_vars import ARCHIVE_INDEX_DIR
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+ARCHIVE_INDEX_VERSION = 1
+
+RANGE_BUFFER_SIZE = 64 * 1024
+"""Minimal size of the range requests (the small reads, i.e. zip headers, are buffered)"""
+
+_LOCK = threading.Lock()
+_VSITAR_REGEX = re.compile(r"^/vsitar/(.+?\.tar)/(.+)$")
+
+
+def get_archive_index_dir() -> AnyPathType:
+    """
+    Get the directory where the archive indices are stored:
+    the one given by :code:`EOREADER_ARCHIVE_INDEX_DIR` if set, else a folder in the temporary directory.
+
+    Returns:
+        AnyPathType: Archive index directory
+    """
+    return AnyPath(
+        os.environ.get(
+            ARCHIVE_INDEX_DIR,
+            os.path.join(tempfile.gettempdir(), "eoreader_archive_index"),
+        )
+    )
+
+
+class _S3RangedReader(io.RawIOBase):
+    """Seekable file object reading a file stored on S3 with range requests"""
+
+    def __init__(self, cloud_path: AnyPathType) -> None:
+        self._client = cloud_path.client.client
+        self._bucket = cloud_path.bucket
+        self._key = cloud_path.key
+        self._size = cloud_path.stat().st_size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._size - self._pos)
+        if size <= 0:
+            return 0
+
+        data = self._client.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range=f"bytes={self._pos}-{self._pos + size - 1}",
+        )["Body"].read()
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def open_ranged(archive_path: AnyPathType) -> io.BufferedReader | None:
+    """
+    Open a file stored on S3 as a seekable file object reading only the wanted bytes (with range requests).
+
+    Args:
+        archive_path (AnyPathType): File path
+
+    Returns:
+        io.BufferedReader | None: File object, None if the file is not stored on S3 (or cannot be read by range)
+    """
+    if not path.is_cloud_path(archive_path) or not hasattr(archive_path, "bucket"):
+        return None
+
+    try:
+        return io.BufferedReader(_S3RangedReader(archive_path), RANGE_BUFFER_SIZE)
+    except AttributeError:
+        return None
+
+
+class ArchiveIndex:
+    """
+    Index of the members of an archive.
+
+    Each member is stored as :code:`(name, offset, size, compression)`, in the order of the archive,
+    with :code:`offset` being the offset of the member data (tar) or of its local header (zip)
+    and :code:`compression` being :code:`None` for uncompressed members.
+    """
+
+    def __init__(self, archive_path: AnyPathStrType, members: list) -> None:
+        self.archive_path = AnyPath(archive_path)
+        """Archive path"""
+
+        self.members = [tuple(member) for member in members]
+        """Members of the archive: (name, offset, size, compression)"""
+
+        self.names = [member[0] for member in self.members]
+        """Names of the members of the archive"""
+
+        self._by_name = {member[0]: member for member in self.members}
+        self._matches = {}
+
+    @classmethod
+    def build(cls, archive_path: AnyPathStrType) -> "ArchiveIndex":
+        """
+        Build the index of an archive by listing its members.
+
+        Args:
+            archive_path (AnyPathStrType): Archive path
+
+        Returns:
+            ArchiveIndex: Archive index
+        """
+        archive_path = AnyPath(archive_path)
+        LOGGER.debug(f"Indexing the members of {path.get_filename(archive_path)}")
+        if archive_path.suffix == ".zip":
+            try:
+                # Only read the central directory of cloud-stored zips (if possible)
+                with (
+                    open_ranged(archive_path) or archive_path.open("rb") as zip_file,
+                    zipfile.ZipFile(zip_file) as zip_ds,
+                ):
+                    members = [
+                        (
+                            info.filename,
+                            info.header_offset,
+                            info.compress_size,
+                            None
+                            if info.compress_type == zipfile.ZIP_STORED
+                            else info.compress_type,
+                        )
+                        for info in zip_ds.infolist()
+                    ]
+            except zipfile.BadZipFile as ex:
+                raise zipfile.BadZipFile(
+                    f"Impossible to open archive: {archive_path}"
+                ) from ex
+        else:
+            try:
+                with tarfile.open(archive_path) as tar_ds:
+                    # Compressed tars (i.e. .tar.gz) cannot be accessed by offset
+                    ext = path.get_ext(archive_path)
+                    compression = None if ext == ".tar" else ext.lstrip(".")
+                    members = [
+                        (member.name, member.offset_data, member.size, compression)
+                        for member in tar_ds.getmembers()
+                    ]
+            except tarfile.ReadError as ex:
+                raise tarfile.ReadError(
+                    f"Impossible to open archive: {archive_path}"
+                ) from ex
+
+        return cls(archive_path, members)
+
+    def get(self, name: str) -> tuple | None:
+        """
+        Get a member of the archive from its name.
+
+        Args:
+            name (str): Member name
+
+        Returns:
+            tuple | None: (name, offset, size, compression), None if not existing
+        """
+        return self._by_name.get(name)
+
+    def match(self, regex: str, case_sensitive: bool = False) -> list:
+        """
+        Get the names of the members matching the given regex (in the order of the archive).
+        The results are memoized: the same patterns are looked up many times when loading a product.
+
+        Args:
+            regex (str): Member regex (used by re)
+            case_sensitive (bool): If true, the regex is case-sensitive.
+
+        Returns:
+            list: Names of the matching members
+        """
+        key = (regex, case_sensitive)
+        matches = self._matches.get(key)
+        if matches is None:
+            re_rgx = (
+                re.compile(regex)
+                if case_sensitive
+                else re.compile(regex, re.IGNORECASE)
+            )
+            matches = [name for name in self.names if re_rgx.match(name)]
+            self._matches[key] = matches
+
+        return list(matches)
+
+    def get_path(
+        self, regex: str, as_list: bool = False, case_sensitive: bool = False
+    ) -> list | str:
+        """
+        Get the archived path(s) matching the given regex, as :py:func:`sertit.path.get_archived_path`.
+
+        Args:
+            regex (str): Member regex (used by re)
+            as_list (bool): If true, returns a list (including all found files). If false, returns only the first match
+            case_sensitive (bool): If true, the regex is case-sensitive.
+
+        Returns:
+            list | str: Path(s) from inside the archive
+        """
+        matches = self.match(regex, case_sensitive=case_sensitive)
+        if not matches:
+            raise FileNotFoundError(
+                f"Impossible to find file {regex} in {path.get_filename(self.archive_path)}"
+            )
+
+        return matches if as_list else matches[0]
+
+    def get_rio_path(self, regex: str, as_list: bool = False) -> list | str:
+        """
+        Get the archived path(s) matching the given regex, to be read with rasterio,
+        as :py:func:`sertit.path.get_archived_rio_path`.
+
+        The members keep their names in these paths (i.e. :code:`/vsitar/{tar_path}/{member}`):
+        see :py:meth:`get_subfile_path` to read the uncompressed members of local tar archives by offset.
+
+        Args:
+            regex (str): Member regex (used by re)
+            as_list (bool): If true, returns a list (including all found files). If false, returns only the first match
+
+        Returns:
+            list | str: Path(s) that can be read by rasterio
+        """
+        ext = path.get_ext(self.archive_path)
+        if ext == ".tar.gz":
+            raise TypeError(
+                ".tar.gz files are too slow to be read from inside the archive. Please extract them instead."
+            )
+        elif ext.split(".")[-1] not in ["tar", "zip"]:
+            raise TypeError(
+                "Only .zip and .tar files can be read from inside its archive."
+            )
+
+        prefix = self.archive_path.suffix[-3:]
+        is_cloud = path.is_cloud_path(self.archive_path)
+
+        rio_paths = []
+        for name in self.get_path(regex, as_list=True):
+            if is_cloud:
+                rio_paths.append(f"{prefix}+file+{self.archive_path}!{name}")
+            else:
+                rio_paths.append(f"/vsi{prefix}/{self.archive_path}/{name}")
+
+        return rio_paths if as_list else rio_paths[0]
+
+    def get_subfile_path(self, name: str) -> str | None:
+        """
+        Get the :code:`/vsisubfile/{offset}_{size},{tar_path}` path of an uncompressed member of a local tar archive,
+        so that GDAL reads it by offset without scanning the tar headers.
+
+        This path loses the name of the member: only use it to open the file, and keep the :code:`/vsitar/` path everywhere else.
+
+        Args:
+            name (str): Member name
+
+        Returns:
+            str | None: Subfile path, None if the member cannot be read by offset (compressed, zip or cloud archive...)
+        """
+        member = self._by_name.get(name)
+        if (
+            member is None
+            or self.archive_path.suffix != ".tar"
+            or path.is_cloud_path(self.archive_path)
+        ):
+            return None
+
+        _, offset, size, compression = member
+        if compression is not None:
+            return None
+
+        return f"/vsisubfile/{offset}_{size},{self.archive_path}"
+
+    def read_member(self, name: str) -> bytes:
+        """
+        Read the (uncompressed) content of a member of the archive.
+
+        Only the bytes of this member are read: for archives stored on S3, they are fetched with range requests
+        instead of downloading the whole archive.
+
+        Args:
+            name (str): Member name
+
+        Returns:
+            bytes: Content of the member
+        """
+        member = self._by_name.get(name)
+        if member is None:
+            raise FileNotFoundError(
+                f"Impossible to find file {name} in {path.get_filename(self.archive_path)}"
+            )
+        _, offset, size, compression = member
+
+        with open_ranged(self.archive_path) or self.archive_path.open(
+            "rb"
+        ) as archive_file:
+            if self.archive_path.suffix != ".zip":
+                if compression is not None:
+                    with tarfile.open(fileobj=archive_file) as tar_ds:
+                        return tar_ds.extractfile(name).read()
+
+                archive_file.seek(offset)
+                return archive_file.read(size)
+
+            # Skip the local header of the zip member
+            archive_file.seek(offset)
+            *_, name_length, extra_length = struct.unpack(
+                zipfile.structFileHeader, archive_file.read(zipfile.sizeFileHeader)
+            )
+            archive_file.seek(name_length + extra_length, os.SEEK_CUR)
+
+            if compression is None:
+                return archive_file.read(size)
+            elif compression == zipfile.ZIP_DEFLATED:
+                return zlib.decompress(archive_file.read(size), -zlib.MAX_WBITS)
+            else:
+                with zipfile.ZipFile(archive_file) as zip_ds:
+                    return zip_ds.read(name)
+
+    def to_dict(self, size: int, mtime: float) -> dict:
+        """
+        Convert the index to a dictionary (to be stored as JSON)
+
+        Args:
+            size (int): Size of the archive
+            mtime (float): Modification time of the archive
+
+        Returns:
+            dict: Index as a dictionary
+        """
+        return {
+            "version": ARCHIVE_INDEX_VERSION,
+            "archive": str(self.archive_path),
+            "size": size,
+            "mtime": mtime,
+            "members": self.members,
+        }
+
+
+def _get_sidecar_path(archive_path: AnyPathType) -> AnyPathType:
+    """Get the path of the sidecar file storing the index of an archive"""
+    archive_hash = hashlib.sha256(str(archive_path).encode()).hexdigest()[:32]
+    return (
+        get_archive_index_dir()
+        / f"{path.get_filename(archive_path)}_{archive_hash}.json"
+    )
+
+
+def _read_sidecar(sidecar_path: AnyPathType, size: int, mtime: float) -> list | None:
+    """Read the members stored in a sidecar file, if existing and still valid (same archive size and modification time)"""
+    try:
+        with open(sidecar_path) as sidecar:
+            index = json.load(sidecar)
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+
+    if (
+        index.get("version") == ARCHIVE_INDEX_VERSION
+        and index.get("size") == size
+        and index.get("mtime") == mtime
+    ):
+        return index.get("members")
+    return None
+
+
+def _write_sidecar(sidecar_path: AnyPathType, index: dict) -> None:
+    """Write a sidecar file atomically (as several processes may index the same archive)"""
+    try:
+        os.makedirs(str(sidecar_path.parent), exist_ok=True)
+        tmp_path = f"{sidecar_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as tmp_file:
+            json.dump(index, tmp_file)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as exc:
+        LOGGER.debug(f"Impossible to write the archive index {sidecar_path}: {exc}")
+
+
+def load_archive_index(archive_path: AnyPathStrType) -> ArchiveIndex:
+    """
+    Load the index of an archive from its sidecar file if it is still valid
+    (same size and modification time of the archive), else build it and write the sidecar file.
+
+    Args:
+        archive_path (AnyPathStrType): Archive path
+
+    Returns:
+        ArchiveIndex: Archive index
+    """
+    archive_path = AnyPath(archive_path)
+    try:
+        stat = archive_path.stat()
+        size, mtime = stat.st_size, stat.st_mtime
+    except (OSError, AttributeError, NotImplementedError):
+        # No way to know if the archive has been modified: don't persist its index
+        return ArchiveIndex.build(archive_path)
+
+    sidecar_path = _get_sidecar_path(archive_path)
+    members = _read_sidecar(sidecar_path, size, mtime)
+    if members is not None:
+        return ArchiveIndex(archive_path, members)
+
+    archive_index = ArchiveIndex.build(archive_path)
+    _write_sidecar(sidecar_path, archive_index.to_dict(size, mtime))
+    return archive_index
+
+
+@lru_cache
+def _get_archive_index(archive_path: str) -> ArchiveIndex:
+    return load_archive_index(archive_path)
+
+
+def get_archive_index(archive_path: AnyPathStrType) -> ArchiveIndex:
+    """
+    Get the index of an archive (loaded only once per process).
+
+    Args:
+        archive_path (AnyPathStrType): Archive path
+
+    Returns:
+        ArchiveIndex: Archive index
+    """
+    with _LOCK:
+        return _get_archive_index(str(archive_path))
+
+
+def get_subfile_path(rio_path: AnyPathStrType) -> AnyPathStrType:
+    """
+    Convert the :code:`/vsitar/{tar_path}/{member}` path of an uncompressed member of a local tar archive
+    to its :code:`/vsisubfile/` path (see :py:meth:`ArchiveIndex.get_subfile_path`), to open it without scanning the tar headers.
+
+    Any other path is returned as is.
+
+    Args:
+        rio_path (AnyPathStrType): Path to be opened with rasterio
+
+    Returns:
+        AnyPathStrType: Path to open
+    """
+    match = _VSITAR_REGEX.match(rio_path) if isinstance(rio_path, str) else None
+    if match is None:
+        return rio_path
+
+    tar_path, name = match.groups()
+    subfile_path = get_archive_index(tar_path).get_subfile_path(name)
+    return subfile_path if subfile_path is not None else rio_path
@@ -64,6 +64,10 @@ from eoreader.bands.band_names import DEM, HILLSHADE, SLOPE, DemBandNames
 
 __all__ += ["DemBandNames", "DEM", "SLOPE", "HILLSHADE"]
 
+from eoreader.bands.band_names import SAA, SZA, VAA, VZA, AngleBandNames
+
+__all__ += ["AngleBandNames", "SZA", "SAA", "VZA", "VAA"]
+
 from eoreader.bands.band_names import (
     MaskBandNames,
     DimapV2MaskBandNames,
@@ -90,7 +94,6 @@ from eoreader.bands.indices import (
     get_all_needed_bands,
     get_needed_bands,
     is_index,
-    NEEDED_BANDS,
     TCBRI,
     TCGRE,
     TCWET,
@@ -257,12 +260,16 @@ __all__ += [
     "is_sat_band",
     "is_clouds",
     "is_dem",
+    "is_angle",
     "is_mask",
     "is_s2_l2a_specific_band",
     "to_band",
     "to_str",
 ]
 
+import functools as _functools
+from types import MappingProxyType as _MappingProxyType
+
 from eoreader.exceptions import InvalidTypeError as _ite
 
 BandType = (
@@ -273,6 +280,89 @@ BandType = (
 BandsType = list | BandType
 """ EOReader bands type, either a list or a BandType. """
 
+_MASK_BAND_NAMES = (
+    DimapV2MaskBandNames,
+    HlsMaskBandNames,
+    LandsatMaskBandNames,
+    PlanetMaskBandNames,
+    S2MaskBandNames,
+    S2TheiaMaskBandNames,
+    VenusMaskBandNames,
+)
+
+_BAND_NAMES = (
+    SarBandNames,
+    SpectralBandNames,
+    DemBandNames,
+    AngleBandNames,
+    CloudsBandNames,
+    DimapV2MaskBandNames,
+    HlsMaskBandNames,
+    LandsatMaskBandNames,
+    PlanetMaskBandNames,
+    S2MaskBandNames,
+    S2TheiaMaskBandNames,
+    Sentinel2L2ABands,
+)
+""" Band names that can be converted from a string by :code:`to_band`, by order of priority """
+
+
+@_functools.cache
+def _get_band_registry() -> _MappingProxyType:
+    """
+    Get the frozen registry of the band names, mapping every band value and name to its band (computed only once).
+
+    The first band names class (in :code:`_BAND_NAMES` order) knowing a string wins, and for each class the values come before the names,
+    as :code:`ListEnum.convert_from` does.
+
+    Returns:
+        MappingProxyType: Band registry {value or name: band}
+    """
+    registry = {}
+    for band_names in _BAND_NAMES:
+        for band in band_names:
+            registry.setdefault(band.value, band)
+        for band in band_names:
+            registry.setdefault(band.name, band)
+
+    return _MappingProxyType(registry)
+
+
+@_functools.cache
+def _get_band_values(band_names: tuple) -> frozenset:
+    """
+    Get the values of some band names classes (computed only once).
+
+    Args:
+        band_names (tuple): Band names classes
+
+    Returns:
+        frozenset: Values of these band names
+    """
+    return frozenset(band.value for bn in band_names for band in bn)
+
+
+def _is_band_of(band: BandType, *band_names) -> bool:
+    """
+    Returns True if the band is a member (or the value of a member) of one of the given band names classes,
+    in constant time (same as trying :code:`band_names(band)` for every class).
+
+    Args:
+        band (BandType): Anything that could be a band
+        *band_names: Band names classes
+
+    Returns:
+        bool: True if the band belongs to one of the given classes
+    """
+    if isinstance(band, band_names):
+        return True
+
+    try:
+        return band in _get_band_values(band_names)
+    except TypeError:
+        # Unhashable
+        return False
+
 
 def is_spectral_band(band: BandType) -> bool:
     """
@@ -300,12 +390,7 @@ def is_spectral_band(band: BandType) -> bool:
         False
 
     """
-    is_valid = True
-    try:
-        SpectralBandNames(band)
-    except ValueError:
-        is_valid = False
-    return is_valid
+    return _is_band_of(band, SpectralBandNames)
 
 
 def is_thermal_band(band: BandType) -> bool:
@@ -365,12 +450,7 @@ def is_sar_band(band: BandType) -> bool:
         False
 
     """
-    is_valid = True
-    try:
-        SarBandNames(band)
-    except ValueError:
-        is_valid = False
-    return is_valid
+    return _is_band_of(band, SarBandNames)
 
 
 def is_sat_band(band: BandType) -> bool:
@@ -428,12 +508,7 @@ def is_clouds(clouds: BandType) -> bool:
         True
 
     """
-    is_valid = True
-    try:
-        CloudsBandNames(clouds)
-    except ValueError:
-        is_valid = False
-    return is_valid
+    return _is_band_of(clouds, CloudsBandNames)
 
 
 def is_dem(dem: BandType) -> bool:
@@ -461,12 +536,33 @@ def is_dem(dem: BandType) -> bool:
         >>> is_dem(CLOUDS)
         False
     """
-    is_valid = True
-    try:
-        DemBandNames(dem)
-    except ValueError:
-        is_valid = False
-    return is_valid
+    return _is_band_of(dem, DemBandNames)
+
+
+def is_angle(angle: BandType) -> bool:
+    """
+    Returns True if is an angle band (from :code:`AngleBandNames`)
+
+    Args:
+        angle (BandType): Anything that could be an angle band
+
+    Returns:
+        bool: True if the band asked is an angle band
+
+    Examples:
+
+        >>> from eoreader.bands import NDVI, GREEN, SZA, SLOPE
+        >>>
+        >>> is_angle(NDVI)
+        False
+        >>> is_angle(GREEN)
+        False
+        >>> is_angle(SLOPE)
+        False
+        >>> is_angle(SZA)
+        True
+    """
+    return _is_band_of(angle, AngleBandNames)
 
 
 def is_mask(mask: BandType) -> bool:
@@ -496,26 +592,7 @@ def is_mask(mask: BandType) -> bool:
         >>> is_mask(CLDPRB)
         True
     """
-    import contextlib
-
-    is_valid = False
-
-    mask_classes = [
-        DimapV2MaskBandNames,
-        HlsMaskBandNames,
-        LandsatMaskBandNames,
-        PlanetMaskBandNames,
-        S2MaskBandNames,
-        S2TheiaMaskBandNames,
-        VenusMaskBandNames,
-    ]
-
-    for mask_class in mask_classes:
-        with contextlib.suppress(ValueError):
-            mask_class(mask)
-            is_valid = True
-
-    return is_valid
+    return _is_band_of(mask, *_MASK_BAND_NAMES)
 
 
 def is_s2_l2a_specific_band(band: BandType) -> bool:
@@ -545,12 +622,7 @@ def is_s2_l2a_specific_band(band: BandType) -> bool:
         >>> is_s2_l2a_specific_band(AOT)
         True
     """
-    is_valid = True
-    try:
-        Sentinel2L2ABands(band)
-    except ValueError:
-        is_valid = False
-    return is_valid
+    return _is_band_of(band, Sentinel2L2ABands)
 
 
 def to_band(
@@ -590,36 +662,18 @@ def to_band(
         # Try legit types
         if isinstance(tc, str):
             # Try index
-            if tc in get_all_index_names():
+            if is_index(tc):
                 from eoreader.bands import indices
 
                 band_or_idx = getattr(indices, tc)
             else:
-                band_names = [
-                    SarBandNames,
-                    SpectralBandNames,
-                    DemBandNames,
-                    CloudsBandNames,
-                    DimapV2MaskBandNames,
-                    HlsMaskBandNames,
-                    LandsatMaskBandNames,
-                    PlanetMaskBandNames,
-                    S2MaskBandNames,
-                    S2TheiaMaskBandNames,
-                    Sentinel2L2ABands,
-                ]
-
-                for bn in band_names:
-                    try:
-                        band_or_idx = bn.convert_from(tc)[0]
-                        break
-                    except TypeError:
-                        pass
+                band_or_idx = _get_band_registry().get(tc)
 
         elif (
             is_index(tc)
             or is_sat_band(tc)
             or is_dem(tc)
+            or is_angle(tc)
             or is_clouds(tc)
             or is_mask(tc)
             or is_s2_l2a_specific_band(tc)
@@ -687,3 +741,13 @@ def to_str(to_convert: list[BandType] | BandType, as_list: bool = True) -> list
             raise _ite(f"Set as_list=True (default) for list arguments")
 
         return __convert_to_str(to_convert)
+
+
+def __getattr__(name: str):
+    """Get :code:`NEEDED_BANDS` from the indices only when it is asked (and not at import time)"""
+    if name == "NEEDED_BANDS":
+        from eoreader.bands import indices
+
+        return indices.NEEDED_BANDS
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
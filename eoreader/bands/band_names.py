@@ -566,6 +566,31 @@ SLOPE = DemBandNames.SLOPE
 HILLSHADE = DemBandNames.HILLSHADE
 
 
+class AngleBandNames(BandNames):
+    """
+    Per-pixel acquisition angle band names (in degrees),
+    interpolated from the angle grids given by the products
+    """
+
+    SZA = "SZA"
+    """ Sun Zenith Angle """
+
+    SAA = "SAA"
+    """ Sun Azimuth Angle """
+
+    VZA = "VZA"
+    """ Viewing Zenith Angle """
+
+    VAA = "VAA"
+    """ Viewing Azimuth Angle """
+
+
+SZA = AngleBandNames.SZA
+SAA = AngleBandNames.SAA
+VZA = AngleBandNames.VZA
+VAA = AngleBandNames.VAA
+
+
 class MaskBandNames(BandNames):
     """
     Mask Band names: Base class to make isinstance work
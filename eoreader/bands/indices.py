@@ -20,17 +20,19 @@ Set of usual spectral indices.
 """
 
 import contextlib
+import functools
 import inspect
 import logging
 import re
 import sys
+from collections import namedtuple
 from collections.abc import Callable
 from functools import wraps
+from types import MappingProxyType
 
 import numpy as np
 import spyndex
 import xarray as xr
-from sertit import rasters
 
 from eoreader import EOREADER_NAME
 from eoreader.bands.band_names import (
@@ -93,6 +95,9 @@ def _idx_fct(function: Callable) -> Callable:
         first_xda = list(bands.values())[0]
         out_xda = first_xda.copy(data=out_np)
 
+        # Import rasters here (long import)
+        from sertit import rasters
+
         out = rasters.set_metadata(out_xda, first_xda, new_name=str(function.__name__))
         return out
 
@@ -148,7 +153,7 @@ def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
         }
         index_arr = spyndex.computeIndex(idx_name, params)
     else:
-        index_arr = eval(index)(bands)
+        index_arr = _INDEX_REGISTRY.functions[index](bands)
 
     # TODO: check if metadata is kept with spyndex
 
@@ -156,6 +161,9 @@ def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
     first_xda = list(bands.values())[0]
     out_xda = first_xda.copy(data=index_arr)
 
+    # Import rasters here (long import)
+    from sertit import rasters
+
     return rasters.set_metadata(out_xda, first_xda, new_name=index)
 
 
@@ -253,6 +261,53 @@ def SCI(bands: dict) -> xr.DataArray:
     return 3 * bands[GREEN] - bands[RED] - 100
 
 
+IndexRegistry = namedtuple(
+    "IndexRegistry", ["spyndex", "eoreader", "names", "name_set", "functions"]
+)
+"""
+Registry of the available indices, built once at import time:
+
+- :code:`spyndex`: Spyndex index names (frozenset)
+- :code:`eoreader`: EOReader index names (frozenset)
+- :code:`names`: All index names, Spyndex first (tuple)
+- :code:`name_set`: All index names (frozenset)
+- :code:`functions`: EOReader index functions (read-only dict {name: function})
+"""
+
+
+def _build_index_registry() -> IndexRegistry:
+    """
+    Build the registry of the available indices, scanning this module once.
+
+    Returns:
+        IndexRegistry: Registry of the indices
+    """
+    spyndex_indices = tuple(spyndex.indices)
+
+    # Do not gather the other functions of this module (nor da.true_divide)
+    functions = {
+        name: fct
+        for name, fct in inspect.getmembers(
+            sys.modules[__name__], predicate=inspect.isfunction
+        )
+        if name[0].isupper()
+    }
+    eoreader_indices = list(functions)
+
+    # Add derivatives
+    for index, deriv_list in EOREADER_DERIVATIVES.items():
+        if hasattr(spyndex.indices, deriv_list[0]):
+            eoreader_indices.append(index)
+
+    return IndexRegistry(
+        spyndex=frozenset(spyndex_indices),
+        eoreader=frozenset(eoreader_indices),
+        names=spyndex_indices + tuple(eoreader_indices),
+        name_set=frozenset(spyndex_indices + tuple(eoreader_indices)),
+        functions=MappingProxyType(functions),
+    )
+
+
 def get_all_index_names() -> list:
     """
     Get all index names contained in this file
@@ -267,7 +322,7 @@ def get_all_index_names() -> list:
         list: Index names
 
     """
-    return get_spyndex_indices() + get_eoreader_indices()
+    return list(_INDEX_REGISTRY.names)
 
 
 def get_eoreader_indices() -> list:
@@ -277,21 +332,9 @@ def get_eoreader_indices() -> list:
     Returns:
         list: list of all EOReader indices
     """
-    eoreader_indices = []
-
-    functions = inspect.getmembers(sys.modules[__name__], predicate=inspect.isfunction)
-
-    for name, fct in functions:
-        # Do not gather this fct nor da.true_divide
-        if name[0].isupper():
-            eoreader_indices.append(fct.__name__)
-
-    # Add derivatives
-    for index, deriv_list in EOREADER_DERIVATIVES.items():
-        if hasattr(spyndex.indices, deriv_list[0]):
-            eoreader_indices.append(index)
-
-    return eoreader_indices
+    return [
+        index for index in _INDEX_REGISTRY.names if index in _INDEX_REGISTRY.eoreader
+    ]
 
 
 def get_spyndex_indices() -> list:
@@ -301,7 +344,9 @@ def get_spyndex_indices() -> list:
     Returns:
         list: list of all Spyndex indices
     """
-    return list(spyndex.indices)
+    return [
+        index for index in _INDEX_REGISTRY.names if index in _INDEX_REGISTRY.spyndex
+    ]
 
 
 def is_eoreader_idx(index: str) -> bool:
@@ -314,7 +359,7 @@ def is_eoreader_idx(index: str) -> bool:
     Returns:
         bool: True if the string is an EOReader index
     """
-    return index in get_eoreader_indices()
+    return index in _INDEX_REGISTRY.eoreader
 
 
 def is_spyndex_idx(index: str) -> bool:
@@ -327,11 +372,7 @@ def is_spyndex_idx(index: str) -> bool:
     Returns:
         bool: True if the string is a Spyndex index
     """
-    return index in get_spyndex_indices()
-
-
-# Check that no EOReader index name shadows Spyndex indices
-assert not any(is_spyndex_idx(alias) for alias in EOREADER_DERIVATIVES)
+    return index in _INDEX_REGISTRY.spyndex
 
 
 def get_needed_bands(index: str) -> list:
@@ -346,27 +387,39 @@ def get_needed_bands(index: str) -> list:
     Returns:
         list: Needed bands for the index function
     """
+    return list(_get_needed_bands(index))
+
+
+@functools.cache
+def _get_needed_bands(index: str) -> tuple:
+    """
+    Gather (only once) all the needed bands for the specified index function
+
+    Returns:
+        tuple: Needed bands for the index function
+    """
     if is_eoreader_idx(index):
         if index in EOREADER_DERIVATIVES:
-            return list(EOREADER_DERIVATIVES[index][1].values())
+            return tuple(EOREADER_DERIVATIVES[index][1].values())
         else:
             # Get source code from this fct
-            code = inspect.getsource(eval(index))
+            code = inspect.getsource(_INDEX_REGISTRY.functions[index])
 
-            # Parse band's signature
-            b_regex = r"spb\.\w+"
+            # Parse band's signature (i.e. bands[GREEN])
+            b_regex = r"bands\[(\w+)\]"
 
-            return [
-                getattr(SpectralBandNames, b.split(".")[-1])
-                for b in re.findall(b_regex, code)
-            ]
+            return tuple(
+                dict.fromkeys(
+                    getattr(SpectralBandNames, b) for b in re.findall(b_regex, code)
+                )
+            )
     elif is_spyndex_idx(index):
         # Don't need gamma etc.
-        return [
+        return tuple(
             SPYNDEX_TO_EOREADER_DICT.get(band)
             for band in getattr(spyndex.indices, index).bands
             if SPYNDEX_TO_EOREADER_DICT.get(band) is not None
-        ]
+        )
     else:
         raise NotImplementedError(
             f"Non existing index, please chose a spectral indice among {get_all_index_names()}"
@@ -426,10 +479,29 @@ def is_index(index) -> bool:
         bool: True if the index asked is an index function (such as :code:`index.NDVI`)
 
     """
-    return str(index) in get_all_index_names()
+    return str(index) in _INDEX_REGISTRY.name_set
+
+
+# Build the registry once every index function is defined (and before their names are set as strings below)
+_INDEX_REGISTRY = _build_index_registry()
+
+# Check that no EOReader index name shadows Spyndex indices
+assert not any(is_spyndex_idx(alias) for alias in EOREADER_DERIVATIVES)
+
+
+@functools.cache
+def _get_needed_bands_dict() -> dict:
+    """Needed bands for all index functions, computed once (see :py:func:`get_all_needed_bands`)"""
+    return get_all_needed_bands()
+
+
+def __getattr__(name: str):
+    """Compute :code:`NEEDED_BANDS` only when it is asked (and not at import time)"""
+    if name == "NEEDED_BANDS":
+        return _get_needed_bands_dict()
 
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-NEEDED_BANDS = get_all_needed_bands()
 
 # Set all indices
 for _idx in get_all_index_names():
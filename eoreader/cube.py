@@ -0,0 +1,335 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Time series cube of many products, loaded on a common grid.
+
+The reads are planned before loading anything: the common grid (CRS, pixel size and bounds) is computed once,
+the products not intersecting it are discarded and each product only reads the windows covering the grid.
+
+The cube is returned lazily, as a dask-backed :code:`xr.DataArray` with a :code:`time` dimension,
+chunked by time (one product per chunk) and by space (see :code:`EOREADER_TILE_SIZE`):
+each chunk is loaded (only reading the window of the product covering the chunk, and reprojecting it on the common grid)
+by one dask task, in the process computing the cube, so that the products are read in parallel by the dask workers
+and share the caches of this process (DEM tiles, archive indices, STAC assets, opened files...).
+Computing a spatial subset of the cube only reads the products on this subset, and the reductions along the time dimension
+stream the products instead of loading them all at once.
+"""
+
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import xarray as xr
+from rasterio import transform
+from rasterio.crs import CRS
+from rasterio.enums import Resampling
+from shapely.geometry import box
+
+from eoreader import EOREADER_NAME
+from eoreader.bands import to_str
+from eoreader.product_pool import get_reader
+from eoreader.utils import DEFAULT_TILE_SIZE, get_default_chunks
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+WINDOW_MARGIN = 2
+"""Margin (in pixels of the cube) added to the window read in each product, to avoid edge effects when resampling"""
+
+
+def _open_products(products: Iterable, workers: int) -> list:
+    """
+    Open the products given as paths (concurrently).
+
+    Args:
+        products (Iterable): Products or product paths
+        workers (int): Number of threads
+
+    Returns:
+        list: Products (the ones that are not recognized are skipped, with a warning)
+    """
+    from eoreader.products import Product
+
+    def _open(prod):
+        return prod if isinstance(prod, Product) else get_reader().open(prod)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [prod for prod in executor.map(_open, products) if prod is not None]
+
+
+def _get_grid(
+    products: list,
+    pixel_size: float = None,
+    crs=None,
+    bounds=None,
+) -> tuple:
+    """
+    Plan the common grid of the cube.
+
+    Args:
+        products (list): Products
+        pixel_size (float): Pixel size of the cube (the one of the first product if not given)
+        crs: CRS of the cube (the one of the first product if not given)
+        bounds: Bounds of the cube (in its CRS) or GeoDataFrame (the union of the footprints of the products if not given)
+
+    Returns:
+        tuple: CRS, transform and shape (height, width) of the cube
+    """
+    # Import geopandas here (long import)
+    import geopandas as gpd
+    import pandas as pd
+
+    crs = CRS.from_user_input(crs) if crs is not None else products[0].crs()
+    if pixel_size is None:
+        pixel_size = products[0].pixel_size
+
+    if bounds is None:
+        bounds = (
+            pd.concat([prod.footprint().to_crs(crs) for prod in products])
+            .union_all()
+            .bounds
+        )
+    elif isinstance(bounds, (gpd.GeoDataFrame, gpd.GeoSeries)):
+        bounds = bounds.to_crs(crs).total_bounds
+
+    # Align the grid on the pixel size
+    left, bottom, right, top = bounds
+    left = np.floor(left / pixel_size) * pixel_size
+    bottom = np.floor(bottom / pixel_size) * pixel_size
+    right = np.ceil(right / pixel_size) * pixel_size
+    top = np.ceil(top / pixel_size) * pixel_size
+
+    dst_tr = transform.from_origin(left, top, pixel_size, pixel_size)
+    shape = (
+        int(round((top - bottom) / pixel_size)),
+        int(round((right - left) / pixel_size)),
+    )
+    return crs, dst_tr, shape
+
+
+def _load_on_grid(
+    prod,
+    bands: list,
+    pixel_size: float,
+    footprint,
+    crs: CRS,
+    dst_tr: transform.Affine,
+    resampling: Resampling,
+    block_info: dict = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Load the bands of a product on a block of the grid of the cube (reprojecting them).
+
+    Only the window covering the block is read in the product.
+
+    Args:
+        prod (Product): Product
+        bands (list): Bands to load
+        pixel_size (float): Pixel size used to load the bands
+        footprint: Footprint of the product (in the CRS of the cube)
+        crs (CRS): CRS of the cube
+        dst_tr (transform.Affine): Transform of the cube
+        resampling (Resampling): Resampling method
+        block_info (dict): Location of the block in the grid (given by :code:`dask.array.map_blocks`)
+        **kwargs: Other arguments passed to :code:`load()`
+
+    Returns:
+        np.ndarray: Bands on the block of the grid of the cube, with shape (bands, height, width)
+    """
+    # Import geopandas here (long import)
+    import geopandas as gpd
+
+    (_, _), (row_start, row_stop), (col_start, col_stop) = block_info[None][
+        "array-location"
+    ]
+    shape = (row_stop - row_start, col_stop - col_start)
+    block_tr = dst_tr * transform.Affine.translation(col_start, row_start)
+    block_box = box(*transform.array_bounds(*shape, block_tr))
+
+    # Don't load anything if the product doesn't cover this block
+    if not footprint.intersects(block_box):
+        return np.full((len(bands), *shape), np.nan, dtype=np.float32)
+
+    LOGGER.debug(
+        f"Loading {prod.condensed_name} on the cube grid (rows {row_start}-{row_stop}, columns {col_start}-{col_stop})"
+    )
+    window = gpd.GeoDataFrame(
+        geometry=[block_box.buffer(WINDOW_MARGIN * dst_tr.a)], crs=crs
+    )
+    prod_bands = prod.to_band(bands)
+    band_xds = prod.load(prod_bands, pixel_size=pixel_size, window=window, **kwargs)
+
+    arrays = []
+    for band in prod_bands:
+        band_xda = band_xds[band].rio.write_nodata(np.nan, encoded=False)
+        band_xda = band_xda.rio.reproject(
+            crs,
+            transform=block_tr,
+            shape=shape,
+            resampling=resampling,
+            nodata=np.nan,
+        )
+        arrays.append(np.asarray(band_xda.data[0], dtype=np.float32))
+
+    return np.stack(arrays)
+
+
+def load(
+    products: Iterable,
+    bands: list,
+    pixel_size: float = None,
+    crs=None,
+    bounds=None,
+    resampling: Resampling = Resampling.bilinear,
+    workers: int = 8,
+    **kwargs,
+) -> xr.DataArray:
+    """
+    Load a time series cube of many products on a common grid, lazily.
+
+    The products not intersecting the bounds are discarded.
+    Each product is loaded by one dask task per spatial block of the grid (computed when the cube is computed),
+    reading only the window covering the block and sharing the caches of the computing process.
+
+    .. code-block:: python
+
+        >>> from eoreader import cube
+        >>> from eoreader.bands import NDVI, RED
+        >>> paths = Path("/archive").glob("S2*.zip")
+        >>> cube_xda = cube.load(paths, [RED, NDVI], pixel_size=20, bounds=aoi)
+        >>> cube_xda.sel(band="NDVI").median(dim="time").compute()
+
+    Args:
+        products (Iterable): Products or product paths
+        bands (list): Bands to load (they should be available in every product)
+        pixel_size (float): Pixel size of the cube (the one of the first product if not given)
+        crs: CRS of the cube (the one of the first product if not given)
+        bounds: Bounds of the cube (in its CRS) or GeoDataFrame (the union of the footprints of the products if not given)
+        resampling (Resampling): Resampling method used to reproject the products on the grid
+        workers (int): Number of threads used to open and plan the products
+        **kwargs: Other arguments passed to :code:`load()` (i.e. :code:`clean_optical`)
+
+    Returns:
+        xr.DataArray: Cube with the dimensions (time, band, y, x), sorted by time
+    """
+    # Import dask here (long import)
+    import dask.array as da
+    from dask.array.core import normalize_chunks
+    from dask.base import tokenize
+
+    if not isinstance(bands, list):
+        bands = [bands]
+
+    products = _open_products(products, workers)
+    if not products:
+        raise ValueError("No product to load in the cube.")
+
+    # Plan the grid
+    crs, dst_tr, shape = _get_grid(products, pixel_size, crs, bounds)
+    grid_pixel_size = dst_tr.a
+    left, top = dst_tr.c, dst_tr.f
+    grid_box = box(
+        left,
+        top - shape[0] * grid_pixel_size,
+        left + shape[1] * grid_pixel_size,
+        top,
+    )
+
+    # Plan the reads: only the products intersecting the grid
+    def _get_footprint(prod):
+        return prod.footprint().to_crs(crs).union_all()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        footprints = list(executor.map(_get_footprint, products))
+
+    discarded = [
+        prod.condensed_name
+        for prod, footprint in zip(products, footprints, strict=True)
+        if not footprint.intersects(grid_box)
+    ]
+    if discarded:
+        LOGGER.debug(f"Products not intersecting the cube: {discarded}")
+
+    planned = sorted(
+        [
+            (prod, footprint)
+            for prod, footprint in zip(products, footprints, strict=True)
+            if footprint.intersects(grid_box)
+        ],
+        key=lambda planned_prod: planned_prod[0].datetime,
+    )
+    if not planned:
+        raise ValueError("No product intersects the bounds of the cube.")
+    products = [prod for prod, _ in planned]
+
+    LOGGER.info(
+        f"Loading a cube of {len(products)} products ({shape[1]} x {shape[0]} pixels, {len(bands)} bands)"
+    )
+
+    # Chunk by time and space, so that the reductions along time stream the products
+    chunks = get_default_chunks()
+    tile_size = chunks["x"] if isinstance(chunks, dict) else DEFAULT_TILE_SIZE
+    block_chunks = (
+        (len(bands),),
+        normalize_chunks(tile_size, (shape[0],))[0],
+        normalize_chunks(tile_size, (shape[1],))[0],
+    )
+
+    # One task per product and spatial block, named explicitly (don't hash the products)
+    # but unique for each grid, so that different cubes of the same products can be computed together
+    grid_token = tokenize(crs, dst_tr, shape, bands, resampling, kwargs)
+    band_names = to_str(bands)
+    arrays = [
+        da.map_blocks(
+            _load_on_grid,
+            prod,
+            bands,
+            grid_pixel_size,
+            footprint,
+            crs,
+            dst_tr,
+            resampling,
+            chunks=block_chunks,
+            dtype=np.float32,
+            meta=np.array((), dtype=np.float32),
+            name=f"eoreader-cube-{prod.condensed_name}-{idx}-{grid_token}",
+            **kwargs,
+        )
+        for idx, (prod, footprint) in enumerate(planned)
+    ]
+    cube_arr = da.stack(arrays)
+
+    # Coordinates of the pixel centers
+    x_coords = left + (np.arange(shape[1]) + 0.5) * grid_pixel_size
+    y_coords = top - (np.arange(shape[0]) + 0.5) * grid_pixel_size
+
+    cube_xda = xr.DataArray(
+        cube_arr,
+        dims=["time", "band", "y", "x"],
+        coords={
+            "time": [np.datetime64(prod.datetime, "ns") for prod in products],
+            "band": band_names,
+            "y": y_coords,
+            "x": x_coords,
+            "condensed_name": ("time", [prod.condensed_name for prod in products]),
+            "constellation": ("time", [prod.constellation_id for prod in products]),
+        },
+        name="cube",
+    )
+    cube_xda = cube_xda.rio.write_crs(crs)
+    cube_xda = cube_xda.rio.write_transform(dst_tr)
+    return cube_xda.rio.write_nodata(np.nan, encoded=False)
@@ -0,0 +1,550 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Local cache of remote DEM tiles, shared between products (and processes).
+
+Remote DEMs (URLs, cloud-stored or :code:`/vsi` files) are split into tiles aligned on their own pixel grid.
+The tiles covering a product are downloaded once into :py:const:`eoreader.env_vars.DEM_CACHE_DIR`
+and mosaicked in a small VRT used instead of the remote DEM, so that products over the same area don't fetch the same DEM blocks again.
+
+The georeferencing of the DEM is stored along with its tiles, so that a cache hit doesn't open the remote DEM at all.
+
+The cache is bounded by :py:const:`eoreader.env_vars.DEM_CACHE_MAX_SIZE`, the least recently used tiles being evicted first.
+The tiles are written atomically, so that several threads or processes can populate the cache at the same time,
+and the eviction is done under an exclusive lock of the cache (the other processes holding a shared lock while getting their tiles).
+The recently used tiles are never evicted, as they can still be read by the (lazily loaded) warped DEMs of other processes.
+
+The exogenous data is cached the same way.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from xml.sax.saxutils import escape
+
+import numpy as np
+import rasterio
+from rasterio import dtypes, warp, windows
+from rasterio.crs import CRS
+from rasterio.transform import Affine
+from rasterio.windows import Window
+from sertit import AnyPath, path
+from sertit.types import AnyPathStrType, AnyPathType
+
+from eoreader import EOREADER_NAME, remote_io
+from eoreader.env_vars import DEM_CACHE_DIR, DEM_CACHE_MAX_SIZE
+from eoreader.file_lock import file_lock
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+DEFAULT_DEM_CACHE_MAX_SIZE = 2048
+"""Default maximum size of the DEM cache (in MB)"""
+
+DEM_TILE_SIZE = 1024
+"""Size of the cached DEM tiles (in pixels)"""
+
+DEM_MARGIN = 16
+"""Margin added around the wanted bounds (in DEM pixels), to allow the resampling of the border pixels"""
+
+DEM_TILE_MIN_AGE = 600
+"""Minimum time (in seconds) since the last use of a tile before it can be evicted (it may still be read by a warped DEM)"""
+
+DEM_CACHE_LOCK = ".lock"
+"""Lock file of the DEM cache (in the cache directory)"""
+
+DEM_INFO = "dem_info.json"
+"""File storing the georeferencing of a DEM (in the directory of its tiles)"""
+
+_LOCK = threading.Lock()
+_TILE_LOCKS = {}
+_DEM_INFOS = {}
+
+
+def get_dem_cache_dir() -> AnyPathType:
+    """
+    Get the directory where the DEM tiles are cached:
+    the one given by :code:`EOREADER_DEM_CACHE_DIR` if set, else a folder in the temporary directory.
+
+    Returns:
+        AnyPathType: DEM cache directory
+    """
+    return AnyPath(
+        os.environ.get(
+            DEM_CACHE_DIR, os.path.join(tempfile.gettempdir(), "eoreader_dem_cache")
+        )
+    )
+
+
+def get_dem_cache_max_size() -> int:
+    """
+    Get the maximum size of the DEM cache (in bytes), given by :code:`EOREADER_DEM_CACHE_MAX_SIZE` (in MB).
+
+    Returns:
+        int: Maximum size of the DEM cache (0 if the cache is disabled)
+    """
+    try:
+        max_size = float(os.getenv(DEM_CACHE_MAX_SIZE, DEFAULT_DEM_CACHE_MAX_SIZE))
+    except ValueError:
+        max_size = DEFAULT_DEM_CACHE_MAX_SIZE
+
+    return max(int(max_size * 1024**2), 0)
+
+
+def is_remote(dem_path: AnyPathStrType) -> bool:
+    """
+    Is the DEM remote (URL, cloud-stored or :code:`/vsi` file)?
+
+    Args:
+        dem_path (AnyPathStrType): DEM path
+
+    Returns:
+        bool: True if the DEM is remote
+    """
+    return remote_io.is_remote_path(dem_path)
+
+
+def _vrt_covers_tile(vrt_name: str, tile_name: str) -> bool:
+    """
+    Does the VRT (named :code:`{tile_size}_{row_off}_{col_off}_{height}_{width}.vrt`)
+    mosaic the tile (named :code:`{tile_size}_{row}_{col}.tif`)?
+    """
+    try:
+        tile_size, row_off, col_off, height, width = (
+            int(val) for val in vrt_name.removesuffix(".vrt").split("_")
+        )
+        tile_tile_size, row, col = (
+            int(val) for val in tile_name.removesuffix(".tif").split("_")
+        )
+    except ValueError:
+        return False
+
+    return (
+        tile_size == tile_tile_size
+        and row_off <= row * tile_size < row_off + height
+        and col_off <= col * tile_size < col_off + width
+    )
+
+
+class DemInfo:
+    """Georeferencing of a DEM (the attributes of its opened dataset needed to cache its tiles)"""
+
+    def __init__(
+        self,
+        crs: CRS | None,
+        transform: Affine,
+        width: int,
+        height: int,
+        dtypes: tuple,
+        nodata: float | None,
+    ) -> None:
+        self.crs = crs
+        """CRS"""
+
+        self.transform = transform
+        """Transform"""
+
+        self.width = width
+        """Width (in pixels)"""
+
+        self.height = height
+        """Height (in pixels)"""
+
+        self.dtypes = tuple(dtypes)
+        """Data types of the bands"""
+
+        self.nodata = nodata
+        """Nodata value"""
+
+    @classmethod
+    def from_dataset(cls, dem_ds) -> "DemInfo":
+        """Get the georeferencing of an opened DEM"""
+        return cls(
+            dem_ds.crs,
+            dem_ds.transform,
+            dem_ds.width,
+            dem_ds.height,
+            dem_ds.dtypes,
+            dem_ds.nodata,
+        )
+
+    @classmethod
+    def from_dict(cls, info: dict) -> "DemInfo":
+        """Get the georeferencing from its dictionary (see :py:meth:`to_dict`)"""
+        return cls(
+            CRS.from_wkt(info["crs"]) if info["crs"] else None,
+            Affine(*info["transform"]),
+            info["width"],
+            info["height"],
+            info["dtypes"],
+            info["nodata"],
+        )
+
+    def to_dict(self) -> dict:
+        """Convert the georeferencing to a dictionary (serializable in JSON)"""
+        return {
+            "crs": self.crs.to_wkt() if self.crs is not None else None,
+            "transform": list(self.transform)[:6],
+            "width": self.width,
+            "height": self.height,
+            "dtypes": list(self.dtypes),
+            "nodata": self.nodata,
+        }
+
+
+class DemTileCache:
+    """Cache of the tiles of one DEM"""
+
+    def __init__(
+        self,
+        dem_path: AnyPathStrType,
+        cache_dir: AnyPathStrType = None,
+        max_size: int = None,
+        tile_size: int = DEM_TILE_SIZE,
+        min_age: float = DEM_TILE_MIN_AGE,
+    ) -> None:
+        """
+        Args:
+            dem_path (AnyPathStrType): DEM path
+            cache_dir (AnyPathStrType): Cache directory (shared by every DEM). :py:func:`get_dem_cache_dir` if not given.
+            max_size (int): Maximum size of the cache directory (in bytes). :py:func:`get_dem_cache_max_size` if not given.
+            tile_size (int): Size of the tiles (in pixels)
+            min_age (float): Minimum time (in seconds) since the last use of a tile before it can be evicted
+        """
+        self.dem_path = str(dem_path)
+        self.cache_dir = str(cache_dir if cache_dir else get_dem_cache_dir())
+        self.max_size = max_size if max_size is not None else get_dem_cache_max_size()
+        self.tile_size = tile_size
+        self.min_age = min_age
+        self.lock_path = os.path.join(self.cache_dir, DEM_CACHE_LOCK)
+
+        dem_hash = hashlib.sha256(self.dem_path.encode()).hexdigest()[:16]
+        self.tile_dir = os.path.join(
+            self.cache_dir, f"{path.get_filename(self.dem_path)}_{dem_hash}"
+        )
+
+    def get_tile_window(self, bounds: tuple, crs: CRS, dem_ds) -> Window | None:
+        """
+        Get the window (aligned on the tiles) of the DEM covering the given bounds
+
+        Args:
+            bounds (tuple): Bounds (left, bottom, right, top)
+            crs (CRS): CRS of the bounds
+            dem_ds: Opened DEM (or its :py:class:`DemInfo`)
+
+        Returns:
+            Window | None: Window aligned on the tiles, None if the bounds don't intersect the DEM
+        """
+        if (
+            crs is not None
+            and dem_ds.crs is not None
+            and CRS.from_user_input(crs) != dem_ds.crs
+        ):
+            bounds = warp.transform_bounds(crs, dem_ds.crs, *bounds, densify_pts=21)
+
+        win = windows.from_bounds(*bounds, transform=dem_ds.transform)
+        col_start = max(int(np.floor(win.col_off)) - DEM_MARGIN, 0)
+        row_start = max(int(np.floor(win.row_off)) - DEM_MARGIN, 0)
+        col_stop = min(int(np.ceil(win.col_off + win.width)) + DEM_MARGIN, dem_ds.width)
+        row_stop = min(
+            int(np.ceil(win.row_off + win.height)) + DEM_MARGIN, dem_ds.height
+        )
+        if col_start >= col_stop or row_start >= row_stop:
+            return None
+
+        # Align on the tiles
+        col_start = col_start // self.tile_size * self.tile_size
+        row_start = row_start // self.tile_size * self.tile_size
+        col_stop = min(
+            int(np.ceil(col_stop / self.tile_size)) * self.tile_size, dem_ds.width
+        )
+        row_stop = min(
+            int(np.ceil(row_stop / self.tile_size)) * self.tile_size, dem_ds.height
+        )
+        return Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+    def get_dem_info(self) -> DemInfo:
+        """
+        Get the georeferencing of the DEM, stored along with its tiles (only opening the DEM the first time).
+
+        Returns:
+            DemInfo: Georeferencing of the DEM
+        """
+        with _LOCK:
+            dem_info = _DEM_INFOS.get(self.dem_path)
+        if dem_info is not None:
+            return dem_info
+
+        info_path = os.path.join(self.tile_dir, DEM_INFO)
+        with (
+            contextlib.suppress(OSError, ValueError, KeyError, TypeError),
+            open(info_path) as info_file,
+        ):
+            dem_info = DemInfo.from_dict(json.load(info_file))
+
+        if dem_info is None:
+            with rasterio.open(self.dem_path) as dem_ds:
+                dem_info = DemInfo.from_dataset(dem_ds)
+
+            # Write atomically, as other processes may read or write the same file
+            os.makedirs(self.tile_dir, exist_ok=True)
+            tmp_path = f"{info_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as info_file:
+                json.dump(dem_info.to_dict(), info_file)
+            os.replace(tmp_path, info_path)
+
+        with _LOCK:
+            _DEM_INFOS[self.dem_path] = dem_info
+        return dem_info
+
+    def _get_tile_path(self, row: int, col: int) -> str:
+        """Get the path of a tile"""
+        return os.path.join(self.tile_dir, f"{self.tile_size}_{row}_{col}.tif")
+
+    def _get_tile(self, dem_ds, row: int, col: int) -> tuple[str, bool]:
+        """Get a tile (downloading it if not already cached), and whether it has been downloaded"""
+        tile_path = self._get_tile_path(row, col)
+        downloaded = False
+
+        with _LOCK:
+            tile_lock = _TILE_LOCKS.setdefault(tile_path, threading.Lock())
+
+        with tile_lock:
+            if os.path.isfile(tile_path):
+                # Used recently
+                os.utime(tile_path)
+            else:
+                LOGGER.debug(f"Caching the DEM tile {row}/{col} of {self.dem_path}")
+                tile_win = Window(
+                    col * self.tile_size,
+                    row * self.tile_size,
+                    min(self.tile_size, dem_ds.width - col * self.tile_size),
+                    min(self.tile_size, dem_ds.height - row * self.tile_size),
+                )
+                profile = dem_ds.profile
+                profile.update(
+                    driver="GTiff",
+                    width=tile_win.width,
+                    height=tile_win.height,
+                    transform=windows.transform(tile_win, dem_ds.transform),
+                    tiled=True,
+                    blockxsize=256,
+                    blockysize=256,
+                    compress="deflate",
+                )
+
+                # Write atomically, as other processes may read or write the same tile
+                os.makedirs(self.tile_dir, exist_ok=True)
+                tmp_path = f"{tile_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with rasterio.open(tmp_path, "w", **profile) as tile_ds:
+                    tile_ds.write(dem_ds.read(window=tile_win))
+                os.replace(tmp_path, tile_path)
+                downloaded = True
+
+        return tile_path, downloaded
+
+    def _write_vrt(self, dem_info: DemInfo, tile_win: Window, tiles: dict) -> str:
+        """Write the VRT mosaicking the tiles covering the window"""
+        vrt_path = os.path.join(
+            self.tile_dir,
+            f"{self.tile_size}_{tile_win.row_off}_{tile_win.col_off}_{tile_win.height}_{tile_win.width}.vrt",
+        )
+        if os.path.isfile(vrt_path):
+            return vrt_path
+
+        geotransform = ", ".join(
+            f"{coeff!r}"
+            for coeff in windows.transform(tile_win, dem_info.transform).to_gdal()
+        )
+        srs = (
+            f"  <SRS>{escape(dem_info.crs.to_wkt())}</SRS>\n"
+            if dem_info.crs is not None
+            else ""
+        )
+        vrt = [
+            f'<VRTDataset rasterXSize="{tile_win.width}" rasterYSize="{tile_win.height}">\n'
+            f"{srs}"
+            f"  <GeoTransform>{geotransform}</GeoTransform>\n"
+        ]
+        for band_id, dtype in enumerate(dem_info.dtypes, start=1):
+            vrt.append(
+                f'  <VRTRasterBand dataType="{dtypes._gdal_typename(dtype)}" band="{band_id}">\n'
+            )
+            if dem_info.nodata is not None:
+                vrt.append(f"    <NoDataValue>{dem_info.nodata!r}</NoDataValue>\n")
+            for (row, col), tile_path in tiles.items():
+                tile_w = min(self.tile_size, dem_info.width - col * self.tile_size)
+                tile_h = min(self.tile_size, dem_info.height - row * self.tile_size)
+                vrt.append(
+                    "    <SimpleSource>\n"
+                    f'      <SourceFilename relativeToVRT="1">{os.path.basename(tile_path)}</SourceFilename>\n'
+                    f"      <SourceBand>{band_id}</SourceBand>\n"
+                    f'      <SrcRect xOff="0" yOff="0" xSize="{tile_w}" ySize="{tile_h}"/>\n'
+                    f'      <DstRect xOff="{col * self.tile_size - tile_win.col_off}" yOff="{row * self.tile_size - tile_win.row_off}" xSize="{tile_w}" ySize="{tile_h}"/>\n'
+                    "    </SimpleSource>\n"
+                )
+            vrt.append("  </VRTRasterBand>\n")
+        vrt.append("</VRTDataset>\n")
+
+        tmp_path = f"{vrt_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as vrt_file:
+            vrt_file.write("".join(vrt))
+        os.replace(tmp_path, vrt_path)
+
+        return vrt_path
+
+    def evict(self, keep: list = None) -> None:
+        """
+        Evict the least recently used tiles (of every DEM) until the cache fits its maximum size.
+
+        The tiles used in the last :code:`min_age` seconds are kept, as they may still be read by a warped DEM.
+        The VRTs mosaicking the evicted tiles are evicted too (they are written again by :py:meth:`get` when needed).
+
+        Args:
+            keep (list): Tiles not to evict (currently used)
+        """
+        keep = set(keep) if keep else set()
+
+        # Exclusive lock: no other process is getting its tiles
+        with file_lock(self.lock_path):
+            tiles = []
+            vrts = {}
+            for root, _, files in os.walk(self.cache_dir):
+                for file in files:
+                    if file.endswith(".vrt"):
+                        vrts.setdefault(root, []).append(file)
+                    elif file.endswith(".tif"):
+                        tile_path = os.path.join(root, file)
+                        try:
+                            stat = os.stat(tile_path)
+                        except OSError:
+                            continue
+                        tiles.append((stat.st_mtime, stat.st_size, tile_path))
+
+            cache_size = sum(size for _, size, _ in tiles)
+            min_mtime = time.time() - self.min_age
+            for mtime, size, tile_path in sorted(tiles):
+                if cache_size <= self.max_size:
+                    break
+                if tile_path in keep or mtime > min_mtime:
+                    continue
+                LOGGER.debug(f"Evicting the DEM tile {tile_path}")
+                try:
+                    os.remove(tile_path)
+                    cache_size -= size
+                except OSError:
+                    continue
+
+                tile_dir, tile_name = os.path.split(tile_path)
+                for vrt_name in vrts.get(tile_dir, []):
+                    if _vrt_covers_tile(vrt_name, tile_name):
+                        with contextlib.suppress(OSError):
+                            os.remove(os.path.join(tile_dir, vrt_name))
+
+    def get(self, bounds: tuple, crs: CRS = None) -> str:
+        """
+        Get a local VRT of the DEM tiles covering the given bounds (downloading the missing tiles).
+
+        Return the DEM path itself if the bounds don't intersect the DEM or if the tiles are too big for the cache.
+
+        Args:
+            bounds (tuple): Bounds (left, bottom, right, top)
+            crs (CRS): CRS of the bounds (the DEM's one if not given)
+
+        Returns:
+            str: Path of the DEM to use
+        """
+        dem_info = self.get_dem_info()
+        tile_win = self.get_tile_window(bounds, crs, dem_info)
+        if tile_win is None:
+            return self.dem_path
+
+        tiles_size = (
+            tile_win.width
+            * tile_win.height
+            * sum(np.dtype(dtype).itemsize for dtype in dem_info.dtypes)
+        )
+        if tiles_size > self.max_size / 2:
+            LOGGER.debug(
+                f"The DEM tiles needed ({tiles_size / 1024**2:.0f} MB) are too big for the DEM cache: reading {self.dem_path} directly."
+            )
+            return self.dem_path
+
+        tiles = {
+            (row, col): self._get_tile_path(row, col)
+            for row in range(
+                tile_win.row_off // self.tile_size,
+                (tile_win.row_off + tile_win.height - 1) // self.tile_size + 1,
+            )
+            for col in range(
+                tile_win.col_off // self.tile_size,
+                (tile_win.col_off + tile_win.width - 1) // self.tile_size + 1,
+            )
+        }
+
+        # Shared lock: the tiles cannot be evicted while getting them
+        downloaded = False
+        with file_lock(self.lock_path, shared=True):
+            missing = [
+                key for key, tile_path in tiles.items() if not os.path.isfile(tile_path)
+            ]
+
+            # Only open the remote DEM on a cache miss
+            if missing:
+                with rasterio.open(self.dem_path) as dem_ds:
+                    for row, col in missing:
+                        _, is_downloaded = self._get_tile(dem_ds, row, col)
+                        downloaded |= is_downloaded
+
+            # Used recently
+            for tile_path in tiles.values():
+                os.utime(tile_path)
+
+            vrt_path = self._write_vrt(dem_info, tile_win, tiles)
+
+        # The cache only grows when downloading tiles
+        if downloaded:
+            self.evict(keep=list(tiles.values()))
+        return vrt_path
+
+
+def get_cached_dem(dem_path: AnyPathStrType, bounds: tuple, crs: CRS = None) -> str:
+    """
+    Get a local copy of the remote DEM tiles covering the given bounds (see :py:class:`DemTileCache`).
+
+    Local DEMs are returned as is, as well as every DEM if the cache is disabled (:code:`EOREADER_DEM_CACHE_MAX_SIZE=0`)
+    or if the DEM cannot be cached (i.e. not georeferenced).
+
+    Args:
+        dem_path (AnyPathStrType): DEM path
+        bounds (tuple): Bounds (left, bottom, right, top)
+        crs (CRS): CRS of the bounds (the DEM's one if not given)
+
+    Returns:
+        str: Path of the DEM to use
+    """
+    if not is_remote(dem_path) or get_dem_cache_max_size() == 0:
+        return str(dem_path)
+
+    try:
+        return DemTileCache(dem_path).get(bounds, crs)
+    except (rasterio.errors.RasterioError, OSError, ValueError) as exc:
+        LOGGER.debug(f"Impossible to cache the tiles of {dem_path}: {exc}")
+        return str(dem_path)
@@ -51,6 +51,102 @@ If :code:`EOREADER_SNAP_DEM_NAME` is set to :code:`External DEM`,
 SNAP will use your DEM stored in :code:`EOREADER_DEM_PATH` as an external DEM.
 """
 
+DEM_CACHE_DIR = "EOREADER_DEM_CACHE_DIR"
+"""
+Environment variable for setting a directory where the tiles of the remote DEMs (and exogenous data) are cached.
+
+This directory can be shared between several products (and several processes):
+the DEM tiles covering a product are downloaded only once and reused by every product over the same area.
+
+If not set, the tiles are cached in a folder of the temporary directory.
+"""
+
+DEM_CACHE_MAX_SIZE = "EOREADER_DEM_CACHE_MAX_SIZE"
+"""
+Environment variable for setting the maximum size of the DEM cache, in MB (2048 by default).
+The least recently used tiles are evicted first. Set it to 0 to disable the DEM cache.
+"""
+
+SNAP_CACHE_DIR = "EOREADER_SNAP_CACHE_DIR"
+"""
+Environment variable for setting a directory where the SAR bands processed by SNAP are cached.
+
+This directory can be shared between several products (and several processes).
+The cached files are indexed by every parameter that could change their content (graph, DEM, pixel size, window...),
+so a modified setting will never reuse an outdated file.
+
+If not set, the SNAP outputs are indexed directly in the output directory of each product.
+"""
+
+SNAP_MAX_SWATH_WORKERS = "EOREADER_SNAP_MAX_SWATH_WORKERS"
+"""
+Environment variable for setting the maximum number of swaths processed concurrently by SNAP
+(for the multi-swath COSMO-SkyMed products, processed swath by swath with SNAP < 11.0.0).
+
+By default, it is bounded by the resources allowed to SNAP (at least 2 cores and 4 GB of memory per swath).
+These resources are split between the swaths processed concurrently.
+"""
+
+ARCHIVE_INDEX_DIR = "EOREADER_ARCHIVE_INDEX_DIR"
+"""
+Environment variable for setting a directory where the indices of the archived products are stored.
+
+The list of the members of an archive is computed only once and stored there (keyed by the size and modification time of the archive),
+so that other processes do not have to list the archive again.
+
+If not set, the indices are stored in a folder of the temporary directory.
+"""
+
+MTD_CACHE_DIR = "EOREADER_MTD_CACHE_DIR"
+"""
+Environment variable for setting a directory where the metadata extracted from the image files are stored
+(i.e. the attributes of the HDF5 files of the COSMO-SkyMed products missing their XML metadata file).
+
+The metadata is extracted only once and stored there (keyed by the size and modification time of the image file),
+so that other products and processes do not have to open the image file again.
+
+If not set, the metadata is stored in a folder of the temporary directory.
+"""
+
+REMOTE_IO_PROFILE = "EOREADER_REMOTE_IO_PROFILE"
+"""
+Environment variable for enabling the remote I/O profile (:code:`1` or :code:`true`, disabled by default),
+optimizing the reading of cloud-optimized data over HTTP (i.e. STAC products or cloud-stored products).
+
+When loading the bands of a remote product, it sets some GDAL configuration options (if not already set by the user),
+see :py:const:`eoreader.remote_io.REMOTE_GDAL_OPTIONS`: the ones used when reading the data are set process-wide (as the chunks are read lazily by the dask workers),
+the ones used when opening the files are set in a scoped :code:`rasterio.Env`.
+It also logs the number of HTTP requests and bytes read by each load (in debug).
+As the bands are loaded lazily, these statistics only cover the eager reads (i.e. opening the files):
+use :py:func:`eoreader.remote_io.track_remote_io` around the computation to track the reading of the data.
+"""
+
+STAC_MAX_CONCURRENCY = "EOREADER_STAC_MAX_CONCURRENCY"
+"""
+Environment variable for setting the maximum number of assets of a STAC product read concurrently (8 by default).
+"""
+
+STAC_CACHE_DIR = "EOREADER_STAC_CACHE_DIR"
+"""
+Environment variable for setting a directory where the small assets of the STAC products (metadata files) are cached.
+
+They are read only once and stored there (keyed by their href without the signing query parameters, such as SAS tokens),
+so that other products and processes do not have to download them again.
+The least recently used files are evicted once the cache exceeds 256 MB.
+
+If not set, the assets are cached in a folder of the temporary directory.
+"""
+
+STAC_VALIDATION = "EOREADER_STAC_VALIDATION"
+"""
+Environment variable for setting the default validation mode of the STAC Items created by EOReader,
+see :py:class:`eoreader.stac.stac_validation.ValidationMode`:
+
+- :code:`full`: validation by :code:`pystac`, downloading the schemas of the extensions
+- :code:`cached` (default): validation with the schemas cached on disk (see :py:const:`STAC_CACHE_DIR`) and the validators compiled once per process
+- :code:`off`: no validation
+"""
+
 S3_DB_URL_ROOT = "S3_DB_URL_ROOT"
 """Environment variable used for specify DB base url (e.g. :code:`https://s3.unistra.fr/bucket_name/`) """
 
@@ -0,0 +1,76 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Locks shared between processes, taken on lock files (with :code:`fcntl`, or :code:`msvcrt` on Windows).
+
+They protect the caches shared by several processes (i.e. the SNAP cache index or the DEM tiles) against concurrent modifications.
+"""
+
+import contextlib
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _lock(lock_file, shared: bool) -> None:
+    """Lock an opened file (blocking until the other processes release it)"""
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    else:
+        # msvcrt has no shared locks and gives up after 10 seconds: retry until the lock is acquired
+        while True:
+            lock_file.seek(0)
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+
+def _unlock(lock_file) -> None:
+    """Unlock an opened file"""
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def file_lock(lock_path: str, shared: bool = False):
+    """
+    Lock a (local) lock file during the context, against the other processes and threads.
+
+    .. code-block:: python
+
+        >>> with file_lock("/cache/index.json.lock"):
+        >>>     # Read-modify-write the index
+
+    Args:
+        lock_path (str): Lock file path (created if not existing)
+        shared (bool): Take a shared lock (several shared locks can be held at the same time, but not with an exclusive one). Exclusive on Windows.
+    """
+    os.makedirs(os.path.dirname(str(lock_path)), exist_ok=True)
+    with open(lock_path, "a+b") as lock_file:
+        _lock(lock_file, shared)
+        try:
+            yield
+        finally:
+            _unlock(lock_file)
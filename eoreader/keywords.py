@@ -23,6 +23,7 @@ __all__ = [
     "SLSTR_VIEW",
     "CLEAN_OPTICAL",
     "SAR_INTERP_NA",
+    "SAR_MULTILOOK",
     "DEM_KW",
     "SLOPE_KW",
     "HILLSHADE_KW",
@@ -31,6 +32,7 @@ __all__ = [
     "ASSOCIATED_BANDS",
     "WRITE_LIA_KW",
     "EXO_KW",
+    "PANSHARPEN_KW",
 ]
 
 SLSTR_RAD_ADJUST = "slstr_radiance_adjustment"
@@ -54,6 +56,15 @@ Interpolate nodata pixels that can be found inside the footprint
 (coming from null values that are not really nodata but that are not processed by the Terrain Correction step)
 """
 
+SAR_MULTILOOK = "sar_multilook"
+"""
+Compute a multilooked intensity of complex SAR products (:code:`SLC`, :code:`SCS`...) without SNAP, for quick previews.
+Set the number of looks (same in range and azimuth) or the :code:`(range, azimuth)` looks, i.e. :code:`sar_multilook=(2, 8)`.
+
+The intensity is computed chunk by chunk (with dask), not calibrated and geocoded on the ellipsoid thanks to the GCPs of the product (no DEM is used).
+Please see :py:mod:`eoreader.products.sar.multilook`.
+"""
+
 DEM_KW = "dem"
 """
 Set a DEM path when specifically loading the :code:`DEM` band, used to overload the :py:const:`eoreader.env_vars.DEM_PATH` environment variable.
@@ -94,6 +105,14 @@ EXO_KW = "exo"
 Set the exo data arguments.
 """
 
+PANSHARPEN_KW = "pansharpen"
+"""
+Pan-sharpen the multispectral bands of VHR products having a panchromatic band,
+please see :py:class:`eoreader.products.optical.pansharpening.PansharpeningMethod` for the available methods.
+
+The multispectral bands are pan-sharpened at the wanted pixel size (which should be the one of the panchromatic band).
+"""
+
 
 def _prune_keywords(additional_keywords: list = None, **kwargs) -> dict:
     """
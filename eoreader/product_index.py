@@ -0,0 +1,475 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Index of the products of an archive, stored as a partitioned `GeoParquet <https://geoparquet.org/>`_ dataset (needing :code:`pyarrow`).
+
+The products are opened once (in a pool of processes) to extract their main attributes
+(name, datetime, constellation, product type, tile, footprint, cloud cover, orbit direction),
+so that the spatio-temporal selection of the products never opens them again.
+
+The index is partitioned by constellation and year (:code:`constellation=S2/year=2020/part-0.parquet`)
+and the products of each partition are sorted along a Hilbert curve and written with the bounding box of their footprint:
+the partitions and the row groups not intersecting a query are skipped without being read.
+
+The index is refreshed incrementally: the signature of each product (size and modification time, or ETag for the cloud paths)
+is stored with its attributes, so only the new or modified products are opened again and the vanished ones are removed.
+"""
+
+import functools
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from sertit import AnyPath, files, path
+from sertit.types import AnyPathStrType, AnyPathType
+from sertit.vectors import WGS84
+
+from eoreader import EOREADER_NAME
+from eoreader.product_pool import get_reader, map_products
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+PARTITION_COLS = ["constellation", "year"]
+"""Columns partitioning the index"""
+
+ROW_GROUP_SIZE = 1000
+"""Number of products per row group (the smallest part of the index skipped by a spatial query)"""
+
+SIGNATURE_COLS = ["size", "mtime", "etag"]
+"""Columns storing the signature of the products (changing when a product is modified)"""
+
+SIGNATURE_THREADS = 16
+"""Number of threads getting the signatures of the products (one request per product for the cloud paths)"""
+
+
+def _to_key(prod_path: AnyPathStrType) -> str:
+    """Key of a product in the index: its normalized path (i.e. without trailing slash)"""
+    return str(AnyPath(prod_path))
+
+
+def _is_product_name(prod_path: AnyPathType) -> bool:
+    """Check if the name of a path is recognized by EOReader (any constellation)"""
+    from eoreader.reader import CONSTELLATION_REGEX
+
+    reader = get_reader()
+    for const in CONSTELLATION_REGEX:
+        try:
+            if reader.valid_name(prod_path, const):
+                return True
+        except Exception as exc:
+            # Some constellations need to look into the product (i.e. files that are not archives)
+            LOGGER.debug(f"{prod_path} is not a {const.value} product: {exc}")
+
+    return False
+
+
+def crawl(directory: AnyPathStrType) -> Iterator[AnyPathType]:
+    """
+    Crawl a directory (or a bucket) and yield the paths of the products recognized by their name,
+    without descending into them.
+
+    The directories not recognized as products are crawled recursively.
+
+    .. WARNING::
+        Only the names are checked: the products whose name is not recognized by EOReader
+        (i.e. renamed folders) have to be given explicitly to :py:func:`build_index`.
+
+    Args:
+        directory (AnyPathStrType): Directory to crawl
+
+    Yields:
+        AnyPathType: Path of the recognized products
+    """
+    for child in sorted(AnyPath(directory).iterdir()):
+        if child.name.startswith("."):
+            continue
+
+        if _is_product_name(child):
+            yield child
+        elif child.is_dir():
+            yield from crawl(child)
+
+
+def _get_signature(prod_path: AnyPathType) -> tuple:
+    """
+    Get the signature of a product, changing when the product is modified:
+    its size and modification time, or its ETag for the cloud paths.
+
+    For the folders, the modification time only changes when their direct children are added, removed or renamed.
+    The cloud folders (prefixes) don't have any signature: they are never considered as modified.
+
+    Args:
+        prod_path (AnyPathType): Product path
+
+    Returns:
+        tuple: Size, modification time and ETag of the product
+    """
+    if path.is_cloud_path(prod_path):
+        try:
+            return None, None, prod_path.etag
+        except Exception:
+            # Prefixes don't have any metadata
+            return None, None, None
+
+    stat = prod_path.stat()
+    return stat.st_size, stat.st_mtime, None
+
+
+def _normalize_signature(signature: Iterable) -> tuple:
+    """Normalize a signature read from the index (missing values as None)"""
+    return tuple(None if pd.isna(val) else val for val in signature)
+
+
+def _get_orbit_direction(prod) -> str | None:
+    """Get the orbit direction of a product, if known"""
+    try:
+        return prod.get_orbit_direction().value
+    except NotImplementedError:
+        return None
+
+
+def _get_product_record(prod_path: AnyPathStrType, **kwargs) -> dict | None:
+    """
+    Open a product and extract the attributes stored in the index.
+
+    Args:
+        prod_path (AnyPathStrType): Product path
+        **kwargs: Other arguments passed to :code:`Reader().open()`
+
+    Returns:
+        dict | None: Attributes of the product (None if the product is not recognized or if it cannot be opened)
+    """
+    try:
+        prod = get_reader().open(prod_path, **kwargs)
+        if prod is None:
+            LOGGER.warning(f"{prod_path} is not a recognized product: skipped.")
+            return None
+
+        with prod:
+            return {
+                "path": _to_key(prod_path),
+                "name": prod.name,
+                "condensed_name": prod.condensed_name,
+                "datetime": prod.datetime,
+                "constellation": prod.constellation_id,
+                "product_type": getattr(prod.product_type, "value", prod.product_type),
+                "tile_name": prod.tile_name,
+                "cloud_cover": (
+                    prod.get_cloud_cover()
+                    if getattr(prod, "_has_cloud_cover", False)
+                    else None
+                ),
+                "orbit_direction": _get_orbit_direction(prod),
+                "geometry": prod.footprint().to_crs(WGS84).union_all(),
+            }
+    except Exception as exc:
+        # Don't stop the indexing of the whole archive for one faulty product
+        LOGGER.warning(f"Impossible to index {prod_path}: {exc}")
+        return None
+
+
+def _to_geodataframe(records: list) -> gpd.GeoDataFrame:
+    """
+    Convert the records of the products to a GeoDataFrame, with the same column types in every partition.
+
+    Args:
+        records (list): Records of the products
+
+    Returns:
+        gpd.GeoDataFrame: Index as a GeoDataFrame
+    """
+    gdf = gpd.GeoDataFrame(records, geometry="geometry", crs=WGS84)
+    for col in [
+        "path",
+        "name",
+        "condensed_name",
+        "constellation",
+        "product_type",
+        "tile_name",
+        "orbit_direction",
+    ]:
+        gdf[col] = gdf[col].astype("string")
+    gdf["cloud_cover"] = gdf["cloud_cover"].astype(np.float64)
+    gdf["size"] = gdf["size"].astype("Int64")
+    gdf["mtime"] = gdf["mtime"].astype(np.float64)
+    gdf["etag"] = gdf["etag"].astype("string")
+    gdf["datetime"] = pd.to_datetime(gdf["datetime"])
+    return gdf
+
+
+def _write_index(gdf: gpd.GeoDataFrame, index_path: AnyPathType) -> None:
+    """
+    Write the index as a partitioned GeoParquet dataset, replacing the existing one only once complete.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Index as a GeoDataFrame
+        index_path (AnyPathType): Index path (directory)
+    """
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    old_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.old")
+    try:
+        gdf = gdf.assign(year=gdf["datetime"].dt.year)
+        for (const, year), part in gdf.groupby(PARTITION_COLS, sort=True):
+            part_path = tmp_path / f"constellation={const}" / f"year={year}"
+            os.makedirs(str(part_path), exist_ok=True)
+
+            # Sort the products along a Hilbert curve: the row groups are spatially compact,
+            # so their bounding boxes skip most of them in the spatial queries
+            order = np.argsort(
+                part.geometry.hilbert_distance(total_bounds=(-180, -90, 180, 90))
+            )
+            part.iloc[order].drop(columns=PARTITION_COLS).to_parquet(
+                str(part_path / "part-0.parquet"),
+                index=False,
+                write_covering_bbox=True,
+                row_group_size=ROW_GROUP_SIZE,
+            )
+
+        if index_path.exists():
+            os.replace(str(index_path), str(old_path))
+        os.replace(str(tmp_path), str(index_path))
+    finally:
+        files.remove(tmp_path)
+        files.remove(old_path)
+
+
+def _read_index(index_path: AnyPathType) -> gpd.GeoDataFrame | None:
+    """
+    Read an existing index, to reuse its entries.
+
+    Args:
+        index_path (AnyPathType): Index path (directory)
+
+    Returns:
+        gpd.GeoDataFrame | None: Index as a GeoDataFrame (None if not existing or written without the signatures of the products)
+    """
+    if not index_path.exists():
+        return None
+
+    gdf = gpd.read_parquet(str(index_path))
+    if not all(col in gdf.columns for col in SIGNATURE_COLS):
+        LOGGER.debug(
+            f"{index_path.name} doesn't store the products' signatures: rebuilding it."
+        )
+        return None
+
+    # The partition columns are read as categories
+    gdf["constellation"] = gdf["constellation"].astype("string")
+    return gdf.drop(columns="year")
+
+
+def build_index(
+    paths: AnyPathStrType | Iterable,
+    index_path: AnyPathStrType,
+    workers: int = None,
+    update: bool = True,
+    **kwargs,
+) -> int:
+    """
+    Build the index of many products as a partitioned GeoParquet dataset (needing :code:`pyarrow`),
+    to select them later with :py:func:`query_index` without opening them.
+
+    The products are opened in a pool of processes.
+    The products that are not recognized or that cannot be opened are skipped (with a warning).
+
+    If the index already exists, it is refreshed incrementally:
+    only the new or modified products (according to their size and modification time, or their ETag for the cloud paths) are opened,
+    the entries of the unchanged products are kept and the ones of the vanished products are removed.
+
+    .. code-block:: python
+
+        >>> from eoreader.product_index import build_index
+        >>> build_index("/archive", "archive_index.parquet", workers=8)
+        12345
+
+    Args:
+        paths (AnyPathStrType | Iterable): Directory (or bucket) to crawl (see :py:func:`crawl`), or product paths (can be a generator)
+        index_path (AnyPathStrType): Path of the index (local directory)
+        workers (int): Number of worker processes (default: the number of CPUs). Set it to 1 to open the products in this process.
+        update (bool): Reuse the entries of the existing index for the unchanged products. Set it to False to open every product again.
+        **kwargs: Other arguments passed to :code:`Reader().open()`
+
+    Returns:
+        int: Number of indexed products
+    """
+    index_path = AnyPath(index_path)
+
+    if workers is None:
+        workers = os.cpu_count()
+
+    if path.is_path(paths):
+        paths = crawl(paths)
+
+    # Signatures of the products (one request per product for the cloud paths, so get them concurrently),
+    # keyed by their normalized path (i.e. without trailing slash), as stored in the records
+    paths = {_to_key(prod_path): AnyPath(prod_path) for prod_path in paths}
+    with ThreadPoolExecutor(max_workers=SIGNATURE_THREADS) as executor:
+        signatures = dict(
+            zip(paths, executor.map(_get_signature, paths.values()), strict=True)
+        )
+
+    # Reuse the entries of the unchanged products
+    existing_gdf = _read_index(index_path) if update else None
+    if existing_gdf is not None:
+        existing_keys = existing_gdf["path"].map(_to_key)
+        is_unchanged = [
+            signatures.get(key) == _normalize_signature(signature)
+            for key, signature in zip(
+                existing_keys,
+                existing_gdf[SIGNATURE_COLS].itertuples(index=False),
+                strict=True,
+            )
+        ]
+        kept_gdf = existing_gdf[is_unchanged]
+        kept_paths = set(existing_keys[is_unchanged])
+        nof_removed = int((~existing_keys.isin(list(paths))).sum())
+    else:
+        kept_gdf = None
+        kept_paths = set()
+        nof_removed = 0
+
+    new_paths = [prod_path for key, prod_path in paths.items() if key not in kept_paths]
+    if existing_gdf is not None and not new_paths and nof_removed == 0:
+        LOGGER.info(f"{index_path.name} is up to date ({len(kept_gdf)} products)")
+        return len(kept_gdf)
+
+    get_record = functools.partial(_get_product_record, **kwargs)
+    records = []
+    for record in map_products(get_record, new_paths, workers):
+        if record is not None:
+            record.update(zip(SIGNATURE_COLS, signatures[record["path"]], strict=True))
+            records.append(record)
+
+    gdfs = [gdf for gdf in [kept_gdf] if gdf is not None and not gdf.empty]
+    if records:
+        gdfs.append(_to_geodataframe(records))
+    if not gdfs:
+        raise ValueError(f"No product has been indexed: cannot write {index_path}.")
+
+    gdf = pd.concat(gdfs, ignore_index=True)
+    _write_index(gdf, index_path)
+
+    LOGGER.info(
+        f"{len(gdf)} products indexed in {index_path.name} "
+        f"({len(records)} opened, {len(kept_paths)} unchanged, {nof_removed} removed)"
+    )
+    return len(gdf)
+
+
+def query_index(
+    index_path: AnyPathStrType,
+    aoi: gpd.GeoDataFrame = None,
+    start_datetime=None,
+    end_datetime=None,
+    max_cloud_cover: float = None,
+    constellation: str | list = None,
+    product_type: str | list = None,
+    orbit_direction: str = None,
+) -> list:
+    """
+    Select the products of an index, without opening them.
+
+    Only the partitions (constellation and year) and the row groups (bounding boxes) intersecting the query are read.
+
+    .. code-block:: python
+
+        >>> from eoreader.product_index import query_index
+        >>> query_index(
+        >>>     "archive_index.parquet",
+        >>>     aoi=vectors.read("aoi.geojson"),
+        >>>     start_datetime=datetime(2020, 6, 1),
+        >>>     end_datetime=datetime(2020, 9, 1),
+        >>>     max_cloud_cover=20,
+        >>>     constellation="S2",
+        >>> )
+        [S3Path('s3://archive/S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE.zip'), ...]
+
+    Args:
+        index_path (AnyPathStrType): Path of the index
+        aoi (gpd.GeoDataFrame): Area of interest (or a shapely geometry in WGS84). The footprint of the products should intersect it.
+        start_datetime: Minimum datetime of the products (included)
+        end_datetime: Maximum datetime of the products (included)
+        max_cloud_cover (float): Maximum cloud cover of the products (the products without cloud cover, i.e. SAR, are always kept)
+        constellation (str | list): Constellation(s) of the products
+        product_type (str | list): Product type(s) of the products
+        orbit_direction (str): Orbit direction of the products
+
+    Returns:
+        list: Paths of the selected products, sorted by datetime
+    """
+    import pyarrow.compute as pc
+
+    from eoreader.products.product import OrbitDirection
+    from eoreader.reader import Constellation
+
+    filters = []
+    if constellation is not None:
+        filters.append(
+            pc.field("constellation").isin(
+                [const.name for const in Constellation.convert_from(constellation)]
+            )
+        )
+    if product_type is not None:
+        product_types = (
+            product_type if isinstance(product_type, list) else [product_type]
+        )
+        filters.append(
+            pc.field("product_type").isin(
+                [getattr(prod_type, "value", prod_type) for prod_type in product_types]
+            )
+        )
+    if start_datetime is not None:
+        start_datetime = pd.Timestamp(start_datetime)
+        filters.append(pc.field("year") >= start_datetime.year)
+        filters.append(pc.field("datetime") >= start_datetime)
+    if end_datetime is not None:
+        end_datetime = pd.Timestamp(end_datetime)
+        filters.append(pc.field("year") <= end_datetime.year)
+        filters.append(pc.field("datetime") <= end_datetime)
+    if max_cloud_cover is not None:
+        filters.append(
+            (pc.field("cloud_cover") <= max_cloud_cover)
+            | pc.field("cloud_cover").is_null()
+        )
+    if orbit_direction is not None:
+        filters.append(
+            pc.field("orbit_direction")
+            == OrbitDirection.convert_from(orbit_direction)[0].value
+        )
+
+    aoi_geom = None
+    if aoi is not None:
+        if isinstance(aoi, (gpd.GeoDataFrame, gpd.GeoSeries)):
+            aoi_geom = aoi.to_crs(WGS84).union_all()
+        else:
+            aoi_geom = aoi
+
+    gdf = gpd.read_parquet(
+        str(index_path),
+        columns=["path", "datetime", "geometry"],
+        filters=functools.reduce(lambda a, b: a & b, filters) if filters else None,
+        bbox=aoi_geom.bounds if aoi_geom is not None else None,
+    )
+
+    # The bounding boxes only give the candidates
+    if aoi_geom is not None:
+        gdf = gdf[gdf.intersects(aoi_geom)]
+
+    return [AnyPath(prod_path) for prod_path in gdf.sort_values("datetime")["path"]]
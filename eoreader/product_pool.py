@@ -0,0 +1,87 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Processing of many products in a pool of processes (i.e. to index them or to export their STAC Items),
+each worker opening the products with its own :py:class:`eoreader.reader.Reader`.
+"""
+
+import functools
+import itertools
+import logging
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from eoreader import EOREADER_NAME
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+PRODUCTS_IN_FLIGHT_PER_WORKER = 4
+"""Number of products submitted in advance to each worker (bounding the number of results held in memory)"""
+
+
+@functools.cache
+def get_reader():
+    """
+    Get the Reader of this process (created only once per process)
+
+    Returns:
+        Reader: Reader of this process
+    """
+    from eoreader.reader import Reader
+
+    return Reader()
+
+
+def map_products(func: Callable, paths: Iterable, workers: int) -> Iterator:
+    """
+    Apply a function to many product paths in a pool of processes,
+    yielding the results as soon as they are computed (in the order of their completion, not in the order of the paths).
+
+    Args:
+        func (Callable): Function to apply to each product path (picklable)
+        paths (Iterable): Product paths (can be a generator)
+        workers (int): Number of worker processes. Set it to 1 to apply the function in this process.
+
+    Yields:
+        Results of the function
+    """
+    if workers <= 1:
+        for prod_path in paths:
+            yield func(prod_path)
+        return
+
+    LOGGER.debug(f"Processing the products with {workers} processes")
+
+    # Spawn the workers, as GDAL and dask don't handle fork very well
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        # Only submit a few products in advance: the paths can be a (huge) generator
+        paths = iter(paths)
+        futures = set()
+
+        def _submit(nof_paths: int) -> None:
+            for prod_path in itertools.islice(paths, nof_paths):
+                futures.add(executor.submit(func, prod_path))
+
+        _submit(workers * PRODUCTS_IN_FLIGHT_PER_WORKER)
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            _submit(len(done))
@@ -15,31 +15,69 @@
 # limitations under the License.
 """
 SAR and Optical products
+
+The product modules (and their heavy dependencies) are only imported when one of their objects is asked,
+to keep :code:`import eoreader` fast.
 """
 
 # flake8: noqa
+import importlib
+
+_LAZY_IMPORTS = {}
+""" Module of every product object, imported only when this object is asked (i.e. :code:`from eoreader.products import S2Product`) """
+
+
+def _lazy_import(module: str, *names: str) -> None:
+    """
+    Register objects to be imported lazily from a product module.
+
+    Args:
+        module (str): Module (relative to :code:`eoreader.products`)
+        *names (str): Names of the objects
+    """
+    _LAZY_IMPORTS.update(dict.fromkeys(names, module))
+
+
+def __getattr__(name: str):
+    """Import a product object (and its module) the first time it is asked"""
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError as exc:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+
+    obj = getattr(importlib.import_module(module, __name__), name)
+
+    # Store it to avoid coming back here
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = ["Product", "SensorType", "OrbitDirection"]
 
-from .product import Product, SensorType, OrbitDirection
+_lazy_import(".product", "Product", "SensorType", "OrbitDirection")
 
 __all__ += [
     "CustomProduct",
     "CustomFields",
 ]
-from .custom_product import CustomProduct, CustomFields
+_lazy_import(".custom_product", "CustomProduct", "CustomFields")
 
 # STAC products
 __all__ += [
     "StacProduct",
 ]
-from .stac_product import StacProduct
+_lazy_import(".stac_product", "StacProduct")
 
 # -- Optical --
 __all__ += [
     "OpticalProduct",
     "CleanMethod",
 ]
-from .optical.optical_product import OpticalProduct, CleanMethod
+_lazy_import(".optical.optical_product", "OpticalProduct", "CleanMethod")
 
 # VHR
 __all__ += [
@@ -68,32 +106,41 @@ __all__ += [
     "Gs2ProductType",
     "Gs2BandCombination",
 ]
-from .optical.vhr_product import VhrProduct
-from .optical.dimap_v1_product import DimapV1Product
-from .optical.dimap_v2_product import (
-    DimapV2BandCombination,
-    DimapV2Product,
-    DimapV2ProductType,
+_lazy_import(".optical.vhr_product", "VhrProduct")
+_lazy_import(".optical.dimap_v1_product", "DimapV1Product")
+_lazy_import(
+    ".optical.dimap_v2_product",
+    "DimapV2BandCombination",
+    "DimapV2Product",
+    "DimapV2ProductType",
 )
-from .optical.pld_product import PldProduct
-from .optical.spot67_product import Spot67Product
-from .optical.vantor_product import (
-    VantorProduct,
-    VantorProductType,
-    VantorSatId,
-    VantorBandId,
+_lazy_import(".optical.pld_product", "PldProduct")
+_lazy_import(".optical.spot67_product", "Spot67Product")
+_lazy_import(
+    ".optical.vantor_product",
+    "VantorProduct",
+    "VantorProductType",
+    "VantorSatId",
+    "VantorBandId",
 )
 
 # legacy, to be deprecated
-from .optical.maxar_product import (
-    MaxarProduct,
-    MaxarProductType,
-    MaxarSatId,
-    MaxarBandId,
+_lazy_import(
+    ".optical.maxar_product",
+    "MaxarProduct",
+    "MaxarProductType",
+    "MaxarSatId",
+    "MaxarBandId",
+)
+_lazy_import(
+    ".optical.vis1_product", "Vis1Product", "Vis1ProductType", "Vis1BandCombination"
+)
+_lazy_import(
+    ".optical.sv1_product", "Sv1Product", "Sv1ProductType", "Sv1BandCombination"
+)
+_lazy_import(
+    ".optical.gs2_product", "Gs2Product", "Gs2ProductType", "Gs2BandCombination"
 )
-from .optical.vis1_product import Vis1Product, Vis1ProductType, Vis1BandCombination
-from .optical.sv1_product import Sv1Product, Sv1ProductType, Sv1BandCombination
-from .optical.gs2_product import Gs2Product, Gs2ProductType, Gs2BandCombination
 
 # SPOT4/5
 __all__ += [
@@ -102,11 +149,12 @@ __all__ += [
     "Spot5BandCombination",
     "Spot45Product",
 ]
-from .optical.spot45_product import (
-    Spot45ProductType,
-    Spot4BandCombination,
-    Spot5BandCombination,
-    Spot45Product,
+_lazy_import(
+    ".optical.spot45_product",
+    "Spot45ProductType",
+    "Spot4BandCombination",
+    "Spot5BandCombination",
+    "Spot45Product",
 )
 
 # Planet
@@ -114,7 +162,7 @@ __all__ += [
     "PlanetMaskType",
 ]
 
-from .optical.planet_product import PlanetMaskType
+_lazy_import(".optical.planet_product", "PlanetMaskType")
 
 # PlanetScope
 __all__ += [
@@ -122,7 +170,7 @@ __all__ += [
     "PlaProductType",
     "PlaInstrument",
 ]
-from .optical.pla_product import PlaProduct, PlaProductType, PlaInstrument
+_lazy_import(".optical.pla_product", "PlaProduct", "PlaProductType", "PlaInstrument")
 
 # SkySat
 __all__ += [
@@ -130,15 +178,14 @@ __all__ += [
     "SkyProduct",
     "SkyInstrument",
 ]
-from .optical.sky_product import SkyProductType, SkyProduct, SkyInstrument
+_lazy_import(".optical.sky_product", "SkyProductType", "SkyProduct", "SkyInstrument")
 
 # RapidEye
 __all__ += [
     "ReProductType",
     "ReProduct",
-    "ReInstrument",
 ]
-from .optical.re_product import ReProductType, ReProduct
+_lazy_import(".optical.re_product", "ReProductType", "ReProduct")
 
 # Landsat
 __all__ += [
@@ -147,11 +194,12 @@ __all__ += [
     "LandsatCollection",
     "LandsatInstrument",
 ]
-from .optical.landsat_product import (
-    LandsatProduct,
-    LandsatProductType,
-    LandsatCollection,
-    LandsatInstrument,
+_lazy_import(
+    ".optical.landsat_product",
+    "LandsatProduct",
+    "LandsatProductType",
+    "LandsatCollection",
+    "LandsatInstrument",
 )
 
 # Sentinel
@@ -163,36 +211,41 @@ __all__ += [
     "S2StacProduct",
     "S2E84Product",
     "S2E84StacProduct",
-    "S2MPCStacProduct",
+    "S2MpcStacProduct",
     "S2TheiaProduct",
     "S3Product",
     "S3ProductType",
     "S3DataType",
     "S3Instrument",
+    "S3OlciProduct",
     "S3SlstrProduct",
     "SlstrRadAdjustTuple",
     "SlstrRadAdjust",
     "SlstrView",
     "SlstrStripe",
 ]
-from .optical.s2_product import (
-    S2Product,
-    S2ProductType,
-    S2GmlMasks,
-    S2Jp2Masks,
-    S2StacProduct,
+_lazy_import(
+    ".optical.s2_product",
+    "S2Product",
+    "S2ProductType",
+    "S2GmlMasks",
+    "S2Jp2Masks",
+    "S2StacProduct",
 )
-from .optical.s2_e84_product import S2E84Product, S2E84StacProduct
-from .optical.s2_mpc_product import S2MpcStacProduct
-from .optical.s2_theia_product import S2TheiaProduct
-from .optical.s3_product import S3Product, S3ProductType, S3DataType, S3Instrument
-from .optical.s3_olci_product import S3OlciProduct
-from .optical.s3_slstr_product import (
-    S3SlstrProduct,
-    SlstrRadAdjustTuple,
-    SlstrRadAdjust,
-    SlstrView,
-    SlstrStripe,
+_lazy_import(".optical.s2_e84_product", "S2E84Product", "S2E84StacProduct")
+_lazy_import(".optical.s2_mpc_product", "S2MpcStacProduct")
+_lazy_import(".optical.s2_theia_product", "S2TheiaProduct")
+_lazy_import(
+    ".optical.s3_product", "S3Product", "S3ProductType", "S3DataType", "S3Instrument"
+)
+_lazy_import(".optical.s3_olci_product", "S3OlciProduct")
+_lazy_import(
+    ".optical.s3_slstr_product",
+    "S3SlstrProduct",
+    "SlstrRadAdjustTuple",
+    "SlstrRadAdjust",
+    "SlstrView",
+    "SlstrStripe",
 )
 
 # -- SAR --
@@ -234,31 +287,33 @@ __all__ += [
     "CapellaProductType",
     "CapellaSensorMode",
 ]
-from .sar.sar_product import SarProduct, SarProductType, SnapDems
-from .sar.cosmo_product import CosmoProduct, CosmoProductType
-from .sar.csg_product import CsgProduct, CsgSensorMode
-from .sar.csk_product import CskProduct, CskSensorMode
-from .sar.iceye_product import IceyeProduct, IceyeProductType, IceyeSensorMode
-from .sar.rcm_product import RcmProduct, RcmProductType, RcmSensorMode
-from .sar.rs2_product import Rs2Product, Rs2ProductType, Rs2SensorMode
-from .sar.s1_product import S1Product, S1SensorMode, S1ProductType
-from .sar.s1_rtc_asf_product import S1RtcAsfProduct, S1RtcProductType
-from .sar.s1_rtc_mpc_product import S1RtcMpcStacProduct
-from .sar.saocom_product import (
-    SaocomProduct,
-    SaocomProductType,
-    SaocomPolarization,
-    SaocomSensorMode,
+_lazy_import(".sar.sar_product", "SarProduct", "SarProductType", "SnapDems")
+_lazy_import(".sar.cosmo_product", "CosmoProduct", "CosmoProductType")
+_lazy_import(".sar.csg_product", "CsgProduct", "CsgSensorMode")
+_lazy_import(".sar.csk_product", "CskProduct", "CskSensorMode")
+_lazy_import(
+    ".sar.iceye_product", "IceyeProduct", "IceyeProductType", "IceyeSensorMode"
 )
-from .sar.tsx_product import (
-    TsxProduct,
-    TsxPolarization,
-    TsxSatId,
-    TsxProductType,
-    TsxSensorMode,
+_lazy_import(".sar.rcm_product", "RcmProduct", "RcmProductType", "RcmSensorMode")
+_lazy_import(".sar.rs2_product", "Rs2Product", "Rs2ProductType", "Rs2SensorMode")
+_lazy_import(".sar.s1_product", "S1Product", "S1SensorMode", "S1ProductType")
+_lazy_import(".sar.s1_rtc_asf_product", "S1RtcAsfProduct", "S1RtcProductType")
+_lazy_import(".sar.s1_rtc_mpc_product", "S1RtcMpcStacProduct")
+_lazy_import(
+    ".sar.saocom_product",
+    "SaocomProduct",
+    "SaocomProductType",
+    "SaocomPolarization",
+    "SaocomSensorMode",
+)
+_lazy_import(
+    ".sar.tsx_product",
+    "TsxProduct",
+    "TsxPolarization",
+    "TsxSatId",
+    "TsxProductType",
+    "TsxSensorMode",
 )
-from .sar.capella_product import (
-    CapellaProduct,
-    CapellaProductType,
-    CapellaSensorMode,
+_lazy_import(
+    ".sar.capella_product", "CapellaProduct", "CapellaProductType", "CapellaSensorMode"
 )
@@ -526,33 +526,15 @@ class CustomProduct(Product):
         """
         sun_az, sun_zen = self.get_mean_sun_angles()
         if sun_az is not None and sun_zen is not None:
-            # Warp DEM
-            warped_dem_path = self._warp_dem(
-                dem_path, pixel_size, size, resampling, **kwargs
-            )
-
-            # Get Hillshade path
-            hillshade_name = self.get_band_file_name(
-                HILLSHADE,
-                dem_name=path.get_filename(dem_path),
-                pixel_size=pixel_size,
-                size=size,
+            hillshade_path = self._compute_terrain(
+                dem_path,
+                [HILLSHADE],
+                pixel_size,
+                size,
+                resampling,
+                sun_angles=(sun_az, sun_zen),
                 **kwargs,
-            )
-
-            hillshade_path, hillshade_exists = self._get_out_path(hillshade_name)
-            if hillshade_exists:
-                LOGGER.debug(
-                    "Already existing hillshade DEM for %s. Skipping process.",
-                    self.name,
-                )
-            else:
-                LOGGER.debug("Computing hillshade DEM for %s", self.name)
-
-                # Compute hillshade
-                hillshade = rasters.hillshade(warped_dem_path, sun_az, sun_zen)
-                hillshade = utils.write_path_in_attrs(hillshade, hillshade_path)
-                utils.write(hillshade, hillshade_path)
+            )[HILLSHADE]
 
         else:
             raise InvalidProductError(
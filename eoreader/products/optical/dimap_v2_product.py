@@ -649,8 +649,11 @@ class DimapV2Product(VhrProduct):
         # array data
         width = band_arr.rio.width
         height = band_arr.rio.height
-        mask_path, mask_exists = self._get_out_path(
-            f"{self.condensed_name}_other_masks_{int(width)}x{int(height)}.npy"
+        mask_path, mask_exists = self._get_np_out_path(
+            f"{self.condensed_name}_other_masks_{int(width)}x{int(height)}.npy",
+            shape=(height, width),
+            transform=band_arr.rio.transform(),
+            crs=band_arr.rio.crs,
         )
 
         if not mask_exists:
@@ -687,7 +690,12 @@ class DimapV2Product(VhrProduct):
                         mask_vis,
                     ],
                 )
-            np.save(str(mask_path), nodata)
+            utils.save_np(
+                nodata,
+                mask_path,
+                transform=band_arr.rio.transform(),
+                crs=band_arr.rio.crs,
+            )
         else:
             nodata = utils.load_np(mask_path, self._tmp_process)
 
@@ -995,8 +1003,11 @@ class DimapV2Product(VhrProduct):
 
             # Rasterize features if existing vector
             if has_vec:
-                mask_path, mask_exists = self._get_out_path(
-                    f"{self.condensed_name}_{band.name.lower()}_{int(width)}x{int(height)}.npy"
+                mask_path, mask_exists = self._get_np_out_path(
+                    f"{self.condensed_name}_{band.name.lower()}_{int(width)}x{int(height)}.npy",
+                    shape=(height, width),
+                    transform=vec_tr,
+                    crs=def_xarr.rio.crs,
                 )
                 if not mask_exists:
                     LOGGER.debug(f"Rasterizing {band.name} mask")
@@ -1009,7 +1020,9 @@ class DimapV2Product(VhrProduct):
                         transform=vec_tr,
                         dtype=np.uint8,
                     )
-                    np.save(str(mask_path), mask_arr)
+                    utils.save_np(
+                        mask_arr, mask_path, transform=vec_tr, crs=def_xarr.rio.crs
+                    )
                 else:
                     mask_arr = utils.load_np(mask_path, self._tmp_process)
 
@@ -46,12 +46,14 @@ from eoreader.bands import (
     NIR,
     RAW_CLOUDS,
     RED,
+    SAA,
     SHADOWS,
     SWIR_1,
     SWIR_2,
     SWIR_CIRRUS,
     TIR_1,
     TIR_2,
+    VAA,
     VRE_1,
     VRE_2,
     VRE_3,
@@ -224,6 +226,50 @@ class HlsProduct(OpticalProduct):
 
         return band_dict
 
+    def _has_angle(self, angle: BandNames) -> bool:
+        """
+        Can the specified per-pixel angle band be loaded from this product?
+
+        The angles are given as angle masks.
+
+        Args:
+            angle (BandNames): Angle band
+
+        Returns:
+            bool: True if the specified angle band is provided by the current product
+        """
+        return self._has_mask(HlsMaskBandNames.from_value(angle.value))
+
+    def _open_angle(
+        self,
+        band: BandNames,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Open a per-pixel angle band (in degrees) as a xarray, from the angle masks given in hundredths of degrees.
+
+        Args:
+            band (BandNames): Wanted angle band
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            xr.DataArray: Angle band
+        """
+        mask = HlsMaskBandNames.from_value(band.value)
+        angle_arr = self._open_masks([mask], pixel_size, size, **kwargs)[mask]
+        angle_arr = angle_arr.astype(np.float32) / 100.0
+
+        # Azimuths between 0 and 360 degrees, as for the other products
+        if band in [SAA, VAA]:
+            angle_arr = angle_arr % 360.0
+
+        angle_name = to_str(band)[0]
+        angle_arr.attrs["long_name"] = angle_name
+        return angle_arr.rename(angle_name)
+
     def _load_nodata(
         self, pixel_size: float = None, size: list | tuple = None, **kwargs
     ) -> xr.DataArray:
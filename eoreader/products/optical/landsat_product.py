@@ -46,12 +46,15 @@ from eoreader.bands import (
     PAN,
     RAW_CLOUDS,
     RED,
+    SAA,
     SHADOWS,
     SWIR_1,
     SWIR_2,
     SWIR_CIRRUS,
+    SZA,
     TIR_1,
     TIR_2,
+    VAA,
     VRE_1,
     VRE_2,
     VRE_3,
@@ -1255,6 +1258,50 @@ class LandsatProduct(OpticalProduct):
         band_arr.attrs["long_name"] = band_name
         return band_arr.rename(band_name)
 
+    def _has_angle(self, angle: BandNames) -> bool:
+        """
+        Can the specified per-pixel angle band be loaded from this product?
+
+        The angles are given as angle masks with the Collection 2 Level-1 products.
+
+        Args:
+            angle (BandNames): Angle band
+
+        Returns:
+            bool: True if the specified angle band is provided by the current product
+        """
+        return self._has_mask(LandsatMaskBandNames.from_value(angle.value))
+
+    def _open_angle(
+        self,
+        band: BandNames,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Open a per-pixel angle band (in degrees) as a xarray, from the angle masks given in hundredths of degrees.
+
+        Args:
+            band (BandNames): Wanted angle band
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            xr.DataArray: Angle band
+        """
+        mask = LandsatMaskBandNames.from_value(band.value)
+        angle_arr = self._open_masks([mask], pixel_size, size, **kwargs)[mask]
+        angle_arr = angle_arr.astype(np.float32) / 100.0
+
+        # Azimuths between 0 and 360 degrees, as for the other products
+        if band in [SAA, VAA]:
+            angle_arr = angle_arr % 360.0
+
+        angle_name = to_str(band)[0]
+        angle_arr.attrs["long_name"] = angle_name
+        return angle_arr.rename(angle_name)
+
     def _to_reflectance(
         self,
         band_arr: xr.DataArray,
@@ -1297,7 +1344,7 @@ class LandsatProduct(OpticalProduct):
 
                 else:
                     # Original band name
-                    band_arr = self._to_refl(band_arr, mtd, band_name)
+                    band_arr = self._to_refl(band_arr, mtd, band_name, **kwargs)
             except TypeError as exc:
                 raise InvalidProductError(
                     f"Cannot find additive or multiplicative "
@@ -1381,14 +1428,25 @@ class LandsatProduct(OpticalProduct):
         band_arr: xr.DataArray,
         mtd: etree._Element,
         band_name: str,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
     ) -> xr.DataArray:
         """
         Converts band to reflectance
 
+        The Level-1 reflectance coefficients don't correct for the sun angle: the reflectance is then divided by
+        the cosine of the sun zenith angle (i.e. the sine of the sun elevation), per pixel if the product provides the angle masks,
+        with the scene center sun elevation otherwise.
+        See `here <https://www.usgs.gov/landsat-missions/using-usgs-landsat-level-1-data-product>`_ for more information.
+
         Args:
             band_arr (xr.DataArray): Band array
             mtd (etree._Element): Metadata
             band_name (str): Band name
+            pixel_size (float): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            **kwargs: Other arguments used to load the band (i.e. the window)
 
         Returns:
             xr.DataArray: Band in reflectance
@@ -1422,6 +1480,19 @@ class LandsatProduct(OpticalProduct):
         # Compute the correct reflectance of the band and set no data to 0
         band_arr = c_mul * band_arr + c_add  # Already in float
 
+        # Correct the Level-1 reflectance for the sun angle
+        if self.product_type == LandsatProductType.L1:
+            if self._has_angle(SZA):
+                # Per-pixel sun zenith angles, loaded on the same grid (pixel size or size, window) as the band
+                if pixel_size is None and size is None:
+                    pixel_size = abs(band_arr.rio.resolution()[0])
+                sun_zen = self._load_angles([SZA], pixel_size, size, **kwargs)[SZA]
+                sun_zen = rasters.collocate(band_arr, sun_zen).data
+            else:
+                _, sun_zen = self.get_mean_sun_angles()
+
+            band_arr = band_arr.copy(data=band_arr.data / np.cos(np.deg2rad(sun_zen)))
+
         return band_arr
 
     def _manage_invalid_pixels(
@@ -1990,6 +2061,8 @@ class LandsatProduct(OpticalProduct):
 
 
 class LandsatStacProduct(StacProduct, LandsatProduct):
+    _small_assets = ["mtl.xml"]
+
     def __init__(
         self,
         product_path: AnyPathStrType = None,
@@ -2025,6 +2098,17 @@ class LandsatStacProduct(StacProduct, LandsatProduct):
         # Initialization from the super class
         super().__init__(product_path, archive_path, output_path, remove_tmp, **kwargs)
 
+    def _pre_init(self, **kwargs) -> None:
+        """
+        Function used to pre_init the products
+        (setting needs_extraction and so on)
+        """
+        # Read the metadata files concurrently
+        self._prefetch_small_assets()
+
+        # Pre init done by the super class
+        super()._pre_init(**kwargs)
+
     def _get_path(self, band_id: str) -> str:
         """
         Get either the archived path of the normal path of a tif file
@@ -23,18 +23,23 @@ from enum import unique
 import numpy as np
 import rasterio
 import xarray as xr
+from affine import Affine
 from rasterio import crs as riocrs
 from rasterio.enums import Resampling
-from sertit import AnyPath, path, rasters
+from sertit import AnyPath
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType
 
-from eoreader import EOREADER_NAME, cache, utils
+from eoreader import EOREADER_NAME, angles, cache, utils
 from eoreader.bands import (
     GREEN,
     HILLSHADE,
+    SAA,
+    SZA,
+    VAA,
     BandNames,
     SpectralBandMap,
+    is_angle,
     is_spectral_band,
     is_thermal_band,
     to_str,
@@ -323,7 +328,14 @@ class OpticalProduct(Product):
                 # (after cleaning -> don't alter pixel value before managing nodata)
                 if kwargs.get(TO_REFLECTANCE, True):
                     LOGGER.debug(f"Converting {band.name} to reflectance (if needed)")
-                    band_arr = self._to_reflectance(band_arr, band_path, band)
+                    band_arr = self._to_reflectance(
+                        band_arr,
+                        band_path,
+                        band,
+                        pixel_size=pixel_size,
+                        size=size,
+                        **kwargs,
+                    )
 
                     # b_min = band_arr.min().data
                     # if b_min < 0:
@@ -500,6 +512,72 @@ class OpticalProduct(Product):
         """
         return None, None, None
 
+    def _get_angle_grid(self, angle: BandNames) -> (np.ndarray, Affine):
+        """
+        Get the coarse grid of an angle, as given by the product.
+
+        Args:
+            angle (BandNames): Angle band
+
+        Returns:
+            (np.ndarray, Affine): Angle grid (in degrees) and its transform (the grid values are located at :code:`transform * (col, row)`)
+        """
+        raise NotImplementedError
+
+    def _open_angle(
+        self,
+        band: BandNames,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Open a per-pixel angle band (in degrees) as a xarray, on the grid of the product bands.
+
+        The coarse angle grid of the product is interpolated lazily (see :py:func:`eoreader.angles.interpolate_angle_grid`).
+
+        Args:
+            band (BandNames): Wanted angle band
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            xr.DataArray: Angle band
+        """
+        grid, grid_tr = self._get_angle_grid(band)
+        dst_tr, width, height = self._get_out_grid(pixel_size, size, **kwargs)
+        return angles.interpolate_angle_grid(
+            grid,
+            grid_tr,
+            dst_tr,
+            (height, width),
+            self.crs(),
+            is_azimuth=band in [SAA, VAA],
+            name=to_str(band)[0],
+        )
+
+    def _get_sun_angles(
+        self, pixel_size: float = None, size: list | tuple = None, **kwargs
+    ) -> tuple:
+        """
+        Get the sun angles (azimuth and zenith) used to compute the hillshade:
+        the per-pixel angles if the product provides them, the mean sun angles otherwise.
+
+        Args:
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            tuple: Azimuth and zenith angles (as floats or xr.DataArrays)
+        """
+        if self._has_angle(SAA) and self._has_angle(SZA):
+            sun_angles = self._load_angles(
+                [SAA, SZA], pixel_size=pixel_size, size=size, **kwargs
+            )
+            return sun_angles[SAA], sun_angles[SZA]
+        else:
+            return self.get_mean_sun_angles()
+
     def _compute_hillshade(
         self,
         dem_path: str = "",
@@ -521,39 +599,15 @@ class OpticalProduct(Product):
             AnyPathType: Hillshade mask path
 
         """
-        # Warp DEM
-        warped_dem_path = self._warp_dem(
-            dem_path, pixel_size, size, resampling, **kwargs
-        )
-
-        # Get Hillshade path
-        hillshade_name = self.get_band_file_name(
-            HILLSHADE,
-            dem_name=path.get_filename(dem_path),
-            pixel_size=pixel_size,
-            size=size,
+        return self._compute_terrain(
+            dem_path,
+            [HILLSHADE],
+            pixel_size,
+            size,
+            resampling,
+            sun_angles=self._get_sun_angles(pixel_size=pixel_size, size=size, **kwargs),
             **kwargs,
-        )
-
-        hillshade_path, hillshade_exists = self._get_out_path(hillshade_name)
-        if hillshade_exists:
-            LOGGER.debug(
-                "Already existing hillshade DEM for %s. Skipping process.", self.name
-            )
-        else:
-            LOGGER.debug("Computing hillshade DEM for %s", self.name)
-
-            # Get angles
-            mean_azimuth_angle, mean_zenith_angle = self.get_mean_sun_angles()
-
-            # Compute hillshade
-            hillshade = rasters.hillshade(
-                warped_dem_path, mean_azimuth_angle, mean_zenith_angle
-            )
-            hillshade = utils.write_path_in_attrs(hillshade, hillshade_path)
-            utils.write(hillshade, hillshade_path)
-
-        return hillshade_path
+        )[HILLSHADE]
 
     @abstractmethod
     def _open_clouds(
@@ -744,6 +798,9 @@ class OpticalProduct(Product):
             rad_proc = "" if kwargs.get(TO_REFLECTANCE, True) else "_as_is"
 
             suffix = f"_{cleaning_method.value}{rad_proc}"
+        elif is_angle(band):
+            # Don't mix up the angle bands with the raw angle masks (i.e. of Landsat and HLS) with the same names
+            suffix = "_deg"
         else:
             suffix = ""
 
@@ -0,0 +1,204 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Pan-sharpening of multispectral bands with a panchromatic band.
+
+Every operation is lazy: with dask arrays, the multispectral bands are upsampled tile by tile to the panchromatic grid
+and the pan-sharpened bands are computed chunk by chunk (only the statistics needed by Gram-Schmidt require a pass over the data).
+"""
+
+import logging
+
+import numpy as np
+import xarray as xr
+from rasterio.enums import Resampling
+from sertit import rasters
+from sertit.misc import ListEnum
+
+from eoreader import EOREADER_NAME
+from eoreader.bands import SpectralBand
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+
+class PansharpeningMethod(ListEnum):
+    """Pan-sharpening methods"""
+
+    BROVEY = "brovey"
+    """
+    Brovey transform: each multispectral band is multiplied by the ratio of the panchromatic band
+    to the mean of the multispectral bands.
+    """
+
+    WEIGHTED_BROVEY = "weighted_brovey"
+    """
+    Weighted Brovey transform: same as Brovey, but the intensity is a mean of the multispectral bands
+    weighted by their spectral overlap with the panchromatic band.
+    """
+
+    GRAM_SCHMIDT = "gram_schmidt"
+    """
+    Gram-Schmidt (component substitution): the details of the panchromatic band (matched to the intensity of the multispectral bands)
+    are injected in each multispectral band, with a gain equal to the covariance between this band and the intensity
+    divided by the variance of the intensity.
+    """
+
+
+def get_spectral_weights(ms_bands: dict, pan_band: SpectralBand) -> dict:
+    """
+    Get the weight of each multispectral band, as its spectral overlap with the panchromatic band.
+    Equal weights are returned if the wavelengths are unknown or if no band overlaps the panchromatic band.
+
+    Args:
+        ms_bands (dict): Multispectral bands {band_name: SpectralBand}
+        pan_band (SpectralBand): Panchromatic band
+
+    Returns:
+        dict: Weights {band_name: weight}
+    """
+
+    def wv_range(band: SpectralBand) -> tuple | None:
+        if band.center_wavelength is None or band.full_width_half_max is None:
+            return None
+        half_width = band.full_width_half_max / 2.0
+        return band.center_wavelength - half_width, band.center_wavelength + half_width
+
+    pan_range = wv_range(pan_band)
+    weights = {}
+    for band_name, band in ms_bands.items():
+        band_range = wv_range(band)
+        if pan_range is None or band_range is None:
+            weights = {}
+            break
+        weights[band_name] = max(
+            min(band_range[1], pan_range[1]) - max(band_range[0], pan_range[0]), 0.0
+        )
+
+    if not weights or sum(weights.values()) == 0:
+        weights = dict.fromkeys(ms_bands, 1.0)
+
+    return weights
+
+
+def upsample(ms_xda: xr.DataArray, pan_xda: xr.DataArray) -> xr.DataArray:
+    """
+    Upsample (lazily with dask arrays) a multispectral band to the panchromatic grid, with a bilinear resampling.
+
+    Args:
+        ms_xda (xr.DataArray): Multispectral band
+        pan_xda (xr.DataArray): Panchromatic band
+
+    Returns:
+        xr.DataArray: Upsampled multispectral band
+    """
+    up_xda = rasters.reproject(
+        ms_xda,
+        dst_crs=pan_xda.rio.crs,
+        dst_transform=pan_xda.rio.transform(),
+        shape=(pan_xda.rio.height, pan_xda.rio.width),
+        resampling=Resampling.bilinear,
+        nodata=np.nan,
+    )
+
+    # Align the coordinates and chunks on the panchromatic band
+    up_xda = up_xda.assign_coords(x=pan_xda.x, y=pan_xda.y)
+    if pan_xda.chunks is not None:
+        up_xda = up_xda.chunk(dict(zip(pan_xda.dims, pan_xda.chunks, strict=True)))
+
+    return up_xda
+
+
+def pansharpen(
+    ms_dict: dict,
+    pan_xda: xr.DataArray,
+    method: PansharpeningMethod | str = PansharpeningMethod.BROVEY,
+    weights: dict = None,
+) -> dict:
+    """
+    Pan-sharpen multispectral bands with the panchromatic band.
+
+    Args:
+        ms_dict (dict): Multispectral bands {band_name: band_xda}, at their native pixel size
+        pan_xda (xr.DataArray): Panchromatic band, at the wanted pixel size
+        method (PansharpeningMethod | str): Pan-sharpening method
+        weights (dict): Weights of the multispectral bands {band_name: weight}, only used for the weighted Brovey method (equal weights if not given)
+
+    Returns:
+        dict: Pan-sharpened bands {band_name: band_xda}
+    """
+    method = PansharpeningMethod.convert_from(method)[0]
+    LOGGER.debug(
+        f"Pan-sharpening {list(ms_dict.keys())} with the {method.value} method"
+    )
+
+    up_dict = {
+        band_name: upsample(ms_xda, pan_xda) for band_name, ms_xda in ms_dict.items()
+    }
+
+    if method == PansharpeningMethod.WEIGHTED_BROVEY and weights:
+        weights = {band_name: weights.get(band_name, 0.0) for band_name in up_dict}
+    else:
+        weights = dict.fromkeys(up_dict, 1.0)
+
+    def intensity(band_dict: dict) -> xr.DataArray:
+        return sum(
+            band_xda * weights[band_name] for band_name, band_xda in band_dict.items()
+        ) / sum(weights.values())
+
+    if method in [PansharpeningMethod.BROVEY, PansharpeningMethod.WEIGHTED_BROVEY]:
+        ratio = pan_xda / intensity(up_dict)
+        ratio = ratio.where(np.isfinite(ratio))
+        sharp_dict = {
+            band_name: up_xda * ratio for band_name, up_xda in up_dict.items()
+        }
+    else:
+        # Import dask here (long import)
+        import dask
+
+        # Statistics computed on the native multispectral grid (cheaper) and in one pass
+        ms_intensity = intensity(ms_dict)
+        stats = [
+            ms_intensity.mean(),
+            ms_intensity.var(),
+            pan_xda.mean(),
+            pan_xda.std(),
+        ] + [
+            xr.cov(ms_xda.squeeze(), ms_intensity.squeeze(), ddof=0)
+            for ms_xda in ms_dict.values()
+        ]
+        stats = [float(stat) for stat in dask.compute(*stats)]
+        int_mean, int_var, pan_mean, pan_std = stats[:4]
+        int_std = np.sqrt(int_var)
+
+        # Match the panchromatic band to the intensity and inject its details
+        details = (
+            (pan_xda - pan_mean) * int_std / pan_std + int_mean - intensity(up_dict)
+        )
+        sharp_dict = {
+            band_name: up_xda + gain / int_var * details
+            for (band_name, up_xda), gain in zip(
+                up_dict.items(), stats[4:], strict=True
+            )
+        }
+
+    # Keep the attributes of the multispectral bands
+    for band_name, sharp_xda in sharp_dict.items():
+        sharp_dict[band_name] = sharp_xda.rename(ms_dict[band_name].name).assign_attrs(
+            ms_dict[band_name].attrs
+        )
+        sharp_dict[band_name].rio.write_crs(pan_xda.rio.crs, inplace=True)
+
+    return sharp_dict
@@ -762,6 +762,8 @@ class S2E84Product(OpticalProduct):
 
 
 class S2E84StacProduct(StacProduct, S2E84Product):
+    _small_assets = ["tileinfo_metadata", "granule_metadata"]
+
     def __init__(
         self,
         product_path: AnyPathStrType = None,
@@ -801,6 +803,9 @@ class S2E84StacProduct(StacProduct, S2E84Product):
         self._use_filename = False
         self.needs_extraction = False
 
+        # Read the metadata files concurrently
+        self._prefetch_small_assets()
+
         # Read the JSON tileinfo mtd
         self.tile_mtd = json.loads(
             self.read_href(self._get_path("tileinfo_metadata"), clients=self.clients),
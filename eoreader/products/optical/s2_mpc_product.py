@@ -37,6 +37,8 @@ LOGGER = logging.getLogger(EOREADER_NAME)
 
 
 class S2MpcStacProduct(StacProduct, S2E84Product):
+    _small_assets = ["granule-metadata"]
+
     def __init__(
         self,
         product_path: AnyPathStrType = None,
@@ -78,6 +80,9 @@ class S2MpcStacProduct(StacProduct, S2E84Product):
         self._use_filename = False
         self.needs_extraction = False
 
+        # Read the metadata files concurrently
+        self._prefetch_small_assets()
+
         self.stac_mtd = self.item.to_dict()
 
         # Pre init done by the super class
@@ -38,7 +38,7 @@ from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType
 from shapely.geometry import box
 
-from eoreader import DATETIME_FMT, EOREADER_NAME, cache, utils
+from eoreader import DATETIME_FMT, EOREADER_NAME, angles, cache, utils
 from eoreader.bands import (
     ALL_CLOUDS,
     AOT,
@@ -52,14 +52,17 @@ from eoreader.bands import (
     NIR,
     RAW_CLOUDS,
     RED,
+    SAA,
     SCL,
     SHADOWS,
     SWIR_1,
     SWIR_2,
     SWIR_CIRRUS,
+    SZA,
     VRE_1,
     VRE_2,
     VRE_3,
+    VZA,
     WV,
     WVP,
     BandNames,
@@ -1599,6 +1602,83 @@ class S2Product(OpticalProduct):
 
         return azimuth_angle, zenith_angle
 
+    def _has_angle(self, angle: BandNames) -> bool:
+        """
+        Can the specified per-pixel angle band be loaded from this product?
+
+        The granule metadata gives the sun angles and the viewing angles (per band and detector) every 5 km.
+
+        Args:
+            angle (BandNames): Angle band
+
+        Returns:
+            bool: True if the specified angle band is provided by the current product
+        """
+        return True
+
+    @cache
+    def _get_angle_grid(self, angle: BandNames) -> (np.ndarray, Affine):
+        """
+        Get the coarse grid of an angle, as given by the granule metadata.
+
+        The viewing angle grids of every detector are merged, then averaged over the bands.
+
+        Args:
+            angle (BandNames): Angle band
+
+        Returns:
+            (np.ndarray, Affine): Angle grid (in degrees) and its transform (the grid values are located at :code:`transform * (col, row)`)
+        """
+        root, _ = self.read_mtd()
+
+        if angle in [SZA, SAA]:
+            grid_nodes = root.findall(".//Sun_Angles_Grid")
+        else:
+            grid_nodes = root.findall(".//Viewing_Incidence_Angles_Grids")
+        angle_type = "Zenith" if angle in [SZA, VZA] else "Azimuth"
+
+        band_grids = defaultdict(list)
+        angle_node = None
+        for grid_node in grid_nodes:
+            angle_node = grid_node.find(angle_type)
+            band_grids[grid_node.get("bandId")].append(
+                [
+                    [float(val) for val in values.text.split()]
+                    for values in angle_node.iterfind("Values_List/VALUES")
+                ]
+            )
+
+        if not band_grids:
+            raise InvalidProductError(f"{to_str(angle)[0]} grid not found in metadata!")
+
+        # Merge the detectors of every band: they only overlap on their borders, keep the first valid value
+        # (don't average them, the viewing azimuths of two adjacent detectors can be opposite)
+        grids = []
+        for det_grids in band_grids.values():
+            det_grids = np.array(det_grids, dtype=np.float64)
+            first_valid = np.argmax(~np.isnan(det_grids), axis=0)
+            grids.append(np.take_along_axis(det_grids, first_valid[np.newaxis], 0)[0])
+
+        # Then average the bands
+        grids = np.array(grids)
+        if angle_type == "Azimuth":
+            grid = angles.circular_nanmean(grids, axis=0)
+        else:
+            nof_valid = np.sum(~np.isnan(grids), axis=0)
+            grid = np.where(
+                nof_valid > 0,
+                np.nansum(grids, axis=0) / np.maximum(nof_valid, 1),
+                np.nan,
+            )
+
+        # The first value of the grids is located at the upper-left corner of the tile
+        ulx = float(root.findtext(".//Geoposition/ULX"))
+        uly = float(root.findtext(".//Geoposition/ULY"))
+        col_step = float(angle_node.findtext("COL_STEP"))
+        row_step = float(angle_node.findtext("ROW_STEP"))
+
+        return grid, transform.from_origin(ulx, uly, col_step, row_step)
+
     @cache
     def _read_mtd(self) -> (etree._Element, dict):
         """
@@ -2166,6 +2246,8 @@ class S2Product(OpticalProduct):
 
 
 class S2StacProduct(StacProduct, S2Product):
+    _small_assets = ["product-metadata", "granule-metadata"]
+
     def __init__(
         self,
         product_path: AnyPathStrType = None,
@@ -2211,6 +2293,9 @@ class S2StacProduct(StacProduct, S2Product):
         self._use_filename = False
         self.needs_extraction = False
 
+        # Read the metadata files concurrently
+        self._prefetch_small_assets()
+
         # Pre init done by the super class
         super(S2Product, self)._pre_init(**kwargs)
 
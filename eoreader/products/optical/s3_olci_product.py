@@ -509,7 +509,10 @@ class S3OlciProduct(S3Product):
 
             # Get raw band
             band_arr = self._read_nc(
-                filename, subdataset, dtype=kwargs.get("dtype", np.float32)
+                filename,
+                subdataset,
+                dtype=kwargs.get("dtype", np.float32),
+                cache=False,
             )
 
             # Convert radiance to reflectances if needed
@@ -552,8 +555,9 @@ class S3OlciProduct(S3Product):
         Returns:
             dict: Dictionary containing {band: path}
         """
-        rad_2_refl_path, rad_2_refl_exists = self._get_out_path(
-            f"rad_2_refl_{band.name}.npy"
+        rad_2_refl_path, rad_2_refl_exists = self._get_np_out_path(
+            f"rad_2_refl_{band.name}.npy",
+            shape=(band_arr.rio.height, band_arr.rio.width),
         )
         if not rad_2_refl_exists:
             # Open SZA array (resampled to band_arr size)
@@ -581,7 +585,7 @@ class S3OlciProduct(S3Product):
             rad_2_refl_coeff = (np.pi / e0 / np.cos(sza_rad)).astype(np.float32)
 
             # Write on disk
-            np.save(str(rad_2_refl_path), rad_2_refl_coeff)
+            utils.save_np(rad_2_refl_coeff, rad_2_refl_path)
 
         else:
             # Open rad_2_refl_coeff (resampled to band_arr size)
@@ -608,8 +612,8 @@ class S3OlciProduct(S3Product):
         band_slice = int(self.bands[band].name[-2:]) - 1
         e0_det = np.squeeze(e0_det[0, band_slice, :])
 
-        # Create e0
-        e0 = det_idx
+        # Create e0 (the detector indices are shared with the cache)
+        e0 = det_idx.copy()
         not_nan_idx = ~np.isnan(det_idx)
         e0[not_nan_idx] = e0_det[det_idx[not_nan_idx].astype(int)]
 
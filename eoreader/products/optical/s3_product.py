@@ -28,8 +28,10 @@ import re
 import warnings
 import zipfile
 from abc import abstractmethod
+from collections import OrderedDict
 from datetime import datetime
 from enum import unique
+from functools import lru_cache
 
 import geopandas as gpd
 import numpy as np
@@ -47,6 +49,7 @@ from sertit.types import AnyPathStrType, AnyPathType
 from shapely.geometry import Polygon, box
 
 from eoreader import DATETIME_FMT, EOREADER_NAME, cache, utils
+from eoreader.archive_index import get_archive_index
 from eoreader.bands import BandNames, SpectralBandNames
 from eoreader.exceptions import InvalidProductError
 from eoreader.products import OpticalProduct
@@ -56,6 +59,30 @@ from eoreader.utils import qck_wrapper, simplify
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+NC_CACHE_MAX_SIZE = 512 * 1024**2
+"""Maximum size (in bytes) of the decoded NetCDF variables kept in memory per product, the least recently used ones being evicted first"""
+
+ARCHIVED_NC_CACHE_SIZE = 4
+"""Number of NetCDF datasets read from archived products kept in memory"""
+
+
+@lru_cache(maxsize=ARCHIVED_NC_CACHE_SIZE)
+def _open_archived_nc(archive_path: str, nc_member: str) -> xr.Dataset:
+    """
+    Open a NetCDF file stored in an archive, reading only the bytes of this member.
+    The last opened datasets are kept in memory, as the same files are read for several bands.
+
+    Args:
+        archive_path (str): Archive path
+        nc_member (str): NetCDF member name
+
+    Returns:
+        xr.Dataset: NetCDF dataset
+    """
+    LOGGER.debug(f"Reading {nc_member} from {path.get_filename(archive_path)}")
+    nc_bytes = get_archive_index(archive_path).read_member(nc_member)
+    return xr.open_dataset(io.BytesIO(nc_bytes), mask_and_scale=True)
+
 
 @unique
 class S3ProductType(ListEnum):
@@ -129,6 +156,9 @@ class S3Product(OpticalProduct):
         self._misc_file = None
         self._solar_flux_name = None
 
+        # Decoded NetCDF variables (geocoding, tie points, angles... are read for every band)
+        self._nc_cache = OrderedDict()
+
         self._set_preprocess_members()
 
         super().__init__(product_path, archive_path, output_path, remove_tmp, **kwargs)
@@ -791,6 +821,7 @@ class S3Product(OpticalProduct):
         subdataset: str = None,
         dtype=np.float32,
         squeeze: bool = False,
+        cache: bool = True,
     ) -> xr.DataArray:
         """
         Read NetCDF file (as float32) and rescaled them to their true values
@@ -806,30 +837,76 @@ class S3Product(OpticalProduct):
             subdataset (str): NetCDF subdataset if needed
             dtype: Dtype
             squeeze(bool): Squeeze array or not
+            cache (bool): Keep the decoded variable in memory (for auxiliary files read for every band: geocoding, tie points, angles...), its data being read-only
 
         Returns:
             xr.DataArray: NetCDF file as a xr.DataArray
         """
-        bytes_file = None
-        nc_path = None
-
         # Try to convert to spb if existing
         with contextlib.suppress(TypeError):
             filename = SpectralBandNames.convert_from(filename)[0]
 
+        # Decode the auxiliary NetCDF variables only once per product
+        key = (str(filename), subdataset, np.dtype(dtype).name)
+        nc = self._nc_cache.get(key)
+        if nc is not None:
+            self._nc_cache.move_to_end(key)
+        elif cache:
+            nc = self._decode_nc(filename, subdataset, dtype).load()
+
+            # The cached data is shared with the callers: make it read-only
+            nc.data.flags.writeable = False
+            self._nc_cache[key] = nc
+            while (
+                self._nc_cache
+                and sum(cached.nbytes for cached in self._nc_cache.values())
+                > NC_CACHE_MAX_SIZE
+            ):
+                self._nc_cache.popitem(last=False)
+        else:
+            nc = self._decode_nc(filename, subdataset, dtype)
+
+        if squeeze:
+            nc = nc.squeeze()
+
+        # Return a shallow copy (sharing the read-only data of the cache, but not its attributes):
+        # copy the data before modifying it in place
+        return nc.copy(deep=False)
+
+    def clear(self):
+        """
+        Clear this product's cache
+        """
+        super().clear()
+        self._nc_cache.clear()
+
+    def _decode_nc(
+        self,
+        filename: str | BandNames,
+        subdataset: str = None,
+        dtype=np.float32,
+    ) -> xr.DataArray:
+        """
+        Open and decode a NetCDF file (see :code:`_read_nc`), without any caching.
+
+        Args:
+            filename (str | BandNames): Filename or band
+            subdataset (str): NetCDF subdataset if needed
+            dtype: Dtype
+
+        Returns:
+            xr.DataArray: NetCDF file as a xr.DataArray
+        """
+        bytes_file = None
+        nc_path = None
+
         # Get raw band path
         if self.is_archived:
-            if path.is_cloud_path(self.path):
-                # Download the whole product (sadly)
-                on_disk = io.BytesIO(self.path.read_bytes())
-            else:
-                on_disk = self.path
-
-            # Cannot read zipped+netcdf files -> we are forced to dezip them
-            with zipfile.ZipFile(on_disk, "r") as zip_ds:
-                filenames = [f.filename for f in zip_ds.filelist]
-                regex = re.compile(f".*/{filename}")
-                bytes_file = zip_ds.read(list(filter(regex.match, filenames))[0])
+            # Cannot read zipped+netcdf files -> only read the bytes of the wanted member
+            # (with range requests for products stored on the cloud)
+            archive_index = get_archive_index(self.path)
+            nc_member = archive_index.get_path(f".*/{filename}", case_sensitive=True)
+            archived_nc = _open_archived_nc(str(self.path), nc_member)
         else:
             try:
                 nc_path = next(self.path.glob(f"{filename}*"))
@@ -849,7 +926,13 @@ class S3Product(OpticalProduct):
         # mask_and_scale=True => offset and scale are automatically applied!
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NotGeoreferencedWarning)
-            if bytes_file:
+            if self.is_archived:
+                nc = archived_nc
+                if subdataset:
+                    nc = nc[subdataset]
+
+                nc.load()
+            elif bytes_file:
                 with io.BytesIO(bytes_file) as bf:
                     # We need to load the dataset as we will do some operations and bf will close
                     nc = xr.open_dataset(bf, mask_and_scale=True)
@@ -896,16 +979,7 @@ class S3Product(OpticalProduct):
         dims = np.array(nc.dims)
         nc = nc.rename({dims[-1]: "x", dims[-2]: "y"})
 
-        if squeeze:
-            nc = nc.squeeze()
-
-        # http://xarray.pydata.org/en/latest/generated/xarray.open_dataset.html
-        # open_dataset opens the file with read-only access.
-        # When you modify values of a Dataset, even one linked to files on disk,
-        # only the in-memory copy you are manipulating in xarray is modified:
-        # the original file on disk is never touched.
-        # -> return a copy() as we will modify it!
-        return nc.copy()
+        return nc
 
     @abstractmethod
     def _open_clouds(
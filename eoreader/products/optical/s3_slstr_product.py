@@ -22,6 +22,7 @@ Sentinel-3 SLSTR products
 """
 
 import logging
+import os
 from collections import namedtuple
 from enum import unique
 from functools import reduce
@@ -56,6 +57,7 @@ from eoreader.bands import (
     SpectralBand,
     to_str,
 )
+from eoreader.env_vars import TILE_SIZE
 from eoreader.exceptions import InvalidTypeError
 from eoreader.keywords import (
     SLSTR_RAD_ADJUST,
@@ -64,9 +66,63 @@ from eoreader.keywords import (
 )
 from eoreader.products import S3DataType, S3Product, S3ProductType
 from eoreader.stac import ASSET_ROLE, BT, CENTER_WV, DESCRIPTION, FWHM, GSD, ID, NAME
+from eoreader.utils import DEFAULT_TILE_SIZE
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+
+def _eval_spline(spline, fy: np.ndarray, fx: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a :code:`RectBivariateSpline` on the image grid (:code:`fy`, :code:`fx`), chunk by chunk with dask.
+
+    If the image grid is separable (i.e. :code:`fx` only varies along the columns and :code:`fy` along the rows),
+    the spline is evaluated on the tensor grid, which is far cheaper than evaluating it point by point.
+
+    Args:
+        spline (RectBivariateSpline): Spline
+        fy (np.ndarray): Rows coordinates of the image grid
+        fx (np.ndarray): Columns coordinates of the image grid
+
+    Returns:
+        np.ndarray: Evaluated spline
+    """
+    import dask.array as da
+
+    try:
+        chunk_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+    except ValueError:
+        chunk_size = int(DEFAULT_TILE_SIZE)
+
+    x = fx[0, :]
+    y = fy[:, 0]
+    if np.array_equal(fx, np.broadcast_to(x, fx.shape)) and np.array_equal(
+        fy, np.broadcast_to(y[:, np.newaxis], fy.shape)
+    ):
+        # The tensor grid must have increasing coordinates
+        x_order = np.argsort(x)
+        y_order = np.argsort(y)
+        x_sorted = x[x_order]
+        y_sorted = da.from_array(y[y_order], chunks=chunk_size)
+
+        img_arr = np.empty(fx.shape, dtype=np.float64)
+        img_arr[np.ix_(y_order, x_order)] = da.map_blocks(
+            lambda y_block: spline(y_block, x_sorted, grid=True),
+            y_sorted,
+            new_axis=1,
+            chunks=(y_sorted.chunks[0], (x_sorted.size,)),
+            dtype=np.float64,
+        ).compute()
+    else:
+        img_arr = da.map_blocks(
+            spline.ev,
+            da.from_array(fy, chunks=chunk_size),
+            da.from_array(fx, chunks=chunk_size),
+            dtype=np.float64,
+        ).compute()
+
+    return img_arr
+
+
 # FROM SNAP (only for radiance bands, not for brightness temperatures)
 # https://github.com/senbox-org/s3tbx/blob/197c9a471002eb2ec1fbd54e9a31bfc963446645/s3tbx-rad2refl/src/main/java/org/esa/s3tbx/processor/rad2refl/Rad2ReflConstants.java#L141
 # Not used for now
@@ -317,6 +373,8 @@ class S3SlstrProduct(S3Product):
         self._geom_file = "geometry_t{view}.nc"
         self._saa_name = "solar_azimuth_t{view}"
         self._sza_name = "solar_zenith_t{view}"
+        self._vaa_name = "sat_azimuth_t{view}"
+        self._vza_name = "sat_zenith_t{view}"
 
         # Rad 2 Refl
         self._misc_file = "{band}_quality_{suffix}.nc"
@@ -596,7 +654,10 @@ class S3SlstrProduct(S3Product):
 
             # Get raw band
             band_arr = self._read_nc(
-                filename, subdataset, dtype=kwargs.get("dtype", np.float32)
+                filename,
+                subdataset,
+                dtype=kwargs.get("dtype", np.float32),
+                cache=False,
             )
 
             # Radiance preprocess (BT bands are given in BT!)
@@ -705,8 +766,8 @@ class S3SlstrProduct(S3Product):
         fx_nc_name = f"x_{suffix}"
         fy_nc_name = f"y_{suffix}"
 
-        fx = np.squeeze(self._read_nc(geo_file, fx_nc_name))
-        fy = np.squeeze(self._read_nc(geo_file, fy_nc_name))
+        fx = np.squeeze(self._read_nc(geo_file, fx_nc_name).data)
+        fy = np.squeeze(self._read_nc(geo_file, fy_nc_name).data)
 
         # Interpolate via Spline (as extrapolation is possible and the grid is very sparse along the rows)
         # Import scipy here (long import)
@@ -717,7 +778,7 @@ class S3SlstrProduct(S3Product):
         spline_interp = RectBivariateSpline(ty, tx, no_nan_arr)
 
         # Interpolate and set nodata back
-        img_arr = spline_interp.ev(fy, fx)
+        img_arr = _eval_spline(spline_interp, fy, fx)
         img_arr[img_arr == 0] = np.nan
 
         return img_arr
@@ -771,8 +832,9 @@ class S3SlstrProduct(S3Product):
         Returns:
             dict: Dictionary containing {band: path}
         """
-        rad_2_refl_path, rad_2_refl_exists = self._get_out_path(
-            f"rad_2_refl_{band.name}_{suffix}.npy"
+        rad_2_refl_path, rad_2_refl_exists = self._get_np_out_path(
+            f"rad_2_refl_{band.name}_{suffix}.npy",
+            shape=(band_arr.rio.height, band_arr.rio.width),
         )
         if not rad_2_refl_exists:
             # Open SZA array (resampled to band_arr size)
@@ -785,7 +847,7 @@ class S3SlstrProduct(S3Product):
             rad_2_refl_coeff = (np.pi / e0 / np.cos(sza)).astype(np.float32)
 
             # Write on disk
-            np.save(str(rad_2_refl_path), rad_2_refl_coeff)
+            utils.save_np(rad_2_refl_coeff, rad_2_refl_path)
 
         else:
             # Open rad_2_refl_coeff (resampled to band_arr size)
@@ -860,24 +922,118 @@ class S3SlstrProduct(S3Product):
         Returns:
             np.ndarray: Resampled Sun Zenith Angle as a numpy array
         """
-        sza_img_path, sza_exists = self._get_out_path(f"sza_{suffix}.npy")
-        if not sza_exists:
+        return self._compute_angle_img_grid("sza", suffix)
+
+    def _compute_angle_img_grid(self, angle: str, suffix: str) -> np.ndarray:
+        """
+        Compute an angle (in radian) resampled to the image grid (from the tie point grid).
+
+        The angle grids are computed once per suffix and stored on disk,
+        then opened as memory-mapped arrays (shared by every band of the same grid).
+
+        Azimuth angles are interpolated through their sine and cosine, to handle their wrap-around.
+
+        Args:
+            angle (str): Angle: :code:`sza` (Sun Zenith Angle), :code:`saa` (Sun Azimuth Angle), :code:`vza` (View Zenith Angle) or :code:`vaa` (View Azimuth Angle)
+            suffix (str): Suffix
+        Returns:
+            np.ndarray: Resampled angle as a (memory-mapped) array
+        """
+        angle_img_path, angle_exists = self._get_np_out_path(f"{angle}_{suffix}.npy")
+        if not angle_exists:
             geom_file = self._replace(self._geom_file, view=suffix[-1])
-            sza_name = self._replace(self._sza_name, view=suffix[-1])
-            sza = self._read_nc(geom_file, sza_name)
-            sza_rad = sza * np.pi / 180.0
+            angle_name = self._replace(getattr(self, f"_{angle}_name"), view=suffix[-1])
+            angle_rad = np.deg2rad(self._read_nc(geom_file, angle_name))
 
             # From tie grid to image grid
-            sza_img = self._tie_to_img(sza_rad, suffix)
+            if angle in ["saa", "vaa"]:
+                sin_img = self._tie_to_img(np.sin(angle_rad), suffix)
+                cos_img = self._tie_to_img(np.cos(angle_rad), suffix)
+                angle_img = np.arctan2(
+                    np.nan_to_num(sin_img), np.nan_to_num(cos_img)
+                ) % (2 * np.pi)
+                angle_img[np.isnan(sin_img) & np.isnan(cos_img)] = np.nan
+            else:
+                angle_img = self._tie_to_img(angle_rad, suffix)
 
             # Write on disk
-            np.save(str(sza_img_path), sza_img)
+            utils.save_np(angle_img.astype(np.float32), angle_img_path)
 
-        else:
-            # Open sza_img (resampled to band_arr size)
-            sza_img = utils.load_np(sza_img_path, self._tmp_process)
+        # Open angle_img (resampled to band_arr size)
+        return utils.load_np(angle_img_path, self._tmp_process)
+
+    def _has_angle(self, angle: BandNames) -> bool:
+        """
+        Can the specified per-pixel angle band be loaded from this product?
+
+        The geometry files give the sun and viewing angles on the tie-point grid, for each view.
+
+        Args:
+            angle (BandNames): Angle band
 
-        return sza_img
+        Returns:
+            bool: True if the specified angle band is provided by the current product
+        """
+        return True
+
+    def _open_angle(
+        self,
+        band: BandNames,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Open a per-pixel angle band (in degrees) as a xarray.
+
+        The angles are interpolated from the tie-point grid to the image grid of the wanted view and stripe, then geocoded as the bands.
+
+        Args:
+            band (BandNames): Wanted angle band
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            xr.DataArray: Angle band
+        """
+        suffix = self._get_suffix(**kwargs)
+        angle_name = to_str(band)[0]
+        pp_path = self._get_preprocessed_band_path(
+            angle_name, suffix=suffix, pixel_size=pixel_size, writable=False
+        )
+
+        if not pp_path.is_file():
+            pp_path = self._get_preprocessed_band_path(
+                angle_name, suffix=suffix, pixel_size=pixel_size, writable=True
+            )
+
+            # Use the cartesian grid as template of the image grid
+            img_grid = self._read_nc(f"cartesian_{suffix}.nc", f"x_{suffix}")
+            angle_img = np.rad2deg(
+                np.asarray(self._compute_angle_img_grid(band.name.lower(), suffix))
+            )
+            angle_arr = img_grid.copy(
+                data=angle_img.reshape(img_grid.shape).astype(np.float32)
+            )
+
+            # Geocode
+            LOGGER.debug(f"Geocoding {angle_name}")
+            angle_arr = self._geocode(
+                angle_arr,
+                suffix=suffix,
+                pixel_size=pixel_size,
+                resampling=Resampling.nearest,
+            )
+
+            # Write on disk
+            angle_arr = utils.write_path_in_attrs(angle_arr, pp_path)
+            utils.write(angle_arr, pp_path)
+
+        angle_arr = utils.read(
+            pp_path, pixel_size=pixel_size, size=size, as_type=np.float32
+        )
+        angle_arr.attrs["long_name"] = angle_name
+        return angle_arr.rename(angle_name)
 
     def _compute_e0(self, band: BandNames, suffix: str) -> np.ndarray:
         """
@@ -20,19 +20,30 @@ for more information.
 """
 
 import logging
+import os
 from abc import abstractmethod
 
 import affine
+import numpy as np
 import rasterio
 import xarray as xr
+from rasterio import rpc, windows
 from rasterio.crs import CRS
 from sertit import AnyPath, rasters
 from sertit.types import AnyPathStrType, AnyPathType
 
 from eoreader import EOREADER_NAME, utils
-from eoreader.bands import BandNames
+from eoreader.bands import PAN, BandNames
+from eoreader.env_vars import TILE_SIZE
 from eoreader.exceptions import InvalidProductError
+from eoreader.keywords import PANSHARPEN_KW
 from eoreader.products import OpticalProduct
+from eoreader.products.optical.pansharpening import (
+    PansharpeningMethod,
+    get_spectral_weights,
+    pansharpen,
+)
+from eoreader.utils import DEFAULT_TILE_SIZE
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
@@ -146,14 +157,11 @@ class VhrProduct(OpticalProduct):
 
                 # Reproject and write on disk data
                 dem_path = self._get_dem_path(**kwargs)
+                rpcs = kwargs.pop("rpcs") if "rpcs" in kwargs else self._get_rpcs()
 
                 with rasterio.open(str(self._get_tile_path())) as ds:
                     tags = ds.tags()
 
-                    # TODO: change this when available in rioxarray
-                    # See https://github.com/corteva/rioxarray/issues/837
-                    rpcs = kwargs.pop("rpcs") if "rpcs" in kwargs else ds.rpcs
-
                     # Only look for GCPs if RPCs are absent
                     if not rpcs:
                         gcps = kwargs.pop("gcps") if "gcps" in kwargs else ds.gcps[0]
@@ -182,6 +190,133 @@ class VhrProduct(OpticalProduct):
 
         return ortho_path
 
+    def _get_rpcs(self) -> rpc.RPC | None:
+        """
+        Get the RPCs of the raw (not orthorectified) stack.
+
+        Returns:
+            rpc.RPC | None: RPCs
+        """
+        # TODO: change this when available in rioxarray
+        # See https://github.com/corteva/rioxarray/issues/837
+        with rasterio.open(str(self._get_tile_path())) as ds:
+            return ds.rpcs
+
+    def _can_orthorectify_window(self, **kwargs) -> bool:
+        """
+        Can the wanted window be orthorectified alone?
+        Only if a window is given and if the product needs to be orthorectified with RPCs (and has not been yet).
+
+        Args:
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            bool: True if the window can be orthorectified alone
+        """
+        if (
+            kwargs.get("window") is None
+            or self.product_type not in self._proj_prod_type
+        ):
+            return False
+
+        _, ortho_exists = self._get_out_path(f"{self.condensed_name}_ortho.tif")
+        if ortho_exists:
+            return False
+
+        rpcs = kwargs.get("rpcs") if "rpcs" in kwargs else self._get_rpcs()
+        return bool(rpcs)
+
+    def _get_windowed_ortho_path(self, band: BandNames, **kwargs) -> AnyPathType:
+        """
+        Orthorectify only the wanted band over the wanted window.
+
+        The orthorectified grid is split in tiles and only the tiles intersecting the window are orthorectified
+        (reading only the raw pixels needed, computed with the inverse RPC model).
+        These tiles are kept on disk, so that overlapping windows can reuse them.
+
+        Args:
+            band (BandNames): Wanted band
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            AnyPathType: Path of the VRT mosaicking the orthorectified tiles covering the window
+        """
+        rpcs = kwargs.pop("rpcs") if "rpcs" in kwargs else self._get_rpcs()
+        band_id = self.bands[band].id
+
+        try:
+            tile_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+        except ValueError:
+            tile_size = int(DEFAULT_TILE_SIZE)
+
+        ortho_tr, ortho_w, ortho_h = self._get_ortho_grid()
+        win_bounds = utils.get_window_bounds(kwargs.get("window"), self.crs(), ortho_tr)
+        blocks = self._get_ortho_blocks(
+            ortho_w,
+            ortho_h,
+            tile_size,
+            window=windows.from_bounds(*win_bounds, ortho_tr),
+        )
+
+        tiles_folder = self._get_band_folder(writable=True).joinpath(
+            f"{self.condensed_name}_ortho_tiles_{tile_size}"
+        )
+        os.makedirs(str(tiles_folder), exist_ok=True)
+
+        src_xda = None
+        dem_path = None
+        tile_paths = []
+        for block_row, block_col, block_win in blocks:
+            tile_path = tiles_folder.joinpath(
+                f"{self.condensed_name}_ortho_{band_id}_{block_row}_{block_col}.tif"
+            )
+            if not tile_path.is_file():
+                if src_xda is None:
+                    LOGGER.info(
+                        f"Orthorectifying {band.name} over the wanted window only "
+                        f"({len(blocks)} tile(s) of {tile_size} pixels)."
+                    )
+                    dem_path = self._get_dem_path(**kwargs)
+                    src_xda = utils.read(self._get_tile_path(), indexes=[band_id])
+
+                tile_xda = self._orthorectify_block(
+                    src_xda,
+                    rpcs=rpcs,
+                    dem_path=dem_path,
+                    dst_transform=windows.transform(block_win, ortho_tr),
+                    dst_shape=(block_win.height, block_win.width),
+                    caching_folder=tiles_folder,
+                    num_threads=utils.get_max_cores(),
+                    **kwargs,
+                )
+                if tile_xda is None:
+                    continue
+
+                tile_xda.attrs["long_name"] = band.name
+                utils.write(
+                    tile_xda, tile_path, dtype=np.float32, nodata=self._raw_nodata
+                )
+            tile_paths.append(tile_path)
+
+        if not tile_paths:
+            LOGGER.warning(
+                "The wanted window doesn't intersect the product. Orthorectifying the whole stack."
+            )
+            if not self.ortho_path:
+                self.ortho_path = self._get_ortho_path(rpcs=rpcs, **kwargs)
+            return self.ortho_path
+
+        first_row, first_col, _ = blocks[0]
+        last_row, last_col, _ = blocks[-1]
+        vrt_path = tiles_folder.joinpath(
+            f"{self.condensed_name}_ortho_{band_id}_"
+            f"{first_row}-{last_row}_{first_col}-{last_col}.vrt"
+        )
+        if not vrt_path.is_file():
+            rasters.merge_vrt(tile_paths, vrt_path)
+
+        return vrt_path
+
     def get_band_paths(
         self, band_list: list, pixel_size: float = None, **kwargs
     ) -> dict:
@@ -210,7 +345,9 @@ class VhrProduct(OpticalProduct):
         Returns:
             dict: Dictionary containing the path of each queried band
         """
-        if not self.ortho_path:
+        # Only orthorectify the wanted window (and bands) if the whole stack is not orthorectified yet
+        windowed_ortho = not self.ortho_path and self._can_orthorectify_window(**kwargs)
+        if not self.ortho_path and not windowed_ortho:
             self.ortho_path = self._get_ortho_path(**kwargs)
 
         # Processed path names
@@ -225,11 +362,13 @@ class VhrProduct(OpticalProduct):
                 reproj_path = self._get_utm_band_path(
                     band=band.name, pixel_size=pixel_size
                 )
-                if not reproj_path.is_file():
+                if reproj_path.is_file():
+                    band_path = reproj_path
+                elif windowed_ortho:
+                    band_path = self._get_windowed_ortho_path(band, **kwargs)
+                else:
                     # Then for original data
                     band_path = self.ortho_path
-                else:
-                    band_path = reproj_path
 
                 band_paths[band] = band_path
 
@@ -341,6 +480,13 @@ class VhrProduct(OpticalProduct):
         # Return empty if no band are specified
         if not bands:
             return {}
+
+        pansharpen_method = kwargs.pop(PANSHARPEN_KW, None)
+        if pansharpen_method and self.has_band(PAN):
+            return self._load_pansharpened_bands(
+                bands, pansharpen_method, pixel_size=pixel_size, size=size, **kwargs
+            )
+
         band_paths = self.get_band_paths(bands, pixel_size=pixel_size, **kwargs)
 
         # Open bands and get array (resampled if needed)
@@ -350,6 +496,73 @@ class VhrProduct(OpticalProduct):
 
         return band_arrays
 
+    def _load_pansharpened_bands(
+        self,
+        bands: list,
+        method: PansharpeningMethod | str,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Load bands, with the multispectral bands pan-sharpened at the wanted pixel size.
+
+        The multispectral bands are loaded at their native pixel size and pan-sharpened lazily (chunk by chunk)
+        with the panchromatic band loaded at the wanted pixel size.
+
+        Args:
+            bands list: List of the wanted bands
+            method (PansharpeningMethod | str): Pan-sharpening method
+            pixel_size (float): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Other arguments used to load bands
+        Returns:
+            dict: Dictionary {band_name, band_xarray}
+        """
+        # Load the panchromatic band at the wanted pixel size
+        pan_arr = self._load_bands([PAN], pixel_size=pixel_size, size=size, **kwargs)[
+            PAN
+        ]
+        pan_res = abs(pan_arr.rio.resolution()[0])
+
+        # Only pan-sharpen the multispectral bands coarser than the wanted pixel size
+        ms_res = {
+            band: self.bands[band].gsd or self._ms_res
+            for band in bands
+            if band != PAN and self.bands[band] is not None
+        }
+        sharp_bands = [band for band, res in ms_res.items() if res and res > pan_res]
+        other_bands = [band for band in bands if band not in sharp_bands + [PAN]]
+
+        band_arrays = {}
+        if sharp_bands:
+            ms_arrays = {}
+            for band in sharp_bands:
+                ms_arrays.update(
+                    self._load_bands([band], pixel_size=ms_res[band], **kwargs)
+                )
+
+            band_arrays = pansharpen(
+                ms_arrays,
+                pan_arr,
+                method=method,
+                weights=get_spectral_weights(
+                    {band: self.bands[band] for band in sharp_bands}, self.bands[PAN]
+                ),
+            )
+
+        if other_bands:
+            band_arrays.update(
+                self._load_bands(
+                    other_bands, pixel_size=pixel_size, size=size, **kwargs
+                )
+            )
+
+        if PAN in bands:
+            band_arrays[PAN] = pan_arr
+
+        return band_arrays
+
     def _manage_nodata(
         self,
         band_arr: xr.DataArray,
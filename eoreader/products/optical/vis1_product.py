@@ -28,6 +28,7 @@ import numpy as np
 import xarray as xr
 from lxml import etree
 from rasterio import crs as riocrs
+from rasterio import rpc
 from sertit import geometry, rasters
 from sertit.misc import ListEnum
 from sertit.types import AnyPathType
@@ -375,24 +376,19 @@ class Vis1Product(DimapV1Product):
         """
         return self._get_path("DIM_", "xml")
 
-    def _get_ortho_path(self, **kwargs) -> AnyPathType:
+    def _get_rpcs(self) -> rpc.RPC:
         """
-        Get the orthorectified path of the bands.
+        Get the RPCs of the raw (not orthorectified) stack, stored in a separate file.
 
         Returns:
-            AnyPathType: Orthorectified path
+            rpc.RPC: RPCs
         """
-        if self.product_type in self._proj_prod_type:
-            # Compute RPCSs
-            if self.is_archived:
-                rpcs_file = io.BytesIO(self._read_archived_file(r".*\.rpc"))
-            else:
-                rpcs_file = self.path.joinpath(self.name + ".rpc")
-
-            rpcs = utils.open_rpc_file(rpcs_file)
+        if self.is_archived:
+            rpcs_file = io.BytesIO(self._read_archived_file(r".*\.rpc"))
         else:
-            rpcs = None
-        return super()._get_ortho_path(rpcs=rpcs, **kwargs)
+            rpcs_file = self.path.joinpath(self.name + ".rpc")
+
+        return utils.open_rpc_file(rpcs_file)
 
     @qck_wrapper
     def get_quicklook_path(self) -> str:
@@ -37,11 +37,12 @@ import validators
 import xarray as xr
 from affine import Affine
 from lxml import etree, html
-from rasterio import control, rpc, transform, warp
+from rasterio import control, rpc, transform, warp, windows
 from rasterio import shutil as rio_shutil
 from rasterio.crs import CRS
 from rasterio.enums import Resampling
 from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
 from sertit import (
     AnyPath,
     files,
@@ -57,16 +58,16 @@ from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType, AnyXrDataStructure
 from sertit.vectors import WGS84
 
-from eoreader import EOREADER_NAME, cache, utils
+from eoreader import EOREADER_NAME, cache, dem_cache, remote_io, terrain, utils
 from eoreader.bands import (
     DEM,
     HILLSHADE,
-    NEEDED_BANDS,
     PAN,
     SLOPE,
     BandNames,
     compute_index,
     indices,
+    is_angle,
     is_clouds,
     is_dem,
     is_index,
@@ -783,6 +784,32 @@ class Product:
 
         return out, exists
 
+    def _get_np_out_path(
+        self, filename: str, shape: tuple = None, transform=None, crs=None
+    ) -> tuple[AnyPathType, bool]:
+        """
+        Returns the output path of a numpy pickle to be written, and if it already exists and can be reused
+        (i.e. if it corresponds to the given shape, transform and CRS, see :py:func:`eoreader.utils.is_valid_np`)
+
+        Args:
+            filename (str): Filename
+            shape (tuple): Expected shape (of the last dimensions of the array)
+            transform (affine.Affine): Expected transform
+            crs (Any): Expected CRS
+
+        Returns:
+            tuple[AnyPathType, bool]: Output path and if the file already exists (and is valid) or not
+        """
+        out, exists = self._get_out_path(filename)
+        if exists and not utils.is_valid_np(
+            out, shape=shape, transform=transform, crs=crs
+        ):
+            LOGGER.debug(f"{filename} is outdated and will be computed again.")
+            out = self._get_band_folder(writable=True) / filename
+            exists = False
+
+        return out, exists
+
     def _is_existing(self, filename: str) -> tuple[AnyPathType, bool]:
         """
         Returns the output path of a filename (looking in nor writable folder first), and if it exists or not
@@ -1132,7 +1159,20 @@ class Product:
 
         # Load bands (only once! and convert the bands to be loaded to correct format)
         unique_bands = misc.unique(bands)
-        band_xds = self._load(unique_bands, pixel_size, size, **kwargs)
+        if remote_io.is_remote_io_profile_enabled() and remote_io.is_remote_path(
+            self.path
+        ):
+            # Only the eager reads (i.e. opening the files) are tracked here, the data is read when computing the bands
+            with (
+                remote_io.remote_io_profile(self.path),
+                remote_io.track_remote_io() as remote_io_stats,
+            ):
+                band_xds = self._load(unique_bands, pixel_size, size, **kwargs)
+            LOGGER.debug(
+                f"Remote I/O when loading {to_str(unique_bands)} (eager reads only): {remote_io_stats}"
+            )
+        else:
+            band_xds = self._load(unique_bands, pixel_size, size, **kwargs)
 
         # Rename all bands and add attributes
         for key, val in band_xds.items():
@@ -1166,6 +1206,7 @@ class Product:
         band_list = []
         index_list = []
         dem_list = []
+        angle_list = []
         clouds_list = []
         mask_list = []
         s2_l2a_list = []
@@ -1208,6 +1249,13 @@ class Product:
                     )
             elif is_dem(band):
                 dem_list.append(band)
+            elif is_angle(band):
+                if self._has_angle(band):
+                    angle_list.append(band)
+                else:
+                    raise InvalidBandError(
+                        f"{band} cannot be retrieved from {self.condensed_name}."
+                    )
             elif is_clouds(band):
                 if self.sensor_type == SensorType.OPTICAL:
                     clouds_list.append(band)
@@ -1237,7 +1285,7 @@ class Product:
         # Get all bands to be open
         bands_to_load = band_list.copy()
         for idx in index_list:
-            bands_to_load += NEEDED_BANDS[idx]
+            bands_to_load += indices.get_needed_bands(idx)
 
         # Load band arrays (only keep unique bands: open them only one time!)
         unique_bands = misc.unique(bands_to_load)
@@ -1274,6 +1322,15 @@ class Product:
                 self._load_dem(dem_list, pixel_size=pixel_size, size=size, **kwargs)
             )
 
+        # Add angles
+        if angle_list:
+            LOGGER.debug(f"Loading angle bands {to_str(angle_list)}")
+            bands_dict.update(
+                self._load_angles(
+                    angle_list, pixel_size=pixel_size, size=size, **kwargs
+                )
+            )
+
         # Add Clouds
         if clouds_list:
             LOGGER.debug(f"Loading Cloud bands {to_str(clouds_list)}")
@@ -1349,6 +1406,89 @@ class Product:
         """
         raise NotImplementedError
 
+    def _load_angles(
+        self,
+        bands: list,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Load per-pixel angle bands as xarrays.
+
+        The angles are computed once per pixel size and written on disk.
+
+        Args:
+            bands (list): List of the wanted bands
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            dict: Dictionary {band_name, band_xarray}
+        """
+        angle_bands = {}
+        for band in bands:
+            angle_path, angle_exists = self._is_existing(
+                self.get_band_file_name(band, pixel_size, size, **kwargs)
+            )
+            if not angle_exists:
+                LOGGER.debug(
+                    "Computing %s for %s", to_str(band)[0], self.condensed_name
+                )
+                angle_arr = self._open_angle(band, pixel_size, size, **kwargs)
+                angle_path = self.get_band_path(
+                    band, pixel_size, size, writable=True, **kwargs
+                )
+                utils.write(
+                    utils.write_path_in_attrs(angle_arr, angle_path),
+                    angle_path,
+                    dtype=np.float32,
+                )
+
+            angle_name = to_str(band)[0]
+            angle_arr = utils.read(angle_path, as_type=np.float32).rename(angle_name)
+            angle_arr.attrs["long_name"] = angle_name
+            angle_bands[band] = angle_arr
+
+        return angle_bands
+
+    def _open_angle(
+        self,
+        band: BandNames,
+        pixel_size: float = None,
+        size: list | tuple = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Open a per-pixel angle band (in degrees) as a xarray, on the grid of the product bands.
+
+        Args:
+            band (BandNames): Wanted angle band
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            xr.DataArray: Angle band
+        """
+        raise InvalidBandError(
+            f"{band} cannot be retrieved from {self.condensed_name}."
+        )
+
+    def _get_sun_angles(
+        self, pixel_size: float = None, size: list | tuple = None, **kwargs
+    ) -> tuple:
+        """
+        Get the sun angles (azimuth and zenith) used to compute the hillshade.
+
+        Args:
+            pixel_size (int): Band pixel size in meters
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Additional arguments
+        Returns:
+            tuple: Azimuth and zenith angles
+        """
+        return self.get_mean_sun_angles()
+
     def _get_band_key(
         self,
         band: BandNames,
@@ -1513,6 +1653,28 @@ class Product:
         dem_bands = {}
         if band_list:
             dem_path = os.environ.get(DEM_PATH)  # We already checked if it exists
+
+            # Compute the slope and the hillshade in one pass if they come from the same DEM
+            slope_dem_path = kwargs.get(SLOPE_KW, dem_path)
+            if (
+                SLOPE in band_list
+                and HILLSHADE in band_list
+                and slope_dem_path == kwargs.get(HILLSHADE_KW, dem_path)
+                and self.sensor_type == SensorType.OPTICAL
+            ):
+                sun_angles = self._get_sun_angles(
+                    pixel_size=pixel_size, size=size, **kwargs
+                )
+                if all(angle is not None for angle in sun_angles):
+                    self._compute_terrain(
+                        slope_dem_path,
+                        [SLOPE, HILLSHADE],
+                        pixel_size=pixel_size,
+                        size=size,
+                        sun_angles=sun_angles,
+                        **kwargs,
+                    )
+
             for band in band_list:
                 assert is_dem(band)
                 if band == DEM:
@@ -1647,6 +1809,8 @@ class Product:
         if is_dem(band):
             # Only limitation: no hillshade for SAR data
             has_band = not (self.sensor_type == SensorType.SAR and band == HILLSHADE)
+        elif is_angle(band):
+            has_band = self._has_angle(band)
         elif is_clouds(band):
             has_band = self._has_cloud_band(band)
         elif is_index(band):
@@ -1741,6 +1905,27 @@ class Product:
         """
         raise NotImplementedError
 
+    def _has_angle(self, angle: BandNames) -> bool:
+        """
+        Can the specified per-pixel angle band be loaded from this product?
+
+        .. code-block:: python
+
+            >>> from eoreader.reader import Reader
+            >>> from eoreader.bands import *
+            >>> path = r"S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE.zip"
+            >>> prod = Reader().open(path)
+            >>> prod.has_band(SZA)
+            True
+
+        Args:
+            angle (BandNames): Angle band
+
+        Returns:
+            bool: True if the specified angle band is provided by the current product
+        """
+        return False
+
     def _has_s2_l2a_bands(self, band: BandNames) -> bool:
         """
         Can the specified mask be loaded from this product?
@@ -1939,6 +2124,9 @@ class Product:
             LOGGER.info(
                 "Already existing DEM for %s. Skipping process.", warped_dem_path
             )
+
+            # The warped VRT points to the DEM tile cache for remote DEMs: download again the tiles evicted since
+            self._refresh_cached_dem(dem_path, **kwargs)
         else:
             LOGGER.debug("Warping DEM for %s", self.condensed_name)
 
@@ -1957,40 +2145,14 @@ class Product:
             # Reproject DEM into products CRS
             LOGGER.debug("Using DEM: %s", dem_path)
             def_tr, def_w, def_h, def_crs = self.default_transform(**kwargs)
+
+            # Read the remote DEMs from the local tile cache
+            dem_path = dem_cache.get_cached_dem(
+                dem_path, transform.array_bounds(def_h, def_w, def_tr), def_crs
+            )
             with rasterio.open(str(dem_path)) as dem_ds:
                 # Get adjusted transform and shape (with new pixel_size)
-                if size is not None and pixel_size is None:
-                    try:
-                        # Get destination transform
-                        out_h = size[1]
-                        out_w = size[0]
-
-                        # Get destination transform
-                        coeff_x = def_w / out_w
-                        coeff_y = def_h / out_h
-                        dst_tr = def_tr
-                        dst_tr *= dst_tr.scale(coeff_x, coeff_y)
-
-                    except (TypeError, KeyError) as exc:
-                        raise ValueError(
-                            f"Size should exist (as pixel_size is None)"
-                            f" and castable to a list: {size}"
-                        ) from exc
-
-                else:
-                    # Refine pixel_size
-                    if pixel_size is None:
-                        pixel_size = self.pixel_size
-
-                    bounds = transform.array_bounds(def_h, def_w, def_tr)
-                    dst_tr, out_w, out_h = warp.calculate_default_transform(
-                        def_crs,
-                        self.crs(),
-                        def_w,
-                        def_h,
-                        *bounds,
-                        resolution=pixel_size,
-                    )
+                dst_tr, out_w, out_h = self._get_out_grid(pixel_size, size, **kwargs)
 
                 vrt_options = {
                     "resampling": resampling,
@@ -2009,6 +2171,71 @@ class Product:
 
         return warped_dem_path
 
+    def _refresh_cached_dem(self, dem_path: str, **kwargs) -> None:
+        """
+        Make sure the tiles of a remote DEM (or exogenous data) covering the product are still in the DEM tile cache,
+        as they may have been evicted (by any process) since the DEM has been warped to this product.
+
+        Args:
+            dem_path (str): DEM path
+            kwargs: Other arguments used to load bands
+        """
+        if dem_cache.is_remote(dem_path):
+            def_tr, def_w, def_h, def_crs = self.default_transform(**kwargs)
+            dem_cache.get_cached_dem(
+                dem_path, transform.array_bounds(def_h, def_w, def_tr), def_crs
+            )
+
+    def _get_out_grid(
+        self, pixel_size: float | tuple = None, size: list | tuple = None, **kwargs
+    ) -> (Affine, int, int):
+        """
+        Get the pixel grid (transform, width and height) of the product bands for the given pixel size or size.
+
+        Args:
+            pixel_size (float | tuple): Pixel size in meters. If not specified, use the product pixel size.
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            (Affine, int, int): Transform, width and height
+        """
+        def_tr, def_w, def_h, def_crs = self.default_transform(**kwargs)
+        if size is not None and pixel_size is None:
+            try:
+                # Get destination transform
+                out_h = size[1]
+                out_w = size[0]
+
+                # Get destination transform
+                coeff_x = def_w / out_w
+                coeff_y = def_h / out_h
+                dst_tr = def_tr
+                dst_tr *= dst_tr.scale(coeff_x, coeff_y)
+
+            except (TypeError, KeyError) as exc:
+                raise ValueError(
+                    f"Size should exist (as pixel_size is None)"
+                    f" and castable to a list: {size}"
+                ) from exc
+
+        else:
+            # Refine pixel_size
+            if pixel_size is None:
+                pixel_size = self.pixel_size
+
+            bounds = transform.array_bounds(def_h, def_w, def_tr)
+            dst_tr, out_w, out_h = warp.calculate_default_transform(
+                def_crs,
+                self.crs(),
+                def_w,
+                def_h,
+                *bounds,
+                resolution=pixel_size,
+            )
+
+        return dst_tr, out_w, out_h
+
     def _warp_exo(
         self,
         exo_path: str = "",
@@ -2046,6 +2273,9 @@ class Product:
             LOGGER.debug(
                 "Already existing EXO for %s. Skipping process.", self.condensed_name
             )
+
+            # The warped VRT points to the tile cache for remote data: download again the tiles evicted since
+            self._refresh_cached_dem(exo_path, **kwargs)
         else:
             LOGGER.debug("Warping EXO for %s", self.condensed_name)
 
@@ -2064,6 +2294,11 @@ class Product:
             # Reproject EXO into products CRS
             LOGGER.debug("Using EXO: %s", exo_path)
             def_tr, def_w, def_h, def_crs = self.default_transform(**kwargs)
+
+            # Read the remote data from the local tile cache
+            exo_path = dem_cache.get_cached_dem(
+                exo_path, transform.array_bounds(def_h, def_w, def_tr), def_crs
+            )
             with rasterio.open(str(exo_path)) as exo_ds:
                 # Get adjusted transform and shape (with new pixel_size)
                 if size is not None and pixel_size is None:
@@ -2159,35 +2394,103 @@ class Product:
             AnyPathType: Slope mask path
 
         """
+        return self._compute_terrain(
+            dem_path, [SLOPE], pixel_size, size, resampling, **kwargs
+        )[SLOPE]
+
+    def _compute_terrain(
+        self,
+        dem_path: str = "",
+        bands: list = None,
+        pixel_size: float | tuple = None,
+        size: list | tuple = None,
+        resampling: Resampling = Resampling.bilinear,
+        sun_angles: tuple = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Compute the terrain bands (slope and hillshade) of the DEM, in one pass and chunk by chunk (see :py:mod:`eoreader.terrain`)
+
+        Args:
+            dem_path (str): DEM path, using EUDEM/MERIT DEM if none
+            bands (list): Terrain bands to compute (:code:`SLOPE` and/or :code:`HILLSHADE`)
+            pixel_size (float | tuple): Pixel size in meters. If not specified, use the product pixel size.
+            size (tuple | list): Size of the array (width, height). Not used if pixel_size is provided.
+            resampling (Resampling): Resampling method
+            sun_angles (tuple): Sun azimuth and zenith angles (scene means or per-pixel arrays), needed for the hillshade
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            dict: Terrain band paths {band: path}
+        """
+        derivatives = {
+            SLOPE: terrain.TerrainDerivative.SLOPE,
+            HILLSHADE: terrain.TerrainDerivative.HILLSHADE,
+        }
+
         # Warp DEM
         warped_dem_path = self._warp_dem(
             dem_path, pixel_size, size, resampling, **kwargs
         )
 
-        # Get slope path
-        slope_name = self.get_band_file_name(
-            SLOPE,
-            dem_name=path.get_filename(dem_path),
-            pixel_size=pixel_size,
-            size=size,
-            **kwargs,
-        )
+        # Get terrain paths
+        terrain_paths = {}
+        bands_to_compute = []
+        for band in bands:
+            terrain_name = self.get_band_file_name(
+                band,
+                dem_name=path.get_filename(dem_path),
+                pixel_size=pixel_size,
+                size=size,
+                **kwargs,
+            )
+            terrain_paths[band], terrain_exists = self._get_out_path(terrain_name)
+            if terrain_exists:
+                LOGGER.debug(
+                    "Already existing %s DEM for %s. Skipping process.",
+                    derivatives[band].value,
+                    self.condensed_name,
+                )
+            else:
+                bands_to_compute.append(band)
 
-        slope_path, slope_exists = self._get_out_path(slope_name)
-        if slope_exists:
+        if bands_to_compute:
             LOGGER.debug(
-                "Already existing slope DEM for %s. Skipping process.",
-                self.condensed_name,
+                "Computing %s for %s", to_str(bands_to_compute), self.condensed_name
             )
-        else:
-            LOGGER.debug("Computing slope for %s", self.condensed_name)
+            dem_xda = utils.read(warped_dem_path, as_type=np.float32)
+            azimuth, zenith = sun_angles if sun_angles is not None else (None, None)
+
+            # The per-pixel angles must be exactly aligned with the DEM
+            if isinstance(azimuth, xr.DataArray):
+                azimuth = rasters.collocate(dem_xda, azimuth)
+            if isinstance(zenith, xr.DataArray):
+                zenith = rasters.collocate(dem_xda, zenith)
+
+            terrain_xdas = terrain.compute_terrain(
+                dem_xda,
+                [derivatives[band] for band in bands_to_compute],
+                azimuth=azimuth,
+                zenith=zenith,
+            )
+            # Write all the derivatives in one computation, reading the DEM and applying the kernel only once
+            delayed = []
+            for band in bands_to_compute:
+                terrain_xda = utils.write_path_in_attrs(
+                    terrain_xdas[derivatives[band]], warped_dem_path
+                )
+                delayed.append(
+                    utils.write(terrain_xda, terrain_paths[band], compute=False)
+                )
+
+            delayed = [write for write in delayed if write is not None]
+            if delayed:
+                # Import dask here (long import)
+                import dask
 
-            # Compute slope
-            slope = rasters.slope(warped_dem_path)
-            slope = utils.write_path_in_attrs(slope, warped_dem_path)
-            utils.write(slope, slope_path)
+                dask.compute(*delayed)
 
-        return slope_path
+        return terrain_paths
 
     @staticmethod
     def _collocate_bands(bands: dict, reference: xr.DataArray = None) -> dict:
@@ -2761,7 +3064,6 @@ class Product:
             regex=regex,
             as_list=as_list,
             case_sensitive=case_sensitive,
-            file_list=self._get_archived_file_list(archive_path),
         )
 
     def _get_archived_rio_path(self, regex, as_list=False, archive_path=None):
@@ -2774,7 +3076,6 @@ class Product:
             archive_path=archive_path,
             regex=regex,
             as_list=as_list,
-            file_list=self._get_archived_file_list(archive_path),
         )
 
     def _read_archived_vector(
@@ -2823,7 +3124,7 @@ class Product:
 
     def _get_dem_path(self, **kwargs) -> str:
         """
-        Get DEM path
+        Get DEM path (the local copy of its tiles covering the product if the DEM is remote)
 
         Returns:
             str: DEM path
@@ -2837,7 +3138,134 @@ class Product:
                 f"you must provide a valid DEM through the {DEM_PATH} environment variable"
             )
 
-        return dem_path
+        # Read the remote DEMs from the local tile cache
+        return dem_cache.get_cached_dem(
+            dem_path, self.extent().total_bounds, self.crs()
+        )
+
+    def _get_ortho_grid(self, pixel_size: float = None) -> (Affine, int, int):
+        """
+        Get the grid of the orthorectified data, aligned on the pixel size and covering the extent of the product.
+
+        Args:
+            pixel_size (float): Pixel size
+
+        Returns:
+            Affine, int, int: Transform, width and height of the orthorectified grid
+        """
+        if pixel_size is None:
+            pixel_size = self.pixel_size
+
+        left, bottom, right, top = self.extent().total_bounds
+        left = np.floor(left / pixel_size) * pixel_size
+        top = np.ceil(top / pixel_size) * pixel_size
+        width = int(np.ceil((right - left) / pixel_size))
+        height = int(np.ceil((top - bottom) / pixel_size))
+
+        return transform.from_origin(left, top, pixel_size, pixel_size), width, height
+
+    @staticmethod
+    def _get_ortho_blocks(
+        width: int, height: int, block_size: int, window: Window = None
+    ) -> list:
+        """
+        Split the orthorectified grid into blocks (only the ones intersecting the window if given).
+
+        Args:
+            width (int): Width of the grid
+            height (int): Height of the grid
+            block_size (int): Size of the blocks (in pixels)
+            window (Window): Window of the grid to cover (whole grid if None)
+
+        Returns:
+            list: List of tuples (block row, block column, block window)
+        """
+        if window is None:
+            window = Window(0, 0, width, height)
+
+        (row_start, row_stop), (col_start, col_stop) = window.toranges()
+        row_start = max(int(np.floor(row_start)) // block_size, 0)
+        row_stop = min(int(np.ceil(row_stop)), height)
+        col_start = max(int(np.floor(col_start)) // block_size, 0)
+        col_stop = min(int(np.ceil(col_stop)), width)
+
+        return [
+            (
+                block_row,
+                block_col,
+                Window(
+                    block_col * block_size,
+                    block_row * block_size,
+                    min(block_size, width - block_col * block_size),
+                    min(block_size, height - block_row * block_size),
+                ),
+            )
+            for block_row in range(row_start, int(np.ceil(row_stop / block_size)))
+            for block_col in range(col_start, int(np.ceil(col_stop / block_size)))
+        ]
+
+    def _orthorectify_block(
+        self,
+        src_xda: xr.DataArray,
+        rpcs: rpc.RPC,
+        dem_path: str,
+        dst_transform: Affine,
+        dst_shape: tuple,
+        caching_folder: AnyPathStrType,
+        **kwargs,
+    ) -> xr.DataArray | None:
+        """
+        Orthorectify one block of the orthorectified grid with RPCs,
+        reading only the source pixels needed (computed with the inverse RPC model).
+
+        Args:
+            src_xda (xr.DataArray): Raw array (lazily loaded)
+            rpcs (rpc.RPC): RPCs of the raw array
+            dem_path (str): DEM path
+            dst_transform (Affine): Transform of the block
+            dst_shape (tuple): Shape of the block (height, width)
+            caching_folder (AnyPathStrType): Folder where the DEM is cached (and converted to ellipsoidal heights) once for all blocks
+            kwargs: Other arguments (resampling, vcrs...)
+
+        Returns:
+            xr.DataArray | None: Orthorectified block, None if the block doesn't intersect the raw array
+        """
+        resampling = kwargs.get("resampling", self.band_resampling)
+        vcrs = kwargs.get("vcrs", os.getenv(DEM_VCRS))
+
+        src_window = utils.get_rpc_window(
+            rpcs,
+            transform.array_bounds(*dst_shape, dst_transform),
+            self.crs(),
+            width=src_xda.rio.width,
+            height=src_xda.rio.height,
+        )
+        if src_window is None:
+            return None
+
+        (row_start, row_stop), (col_start, col_stop) = src_window.toranges()
+        block_xda = src_xda.isel(
+            y=slice(row_start, row_stop), x=slice(col_start, col_stop)
+        ).compute()
+
+        if not block_xda.rio.crs:
+            # RPCs are always in 4326 by convention
+            block_xda.rio.write_crs(vectors.EPSG_4326, inplace=True)
+
+        return rasters.reproject(
+            block_xda,
+            rpcs=utils.shift_rpcs(rpcs, row_start, col_start),
+            dem_path=dem_path,
+            shape=dst_shape,
+            transform=dst_transform,
+            dst_crs=self.crs(),
+            resampling=resampling,
+            nodata=self._raw_nodata,
+            num_threads=kwargs.get("num_threads", 1),
+            extent=self.extent(),
+            vcrs=vcrs,
+            caching_folder=caching_folder,
+        )
 
     def _orthorectify(
         self,
@@ -2871,10 +3299,31 @@ class Product:
         resampling = kw.pop("resampling", self.band_resampling)
         vcrs = kw.pop("vcrs", os.getenv(DEM_VCRS))
 
-        if rpcs and not src_xda.rio.crs:
-            # RPCs are always in 4326 by convention
-            # https://rasterio.readthedocs.io/en/latest/topics/reproject.html#reprojecting-with-other-georeferencing-metadata
-            src_xda.rio.write_crs(vectors.EPSG_4326, inplace=True)
+        if rpcs:
+            with tempfile.TemporaryDirectory() as caching_folder:
+                out_xda = self._orthorectify_by_blocks(
+                    src_xda,
+                    rpcs=rpcs,
+                    dem_path=dem_path,
+                    pixel_size=pixel_size,
+                    caching_folder=caching_folder,
+                    resampling=resampling,
+                    vcrs=vcrs,
+                ).rename(f"Reprojected stack of {self.name}")
+                self._set_ortho_long_name(out_xda, **kw)
+
+                # Blocks are orthorectified (in parallel) while being written
+                utils.write(
+                    out_xda,
+                    ortho_path,
+                    dtype=np.float32,
+                    nodata=self._raw_nodata,
+                    tags=kw.get("tags"),
+                    predictor=kw.get("predictor"),
+                )
+
+            # Don't orthorectify the blocks again
+            return utils.read(ortho_path)
 
         out_xda = rasters.reproject(
             src_xda,
@@ -2890,13 +3339,7 @@ class Product:
             vcrs=vcrs,
             **kwargs,
         ).rename(f"Reprojected stack of {self.name}")
-
-        if "long_name" in kw:
-            out_xda.attrs["long_name"] = kw["long_name"]
-        elif kw.get("band") == PAN:
-            out_xda.attrs["long_name"] = "PAN"
-        else:
-            out_xda.attrs["long_name"] = self.get_bands_names()
+        self._set_ortho_long_name(out_xda, **kw)
 
         utils.write(
             out_xda,
@@ -2908,6 +3351,118 @@ class Product:
         )
         return out_xda
 
+    def _set_ortho_long_name(self, ortho_xda: xr.DataArray, **kwargs) -> None:
+        """
+        Set the long name of an orthorectified array
+
+        Args:
+            ortho_xda (xr.DataArray): Orthorectified array
+            kwargs: Other arguments
+        """
+        if "long_name" in kwargs:
+            ortho_xda.attrs["long_name"] = kwargs["long_name"]
+        elif kwargs.get("band") == PAN:
+            ortho_xda.attrs["long_name"] = "PAN"
+        else:
+            ortho_xda.attrs["long_name"] = self.get_bands_names()
+
+    def _orthorectify_by_blocks(
+        self,
+        src_xda: xr.DataArray,
+        rpcs: rpc.RPC,
+        dem_path: str,
+        pixel_size: float,
+        caching_folder: AnyPathStrType,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Orthorectify an array with RPCs block by block.
+
+        The orthorectified grid is split in blocks of :code:`EOREADER_TILE_SIZE` pixels,
+        each one being a dask chunk orthorectified from the raw pixels it needs only.
+        This way, the blocks are orthorectified in parallel, and only a few of them are held in memory when writing the result.
+
+        Args:
+            src_xda (xr.DataArray): Raw array (lazily loaded)
+            rpcs (rpc.RPC): RPCs of the raw array
+            dem_path (str): DEM path
+            pixel_size (float): Pixel size
+            caching_folder (AnyPathStrType): Folder where the DEM is cached
+            kwargs: Other arguments (resampling, vcrs...)
+
+        Returns:
+            xr.DataArray: Orthorectified array (lazy)
+        """
+        import dask
+        import dask.array as da
+
+        try:
+            tile_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+        except ValueError:
+            tile_size = int(DEFAULT_TILE_SIZE)
+
+        ortho_tr, ortho_w, ortho_h = self._get_ortho_grid(pixel_size)
+        nof_bands = src_xda.shape[0]
+
+        def ortho_block(block_win: Window) -> np.ndarray | None:
+            block_xda = self._orthorectify_block(
+                src_xda,
+                rpcs=rpcs,
+                dem_path=dem_path,
+                dst_transform=windows.transform(block_win, ortho_tr),
+                dst_shape=(block_win.height, block_win.width),
+                caching_folder=caching_folder,
+                num_threads=1,
+                **kwargs,
+            )
+            if block_xda is None:
+                # Block outside the raw array
+                return np.full(
+                    (nof_bands, block_win.height, block_win.width),
+                    np.nan,
+                    dtype=np.float32,
+                )
+            return block_xda.data.astype(np.float32)
+
+        LOGGER.debug(
+            f"Orthorectifying {ortho_w}x{ortho_h} pixels by blocks of {tile_size} pixels."
+        )
+        dem_cached = False
+        block_rows = {}
+        for block_row, _, block_win in self._get_ortho_blocks(
+            ortho_w, ortho_h, tile_size
+        ):
+            shape = (nof_bands, block_win.height, block_win.width)
+            if not dem_cached:
+                # The DEM is cached (and converted to ellipsoidal heights) with the first valid block:
+                # orthorectify it before the others to avoid concurrent writes
+                block_arr = ortho_block(block_win)
+                dem_cached = not np.isnan(block_arr).all()
+                block_arr = da.from_array(block_arr, chunks=shape)
+            else:
+                block_arr = da.from_delayed(
+                    dask.delayed(ortho_block)(block_win), shape=shape, dtype=np.float32
+                )
+            block_rows.setdefault(block_row, []).append(block_arr)
+
+        # Coordinates of the pixel centers
+        x_coords = ortho_tr.c + (np.arange(ortho_w) + 0.5) * ortho_tr.a
+        y_coords = ortho_tr.f + (np.arange(ortho_h) + 0.5) * ortho_tr.e
+
+        out_xda = xr.DataArray(
+            da.block(list(block_rows.values())),
+            dims=("band", "y", "x"),
+            coords={
+                "band": src_xda.coords["band"].values,
+                "y": y_coords,
+                "x": x_coords,
+            },
+        )
+        out_xda.rio.write_crs(self.crs(), inplace=True)
+        out_xda.rio.write_transform(ortho_tr, inplace=True)
+        out_xda.rio.write_nodata(np.nan, encoded=False, inplace=True)
+        return out_xda
+
     def _warp_band(
         self,
         band_path: AnyPathStrType,
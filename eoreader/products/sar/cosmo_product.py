@@ -18,11 +18,17 @@ COSMO-SkyMed products.
 More info `here <https://egeos.my.salesforce.com/sfc/p/#1r000000qoOc/a/69000000JXxZ/WEEbowzi5cmY8vLqyfAAMKZ064iN1eWw_qZAgUkTtXI>`_.
 """
 
+import contextlib
+import hashlib
+import json
 import logging
 import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import unique
-from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
@@ -30,20 +36,146 @@ import rasterio
 from lxml import etree
 from lxml.builder import E
 from rasterio import merge
-from sertit import AnyPath, misc, path, rasters_rio, strings, vectors
+from sertit import AnyPath, misc, path, strings, vectors
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType
 from shapely.geometry import Polygon, box
 
 from eoreader import DATETIME_FMT, EOREADER_NAME, cache, utils
+from eoreader.env_vars import MTD_CACHE_DIR
 from eoreader.exceptions import InvalidProductError
-from eoreader.keywords import WRITE_LIA_KW
 from eoreader.products import SarProduct, SarProductType
 from eoreader.products.product import OrbitDirection
+from eoreader.products.sar import snap_cache
 from eoreader.utils import qck_wrapper
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+H5_POOL_SIZE = 4
+"""Number of HDF5 files kept open (shared between the products)"""
+
+H5_MTD_VERSION = 1
+
+_H5_POOL = OrderedDict()
+_H5_USERS = {}
+_H5_LOCKS = {}
+_H5_POOL_LOCK = threading.Lock()
+
+
+def _get_h5_lock(key: str) -> threading.RLock:
+    """Get the lock of a HDF5 file (to be called with the pool lock)"""
+    return _H5_LOCKS.setdefault(key, threading.RLock())
+
+
+def _evict_h5() -> None:
+    """Close the least recently used HDF5 files not in use, until the pool fits its size (to be called with the pool lock)"""
+    for key in list(_H5_POOL):
+        if len(_H5_POOL) <= H5_POOL_SIZE:
+            break
+        if key not in _H5_USERS:
+            _H5_POOL.pop(key).close()
+
+
+@contextmanager
+def _open_h5(h5_path: AnyPathStrType):
+    """
+    Open a HDF5 file with rasterio (to read its subdatasets and tags), reusing the handles kept open in a pool shared between the products:
+    the same file is opened to get its swaths, tags, quicklook, images...
+
+    Each file is locked while its handle is used, as the rasterio datasets are not thread-safe,
+    but different files can be read concurrently (i.e. the swaths of a product). The pool itself is only locked while updated.
+
+    Args:
+        h5_path (AnyPathStrType): HDF5 file path
+
+    Yields:
+        rasterio.DatasetReader: Opened HDF5 file
+    """
+    key = str(h5_path)
+    with _H5_POOL_LOCK:
+        file_lock = _get_h5_lock(key)
+
+        # Don't evict a file in use
+        _H5_USERS[key] = _H5_USERS.get(key, 0) + 1
+
+    try:
+        with file_lock:
+            with _H5_POOL_LOCK:
+                h5_ds = _H5_POOL.pop(key, None)
+
+            if h5_ds is None or h5_ds.closed:
+                h5_ds = rasterio.open(key)
+
+            # Keep the last used files open
+            with _H5_POOL_LOCK:
+                _H5_POOL[key] = h5_ds
+                _evict_h5()
+
+            yield h5_ds
+    finally:
+        with _H5_POOL_LOCK:
+            _H5_USERS[key] -= 1
+            if _H5_USERS[key] == 0:
+                _H5_USERS.pop(key)
+            _evict_h5()
+
+
+def _release_h5(h5_path: AnyPathStrType) -> None:
+    """
+    Close the handle of a HDF5 file kept open in the pool (i.e. before removing the file)
+
+    Args:
+        h5_path (AnyPathStrType): HDF5 file path
+    """
+    key = str(h5_path)
+    with _H5_POOL_LOCK:
+        file_lock = _get_h5_lock(key)
+
+    with file_lock:
+        with _H5_POOL_LOCK:
+            h5_ds = _H5_POOL.pop(key, None)
+
+        if h5_ds is not None:
+            h5_ds.close()
+
+
+def _get_h5_mtd_path(h5_path: AnyPathType) -> AnyPathType:
+    """Get the path of the sidecar file storing the metadata extracted from a HDF5 file"""
+    h5_hash = hashlib.sha256(str(h5_path).encode()).hexdigest()[:32]
+    mtd_dir = os.environ.get(
+        MTD_CACHE_DIR, os.path.join(tempfile.gettempdir(), "eoreader_mtd")
+    )
+    return AnyPath(mtd_dir) / f"{path.get_filename(h5_path)}_{h5_hash}.json"
+
+
+def _read_h5_mtd(mtd_path: AnyPathType, size: int, mtime: float) -> dict | None:
+    """Read the metadata stored in a sidecar file, if existing and still valid (same HDF5 size and modification time)"""
+    try:
+        with open(mtd_path) as mtd_file:
+            h5_mtd = json.load(mtd_file)
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+
+    if (
+        h5_mtd.get("version") == H5_MTD_VERSION
+        and h5_mtd.get("size") == size
+        and h5_mtd.get("mtime") == mtime
+    ):
+        return h5_mtd.get("attributes")
+    return None
+
+
+def _write_h5_mtd(mtd_path: AnyPathType, h5_mtd: dict) -> None:
+    """Write a sidecar file atomically (as several processes may read the same product)"""
+    try:
+        os.makedirs(str(mtd_path.parent), exist_ok=True)
+        tmp_path = f"{mtd_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as tmp_file:
+            json.dump(h5_mtd, tmp_file)
+        os.replace(tmp_path, mtd_path)
+    except OSError as exc:
+        LOGGER.debug(f"Impossible to write the metadata sidecar {mtd_path}: {exc}")
+
 
 @unique
 class CosmoProductType(ListEnum):
@@ -107,12 +239,13 @@ class CosmoProduct(SarProduct):
         self._raw_band_regex = "*_{}_*.h5"
         self._band_folder = self.path
         self.snap_filename = self._img_path.name
+        self._swath = None
 
         # SNAP cannot process its archive
         self.needs_extraction = True
 
         # Get the number of swaths of this product
-        with rasterio.open(str(self._img_path)) as raw_h5:
+        with _open_h5(self._img_path) as raw_h5:
             sub_ds = [s.split("//")[-1] for s in raw_h5.subdatasets]
             # Never more than 10 swaths
             self.nof_swaths = len(set(s.split("/")[0] for s in sub_ds if "S0" in s))
@@ -224,6 +357,13 @@ class CosmoProduct(SarProduct):
 
         return extent_wgs84
 
+    def close(self):
+        """Close the product, releasing its HDF5 file from the pool of opened files"""
+        with contextlib.suppress(AttributeError, TypeError):
+            _release_h5(self._img_path)
+
+        super().close()
+
     def _set_product_type(self) -> None:
         """Set products type"""
         # Get MTD XML file
@@ -328,103 +468,128 @@ class CosmoProduct(SarProduct):
 
             return self._read_mtd_xml(mtd_from_path)
         except InvalidProductError:
+            # Without XML, the metadata is extracted from the HDF5 attributes only once, then stored in a sidecar file
+            h5_mtd = None
+            h5_path = AnyPath(self._img_path)
             try:
-                field_map = {
-                    # ProductInfo
-                    "ProductName": "Product Filename",
-                    # "ProductId": ,
-                    "MissionId": "Mission ID",
-                    # "UniqueIdentifier": ,
-                    "ProductGenerationDate": "Product Generation UTC",
-                    # "UserRequestId": ,
-                    # "ServiceRequestName": ,
-                    # ProductDefinitionData
-                    "ProductType": "Product Type",
-                    "SceneSensingStartUTC": "Scene Sensing Start UTC",
-                    "SceneSensingStopUTC": "Scene Sensing Stop UTC",
-                    # "GeoCoordTopRightEN": ,
-                    "GeoCoordSceneCentre": "Scene Centre Geodetic Coordinates",
-                    "SatelliteId": "Satellite ID",
-                    "AcquisitionMode": "Acquisition Mode",
-                    "LookSide": "Look Side",
-                    "ProjectionId": "Projection ID",
-                    "DeliveryMode": "Delivery Mode",
-                    "AcquisitionStationId": "Acquisition Station ID",
-                    # ProcessingInfo
-                    # "ProcessingLevel":,
-                    # ProductCharacteristics
-                    "AzimuthGeometricResolution": "Azimuth Geometric Resolution",
-                    "GroundRangeGeometricResolution": "Ground Range Geometric Resolution",
-                }
-
-                sbi_field_map = {
-                    "GeoCoordBottomLeft": "Bottom Left Geodetic Coordinates",
-                    "GeoCoordBottomRight": "Bottom Right Geodetic Coordinates",
-                    "GeoCoordTopLeft": "Top Left Geodetic Coordinates",
-                    "GeoCoordTopRight": "Top Right Geodetic Coordinates",
-                    # "GeoCoordTopRightEN": "Top Right East-North",
-                    "NearLookAngle": "Near Look Angle",
-                    "FarLookAngle": "Far Look Angle",
-                }
-
-                def h5_to_str(h5_val):
-                    str_val = str(h5_val)
-                    str_val = str_val.replace("[", "")
-                    str_val = str_val.replace("]", "")
-                    return str_val
-
-                import h5netcdf
-
-                with h5netcdf.File(str(self._img_path)) as netcdf_ds:
-                    # Create XML attributes
-                    global_attr = []
-                    for xml_attr, h5_attr in field_map.items():
-                        try:
-                            global_attr.append(
-                                E(xml_attr, h5_to_str(netcdf_ds.attrs[h5_attr]))
-                            )
-                        except KeyError:
-                            # CSG products don't have their ProductName in the h5 file...
-                            if xml_attr == "ProductName":
-                                global_attr.append(
-                                    E(xml_attr, path.get_filename(self._img_path))
-                                )
-
-                    if "S01" in netcdf_ds.groups and netcdf_ds.groups["S01"].variables:
-                        try:
-                            # CSK products
-                            sbi = netcdf_ds.groups["S01"].variables["SBI"]
-                        except KeyError:
-                            # CSG products
-                            sbi = netcdf_ds.groups["S01"].variables["IMG"]
-                    elif netcdf_ds.variables:
-                        try:
-                            sbi = netcdf_ds.variables["IMG"]
-                        except KeyError:
-                            sbi = netcdf_ds.variables["MBI"]
-                    else:
-                        raise InvalidProductError(
-                            "No valid variable found in the dataset. Cannot read the product."
-                        )
+                stat = h5_path.stat()
+                size, mtime = stat.st_size, stat.st_mtime
+            except (OSError, AttributeError, NotImplementedError):
+                # No way to know if the file has been modified: don't persist its metadata
+                size = mtime = mtd_path = None
+            else:
+                mtd_path = _get_h5_mtd_path(h5_path)
+                h5_mtd = _read_h5_mtd(mtd_path, size, mtime)
+
+            if h5_mtd is None:
+                h5_mtd = self._extract_h5_mtd()
+                if mtd_path is not None:
+                    _write_h5_mtd(
+                        mtd_path,
+                        {
+                            "version": H5_MTD_VERSION,
+                            "h5": str(h5_path),
+                            "size": size,
+                            "mtime": mtime,
+                            "attributes": h5_mtd,
+                        },
+                    )
 
-                    for xml_attr, h5_attr in sbi_field_map.items():
-                        global_attr.append(E(xml_attr, h5_to_str(sbi.attrs[h5_attr])))
+            mtd_el = E.s3_global_attributes(
+                *[E(xml_attr, val) for xml_attr, val in h5_mtd.items()]
+            )
+            return mtd_el, {}
 
-                    mtd = E.s3_global_attributes(*global_attr)
-                    mtd_el = etree.fromstring(
-                        etree.tostring(
-                            mtd,
-                            pretty_print=True,
-                            xml_declaration=True,
-                            encoding="UTF-8",
-                        )
+    def _extract_h5_mtd(self) -> dict:
+        """
+        Extract the metadata from the attributes of the HDF5 file (when the XML metadata file is missing).
+
+        Returns:
+            dict: Metadata, as XML tags and their values
+        """
+        try:
+            field_map = {
+                # ProductInfo
+                "ProductName": "Product Filename",
+                # "ProductId": ,
+                "MissionId": "Mission ID",
+                # "UniqueIdentifier": ,
+                "ProductGenerationDate": "Product Generation UTC",
+                # "UserRequestId": ,
+                # "ServiceRequestName": ,
+                # ProductDefinitionData
+                "ProductType": "Product Type",
+                "SceneSensingStartUTC": "Scene Sensing Start UTC",
+                "SceneSensingStopUTC": "Scene Sensing Stop UTC",
+                # "GeoCoordTopRightEN": ,
+                "GeoCoordSceneCentre": "Scene Centre Geodetic Coordinates",
+                "SatelliteId": "Satellite ID",
+                "AcquisitionMode": "Acquisition Mode",
+                "LookSide": "Look Side",
+                "ProjectionId": "Projection ID",
+                "DeliveryMode": "Delivery Mode",
+                "AcquisitionStationId": "Acquisition Station ID",
+                # ProcessingInfo
+                # "ProcessingLevel":,
+                # ProductCharacteristics
+                "AzimuthGeometricResolution": "Azimuth Geometric Resolution",
+                "GroundRangeGeometricResolution": "Ground Range Geometric Resolution",
+            }
+
+            sbi_field_map = {
+                "GeoCoordBottomLeft": "Bottom Left Geodetic Coordinates",
+                "GeoCoordBottomRight": "Bottom Right Geodetic Coordinates",
+                "GeoCoordTopLeft": "Top Left Geodetic Coordinates",
+                "GeoCoordTopRight": "Top Right Geodetic Coordinates",
+                # "GeoCoordTopRightEN": "Top Right East-North",
+                "NearLookAngle": "Near Look Angle",
+                "FarLookAngle": "Far Look Angle",
+            }
+
+            def h5_to_str(h5_val):
+                str_val = str(h5_val)
+                str_val = str_val.replace("[", "")
+                str_val = str_val.replace("]", "")
+                return str_val
+
+            import h5netcdf
+
+            LOGGER.debug(f"Extracting the metadata from {self._img_path.name}")
+            h5_mtd = {}
+            with h5netcdf.File(str(self._img_path)) as netcdf_ds:
+                for xml_attr, h5_attr in field_map.items():
+                    try:
+                        h5_mtd[xml_attr] = h5_to_str(netcdf_ds.attrs[h5_attr])
+                    except KeyError:
+                        # CSG products don't have their ProductName in the h5 file...
+                        if xml_attr == "ProductName":
+                            h5_mtd[xml_attr] = path.get_filename(self._img_path)
+
+                if "S01" in netcdf_ds.groups and netcdf_ds.groups["S01"].variables:
+                    try:
+                        # CSK products
+                        sbi = netcdf_ds.groups["S01"].variables["SBI"]
+                    except KeyError:
+                        # CSG products
+                        sbi = netcdf_ds.groups["S01"].variables["IMG"]
+                elif netcdf_ds.variables:
+                    try:
+                        sbi = netcdf_ds.variables["IMG"]
+                    except KeyError:
+                        sbi = netcdf_ds.variables["MBI"]
+                else:
+                    raise InvalidProductError(
+                        "No valid variable found in the dataset. Cannot read the product."
                     )
 
-                return mtd_el, {}
-            except KeyError as exc:
-                raise InvalidProductError(
-                    "Missing the XML metadata file. Cannot read the product."
-                ) from exc
+                for xml_attr, h5_attr in sbi_field_map.items():
+                    h5_mtd[xml_attr] = h5_to_str(sbi.attrs[h5_attr])
+
+            return h5_mtd
+        except KeyError as exc:
+            raise InvalidProductError(
+                "Missing the XML metadata file. Cannot read the product."
+            ) from exc
 
     @qck_wrapper
     def get_quicklook_path(self) -> str:
@@ -436,7 +601,7 @@ class CosmoProduct(SarProduct):
         """
         qlk_path, qlk_exists = self._get_out_path(f"{self.condensed_name}_QLK.png")
         if not qlk_exists:
-            with rasterio.open(str(self._img_path)) as ds:
+            with _open_h5(self._img_path) as ds:
                 quicklook_paths = [subds for subds in ds.subdatasets if "QLK" in subds]
 
             if len(quicklook_paths) == 0:
@@ -472,7 +637,7 @@ class CosmoProduct(SarProduct):
         Returns:
             OrbitDirection: Orbit direction (ASCENDING/DESCENDING)
         """
-        with rasterio.open(str(self._img_path)) as h5_xarr:
+        with _open_h5(self._img_path) as h5_xarr:
             # Get the orbit direction
             try:
                 od = OrbitDirection.from_value(h5_xarr.tags().get("Orbit_Direction"))
@@ -499,7 +664,7 @@ class CosmoProduct(SarProduct):
         """
         if self.product_type == CosmoProductType.GTC:
             ortho_path = self.get_band_path(band, writable=True, **kwargs)
-            with rasterio.open(str(self._img_path)) as ds:
+            with _open_h5(self._img_path) as ds:
                 img_paths = [subds for subds in ds.subdatasets if "IMG" in subds]
 
             if len(img_paths) == 0:
@@ -522,6 +687,11 @@ class CosmoProduct(SarProduct):
                         "For now, only the image of the first swath is taken into account."
                     )
             return ortho_path
+        elif self._get_multilook(**kwargs) is not None:
+            # Multilooked intensity, computed without SNAP
+            return super()._pre_process_sar(
+                pre_processed_path, band, pixel_size, **kwargs
+            )
         elif misc.compare_version(self.get_snap_version(), "11.0.0", ">="):
             return super()._pre_process_sar(pre_processed_path, band, **kwargs)
         else:
@@ -533,112 +703,214 @@ class CosmoProduct(SarProduct):
                     "This is a workaround. See https://github.com/sertit/eoreader/issues/78"
                 )
 
-                pp_swath_path = []
                 import tempfile
+                from concurrent.futures import ThreadPoolExecutor
 
-                import h5netcdf
-
-                from eoreader.reader import Reader
-
-                with h5netcdf.File(str(self._img_path), phony_dims="access") as raw_h5:
-                    for group in raw_h5.groups:
-                        with tempfile.TemporaryDirectory() as tmp_dir:
-                            LOGGER.debug(f"Processing {group}")
-
-                            prod_path = os.path.join(
-                                tmp_dir, f"{path.get_filename(self._img_path)}.h5"
-                            )
-
-                            with h5netcdf.File(
-                                prod_path, "w", phony_dims="access"
-                            ) as out_h5:
-                                # Copy root attributes
-                                out_h5.attrs.update(raw_h5.attrs)
-                                # SNAP requires S01
-                                new_group = "S01"
-                                grp_out = out_h5.create_group(new_group)
-                                # Copy swath attributes
-                                grp_out.attrs.update(raw_h5.groups[group].attrs)
-
-                                # Copy variables
-                                for var_name, var in raw_h5.groups[
-                                    group
-                                ].variables.items():
-                                    grp_out.create_variable(
-                                        f"/{new_group}/{var_name}",
-                                        dimensions=var.dimensions,
-                                        dtype=var.dtype,
-                                        data=var,
-                                        chunks=var.chunks,
-                                    )
-                                    grp_out.variables[var_name].attrs.update(var.attrs)
-
-                                # Copy nested groups correctly
-                                for subgrp_name, subgrp in raw_h5.groups[
-                                    group
-                                ].groups.items():
-                                    new_subgrp = grp_out.create_group(subgrp_name)
-                                    new_subgrp.attrs.update(subgrp.attrs)
-
-                            LOGGER.info(
-                                f"Created seperated .h5 for swath {group}: {prod_path}"
-                            )
-
-                            # Pre-process individual swath
-                            swath_prod = Reader().open(
-                                tmp_dir
-                            )  # new product built from the swath HDF only
-
-                            # --- Now preprocess this *independent* product ---
-                            pp_swath = swath_prod._pre_process_sar(
-                                pre_processed_path,
-                                band,
-                                prod_path=prod_path,
-                                suffix=group,  # S01, S02, S03...
-                                **kwargs,
-                            )
-
-                            # Rename swath output file
-                            swath_path = Path(pp_swath).with_name(
-                                f"{Path(pp_swath).stem}_{group}.tif"
-                            )
-                            Path(pp_swath).rename(swath_path)
-                            pp_swath_path.append(swath_path)
-                            LOGGER.info(f"Generated swath {group}: {swath_path}")
+                # h5py comes with h5netcdf
+                import h5py
 
-                    LOGGER.debug("Merging the swaths")
-                    pp_path = self.get_band_path(band, writable=True, **kwargs)
+                with h5py.File(str(self._img_path), "r") as raw_h5:
+                    groups = [
+                        group
+                        for group, obj in raw_h5.items()
+                        if isinstance(obj, h5py.Group)
+                    ]
 
-                    try:
-                        pp_ds = [rasterio.open(str(p)) for p in pp_swath_path]
-                        kwargs.pop(WRITE_LIA_KW, None)
-                        merged_array, merged_transform = merge.merge(pp_ds, **kwargs)
-                        merged_meta = pp_ds[0].meta.copy()
-                        merged_meta.update(
-                            {
-                                "driver": "GTiff",
-                                "height": merged_array.shape[1],
-                                "width": merged_array.shape[2],
-                                "transform": merged_transform,
-                            }
+                # Process the swaths concurrently, sharing the resources allowed to SNAP
+                nof_workers = self._get_nof_snap_workers(len(groups))
+                LOGGER.debug(
+                    f"Processing {len(groups)} swaths ({nof_workers} concurrently)"
+                )
+                pp_path = self.get_band_path(band, writable=True, **kwargs)
+                with (
+                    tempfile.TemporaryDirectory() as tmp_dir,
+                    self._split_snap_resources(nof_workers),
+                    ThreadPoolExecutor(max_workers=nof_workers) as executor,
+                ):
+                    swath_paths = list(
+                        executor.map(
+                            lambda group: self._pre_process_swath(
+                                group, tmp_dir, band, **kwargs
+                            ),
+                            groups,
                         )
-                    finally:
-                        for ds in pp_ds:
-                            ds.close()
-                        for p in pp_swath_path:
-                            Path(p).unlink()
-
-                    # WARNING: Set nodata to 0 here as it is the value wanted by SNAP!
-
-                    # SNAP < 10.0.0 fails with classic predictor !!! Set the predictor to the default value (1) !!!
-                    # Caused by: javax.imageio.IIOException: Illegal value for Predictor in TIFF file
-                    rasters_rio.write(
-                        merged_array,
-                        merged_meta,
-                        pp_path,
-                        nodata=self._snap_no_data,
-                        predictor=self._get_predictor(),
-                        driver="GTiff",  # SNAP doesn't handle COGs very well apparently
                     )
 
+                    LOGGER.debug("Merging the swaths")
+                    self._merge_swaths(swath_paths, pp_path)
+
                 return pp_path
+
+    def _get_complex_paths(self, band) -> list:
+        """
+        Get the path of the complex image (:code:`SBI` or :code:`IMG` subdataset of the HDF5 file).
+
+        Args:
+            band (sab): Band
+
+        Returns:
+            list: Path of the complex band
+        """
+        with _open_h5(self._img_path) as ds:
+            img_paths = [
+                subds for subds in ds.subdatasets if subds.endswith(("/SBI", "/IMG"))
+            ]
+
+        if len(img_paths) == 0:
+            raise InvalidProductError(
+                f"No complex image found in {self.condensed_name}"
+            )
+        elif len(img_paths) > 1:
+            LOGGER.info(
+                "For now, only the image of the first swath is taken into account."
+            )
+
+        return img_paths[:1]
+
+    def _get_complex_corners(self) -> list | None:
+        """
+        Get the WGS84 coordinates (lon, lat) of the corners of the complex image (of its first swath).
+
+        Returns:
+            list | None: Coordinates of the corners (None if not available)
+        """
+        root, _ = self.read_mtd()
+
+        corners = []
+        for corner in ["TopLeft", "TopRight", "BottomRight", "BottomLeft"]:
+            geo_coord = root.findtext(f".//GeoCoord{corner}")
+            if not geo_coord:
+                return None
+
+            # lat lon height (for each swath)
+            lat, lon = [
+                float(it)
+                for it in strings.str_to_list(geo_coord, additional_separator="\n")
+                if "+" not in it
+            ][:2]
+            corners.append((lon, lat))
+
+        return corners
+
+    def _extract_swath(self, group: str, swath_path: str) -> None:
+        """
+        Extract one swath of the product into a new HDF5 file, as its first swath (:code:`S01`, as SNAP requires it).
+
+        The swath group (variables, nested groups and attributes) is copied by HDF5 itself, chunk by chunk,
+        without loading the whole variables in memory.
+
+        Args:
+            group (str): Swath group (S01, S02, S03...)
+            swath_path (str): Path of the HDF5 file to create
+        """
+        # h5py comes with h5netcdf
+        import h5py
+
+        with (
+            h5py.File(str(self._img_path), "r") as raw_h5,
+            h5py.File(swath_path, "w") as out_h5,
+        ):
+            # Copy root attributes
+            out_h5.attrs.update(raw_h5.attrs)
+
+            # SNAP requires S01
+            raw_h5.copy(raw_h5[group], out_h5, name="S01")
+
+    def _pre_process_swath(
+        self, group: str, tmp_dir: str, band, **kwargs
+    ) -> AnyPathType:
+        """
+        Pre-process one swath of the product with SNAP, as an independent product built from this swath only.
+
+        Args:
+            group (str): Swath group (S01, S02, S03...)
+            tmp_dir (str): Temporary directory
+            band (sbn): Band to preprocess
+            kwargs: Additional arguments
+
+        Returns:
+            AnyPathType: Pre-processed swath path
+        """
+        from eoreader.reader import Reader
+
+        LOGGER.debug(f"Processing {group}")
+        swath_dir = os.path.join(tmp_dir, group)
+        os.makedirs(swath_dir)
+        prod_path = os.path.join(swath_dir, f"{path.get_filename(self._img_path)}.h5")
+        self._extract_swath(group, prod_path)
+        LOGGER.info(f"Created separated .h5 for swath {group}: {prod_path}")
+
+        # New product built from the swath HDF only
+        swath_prod = Reader().open(swath_dir)
+        swath_prod._swath = group
+
+        # Each swath is written in its own file, so they can be processed concurrently
+        swath_path = swath_prod._pre_process_sar(
+            AnyPath(tmp_dir) / f"{swath_prod.condensed_name}_{group}.tif",
+            band,
+            prod_path=prod_path,
+            **kwargs,
+        )
+        LOGGER.info(f"Generated swath {group}: {swath_path}")
+
+        # The swath HDF will be removed with the temporary directory
+        _release_h5(prod_path)
+
+        return swath_path
+
+    def _merge_swaths(self, swath_paths: list, pp_path: AnyPathType) -> None:
+        """
+        Merge the pre-processed swaths, written window by window in a tiled GeoTiff.
+
+        Args:
+            swath_paths (list): Pre-processed swath paths
+            pp_path (AnyPathType): Output path
+        """
+        pp_ds = [rasterio.open(str(swath_path)) for swath_path in swath_paths]
+        try:
+            # WARNING: Set nodata to 0 here as it is the value wanted by SNAP!
+
+            # SNAP < 10.0.0 fails with classic predictor !!! Set the predictor to the default value (1) !!!
+            # Caused by: javax.imageio.IIOException: Illegal value for Predictor in TIFF file
+            merge.merge(
+                pp_ds,
+                nodata=self._snap_no_data,
+                dst_path=str(pp_path),
+                dst_kwds={
+                    "driver": "GTiff",  # SNAP doesn't handle COGs very well apparently
+                    "tiled": True,
+                    "blockxsize": 512,
+                    "blockysize": 512,
+                    "compress": "lzw",
+                    "predictor": self._get_predictor(),
+                    "BIGTIFF": "IF_SAFER",
+                },
+            )
+        finally:
+            for ds in pp_ds:
+                ds.close()
+
+    def _get_snap_cache_keys(
+        self, band, pixel_size: float = None, **kwargs
+    ) -> (str, str, str):
+        """
+        Get the keys of a processed band in the SNAP cache, see :py:meth:`SarProduct._get_snap_cache_keys`.
+
+        The swaths processed independently share the name of their product: their swath is added to the keys.
+
+        Args:
+            band (sab): Band
+            pixel_size (float): Pixel size used by SNAP
+            kwargs: Additional arguments
+
+        Returns:
+            (str, str, str): Key, base key and window suffix
+        """
+        key, base_key, win_suffix = super()._get_snap_cache_keys(
+            band, pixel_size, **kwargs
+        )
+        if self._swath is not None:
+            key = snap_cache.get_key(key=key, swath=self._swath)
+            base_key = snap_cache.get_key(key=base_key, swath=self._swath)
+
+        return key, base_key, win_suffix
@@ -386,6 +386,43 @@ class IceyeProduct(SarProduct):
 
         return band_paths
 
+    def _get_complex_paths(self, band: sab) -> list:
+        """
+        Get the paths of the I and Q bands (:code:`s_i` and :code:`s_q` datasets of the HDF5 file of the SLC products).
+
+        Args:
+            band (sab): Band
+
+        Returns:
+            list: Paths of the I and Q bands
+        """
+        h5_path = self.get_raw_band_paths()[band]
+        return [f'HDF5:"{h5_path}"://{dataset}' for dataset in ["s_i", "s_q"]]
+
+    def _get_complex_corners(self) -> list | None:
+        """
+        Get the WGS84 coordinates (lon, lat) of the corners of the complex image.
+
+        Returns:
+            list | None: Coordinates of the corners (None if not available)
+        """
+        root, nsmap = self.read_mtd()
+
+        # Some ICEYE product metadata has a namespace some don't
+        namespace = nsmap.get(None, "")
+
+        corners = []
+        for corner in ["first_near", "first_far", "last_far", "last_near"]:
+            coord = root.findtext(f".//{namespace}coord_{corner}")
+            if not coord:
+                return None
+
+            # row col lat lon
+            lat, lon = [float(it) for it in coord.split(" ")[2:4]]
+            corners.append((lon, lat))
+
+        return corners
+
     @qck_wrapper
     def get_quicklook_path(self) -> str:
         """
@@ -0,0 +1,201 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Multilooked intensity of complex SAR products, computed without SNAP (i.e. for quick previews).
+
+The complex data (one complex band, or two real bands I and Q) is read lazily, with chunks aligned on the looks:
+the intensity :code:`|I + jQ|²` of each chunk is averaged over the looks inside this chunk only,
+so the complex array is never loaded as a whole, only the (much smaller) multilooked intensity is computed.
+
+The multilooked intensity is then geocoded on the ellipsoid thanks to the GCPs of the product (no DEM is used).
+It is not calibrated.
+"""
+
+import logging
+
+import numpy as np
+import xarray as xr
+from rasterio.control import GroundControlPoint
+from rasterio.enums import Resampling
+
+from eoreader import EOREADER_NAME
+from eoreader.utils import DEFAULT_TILE_SIZE, get_default_chunks
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+
+def get_looks(looks: int | tuple | list) -> tuple:
+    """
+    Get the looks in range and azimuth.
+
+    .. code-block:: python
+
+        >>> get_looks(4)
+        (4, 4)
+        >>> get_looks((2, 8))
+        (2, 8)
+
+    Args:
+        looks (int | tuple | list): Number of looks (same in range and azimuth) or (range, azimuth) looks
+
+    Returns:
+        tuple: Looks in range and azimuth
+    """
+    if isinstance(looks, (tuple, list)):
+        if len(looks) != 2:
+            raise ValueError(
+                f"The looks should be given as (range, azimuth), not {looks}."
+            )
+        rg_looks, az_looks = looks
+    else:
+        rg_looks = az_looks = looks
+
+    rg_looks, az_looks = int(rg_looks), int(az_looks)
+    if rg_looks < 1 or az_looks < 1:
+        raise ValueError(f"The looks should be positive integers, not {looks}.")
+
+    return rg_looks, az_looks
+
+
+def read_complex(paths: list, looks: tuple) -> xr.DataArray:
+    """
+    Open lazily (with dask) the complex data of a SAR product, with chunks aligned on the looks.
+
+    Args:
+        paths (list): Path of the complex band, or paths of the I and Q bands
+        looks (tuple): Looks in range and azimuth
+
+    Returns:
+        xr.DataArray: Complex data, with shape (1, height, width) (or (2, height, width) for I and Q)
+    """
+    # Import rioxarray here (long import)
+    import rioxarray
+
+    rg_looks, az_looks = looks
+
+    # Chunks as multiples of the looks: each multilooked pixel lies in only one chunk
+    chunks = get_default_chunks()
+    tile_size = chunks["x"] if isinstance(chunks, dict) else DEFAULT_TILE_SIZE
+    chunks = {
+        "band": 1,
+        "x": max(tile_size // rg_looks, 1) * rg_looks,
+        "y": max(tile_size // az_looks, 1) * az_looks,
+    }
+
+    arrays = [
+        rioxarray.open_rasterio(str(path), chunks=chunks, masked=False)
+        for path in paths
+    ]
+    if len(arrays) == 1:
+        return arrays[0]
+    else:
+        # I and Q stored in two files
+        return xr.concat(arrays, dim="band")
+
+
+def multilook_intensity(cplx_xda: xr.DataArray, looks: tuple) -> xr.DataArray:
+    """
+    Compute the multilooked intensity :code:`|I + jQ|²` of complex SAR data, averaged over the looks.
+
+    The incomplete looks on the last rows and columns are trimmed.
+    The pixels whose looks are all null (outside the swath) are set to NaN.
+
+    Args:
+        cplx_xda (xr.DataArray): Complex data, with shape (1, height, width) (or (2, height, width) for I and Q)
+        looks (tuple): Looks in range and azimuth
+
+    Returns:
+        xr.DataArray: Multilooked intensity, with shape (1, height // azimuth looks, width // range looks)
+    """
+    rg_looks, az_looks = looks
+
+    # Drop the coordinates, not meaningful in the SAR geometry
+    cplx_xda = cplx_xda.drop_vars(
+        [coord for coord in ["x", "y", "spatial_ref"] if coord in cplx_xda.coords]
+    )
+
+    if np.iscomplexobj(cplx_xda):
+        intensity = cplx_xda.real.astype(np.float32) ** 2 + (
+            cplx_xda.imag.astype(np.float32) ** 2
+        )
+    elif cplx_xda.sizes["band"] == 2:
+        intensity = (cplx_xda.astype(np.float32) ** 2).sum(dim="band", keepdims=True)
+    else:
+        raise ValueError(
+            "The SAR data should be complex, or stored as two real bands (I and Q)."
+        )
+
+    LOGGER.debug(f"Multilooking the intensity ({rg_looks} x {az_looks} looks)")
+    ml_xda = intensity.coarsen(y=az_looks, x=rg_looks, boundary="trim").mean()
+    ml_xda = ml_xda.where(ml_xda > 0)
+
+    return ml_xda.astype(np.float32)
+
+
+def scale_gcps(gcps: list, looks: tuple) -> list:
+    """
+    Scale the GCPs of the complex data to the grid of the multilooked intensity.
+
+    Args:
+        gcps (list): GCPs of the complex data
+        looks (tuple): Looks in range and azimuth
+
+    Returns:
+        list: GCPs of the multilooked intensity
+    """
+    rg_looks, az_looks = looks
+    return [
+        GroundControlPoint(
+            row=gcp.row / az_looks,
+            col=gcp.col / rg_looks,
+            x=gcp.x,
+            y=gcp.y,
+            # On the ellipsoid if the height is not known
+            z=gcp.z if gcp.z is not None else 0.0,
+            id=gcp.id,
+            info=gcp.info if gcp.info is not None else "",
+        )
+        for gcp in gcps
+    ]
+
+
+def geocode(
+    ml_xda: xr.DataArray,
+    gcps: list,
+    gcps_crs,
+    dst_crs,
+    pixel_size: float,
+) -> xr.DataArray:
+    """
+    Geocode the multilooked intensity on the ellipsoid, thanks to its GCPs.
+
+    Args:
+        ml_xda (xr.DataArray): Multilooked intensity
+        gcps (list): GCPs of the multilooked intensity
+        gcps_crs: CRS of the GCPs
+        dst_crs: Destination CRS
+        pixel_size (float): Destination pixel size
+
+    Returns:
+        xr.DataArray: Geocoded intensity
+    """
+    ml_xda = ml_xda.rio.write_gcps(gcps, gcps_crs)
+    return ml_xda.rio.reproject(
+        dst_crs,
+        resolution=pixel_size,
+        resampling=Resampling.bilinear,
+        nodata=np.nan,
+    )
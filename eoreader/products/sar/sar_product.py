@@ -21,6 +21,7 @@ import re
 import tempfile
 import xml.etree.ElementTree as ET
 from abc import abstractmethod
+from contextlib import contextmanager
 from enum import unique
 from string import Formatter
 
@@ -31,6 +32,7 @@ import rioxarray
 import xarray as xr
 from affine import Affine
 from rasterio import CRS, crs
+from rasterio.control import GroundControlPoint
 from rasterio.enums import Resampling
 from rasterio.windows import Window
 from sertit import AnyPath, geometry, misc, path, rasters, snap, strings, types, vectors
@@ -48,17 +50,42 @@ from eoreader.env_vars import (
     PP_GRAPH,
     SAR_DEF_PIXEL_SIZE,
     SAR_PREDICTOR,
+    SNAP_CACHE_DIR,
     SNAP_DEM_NAME,
+    SNAP_MAX_SWATH_WORKERS,
 )
 from eoreader.exceptions import InvalidProductError, InvalidTypeError
-from eoreader.keywords import SAR_INTERP_NA, WRITE_LIA_KW
+from eoreader.keywords import SAR_INTERP_NA, SAR_MULTILOOK, WRITE_LIA_KW
 from eoreader.products.product import Product, SensorType
+from eoreader.products.sar import multilook, snap_cache
 from eoreader.reader import Constellation
 from eoreader.stac import INTENSITY
 from eoreader.utils import simplify
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+MIN_SNAP_CORES = 2
+"""Minimum number of cores given to each SNAP process running concurrently"""
+
+MIN_SNAP_MEMORY = 4 * 1024**3
+"""Minimum memory (in bytes) given to each SNAP process running concurrently"""
+
+
+def _get_snap_resources() -> (int, int):
+    """
+    Get the resources allowed to SNAP, as set by :code:`sertit.snap.get_gpt_cli`.
+
+    Returns:
+        (int, int): Number of cores and memory (in bytes)
+    """
+    # psutil comes with sertit
+    import psutil
+
+    max_mem = int(
+        os.environ.get(snap.JAVA_OPTS_XMX, 0.95 * psutil.virtual_memory().total)
+    )
+    return utils.get_max_cores(), max_mem
+
 
 @unique
 class SnapDems(ListEnum):
@@ -516,6 +543,15 @@ class SarProduct(Product):
                 self.get_band_file_name(band, pixel_size, **kwargs)
             )
 
+            # Don't reuse a band processed with other parameters (DEM, graph, etc.)
+            if ortho_exists and self._is_stale_snap_output(
+                ortho_band, band, pixel_size, **kwargs
+            ):
+                LOGGER.debug(
+                    f"{ortho_band.name} has been processed with other parameters. Processing it again."
+                )
+                ortho_exists = False
+
             if ortho_exists:
                 band_paths[band] = ortho_band
             else:
@@ -530,7 +566,9 @@ class SarProduct(Product):
                         speckle_ortho_band, speckle_ortho_exists = self._is_existing(
                             self.get_band_file_name(speckle_band, pixel_size, **kwargs)
                         )
-                        if not speckle_ortho_exists:
+                        if not speckle_ortho_exists or self._is_stale_snap_output(
+                            speckle_ortho_band, speckle_band, pixel_size, **kwargs
+                        ):
                             self._pre_process_sar(
                                 speckle_ortho_band, speckle_band, pixel_size, **kwargs
                             )
@@ -800,6 +838,160 @@ class SarProduct(Product):
         )
         return pre_processed_path
 
+    def _get_multilook(self, **kwargs) -> tuple | None:
+        """
+        Get the looks (range, azimuth) of the multilooked intensity computed without SNAP, if wanted.
+        Only complex products can be multilooked.
+
+        Args:
+            kwargs: Additional arguments
+
+        Returns:
+            tuple | None: Looks in range and azimuth (None if not wanted)
+        """
+        looks = kwargs.get(SAR_MULTILOOK)
+        if looks is None:
+            return None
+
+        if self.sar_prod_type != SarProductType.CPLX:
+            LOGGER.debug(
+                f"{self.condensed_name} is not a complex product: {SAR_MULTILOOK} is ignored."
+            )
+            return None
+
+        return multilook.get_looks(looks)
+
+    def _get_band_file_name_sensor_specific_suffix(self, band: sab, **kwargs) -> str:
+        """
+        Get the sensor-specific suffix of a band filename (the looks of the multilooked intensity computed without SNAP).
+
+        Args:
+            band (sab): Wanted band
+            **kwargs: Other args
+
+        Returns:
+            str: Band filename sensor-specific suffix
+        """
+        looks = self._get_multilook(**kwargs)
+        if looks is None:
+            return ""
+        else:
+            return f"_ML{looks[0]}x{looks[1]}"
+
+    def _get_complex_paths(self, band: sab) -> list:
+        """
+        Get the paths (readable by rasterio) of the complex data of a band:
+        the path of the complex band or the paths of its I and Q bands.
+
+        Args:
+            band (sab): Band
+
+        Returns:
+            list: Path of the complex band, or paths of the I and Q bands
+        """
+        return [self.get_raw_band_paths()[band]]
+
+    def _get_complex_corners(self) -> list | None:
+        """
+        Get the WGS84 coordinates (lon, lat) of the corners of the complex data
+        (first line and near range, first line and far range, last line and far range, last line and near range),
+        used to geocode it if the complex data doesn't have any GCP.
+
+        Returns:
+            list | None: Coordinates of the corners (None if not available)
+        """
+        return None
+
+    def _get_complex_gcps(self, complex_path: AnyPathStrType) -> (list, CRS):
+        """
+        Get the GCPs of the complex data, or create them from its corners if it doesn't have any.
+
+        Args:
+            complex_path (AnyPathStrType): Path of the complex data
+
+        Returns:
+            (list, CRS): GCPs and their CRS
+        """
+        with rasterio.open(str(complex_path)) as ds:
+            gcps, gcps_crs = ds.gcps
+            height, width = ds.height, ds.width
+
+        if not gcps:
+            corners = self._get_complex_corners()
+            if corners is None:
+                raise InvalidProductError(
+                    f"No GCP found to geocode {self.condensed_name} without SNAP."
+                )
+
+            # The corners are located at the center of the corner pixels
+            rows_cols = [
+                (0.5, 0.5),
+                (0.5, width - 0.5),
+                (height - 0.5, width - 0.5),
+                (height - 0.5, 0.5),
+            ]
+            gcps = [
+                GroundControlPoint(row=row, col=col, x=lon, y=lat, id=str(idx + 1))
+                for idx, ((row, col), (lon, lat)) in enumerate(
+                    zip(rows_cols, corners, strict=True)
+                )
+            ]
+            gcps_crs = WGS84
+
+        return gcps, gcps_crs if gcps_crs is not None else WGS84
+
+    def _pre_process_multilook(
+        self,
+        pre_processed_path: AnyPathType,
+        band: sab,
+        pixel_size: float = None,
+        **kwargs,
+    ) -> AnyPathType:
+        """
+        Pre-process complex SAR data without SNAP: compute its multilooked intensity and geocode it on the ellipsoid.
+        Please see :py:mod:`eoreader.products.sar.multilook`.
+
+        Args:
+            pre_processed_path (AnyPathType): Pre-processed path
+            band (sbn): Band to preprocess
+            pixel_size (float): Pixel size
+            kwargs: Additional arguments
+
+        Returns:
+            AnyPathType: Band path
+        """
+        looks = self._get_multilook(**kwargs)
+        LOGGER.debug(
+            f"Pre-processing file without SNAP (multilooked intensity with {looks[0]} x {looks[1]} looks)"
+        )
+
+        complex_paths = self._get_complex_paths(band)
+        gcps, gcps_crs = self._get_complex_gcps(complex_paths[0])
+
+        # Only the multilooked intensity is computed, never the whole complex array
+        ml_xda = multilook.multilook_intensity(
+            multilook.read_complex(complex_paths, looks), looks
+        ).compute()
+
+        ml_xda = multilook.geocode(
+            ml_xda,
+            multilook.scale_gcps(gcps, looks),
+            gcps_crs,
+            self.crs(),
+            pixel_size if pixel_size else self.pixel_size,
+        )
+
+        ml_xda = utils.write_path_in_attrs(ml_xda, pre_processed_path)
+        utils.write(
+            ml_xda,
+            pre_processed_path,
+            dtype=np.float32,
+            nodata=self._snap_no_data,
+            predictor=self._get_predictor(),
+            driver="GTiff",  # SNAP doesn't handle COGs very well apparently
+        )
+        return pre_processed_path
+
     def _get_pp_graph(
         self,
         write_lia: bool = False,
@@ -977,39 +1169,281 @@ class SarProduct(Product):
         res_deg = pixel_size / equatorial_earth_radius * 180 / np.pi
         return pixel_size, res_deg
 
+    def _get_dspk_graph(self) -> str:
+        """Get the despeckling graph"""
+        if DSPK_GRAPH not in os.environ:
+            dspk_graph = utils.get_data_dir().joinpath("sar_despeckle_default.xml")
+        else:
+            dspk_graph = AnyPath(os.environ[DSPK_GRAPH]).resolve()
+            if not dspk_graph.is_file() or dspk_graph.suffix != ".xml":
+                raise FileNotFoundError(f"{dspk_graph} cannot be found.")
+
+        return str(dspk_graph)
+
+    def _get_snap_caches(self) -> list:
+        """
+        Get the caches where the SNAP outputs are indexed:
+        the directory given by :code:`EOREADER_SNAP_CACHE_DIR` (shared between products) if existing, and the band folder.
+        """
+        caches = [snap_cache.get_snap_cache(self._get_band_folder(writable=True))]
+
+        shared_cache_dir = os.environ.get(SNAP_CACHE_DIR)
+        if shared_cache_dir:
+            caches.insert(0, snap_cache.get_snap_cache(shared_cache_dir))
+
+        return caches
+
+    def _get_snap_cache_keys(
+        self, band: sab, pixel_size: float = None, **kwargs
+    ) -> (str, str, str):
+        """
+        Get the keys of a processed band in the SNAP cache:
+
+        - the key, hashing every parameter that could change the processed file
+        - the base key, which is the key without the pixel size and the window (to derive bands from better-resolution files)
+
+        Args:
+            band (sab): Band
+            pixel_size (float): Pixel size used by SNAP
+            kwargs: Additional arguments
+
+        Returns:
+            (str, str, str): Key, base key and window suffix
+        """
+        write_lia = kwargs.get(WRITE_LIA_KW, False)
+        fields = {
+            "product": self.condensed_name,
+            "band": self.bands[band].id,
+            "crs": str(self.crs()),
+            "calibrate": self._calibrate,
+            WRITE_LIA_KW: bool(write_lia),
+            SAR_INTERP_NA: bool(kwargs.get(SAR_INTERP_NA, False)),
+        }
+
+        graphs = []
+        looks = self._get_multilook(**kwargs)
+        if looks is not None:
+            # Multilooked intensity, computed without SNAP nor DEM
+            fields[SAR_MULTILOOK] = list(looks)
+        elif self._need_snap:
+            graphs.append(self._get_pp_graph(write_lia))
+            dem_name, dem_path = self._get_dem()
+            fields["dem"] = [dem_name.value, str(dem_path)]
+        else:
+            # Some products may be orthorectified with EOReader's DEM (i.e. Umbra with RPCs)
+            fields["dem"] = [os.environ.get(DEM_PATH, "")]
+        if sab.is_despeckle(band):
+            graphs.append(self._get_dspk_graph())
+        fields["graphs"] = [snap_cache.hash_file(graph) for graph in graphs]
+
+        base_key = snap_cache.get_key(**fields)
+
+        window = kwargs.get("window")
+        win_suffix = utils.get_window_suffix(
+            window, max_extent=self.extent() if window is not None else None
+        )
+        key = snap_cache.get_key(
+            base_key=base_key,
+            pixel_size=float(pixel_size if pixel_size else self.pixel_size),
+            window=win_suffix,
+        )
+
+        return key, base_key, win_suffix
+
+    def _is_stale_snap_output(
+        self, band_path: AnyPathType, band: sab, pixel_size: float = None, **kwargs
+    ) -> bool:
+        """
+        Is the given band file registered in the SNAP cache with other parameters (DEM, graph...)?
+
+        Args:
+            band_path (AnyPathType): Band path
+            band (sab): Band
+            pixel_size (float): Pixel size
+            kwargs: Additional arguments
+
+        Returns:
+            bool: True if the band has been processed with other parameters
+        """
+        # Only the Terrain Correction can be done at another pixel size than the reading one
+        if self._need_snap and not sab.is_despeckle(band):
+            pixel_size = self._get_snap_pixel_size(pixel_size)
+
+        try:
+            key, _, _ = self._get_snap_cache_keys(band, pixel_size, **kwargs)
+        except (ValueError, FileNotFoundError):
+            # Invalid SNAP configuration: trust the existing file
+            return False
+
+        return any(
+            processing_cache.is_stale(band_path, key)
+            for processing_cache in self._get_snap_caches()
+        )
+
+    def _register_snap_output(
+        self,
+        band_path: AnyPathType,
+        band: sab,
+        pixel_size: float = None,
+        sidecars: list = None,
+        **kwargs,
+    ) -> AnyPathType:
+        """
+        Register a band processed by SNAP into the caches (copying it into the shared cache directory if needed).
+
+        Args:
+            band_path (AnyPathType): Processed band path
+            band (sab): Band
+            pixel_size (float): Pixel size used by SNAP
+            sidecars (list): Files to be cached along the band (i.e. Local Incidence Angle)
+            kwargs: Additional arguments
+
+        Returns:
+            AnyPathType: Cached band path (in the shared cache directory if existing)
+        """
+        key, base_key, win_suffix = self._get_snap_cache_keys(
+            band, pixel_size, **kwargs
+        )
+
+        cached_paths = [
+            processing_cache.put(
+                key,
+                base_key,
+                band_path,
+                pixel_size=pixel_size if pixel_size else self.pixel_size,
+                window=win_suffix,
+                sidecars=sidecars,
+                product=self.condensed_name,
+                band=band.name,
+            )
+            for processing_cache in self._get_snap_caches()
+        ]
+
+        return cached_paths[0]
+
+    @staticmethod
+    def _get_nof_snap_workers(nof_jobs: int) -> int:
+        """
+        Get the number of SNAP processes that can run concurrently (i.e. to process several swaths).
+
+        Set by :code:`EOREADER_SNAP_MAX_SWATH_WORKERS`, or else bounded by the resources allowed to SNAP.
+
+        Args:
+            nof_jobs (int): Number of jobs to run
+
+        Returns:
+            int: Number of SNAP processes to run concurrently
+        """
+        max_workers = os.environ.get(SNAP_MAX_SWATH_WORKERS)
+        if max_workers is None:
+            max_cores, max_mem = _get_snap_resources()
+            max_workers = min(max_cores // MIN_SNAP_CORES, max_mem // MIN_SNAP_MEMORY)
+
+        return max(1, min(nof_jobs, int(max_workers)))
+
+    @staticmethod
+    @contextmanager
+    def _split_snap_resources(nof_workers: int):
+        """
+        Split the cores and the memory allowed to SNAP between SNAP processes running concurrently, in this context.
+
+        Args:
+            nof_workers (int): Number of SNAP processes running concurrently
+        """
+        if nof_workers <= 1:
+            yield
+            return
+
+        max_cores, max_mem = _get_snap_resources()
+        old_env = {
+            key: os.environ.get(key) for key in [snap.SU_MAX_CORE, snap.JAVA_OPTS_XMX]
+        }
+        os.environ[snap.SU_MAX_CORE] = str(max(1, max_cores // nof_workers))
+        # GPT is launched with an initial memory of 2 GB, the maximum memory cannot be lower
+        os.environ[snap.JAVA_OPTS_XMX] = str(max(max_mem // nof_workers, 2 * 1024**3))
+        try:
+            yield
+        finally:
+            for key, val in old_env.items():
+                if val is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = val
+
+    def _get_snap_pixel_size(self, pixel_size: float = None) -> float:
+        """
+        Manage pixel size used for Terrain correction.
+        This is not the pixel size used for reading the file!
+        It is possible to orthorectify the image at 20 m but read it at 10 m
+        """
+        def_snap_pixel_size = float(os.environ.get(SAR_DEF_PIXEL_SIZE, 0))
+        return (
+            pixel_size
+            if (pixel_size and pixel_size != self.pixel_size)
+            else def_snap_pixel_size
+        )
+
     def _already_processed_path(
         self,
         band: sab,
         pixel_size: float = None,
-        use_no_window_path: bool = True,
         **kwargs,
     ) -> AnyPathType:
         """
         Check if an acceptable orthorectified file already exists on disk
 
+        The SNAP outputs are looked for in the SNAP cache (processed with the exact same parameters),
+        or in the CI band folder (for legacy purposes, where the files are trusted by name).
+
         Args:
             band (sbn): Band to preprocess
             pixel_size (float): Pixel size
-            use_no_window_path (bool): Use the no_window path
             kwargs: Additional arguments
 
         Returns:
             AnyPathType: Band path
         """
-        already_ortho = None
+        caches = self._get_snap_caches()
+        no_window_kwargs = utils._prune_keywords(
+            additional_keywords=["window"], **kwargs
+        )
+
+        def _get_from_caches(fct, *args):
+            for processing_cache in caches:
+                cached_path = getattr(processing_cache, fct)(*args)
+                if cached_path is not None:
+                    return cached_path
+            return None
+
+        # Check if the image has already been processed with the exact same parameters
+        key, base_key, _ = self._get_snap_cache_keys(band, pixel_size, **kwargs)
+        already_ortho = _get_from_caches("get", key)
+        if already_ortho is not None:
+            LOGGER.debug(f"Using {already_ortho.name} from the SNAP cache.")
+            return already_ortho
+
         # Check if the image has been orthorectified without a window.
         # If so, don't redo the ortho with SNAP, only read the ortho image with the window
         # This makes a discrepancy between windowed read with pixels between subset and read, but is this bad?
         # Let's assume it's not
-        no_window_ortho_path, no_window_ortho_exists = self._is_existing(
-            self.get_band_file_name(
-                band,
-                pixel_size,
-                **utils._prune_keywords(additional_keywords=["window"], **kwargs),
+        no_window_ortho_path = None
+        if "window" in kwargs:
+            no_window_key, _, _ = self._get_snap_cache_keys(
+                band, pixel_size, **no_window_kwargs
             )
-        )
+            no_window_ortho_path = _get_from_caches("get", no_window_key)
+
+        # Legacy: look for the files by name in the CI band folder (read-only and not indexed)
+        ci_band_folder = self._get_band_folder(writable=False)
+        use_ci_band_folder = ci_band_folder != self._get_band_folder(writable=True)
+        if no_window_ortho_path is None and use_ci_band_folder:
+            ci_ortho_path = ci_band_folder / self.get_band_file_name(
+                band, pixel_size, **no_window_kwargs
+            )
+            if ci_ortho_path.exists():
+                no_window_ortho_path = ci_ortho_path
 
-        if no_window_ortho_exists:
+        if no_window_ortho_path is not None:
             if "window" in kwargs:
                 with_window_ortho_path, with_window_ortho_exists = self._is_existing(
                     self.get_band_file_name(
@@ -1037,48 +1471,64 @@ class SarProduct(Product):
                 already_ortho = no_window_ortho_path
 
         else:
-            # Check if an ortho band with a better resolution exists (and for legacy purposes, without any resolution)
+            # Check if an ortho band with a better resolution exists (processed with the same parameters)
             # If so, use it instead of re-orthorectifying bands
-            no_res_name = f"{self.condensed_name}_{self.bands[band].id}*"
-            no_res_files = list(
-                self._get_band_folder(writable=True).glob(no_res_name)
-            ) + list(self._get_band_folder(writable=False).glob(no_res_name))
-
-            if len(no_res_files) > 0:
-                for no_res_file in no_res_files:
-                    # Discard despeckled file
-                    if (
-                        sab.is_speckle(band)
-                        and sab.corresponding_despeckle(band).name in no_res_file.name
-                    ):
-                        continue
-                    filename = path.get_filename(no_res_file)
-                    split_name = filename.split("_")
-                    if pixel_size is not None:
-                        res_fragment = list(
-                            filter(re.compile(".*\dm\.").match, split_name)
-                        )
-                        if res_fragment:
-                            # Check if resolution is better than the one asked
-                            file_res = float(
-                                res_fragment[-1].replace("m", "").replace("-", ".")
-                            )
-                            if file_res <= pixel_size:
-                                LOGGER.debug(
-                                    f"Deriving {band.name} at {pixel_size} m from {filename}."
-                                )
-                                already_ortho = no_res_file
-                                break
-                    elif filename == no_res_name:
-                        # No resolution, take it (for legacy purposes)
-                        LOGGER.debug(
-                            f"Deriving {band.name} at {pixel_size} m from {filename}."
-                        )
-                        already_ortho = no_res_file
-                        break
+            if pixel_size:
+                already_ortho = _get_from_caches("get_derivable", base_key, pixel_size)
+
+            # Legacy: look for the files by name in the CI band folder
+            if already_ortho is None and use_ci_band_folder:
+                already_ortho = self._legacy_already_processed_path(
+                    ci_band_folder, band, pixel_size
+                )
+
+            if already_ortho is not None:
+                LOGGER.debug(
+                    f"Deriving {band.name} at {pixel_size} m from {already_ortho.name}."
+                )
 
         return already_ortho
 
+    def _legacy_already_processed_path(
+        self, band_folder: AnyPathType, band: sab, pixel_size: float = None
+    ) -> AnyPathType:
+        """
+        Check if an ortho band with a better resolution exists in the given folder (and for legacy purposes, without any resolution),
+        by parsing the resolution written in the filenames.
+
+        Args:
+            band_folder (AnyPathType): Folder where to look for the files
+            band (sbn): Band to preprocess
+            pixel_size (float): Pixel size
+
+        Returns:
+            AnyPathType: Band path
+        """
+        no_res_name = f"{self.condensed_name}_{self.bands[band].id}*"
+        for no_res_file in band_folder.glob(no_res_name):
+            # Discard despeckled file
+            if (
+                sab.is_speckle(band)
+                and sab.corresponding_despeckle(band).name in no_res_file.name
+            ):
+                continue
+            filename = path.get_filename(no_res_file)
+            split_name = filename.split("_")
+            if pixel_size is not None:
+                res_fragment = list(filter(re.compile(r".*\dm\.").match, split_name))
+                if res_fragment:
+                    # Check if resolution is better than the one asked
+                    file_res = float(
+                        res_fragment[-1].replace("m", "").replace("-", ".")
+                    )
+                    if file_res <= pixel_size:
+                        return no_res_file
+            elif filename == no_res_name:
+                # No resolution, take it (for legacy purposes)
+                return no_res_file
+
+        return None
+
     def _pre_process_snap(
         self,
         pre_processed_path: AnyPathType,
@@ -1101,12 +1551,7 @@ class SarProduct(Product):
         # Manage pixel size used for Terrain correction
         # This is not the pixel size used for reading the file!
         # It is possible to orthorectify the image at 20 m but read it at 10 m
-        def_snap_pixel_size = float(os.environ.get(SAR_DEF_PIXEL_SIZE, 0))
-        snap_pixel_size = (
-            pixel_size
-            if (pixel_size and pixel_size != self.pixel_size)
-            else def_snap_pixel_size
-        )
+        snap_pixel_size = self._get_snap_pixel_size(pixel_size)
         already_ortho = self._already_processed_path(band, snap_pixel_size, **kwargs)
         if already_ortho is not None:
             return already_ortho
@@ -1185,21 +1630,33 @@ class SarProduct(Product):
                         raise RuntimeError("Something went wrong with SNAP!") from ex
 
                 # Convert Local Incidence Angle files from DIMAP to GeoTiff
+                lia_path = None
                 if write_lia:
                     LOGGER.debug(
                         "Converting Local Incidence Angle files from DIMAP to GeoTiff"
                     )
-                    self._write_lia(
+                    lia_path = self._write_lia(
                         pre_processed_path, pp_dim, crop=window_to_crop, **kwargs
                     )
 
                 # Convert DIMAP images to GeoTiff
                 LOGGER.debug("Converting DIMAP to GeoTiff")
 
-                return self._write_sar(
+                out_path = self._write_sar(
                     pre_processed_path, pp_dim, band, crop=window_to_crop, **kwargs
                 )
 
+                # Index the output in the SNAP cache
+                self._register_snap_output(
+                    out_path,
+                    band,
+                    snap_pixel_size,
+                    sidecars=[lia_path] if lia_path else None,
+                    **kwargs,
+                )
+
+                return out_path
+
     def _fallback_csk_snap_13(self, write_lia: bool, tmp_dir, snap_args, ex):
         """
         With SNAP 13.0.0, there is an issue with CSK and calibration
@@ -1241,7 +1698,9 @@ class SarProduct(Product):
         Returns:
             AnyPathType: Band path
         """
-        if not self._need_snap:
+        if self._get_multilook(**kwargs) is not None:
+            pre_process_fct = self._pre_process_multilook
+        elif not self._need_snap:
             pre_process_fct = self._pre_process_no_snap
         else:
             pre_process_fct = self._pre_process_snap
@@ -1276,12 +1735,7 @@ class SarProduct(Product):
             )
 
             # Despeckle graph
-            if DSPK_GRAPH not in os.environ:
-                dspk_graph = utils.get_data_dir().joinpath("sar_despeckle_default.xml")
-            else:
-                dspk_graph = AnyPath(os.environ[DSPK_GRAPH]).resolve()
-                if not dspk_graph.is_file() or dspk_graph.suffix != ".xml":
-                    raise FileNotFoundError(f"{dspk_graph} cannot be found.")
+            dspk_graph = self._get_dspk_graph()
 
             # Create command line and run it
             if not os.path.isfile(dspk_dim):
@@ -1289,8 +1743,14 @@ class SarProduct(Product):
                     band, pixel_size=pixel_size, **kwargs
                 )
 
+                # Fallback: the speckle band has been written in the band folder without being processed by SNAP
+                if spk_path is None:
+                    spk_path = self._is_existing(
+                        self.get_band_file_name(band, pixel_size, **kwargs)
+                    )[0]
+
                 cmd_list = snap.get_gpt_cli(
-                    str(dspk_graph),
+                    dspk_graph,
                     [f"-Pfile={spk_path}", f"-Pout={dspk_dim}"],
                     display_snap_opt=False,
                 )
@@ -1305,6 +1765,9 @@ class SarProduct(Product):
             # Convert DIMAP images to GeoTiff
             out = self._write_sar(despeckled_path, dspk_dim, dspk_band, **kwargs)
 
+            # Index the output in the SNAP cache
+            self._register_snap_output(out, dspk_band, pixel_size, **kwargs)
+
         return out
 
     def _find_beam_dimaps(self, dim_path, pol) -> list:
@@ -1341,22 +1804,6 @@ class SarProduct(Product):
         dspk = dspk_suffix in band_id
         pol = band_id.replace(dspk_suffix, "")
 
-        def interp_na(array, dim):
-            try:
-                array = array.interpolate_na(dim=dim, limit=10, keep_attrs=True)
-            except ValueError:
-                try:
-                    # ValueError: Index 'y' must be monotonically increasing
-                    dim_idx = getattr(array, dim)
-                    reversed_dim_idx = list(reversed(dim_idx))
-                    array = array.reindex(**{dim: reversed_dim_idx})
-                    array = array.interpolate_na(dim=dim, limit=10, keep_attrs=True)
-                    array = array.reindex(**{dim: dim_idx})
-                except ValueError:
-                    pass
-
-            return array
-
         # Get the .img path(s)
         imgs = self._find_beam_dimaps(dim_path, pol)
 
@@ -1374,14 +1821,16 @@ class SarProduct(Product):
             mos_path = imgs[0]
 
         # Open SAR image and convert it to a clean geotiff
-        with rioxarray.open_rasterio(mos_path) as arr:
+        with rioxarray.open_rasterio(
+            mos_path, chunks=utils.get_default_chunks()
+        ) as arr:
             arr = arr.where(arr != self._snap_no_data, np.nan)
 
-            # Interpolate if needed (interpolate na works only 1D-like, sadly)
+            # Interpolate if needed (chunk by chunk, along y and then x)
             # DSPK step in done on already interpolated data
             if not dspk and kwargs.get(SAR_INTERP_NA, False):
-                arr = interp_na(arr, dim="y")
-                arr = interp_na(arr, dim="x")
+                arr = utils.interpolate_na(arr, dim="y", limit=10)
+                arr = utils.interpolate_na(arr, dim="x", limit=10)
 
             crop_window = kwargs.get("crop")
             if crop_window is not None:
@@ -1419,22 +1868,6 @@ class SarProduct(Product):
         # Save the file as the terrain-corrected image
         # input data
 
-        def interp_na(array, dim):
-            try:
-                array = array.interpolate_na(dim=dim, limit=10, keep_attrs=True)
-            except ValueError:
-                try:
-                    # ValueError: Index 'y' must be monotonically increasing
-                    dim_idx = getattr(array, dim)
-                    reversed_dim_idx = list(reversed(dim_idx))
-                    array = array.reindex(**{dim: reversed_dim_idx})
-                    array = array.interpolate_na(dim=dim, limit=10, keep_attrs=True)
-                    array = array.reindex(**{dim: dim_idx})
-                except ValueError:
-                    pass
-
-            return array
-
         # Get the .img path(s)
         imgs = []
         try:
@@ -1449,13 +1882,13 @@ class SarProduct(Product):
             lia_out_path = out_path.parent / f"{base_name}_localIncidenceAngle.tif"
 
             # Open Local Incidence Angle image and convert it to a clean geotiff
-            with rioxarray.open_rasterio(img) as arr:
+            with rioxarray.open_rasterio(img, chunks=utils.get_default_chunks()) as arr:
                 arr = arr.where(arr != self._snap_no_data, np.nan)
 
-                # Interpolate if needed (interpolate na works only 1D-like, sadly)
+                # Interpolate if needed (chunk by chunk, along y and then x)
                 if kwargs.get(SAR_INTERP_NA, False):
-                    arr = interp_na(arr, dim="y")
-                    arr = interp_na(arr, dim="x")
+                    arr = utils.interpolate_na(arr, dim="y", limit=10)
+                    arr = utils.interpolate_na(arr, dim="x", limit=10)
 
                 crop_window = kwargs.get("crop")
                 if crop_window is not None:
@@ -0,0 +1,344 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Content-addressed cache for the outputs of the SNAP graphs.
+
+Every orthorectified (or despeckled) SAR band is registered in an index file (:code:`snap_cache_index.json`)
+under a key hashing everything that could change its content (product, band, graphs, DEM, pixel size, window, etc.).
+
+This way, cache hits are dictionary lookups, outdated files are never silently reused
+and several products can share one cache directory (see :py:const:`eoreader.env_vars.SNAP_CACHE_DIR`).
+
+As this directory can be shared by several processes, the index is updated under an exclusive lock
+on a lock file (:code:`snap_cache_index.json.lock`), so that concurrent writers don't lose each other's entries.
+Cloud indices cannot be locked: they should not be written by several processes at the same time.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+
+from sertit import AnyPath, files, path
+from sertit.types import AnyPathStrType, AnyPathType
+
+from eoreader import EOREADER_NAME
+from eoreader.file_lock import file_lock
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+SNAP_CACHE_INDEX = "snap_cache_index.json"
+SNAP_CACHE_LOCK = f"{SNAP_CACHE_INDEX}.lock"
+SNAP_CACHE_VERSION = 1
+
+_LOCK = threading.Lock()
+
+
+@lru_cache
+def _hash_file(file_path: str, mtime: float, size: int) -> str:
+    """Hash a file content (cached with its modification time and size)"""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(65536), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def hash_file(file_path: AnyPathStrType) -> str:
+    """
+    Hash a file content (i.e. a SNAP graph), so that a modification of this file invalidates the cache.
+
+    Args:
+        file_path (AnyPathStrType): File to hash
+
+    Returns:
+        str: Hash of the file content
+    """
+    file_path = AnyPath(file_path)
+    if path.is_cloud_path(file_path):
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+    stat = os.stat(file_path)
+    return _hash_file(str(file_path), stat.st_mtime, stat.st_size)
+
+
+def get_key(**fields) -> str:
+    """
+    Compute the cache key corresponding to the given fields.
+
+    Args:
+        **fields: Every parameter impacting the SNAP output
+
+    Returns:
+        str: Cache key
+    """
+    return hashlib.sha256(
+        json.dumps(fields, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class SnapCache:
+    """
+    Index of the SNAP outputs stored in one directory.
+
+    The index is stored as :code:`{"version": 1, "entries": {key: entry}}`,
+    with an entry containing the file name (relative to the cache directory), its base key
+    (the key without pixel size and window, used to derive bands from better-resolution files) and its pixel size.
+    """
+
+    def __init__(self, cache_dir: AnyPathStrType) -> None:
+        self.cache_dir = AnyPath(cache_dir)
+        """Cache directory"""
+
+        self.index_path = self.cache_dir / SNAP_CACHE_INDEX
+        """Index path"""
+
+        self.lock_path = self.cache_dir / SNAP_CACHE_LOCK
+        """Lock file path, locked while updating the index"""
+
+        self._entries = {}
+        self._by_base_key = {}
+        self._by_file = {}
+        self._index_mtime = None
+
+    def _stamp(self):
+        """Modification time of the index file (None if not existing)"""
+        with contextlib.suppress(FileNotFoundError, OSError):
+            return self.index_path.stat().st_mtime
+        return None
+
+    def _load(self) -> None:
+        """(Re)load the index if it has been modified by another process"""
+        stamp = self._stamp()
+        if stamp == self._index_mtime:
+            return
+
+        entries = {}
+        if stamp is not None:
+            try:
+                index = json.loads(self.index_path.read_text())
+                if index.get("version") == SNAP_CACHE_VERSION:
+                    entries = index.get("entries", {})
+            except (ValueError, OSError) as exc:
+                LOGGER.warning(f"Corrupted SNAP cache index ({self.index_path}): {exc}")
+
+        self._set_entries(entries)
+        self._index_mtime = stamp
+
+    def _set_entries(self, entries: dict) -> None:
+        """Set the entries and build the secondary dictionaries"""
+        self._entries = entries
+        self._by_base_key = {}
+        self._by_file = {}
+        for key, entry in entries.items():
+            self._by_base_key.setdefault(entry["base_key"], []).append(key)
+            self._by_file[entry["file"]] = key
+
+    def _save(self) -> None:
+        """Write the index on disk (atomically for local paths)"""
+        index = {"version": SNAP_CACHE_VERSION, "entries": self._entries}
+        if path.is_cloud_path(self.index_path):
+            self.index_path.write_text(json.dumps(index, indent=3))
+        else:
+            tmp_path = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as tmp_file:
+                json.dump(index, tmp_file, indent=3)
+            os.replace(tmp_path, self.index_path)
+
+        self._index_mtime = self._stamp()
+
+    @contextlib.contextmanager
+    def _index_lock(self):
+        """Lock the index against the other processes (only for local paths), to be held during its read-modify-write"""
+        if path.is_cloud_path(self.cache_dir):
+            yield
+            return
+
+        with file_lock(str(self.lock_path)):
+            yield
+
+    def _get_path(self, key: str) -> AnyPathType | None:
+        """Get the file corresponding to a key, if existing (forget the entry if the file has been deleted)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        file_path = self.cache_dir / entry["file"]
+        if not file_path.exists():
+            LOGGER.debug(f"{file_path} has been removed from the SNAP cache.")
+            return None
+
+        return file_path
+
+    def get(self, key: str) -> AnyPathType | None:
+        """
+        Get the file corresponding to the given key.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            AnyPathType | None: Cached file, None if not existing
+        """
+        with _LOCK:
+            self._load()
+            return self._get_path(key)
+
+    def get_derivable(self, base_key: str, pixel_size: float) -> AnyPathType | None:
+        """
+        Get a file processed with the same parameters over the whole product
+        and with a better (or equal) pixel size than the given one, in order to derive the wanted band from it.
+
+        Args:
+            base_key (str): Base key (key without pixel size and window)
+            pixel_size (float): Wanted pixel size
+
+        Returns:
+            AnyPathType | None: Cached file, None if not existing
+        """
+        with _LOCK:
+            self._load()
+
+            # Take the coarsest acceptable file (the closest to the wanted pixel size)
+            candidates = sorted(
+                (
+                    self._entries[key]
+                    for key in self._by_base_key.get(base_key, [])
+                    if not self._entries[key]["window"]
+                    and self._entries[key]["pixel_size"] <= pixel_size
+                ),
+                key=lambda entry: entry["pixel_size"],
+                reverse=True,
+            )
+            for entry in candidates:
+                file_path = self._get_path(entry["key"])
+                if file_path is not None:
+                    return file_path
+
+            return None
+
+    def is_stale(self, file_path: AnyPathStrType, key: str) -> bool:
+        """
+        Is the given file registered in the cache with another key (i.e. processed with other parameters)?
+
+        Files that are unknown to the cache (i.e. legacy files) are not considered as stale.
+
+        Args:
+            file_path (AnyPathStrType): File to check
+            key (str): Expected key
+
+        Returns:
+            bool: True if the file has been processed with other parameters
+        """
+        file_path = AnyPath(file_path)
+        if file_path.parent != self.cache_dir:
+            return False
+
+        with _LOCK:
+            self._load()
+            registered_key = self._by_file.get(file_path.name)
+            return registered_key is not None and registered_key != key
+
+    def put(
+        self,
+        key: str,
+        base_key: str,
+        file_path: AnyPathStrType,
+        pixel_size: float,
+        window: str = "",
+        sidecars: list = None,
+        **metadata,
+    ) -> AnyPathType:
+        """
+        Register a file in the cache. If the file is not stored in the cache directory, it is copied into it.
+
+        Args:
+            key (str): Cache key
+            base_key (str): Base key (key without pixel size and window)
+            file_path (AnyPathStrType): Processed file
+            pixel_size (float): Pixel size of the file
+            window (str): Window suffix of the file (empty if processed over the whole product)
+            sidecars (list): Files to be copied along with the processed file (i.e. Local Incidence Angle), their names should begin with the file stem
+            **metadata: Other information to be stored in the index (for debug purposes)
+
+        Returns:
+            AnyPathType: Cached file path
+        """
+        file_path = AnyPath(file_path)
+        if file_path.parent != self.cache_dir:
+            cached_path = (
+                self.cache_dir / f"{file_path.stem}_{key[:16]}{file_path.suffix}"
+            )
+            os.makedirs(str(self.cache_dir), exist_ok=True)
+            files.copy(file_path, cached_path)
+
+            # Copy the sidecar files (i.e. Local Incidence Angle), renamed with the cached file stem
+            for sidecar in sidecars or []:
+                sidecar = AnyPath(sidecar)
+                if sidecar.exists():
+                    files.copy(
+                        sidecar,
+                        self.cache_dir
+                        / sidecar.name.replace(file_path.stem, cached_path.stem, 1),
+                    )
+        else:
+            cached_path = file_path
+
+        with _LOCK, self._index_lock():
+            # Reload the index in case another process wrote it in the meantime
+            self._index_mtime = None
+            self._load()
+
+            entries = dict(self._entries)
+
+            # A file can only correspond to one key: forget the outdated one
+            old_key = self._by_file.get(cached_path.name)
+            if old_key is not None:
+                entries.pop(old_key, None)
+
+            entries[key] = {
+                "key": key,
+                "base_key": base_key,
+                "file": cached_path.name,
+                "pixel_size": float(pixel_size),
+                "window": window,
+                **metadata,
+            }
+            self._set_entries(entries)
+            self._save()
+
+        return cached_path
+
+
+@lru_cache
+def _get_snap_cache(cache_dir: str) -> SnapCache:
+    return SnapCache(cache_dir)
+
+
+def get_snap_cache(cache_dir: AnyPathStrType) -> SnapCache:
+    """
+    Get the SNAP cache of a directory (only one instance per directory and per process).
+
+    Args:
+        cache_dir (AnyPathStrType): Cache directory
+
+    Returns:
+        SnapCache: SNAP cache
+    """
+    return _get_snap_cache(str(cache_dir))
@@ -551,6 +551,10 @@ class UmbraProduct(SarProduct):
                     LOGGER.debug(f"{band.name} band reprojected.")
                 else:
                     ortho_path = raw_band_path
+
+            # Index the output in the cache
+            if ortho_path == pre_processed_path:
+                self._register_snap_output(ortho_path, band, pixel_size, **kwargs)
         return ortho_path
 
     def get_orbit_direction(self) -> OrbitDirection:
@@ -16,8 +16,11 @@
 """Class for STAC products"""
 
 import asyncio
+import atexit
 import contextlib
 import logging
+import os
+import threading
 from io import BytesIO
 
 import geopandas as gpd
@@ -28,9 +31,11 @@ from sertit import geometry, vectors
 from sertit.types import AnyPathStrType
 
 from eoreader import EOREADER_NAME, cache, utils
+from eoreader.env_vars import STAC_MAX_CONCURRENCY
 from eoreader.exceptions import InvalidProductError
 from eoreader.products.product import Product
 from eoreader.stac import PROJ_CODE
+from eoreader.stac.stac_cache import get_cache_key, read_cached, write_cached
 from eoreader.utils import simplify
 
 try:
@@ -40,6 +45,155 @@ except ModuleNotFoundError:
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+DEFAULT_STAC_MAX_CONCURRENCY = 8
+"""Default maximum number of assets read concurrently"""
+
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 0.5
+
+_LOCK = threading.Lock()
+_LOOP = None
+_LOOP_PID = None
+_CLIENTS_POOLS = {}
+_S3_CLIENTS = {}
+
+
+def _get_max_concurrency() -> int:
+    """Get the maximum number of assets read concurrently"""
+    try:
+        max_concurrency = int(
+            os.getenv(STAC_MAX_CONCURRENCY, DEFAULT_STAC_MAX_CONCURRENCY)
+        )
+    except ValueError:
+        max_concurrency = DEFAULT_STAC_MAX_CONCURRENCY
+
+    return max(max_concurrency, 1)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop reading the hrefs, running in a background thread for the whole process,
+    so that the clients (and their HTTP sessions, bound to their loop) are reused between the reads.
+
+    The loop is recreated in forked processes (as its thread is not forked).
+    """
+    global _LOOP, _LOOP_PID
+
+    with _LOCK:
+        if _LOOP is None or os.getpid() != _LOOP_PID:
+            _LOOP = asyncio.new_event_loop()
+            _LOOP_PID = os.getpid()
+            _CLIENTS_POOLS.clear()
+            threading.Thread(
+                target=_LOOP.run_forever, name="eoreader_stac", daemon=True
+            ).start()
+
+    return _LOOP
+
+
+@atexit.register
+def _close_clients_pools() -> None:
+    """Close the pools of clients (and their HTTP sessions) at exit"""
+    if _LOOP is None or os.getpid() != _LOOP_PID or not _CLIENTS_POOLS:
+        return
+
+    async def close_all():
+        for _, _, pool in _CLIENTS_POOLS.values():
+            await pool.close_all()
+
+    with contextlib.suppress(Exception):
+        asyncio.run_coroutine_threadsafe(close_all(), _LOOP).result(timeout=5)
+
+
+def _get_clients_pool(config=None, clients=None):
+    """
+    Get the pool of clients (one per provider) for the given configuration and pre-configured clients,
+    created once per process and reused by every read.
+    """
+    from stac_asset import Config
+    from stac_asset.client import Clients
+
+    # Key by the objects identity (the objects are kept in the pool, so their ids cannot be reused)
+    key = (id(config), tuple(id(client) for client in clients or []))
+    with _LOCK:
+        if key not in _CLIENTS_POOLS:
+            _CLIENTS_POOLS[key] = (
+                config,
+                clients,
+                Clients(config if config is not None else Config(), clients=clients),
+            )
+
+    return _CLIENTS_POOLS[key][-1]
+
+
+async def _read_hrefs(hrefs: list, pool) -> dict:
+    """
+    Read hrefs concurrently (with a bounded concurrency), with one client per provider shared by every request,
+    retrying with an exponential backoff on transient errors.
+    """
+    semaphore = asyncio.Semaphore(_get_max_concurrency())
+
+    async def read(href: str) -> bytes:
+        async with semaphore:
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    client = await pool.get_client(href)
+                    chunks = [chunk async for chunk in client.open_href(href)]
+                    return b"".join(chunks)
+                except (FileNotFoundError, ValueError):
+                    raise
+                except Exception as exc:
+                    if attempt == MAX_ATTEMPTS - 1:
+                        raise
+                    LOGGER.debug(f"Error when reading {href} ({exc}), retrying.")
+                    await asyncio.sleep(RETRY_DELAY * 2**attempt)
+
+    data = await asyncio.gather(*[read(href) for href in hrefs])
+    return dict(zip(hrefs, data, strict=True))
+
+
+def read_hrefs(hrefs: list, config=None, clients=None) -> dict:
+    """
+    Read several hrefs concurrently (with stac-asset).
+
+    - The small assets (metadata files) are cached on disk (see :py:const:`eoreader.env_vars.STAC_CACHE_DIR`)
+    - The other ones are read concurrently (see :py:const:`eoreader.env_vars.STAC_MAX_CONCURRENCY`),
+      with one client per provider (i.e. one S3 client, one HTTP session), reused between the calls, and retries on transient errors
+
+    Args:
+        hrefs (list): The hrefs to read
+        config: The download configuration to use
+        clients: Any pre-configured clients to use
+
+    Returns:
+        dict: The bytes from each href {href: bytes}
+    """
+    try:
+        import stac_asset  # noqa: F401
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "You need to install 'stac-asset' (see https://stac-asset.readthedocs.io/en/latest/) to use STAC products in EOReader."
+        ) from exc
+
+    hrefs_data = {}
+    for href in dict.fromkeys(hrefs):
+        data = read_cached(href)
+        if data is not None:
+            hrefs_data[href] = data
+
+    hrefs_to_read = [href for href in dict.fromkeys(hrefs) if href not in hrefs_data]
+    if hrefs_to_read:
+        LOGGER.debug(f"Reading {len(hrefs_to_read)} STAC assets")
+        read_data = asyncio.run_coroutine_threadsafe(
+            _read_hrefs(hrefs_to_read, _get_clients_pool(config, clients)),
+            _get_loop(),
+        ).result()
+        for href, data in read_data.items():
+            write_cached(href, data)
+        hrefs_data.update(read_data)
+
+    return hrefs_data
+
 
 class StacProduct(Product):
     """Stac products"""
@@ -50,6 +204,10 @@ class StacProduct(Product):
     item = None
     clients = None
     default_clients = None
+    _prefetched = None
+
+    _small_assets = []
+    """Small assets (metadata files) read by the product, prefetched concurrently when opening it"""
 
     def _set_item(self, product_path: AnyPathStrType, **kwargs) -> Item:
         """
@@ -221,7 +379,7 @@ class StacProduct(Product):
 
     def read_href(self, href: str, config=None, clients=None) -> bytes:
         """
-        Read HREF (with stac-asset.blocking)
+        Read HREF (with stac-asset), from the prefetched assets if available
 
         Args:
             href: The href to read
@@ -231,24 +389,75 @@ class StacProduct(Product):
         Returns:
             bytes: The bytes from the href
         """
-        try:
-            from stac_asset import blocking
-        except ModuleNotFoundError as exc:
-            raise ModuleNotFoundError(
-                "You need to install 'stac-asset' (see https://stac-asset.readthedocs.io/en/latest/) to use STAC products in EOReader."
-            ) from exc
-        return blocking.read_href(href, config, clients)
+        if self._prefetched is not None and get_cache_key(href) in self._prefetched:
+            return self._prefetched[get_cache_key(href)]
+
+        return read_hrefs([href], config, clients)[href]
+
+    def prefetch(self, hrefs: list, config=None) -> None:
+        """
+        Read concurrently the given hrefs (see :py:func:`read_hrefs`), to be used afterward by :py:meth:`read_href`.
+
+        The prefetched assets are kept in memory with the product (keyed by their unsigned href, see :py:func:`eoreader.stac.stac_cache.get_cache_key`):
+        only prefetch small assets (metadata or sidecar files), the bands are read one by one when loading them.
+
+        Args:
+            hrefs (list): The hrefs to prefetch
+            config: The download configuration to use
+        """
+        if self._prefetched is None:
+            self._prefetched = {}
+
+        hrefs = [href for href in hrefs if get_cache_key(href) not in self._prefetched]
+        if hrefs:
+            self._prefetched.update(
+                {
+                    get_cache_key(href): data
+                    for href, data in read_hrefs(hrefs, config, self.clients).items()
+                }
+            )
+
+    def _prefetch_small_assets(self) -> None:
+        """Prefetch the small assets of the product (see :py:attr:`_small_assets`), signed if needed"""
+        self.prefetch(
+            [self.sign_url(href) for href in self._get_asset_hrefs(self._small_assets)]
+        )
+
+    def _get_asset_hrefs(self, asset_names: list) -> list:
+        """
+        Get the hrefs of the existing assets among the given ones
+
+        Args:
+            asset_names (list): Asset names
+
+        Returns:
+            list: Asset hrefs
+        """
+        return [
+            self.item.assets[asset_name].href
+            for asset_name in asset_names
+            if asset_name in self.item.assets
+        ]
+
+    def clear(self):
+        """
+        Clear this product's cache
+        """
+        super().clear()
+        self._prefetched = None
 
     def get_s3_client(self, region_name: str, requester_pays: bool = False, **kwargs):
         """
-        Get a Client (for stac-asset)
+        Get a S3 Client (for stac-asset), created once per process for the given arguments
+        and shared by every product
+
         Args:
             region_name (str): Region name
             requester_pays (bool): Requester pays
             **kwargs: Other args
 
         Returns:
-
+            S3Client: S3 client
         """
         try:
             from stac_asset import S3Client
@@ -256,9 +465,15 @@ class StacProduct(Product):
             raise ModuleNotFoundError(
                 "You need to install 'stac-asset' (see https://stac-asset.readthedocs.io/en/latest/) to use STAC products in EOReader."
             ) from exc
-        return S3Client(
-            region_name=region_name, requester_pays=requester_pays, **kwargs
-        )
+
+        key = (region_name, requester_pays, tuple(sorted(kwargs.items())))
+        with _LOCK:
+            if key not in _S3_CLIENTS:
+                _S3_CLIENTS[key] = S3Client(
+                    region_name=region_name, requester_pays=requester_pays, **kwargs
+                )
+
+        return _S3_CLIENTS[key]
 
     def get_sinergise_client(self):
         """
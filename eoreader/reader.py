@@ -28,7 +28,7 @@ from sertit import AnyPath, path, strings, types
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType
 
-from eoreader import EOREADER_NAME, utils
+from eoreader import EOREADER_NAME
 from eoreader.exceptions import InvalidProductError
 
 try:
@@ -937,6 +937,9 @@ class Reader:
 
         # Archive
         else:
+            # Import utils here (long import)
+            from eoreader import utils
+
             try:
                 prod_files = utils.get_archived_file_list(product_path)
             except BadZipFile as exc:
@@ -987,6 +990,9 @@ def is_filename_valid(product_path: AnyPathStrType, regex: list | re.Pattern) ->
                     is_valid = True
                     break
         else:
+            # Import utils here (long import)
+            from eoreader import utils
+
             try:
                 file_list = utils.get_archived_file_list(product_path)
                 for file in file_list:
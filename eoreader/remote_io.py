@@ -0,0 +1,281 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Remote I/O profile, used to read cloud-optimized data (i.e. COGs from STAC catalogs or cloud-stored products) over HTTP.
+
+The profile (opt-in, see :py:const:`eoreader.env_vars.REMOTE_IO_PROFILE`) sets GDAL configuration options
+that reduce the number of HTTP requests (bigger header reads, cached and merged ranges, multi-range requests, no directory listing)
+and reuse the connections between bands (HTTP/2 multiplexing).
+
+As the bands are loaded lazily, their chunks are read later by the dask workers, outside the loading of the product.
+The options used when reading the data (see :py:const:`REMOTE_GDAL_READ_OPTIONS`) are thus set process-wide, once, when the first remote product is loaded.
+They only concern the remote files or are harmless for the local ones.
+The options used when opening the files (see :py:const:`REMOTE_GDAL_OPEN_OPTIONS`) are only set in a scoped :code:`rasterio.Env` (see :py:func:`remote_io_profile`)
+around the loading of remote products, so that they don't affect the opening of local files (i.e. looking for sidecar files such as :code:`.aux.xml`, :code:`.hdr` or :code:`.RPB`).
+
+The HTTP requests issued by GDAL can also be tracked (:py:func:`track_remote_io`) to know the number of requests and bytes read during a load.
+"""
+
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager, nullcontext
+
+import rasterio
+import validators
+from rasterio.env import get_gdal_config, set_gdal_config
+from sertit import path
+from sertit.types import AnyPathStrType
+
+from eoreader import EOREADER_NAME
+from eoreader.env_vars import REMOTE_IO_PROFILE
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+REMOTE_GDAL_OPTIONS = {
+    # Don't list the directories of the remote files (i.e. looking for sidecar files)
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    # Read the whole header of a COG at once
+    "GDAL_INGESTED_BYTES_AT_OPEN": "32768",
+    # Keep the downloaded blocks in memory (shared between the bands)
+    "CPL_VSIL_CURL_CACHE_SIZE": str(256 * 1024 * 1024),
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": str(64 * 1024 * 1024),
+    # Group the block requests
+    "GDAL_HTTP_MULTIRANGE": "YES",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    # Reuse the connections (HTTP/2 over TLS) and fetch the blocks concurrently
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_NUM_THREADS": "ALL_CPUS",
+    # Retry on transient errors
+    "GDAL_HTTP_MAX_RETRY": "5",
+    "GDAL_HTTP_RETRY_DELAY": "1",
+}
+"""GDAL configuration options set by the remote I/O profile"""
+
+REMOTE_GDAL_OPEN_OPTIONS = (
+    "GDAL_DISABLE_READDIR_ON_OPEN",
+    "GDAL_INGESTED_BYTES_AT_OPEN",
+)
+"""GDAL configuration options of the remote I/O profile only used when opening the files (set in a scoped :code:`rasterio.Env`)"""
+
+REMOTE_GDAL_READ_OPTIONS = tuple(
+    key for key in REMOTE_GDAL_OPTIONS if key not in REMOTE_GDAL_OPEN_OPTIONS
+)
+"""GDAL configuration options of the remote I/O profile used when reading the data (set process-wide)"""
+
+_DOWNLOAD_REGEX = re.compile(r"VSICURL: Downloading ([\d\-,]+) \(")
+_FILE_SIZE_REGEX = re.compile(r"VSICURL: GetFileSize\(")
+
+_LOCK = threading.RLock()
+_TRACKERS = []
+_GDAL_LOGGERS = ["rasterio._env", "rasterio._err"]
+_PREVIOUS_STATE = {}
+_READ_OPTIONS_SET = False
+
+
+def is_remote_io_profile_enabled() -> bool:
+    """
+    Is the remote I/O profile enabled (with :code:`EOREADER_REMOTE_IO_PROFILE`)?
+
+    Returns:
+        bool: True if the remote I/O profile is enabled
+    """
+    return os.getenv(REMOTE_IO_PROFILE, "0").lower() in ("1", "true", "yes", "on")
+
+
+def is_remote_path(file_path: AnyPathStrType) -> bool:
+    """
+    Is the path remote (URL, cloud-stored or :code:`/vsi` file)?
+
+    Args:
+        file_path (AnyPathStrType): Path to check
+
+    Returns:
+        bool: True if the path is remote
+    """
+    path_str = str(file_path)
+    return bool(
+        validators.url(path_str)
+        or path_str.startswith("/vsi")
+        or path.is_cloud_path(file_path)
+    )
+
+
+def get_remote_io_options() -> dict:
+    """
+    Get the GDAL options of the remote I/O profile that are not already set by the user (as environment variables or GDAL configuration options).
+
+    Returns:
+        dict: GDAL options to set
+    """
+    return {
+        key: val
+        for key, val in REMOTE_GDAL_OPTIONS.items()
+        if key not in os.environ and get_gdal_config(key) is None
+    }
+
+
+def set_remote_read_options() -> None:
+    """
+    Set the GDAL options of the remote I/O profile used when reading the data (see :py:const:`REMOTE_GDAL_READ_OPTIONS`),
+    process-wide and only once, so that they apply to the chunks read lazily by the dask workers.
+
+    The options already set by the user are not overridden.
+    """
+    global _READ_OPTIONS_SET
+    with _LOCK:
+        if _READ_OPTIONS_SET:
+            return
+
+        for key, val in get_remote_io_options().items():
+            if key in REMOTE_GDAL_READ_OPTIONS:
+                set_gdal_config(key, val)
+        _READ_OPTIONS_SET = True
+
+
+def remote_io_profile(file_path: AnyPathStrType):
+    """
+    Context manager applying the remote I/O profile, if enabled and if the path is remote.
+
+    The options used when reading the data are set process-wide (see :py:func:`set_remote_read_options`),
+    whereas the options used when opening the files are set in a scoped :code:`rasterio.Env`, restored when exiting the context.
+    The options already set by the user are not overridden.
+
+    .. code-block:: python
+
+        >>> with remote_io_profile(prod.path):
+        >>>     band_xda = rasters.read(band_path, chunks=True)
+        >>> band_xda.compute()
+
+    Args:
+        file_path (AnyPathStrType): Path of the file (or product) to read
+
+    Returns:
+        Context manager setting the GDAL options of the remote I/O profile
+    """
+    if is_remote_io_profile_enabled() and is_remote_path(file_path):
+        set_remote_read_options()
+        return rasterio.Env(
+            **{
+                key: val
+                for key, val in get_remote_io_options().items()
+                if key in REMOTE_GDAL_OPEN_OPTIONS
+            }
+        )
+    else:
+        return nullcontext()
+
+
+class RemoteIOStats:
+    """Statistics of the HTTP requests issued by GDAL"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        """Number of HTTP requests"""
+
+        self.ranges = 0
+        """Number of byte ranges requested (a multi-range request can contain several ranges)"""
+
+        self.bytes = 0
+        """Number of bytes requested"""
+
+    def _update(self, message: str) -> None:
+        """Update the statistics with a GDAL debug message"""
+        download = _DOWNLOAD_REGEX.search(message)
+        if download:
+            self.requests += 1
+            for byte_range in download.group(1).split(","):
+                start, end = byte_range.split("-")
+                self.ranges += 1
+                self.bytes += int(end) - int(start) + 1
+        elif _FILE_SIZE_REGEX.search(message):
+            self.requests += 1
+
+    def __repr__(self) -> str:
+        return f"{self.requests} HTTP requests, {self.ranges} ranges, {self.bytes / 1024**2:.2f} MB"
+
+
+class _GdalDebugFilter(logging.Filter):
+    """Filter catching the GDAL debug messages of the HTTP requests (and hiding the debug messages the user didn't ask for)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if "VSICURL" in record.getMessage():
+            with _LOCK:
+                for tracker in _TRACKERS:
+                    tracker._update(record.getMessage())
+
+        # Only propagate the debug messages if the user wants them
+        return (
+            record.levelno > logging.DEBUG
+            or _PREVIOUS_STATE.get(record.name, (logging.NOTSET, True))[1]
+        )
+
+
+_FILTER = _GdalDebugFilter()
+
+
+@contextmanager
+def track_remote_io():
+    """
+    Track the HTTP requests issued by GDAL (with :code:`/vsicurl/`, :code:`/vsis3/`...) in this context.
+
+    GDAL debug messages are enabled during this context (:code:`CPL_DEBUG`) to catch the requests,
+    but they are not propagated to the user's logs (except if the rasterio loggers were already in debug mode).
+
+    Only the requests issued inside the context are tracked: as the bands are loaded lazily,
+    compute them inside the context to track the reading of the data and not only the opening of the files.
+
+    .. code-block:: python
+
+        >>> with track_remote_io() as stats:
+        >>>     prod.load(RED).compute()
+        >>> print(stats)
+        12 HTTP requests, 18 ranges, 5.21 MB
+
+    Yields:
+        RemoteIOStats: Statistics of the HTTP requests, updated during the context
+    """
+    stats = RemoteIOStats()
+    with _LOCK:
+        if not _TRACKERS:
+            _PREVIOUS_STATE["CPL_DEBUG"] = get_gdal_config("CPL_DEBUG")
+            set_gdal_config("CPL_DEBUG", True)
+            for logger_name in _GDAL_LOGGERS:
+                gdal_logger = logging.getLogger(logger_name)
+                _PREVIOUS_STATE[logger_name] = (
+                    gdal_logger.level,
+                    gdal_logger.isEnabledFor(logging.DEBUG),
+                )
+                gdal_logger.setLevel(logging.DEBUG)
+                gdal_logger.addFilter(_FILTER)
+        _TRACKERS.append(stats)
+
+    try:
+        yield stats
+    finally:
+        with _LOCK:
+            _TRACKERS.remove(stats)
+            if not _TRACKERS:
+                cpl_debug = _PREVIOUS_STATE.pop("CPL_DEBUG")
+                set_gdal_config(
+                    "CPL_DEBUG", cpl_debug if cpl_debug is not None else False
+                )
+                for logger_name in _GDAL_LOGGERS:
+                    gdal_logger = logging.getLogger(logger_name)
+                    gdal_logger.removeFilter(_FILTER)
+                    gdal_logger.setLevel(_PREVIOUS_STATE.pop(logger_name)[0])
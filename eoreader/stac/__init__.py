@@ -74,6 +74,14 @@ __all__ += [
     "ProjExt",
 ]
 
+from .stac_validation import ValidationMode
+
+__all__ += ["ValidationMode"]
+
 from .stac_item import StacItem
 
 __all__ += ["StacItem"]
+
+from .stac_catalog import export_catalog
+
+__all__ += ["export_catalog"]
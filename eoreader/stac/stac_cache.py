@@ -0,0 +1,218 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Disk cache of the small remote STAC files (metadata files of the STAC products, JSON schemas of the STAC extensions...),
+shared between products and processes (see :py:const:`eoreader.env_vars.STAC_CACHE_DIR`).
+
+The files are keyed by their href without the signing query parameters (SAS tokens, presigned URLs...),
+which change at every request for the same file, and the least recently used ones are evicted
+once the cache exceeds :py:const:`STAC_CACHE_MAX_TOTAL_SIZE`.
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sertit import AnyPath
+from sertit.types import AnyPathType
+
+from eoreader import EOREADER_NAME
+from eoreader.env_vars import STAC_CACHE_DIR
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+STAC_CACHE_MAX_SIZE = 1024**2
+"""Maximum size of the files cached on disk (metadata files, not the bands)"""
+
+STAC_CACHE_MAX_TOTAL_SIZE = 256 * 1024**2
+"""Maximum size of the disk cache, the least recently used files being evicted first"""
+
+SIGNING_QUERY_PARAMS = {
+    # Azure SAS tokens (Microsoft Planetary Computer)
+    "sv",
+    "ss",
+    "srt",
+    "sr",
+    "sp",
+    "st",
+    "se",
+    "si",
+    "sip",
+    "spr",
+    "sig",
+    "skoid",
+    "sktid",
+    "skt",
+    "ske",
+    "sks",
+    "skv",
+    "sdd",
+    # CloudFront signed URLs
+    "expires",
+    "signature",
+    "policy",
+    "key-pair-id",
+}
+"""Query parameters (lowercase) used to sign the URLs, not changing the file they point to"""
+
+SIGNING_QUERY_PREFIXES = ("x-amz-", "x-goog-")
+"""Prefixes (lowercase) of the query parameters of the presigned S3 and GCS URLs"""
+
+
+def get_stac_cache_dir() -> AnyPathType:
+    """
+    Get the directory where the small remote STAC files are cached:
+    the one given by :code:`EOREADER_STAC_CACHE_DIR` if set, else a folder in the temporary directory.
+
+    Returns:
+        AnyPathType: STAC cache directory
+    """
+    return AnyPath(
+        os.environ.get(
+            STAC_CACHE_DIR, os.path.join(tempfile.gettempdir(), "eoreader_stac_cache")
+        )
+    )
+
+
+def get_cache_key(href: str) -> str:
+    """
+    Get the key of a remote href in the caches: the href without its signing query parameters
+    (see :py:const:`SIGNING_QUERY_PARAMS`), as they change at every request for the same file.
+
+    The other query parameters are kept, as they may change the file.
+
+    .. code-block:: python
+
+        >>> get_cache_key("https://example.com/mtd.xml?version=1&st=2026-01-01&se=2026-01-02&sig=abc")
+        'https://example.com/mtd.xml?version=1'
+
+    Args:
+        href (str): Href of the file
+
+    Returns:
+        str: Cache key of the href
+    """
+    if "://" not in href or "?" not in href:
+        return href
+
+    url = urlsplit(href)
+    query = [
+        (key, val)
+        for key, val in parse_qsl(url.query, keep_blank_values=True)
+        if key.lower() not in SIGNING_QUERY_PARAMS
+        and not key.lower().startswith(SIGNING_QUERY_PREFIXES)
+    ]
+    return urlunsplit(url._replace(query=urlencode(query)))
+
+
+def _get_cached_path(href: str) -> AnyPathType | None:
+    """Get the path of the cached file (only for remote hrefs, keyed by :py:func:`get_cache_key`)"""
+    if "://" not in href:
+        return None
+
+    href_hash = hashlib.sha256(get_cache_key(href).encode()).hexdigest()[:32]
+    return get_stac_cache_dir() / href_hash
+
+
+def read_cached(href: str) -> bytes | None:
+    """
+    Read a remote file from the disk cache, if existing
+
+    Args:
+        href (str): Href of the file
+
+    Returns:
+        bytes | None: Content of the file, None if not cached
+    """
+    cached_path = _get_cached_path(href)
+    if cached_path is None:
+        return None
+
+    try:
+        with open(cached_path, "rb") as cached_file:
+            data = cached_file.read()
+    except OSError:
+        return None
+
+    # Mark the file as recently used (for the eviction)
+    with contextlib.suppress(OSError):
+        os.utime(cached_path)
+
+    return data
+
+
+def write_cached(href: str, data: bytes) -> None:
+    """
+    Write a small remote file in the disk cache, atomically (as several processes may read the same file).
+
+    Local files and files bigger than :py:const:`STAC_CACHE_MAX_SIZE` are not cached.
+    The least recently used files are then evicted if the cache exceeds :py:const:`STAC_CACHE_MAX_TOTAL_SIZE`.
+
+    Args:
+        href (str): Href of the file
+        data (bytes): Content of the file
+    """
+    cached_path = _get_cached_path(href)
+    if cached_path is None or len(data) > STAC_CACHE_MAX_SIZE:
+        return
+
+    try:
+        os.makedirs(str(cached_path.parent), exist_ok=True)
+        tmp_path = f"{cached_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, cached_path)
+    except OSError as exc:
+        LOGGER.debug(f"Impossible to cache {href}: {exc}")
+    else:
+        evict(cached_path.parent)
+
+
+def evict(cache_dir: AnyPathType, max_size: int = STAC_CACHE_MAX_TOTAL_SIZE) -> None:
+    """
+    Evict the least recently used files of the cache until it is smaller than :code:`max_size`.
+
+    Several processes may evict the same files: the ones already removed are skipped.
+
+    Args:
+        cache_dir (AnyPathType): Cache directory
+        max_size (int): Maximum size of the cache, in bytes
+    """
+    cached_files = []
+    total_size = 0
+    with contextlib.suppress(OSError), os.scandir(str(cache_dir)) as entries:
+        for entry in entries:
+            if entry.name.endswith(".tmp"):
+                continue
+            with contextlib.suppress(OSError):
+                stat = entry.stat()
+                cached_files.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+    if total_size <= max_size:
+        return
+
+    for _, size, path in sorted(cached_files):
+        if total_size <= max_size:
+            break
+        with contextlib.suppress(OSError):
+            os.remove(path)
+            total_size -= size
+            LOGGER.debug(f"Evicted {path} from the STAC cache")
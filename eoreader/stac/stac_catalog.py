@@ -0,0 +1,161 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Batch export of the STAC Items of many products into one catalogue file.
+
+The items are created in a pool of processes (each product being opened by the worker creating its item)
+and written as soon as they are created in a newline-delimited JSON file (one item per line),
+that can then be converted chunk by chunk to a `stac-geoparquet <https://github.com/stac-utils/stac-geoparquet>`_ file:
+the catalogue is never held in memory.
+"""
+
+import functools
+import json
+import logging
+import os
+from collections.abc import Iterable
+
+from sertit import AnyPath, files
+from sertit.types import AnyPathStrType, AnyPathType
+
+from eoreader import EOREADER_NAME
+from eoreader.product_pool import get_reader, map_products
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+NDJSON_EXT = [".ndjson", ".jsonl", ".json"]
+"""Extensions of the newline-delimited JSON catalogues"""
+
+GEOPARQUET_EXT = [".parquet", ".geoparquet"]
+"""Extensions of the stac-geoparquet catalogues"""
+
+
+def _create_item_dict(
+    prod_path: AnyPathStrType, validate: bool | str = True, **kwargs
+) -> dict | None:
+    """
+    Open a product and create its STAC Item, as a dictionary.
+
+    Args:
+        prod_path (AnyPathStrType): Product path
+        validate (bool | str): Validate the STAC Item (see :py:meth:`eoreader.stac.StacItem.create_item`)
+        **kwargs: Other arguments passed to :code:`Reader().open()`
+
+    Returns:
+        dict | None: STAC Item as a dictionary (None if the product is not recognized or if its item cannot be created)
+    """
+    try:
+        prod = get_reader().open(prod_path, **kwargs)
+        if prod is None:
+            LOGGER.warning(f"{prod_path} is not a recognized product: skipped.")
+            return None
+
+        with prod:
+            return prod.stac.create_item(validate=validate).to_dict()
+    except Exception as exc:
+        # Don't stop the export of the whole catalogue for one faulty product
+        LOGGER.warning(f"Impossible to create the STAC Item of {prod_path}: {exc}")
+        return None
+
+
+def _to_geoparquet(ndjson_path: AnyPathType, output_path: AnyPathType) -> None:
+    """
+    Convert a newline-delimited JSON catalogue to a stac-geoparquet file, chunk by chunk.
+
+    Args:
+        ndjson_path (AnyPathType): Newline-delimited JSON catalogue
+        output_path (AnyPathType): stac-geoparquet output path
+    """
+    try:
+        from stac_geoparquet.arrow import parse_stac_ndjson_to_parquet
+    except ImportError as exc:
+        raise ImportError(
+            "You need to install 'stac-geoparquet' to export your catalogue to a stac-geoparquet file!"
+        ) from exc
+
+    LOGGER.debug(f"Converting the catalogue to {output_path.name}")
+    parse_stac_ndjson_to_parquet(str(ndjson_path), str(output_path))
+
+
+def export_catalog(
+    paths: Iterable,
+    output_path: AnyPathStrType,
+    workers: int = None,
+    validate: bool | str = True,
+    **kwargs,
+) -> int:
+    """
+    Export the STAC Items of many products into one catalogue file,
+    as a newline-delimited JSON (:code:`.ndjson`, :code:`.jsonl` or :code:`.json`)
+    or as a stac-geoparquet file (:code:`.parquet` or :code:`.geoparquet`, needing :code:`stac-geoparquet`).
+
+    The items are created in a pool of processes and streamed to the catalogue file as soon as they are created
+    (in the order of their creation, not in the order of the paths).
+    The products that are not recognized or whose item cannot be created are skipped (with a warning).
+
+    The catalogue is written in a temporary file, only moved to the output path once complete.
+
+    .. code-block:: python
+
+        >>> from eoreader.stac import export_catalog
+        >>> paths = Path("/archive").glob("S2*.zip")
+        >>> export_catalog(paths, "catalogue.ndjson", workers=8)
+        12345
+
+    Args:
+        paths (Iterable): Product paths (can be a generator)
+        output_path (AnyPathStrType): Output path of the catalogue (local)
+        workers (int): Number of worker processes (default: the number of CPUs). Set it to 1 to create the items in this process.
+        validate (bool | str): Validate the STAC Items (see :py:meth:`eoreader.stac.StacItem.create_item`)
+        **kwargs: Other arguments passed to :code:`Reader().open()`
+
+    Returns:
+        int: Number of items written in the catalogue
+    """
+    output_path = AnyPath(output_path)
+    suffix = output_path.suffix.lower()
+    if suffix not in NDJSON_EXT + GEOPARQUET_EXT:
+        raise ValueError(
+            f"The catalogue should be a newline-delimited JSON ({NDJSON_EXT}) or a stac-geoparquet file ({GEOPARQUET_EXT}), not {output_path.name}."
+        )
+
+    if workers is None:
+        workers = os.cpu_count()
+
+    create_item = functools.partial(_create_item_dict, validate=validate, **kwargs)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    nof_items = 0
+    try:
+        with open(str(tmp_path), "w") as ndjson_file:
+            for item_dict in map_products(create_item, paths, workers):
+                if item_dict is not None:
+                    ndjson_file.write(json.dumps(item_dict, separators=(",", ":")))
+                    ndjson_file.write("\n")
+                    nof_items += 1
+
+        if suffix in GEOPARQUET_EXT:
+            if nof_items == 0:
+                raise ValueError(
+                    "No STAC Item has been created: cannot write an empty stac-geoparquet file."
+                )
+            _to_geoparquet(tmp_path, output_path)
+        else:
+            os.replace(str(tmp_path), str(output_path))
+    finally:
+        files.remove(tmp_path)
+
+    LOGGER.info(f"{nof_items} STAC Items written in {output_path.name}")
+    return nof_items
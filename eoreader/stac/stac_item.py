@@ -54,6 +54,11 @@ from eoreader.stac.stac_utils import (
     get_media_type,
     repr_multiline_str,
 )
+from eoreader.stac.stac_validation import (
+    ValidationMode,
+    get_validation_mode,
+    validate_item,
+)
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
@@ -122,7 +127,18 @@ class StacItem:
         return self._prod.extent().to_crs(WGS84)
 
     @cache
-    def create_item(self):
+    def create_item(self, validate: bool | str | ValidationMode = True):
+        """
+        Create the STAC Item of the product.
+
+        Args:
+            validate (bool | str | ValidationMode): Validate the STAC Item against the schemas of the STAC specification and its extensions.
+                :code:`True` for the default validation mode (see :py:const:`eoreader.env_vars.STAC_VALIDATION`),
+                :code:`False` to disable it, or the wanted :py:class:`eoreader.stac.stac_validation.ValidationMode`.
+
+        Returns:
+            pystac.Item: STAC Item
+        """
         try:
             import pystac
         except ImportError as exc:
@@ -173,8 +189,15 @@ class StacItem:
         # let's check the validator to make sure we've specified everything correctly.
         # The validation logic will take into account the new extensions
         # that have been enabled and validate against the proper schemas for those extensions
-        LOGGER.debug(f"Validate STAC Item for {self._prod.condensed_name}")
-        item.validate()
+        validation_mode = get_validation_mode(validate)
+        if validation_mode != ValidationMode.OFF:
+            LOGGER.debug(
+                f"Validate STAC Item for {self._prod.condensed_name} ({validation_mode.value})"
+            )
+            if validation_mode == ValidationMode.FULL:
+                item.validate()
+            else:
+                validate_item(item.to_dict())
 
         return item
 
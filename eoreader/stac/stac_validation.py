@@ -0,0 +1,165 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Validation of the STAC Items against the JSON schemas of the STAC specification and of its extensions.
+
+With the :code:`cached` mode, the schemas are read only once:
+
+- the core schemas come with :code:`pystac`
+- the schemas of the extensions are downloaded once and cached on disk (see :py:const:`eoreader.env_vars.STAC_CACHE_DIR`),
+  so the validation works without network once they are cached (the cache can be copied to offline machines)
+
+and the validators are compiled only once per process, so validating an item is only CPU-bound.
+"""
+
+import functools
+import json
+import logging
+import os
+
+from sertit.misc import ListEnum
+
+from eoreader import EOREADER_NAME
+from eoreader.env_vars import STAC_VALIDATION
+from eoreader.stac.stac_cache import read_cached, write_cached
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+
+class ValidationMode(ListEnum):
+    """Validation modes of the STAC Items"""
+
+    FULL = "full"
+    """Validation by :code:`pystac` (:code:`item.validate()`), downloading the schemas of the extensions as :code:`pystac` does"""
+
+    CACHED = "cached"
+    """Validation with the schemas cached on disk and the validators compiled once per process (default)"""
+
+    OFF = "off"
+    """No validation"""
+
+
+def get_validation_mode(validate: bool | str | ValidationMode = True) -> ValidationMode:
+    """
+    Get the validation mode of the STAC Items.
+
+    Args:
+        validate (bool | str | ValidationMode): Validation mode, or :code:`True` for the default one
+            (given by :code:`EOREADER_STAC_VALIDATION`, :code:`cached` if not set) and :code:`False` to disable it
+
+    Returns:
+        ValidationMode: Validation mode
+    """
+    if validate is True:
+        validate = os.environ.get(STAC_VALIDATION, ValidationMode.CACHED.value)
+    elif validate is False:
+        validate = ValidationMode.OFF
+
+    return ValidationMode.convert_from(validate)[0]
+
+
+@functools.cache
+def _get_local_schemas() -> dict:
+    """Get the core schemas coming with :code:`pystac` (read only once per process)"""
+    from pystac.validation.local_validator import get_local_schema_cache
+
+    return get_local_schema_cache()
+
+
+@functools.cache
+def _get_schema(schema_uri: str) -> dict:
+    """
+    Get a JSON schema (read only once per process): from :code:`pystac` for the core schemas,
+    else from the disk cache, else downloaded (and cached on disk).
+
+    Args:
+        schema_uri (str): Schema URI
+
+    Returns:
+        dict: JSON schema
+    """
+    from pystac import StacIO
+
+    schema = _get_local_schemas().get(schema_uri)
+    if schema is not None:
+        return schema
+
+    schema_bytes = read_cached(schema_uri)
+    if schema_bytes is None:
+        LOGGER.debug(f"Downloading the STAC schema {schema_uri}")
+        schema_bytes = StacIO.default().read_text(schema_uri).encode()
+        write_cached(schema_uri, schema_bytes)
+
+    schema = json.loads(schema_bytes)
+
+    # Same as pystac: resolve the relative references from the schema URI
+    id_field = "$id" if "$id" in schema else "id"
+    if not schema.get(id_field, "").startswith("http"):
+        schema[id_field] = schema_uri
+
+    return schema
+
+
+@functools.cache
+def _get_validator(schema_uri: str):
+    """
+    Get the validator of a JSON schema (compiled only once per process).
+
+    Args:
+        schema_uri (str): Schema URI
+
+    Returns:
+        jsonschema.protocols.Validator: Validator
+    """
+    import jsonschema
+    from referencing import Registry, Resource
+
+    schema = _get_schema(schema_uri)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    # The referenced schemas (i.e. GeoJSON) are retrieved with the same cache
+    registry = Registry(retrieve=lambda uri: Resource.from_contents(_get_schema(uri)))
+    return validator_cls(schema, registry=registry)
+
+
+def validate_item(item_dict: dict) -> None:
+    """
+    Validate a STAC Item (as a dictionary) against the schemas of the STAC specification and of its extensions,
+    with the schemas cached on disk and the validators compiled once per process.
+
+    Args:
+        item_dict (dict): STAC Item as a dictionary
+
+    Raises:
+        pystac.errors.STACValidationError: If the item is not valid
+    """
+    import jsonschema
+    from pystac import STACObjectType
+    from pystac.errors import STACValidationError
+    from pystac.validation.schema_uri_map import DefaultSchemaUriMap
+
+    core_uri = DefaultSchemaUriMap().get_object_schema_uri(
+        STACObjectType.ITEM, item_dict["stac_version"]
+    )
+    for schema_uri in [core_uri] + item_dict.get("stac_extensions", []):
+        errors = list(_get_validator(schema_uri).iter_errors(item_dict))
+        if errors:
+            msg = f"Validation failed for STAC Item with ID {item_dict.get('id')} against schema at {schema_uri}"
+            best = jsonschema.exceptions.best_match(errors)
+            if best:
+                msg += f"\n{best}"
+            raise STACValidationError(msg, source=errors) from best
@@ -0,0 +1,218 @@
+# Copyright 2026, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Terrain derivatives (slope, aspect and hillshade) of a DEM.
+
+The gradients are computed with Horn's method (as :code:`gdaldem`) on a 3x3 window:
+with dask arrays, each chunk is processed independently with a one-pixel halo taken from its neighbours,
+so the derivatives are computed in parallel and never need the whole DEM in memory.
+
+Every derivative wanted is computed in one pass from the same gradients.
+The hillshade can be lit by constant angles (i.e. the scene mean sun angles) or by per-pixel angles.
+"""
+
+import logging
+
+import numpy as np
+import xarray as xr
+from sertit.misc import ListEnum
+
+from eoreader import EOREADER_NAME
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+DEG_2_RAD = np.pi / 180
+
+
+class TerrainDerivative(ListEnum):
+    """Terrain derivatives"""
+
+    SLOPE = "slope"
+    """Slope, in degrees"""
+
+    ASPECT = "aspect"
+    """Aspect (direction of the downslope), in degrees clockwise from the north. NaN for flat areas."""
+
+    HILLSHADE = "hillshade"
+    """Hillshade, as computed by :code:`gdaldem` (between 1 and 255)"""
+
+
+def _terrain_block(
+    dem: np.ndarray,
+    res: tuple,
+    derivatives: list,
+    azimuth: float | np.ndarray = None,
+    zenith: float | np.ndarray = None,
+) -> np.ndarray:
+    """
+    Compute the terrain derivatives of a DEM block (with a one-pixel halo, whose derivatives are set to NaN).
+
+    Args:
+        dem (np.ndarray): DEM block, with shape (1, height, width)
+        res (tuple): Resolution (x, y) of the DEM
+        derivatives (list): Derivatives to compute
+        azimuth (float | np.ndarray): Azimuth of the light (hillshade), in degrees (or per-pixel, with the same shape as the DEM block)
+        zenith (float | np.ndarray): Zenith angle of the light (hillshade), in degrees (or per-pixel, with the same shape as the DEM block)
+
+    Returns:
+        np.ndarray: Derivatives, with shape (len(derivatives), height, width)
+    """
+    out = np.full((len(derivatives),) + dem.shape[-2:], np.nan, dtype=np.float32)
+    if min(dem.shape[-2:]) < 3:
+        return out
+
+    z = dem[0].astype(np.float64)
+    top_left, top, top_right = z[:-2, :-2], z[:-2, 1:-1], z[:-2, 2:]
+    left, right = z[1:-1, :-2], z[1:-1, 2:]
+    bottom_left, bottom, bottom_right = z[2:, :-2], z[2:, 1:-1], z[2:, 2:]
+
+    # Horn's gradients, along the columns (eastward) and the rows (southward)
+    dz_dx = (
+        (top_right + 2 * right + bottom_right) - (top_left + 2 * left + bottom_left)
+    ) / (8 * res[0])
+    dz_dy = (
+        (bottom_left + 2 * bottom + bottom_right) - (top_left + 2 * top + top_right)
+    ) / (8 * res[1])
+    grad_2 = dz_dx**2 + dz_dy**2
+
+    # Remove the halo of the per-pixel angles
+    if isinstance(azimuth, np.ndarray):
+        azimuth = azimuth[0, 1:-1, 1:-1]
+    if isinstance(zenith, np.ndarray):
+        zenith = zenith[0, 1:-1, 1:-1]
+
+    for idx, derivative in enumerate(derivatives):
+        if derivative == TerrainDerivative.SLOPE:
+            deriv = np.arctan(np.sqrt(grad_2)) / DEG_2_RAD
+        elif derivative == TerrainDerivative.ASPECT:
+            deriv = np.mod(np.arctan2(-dz_dx, dz_dy) / DEG_2_RAD, 360.0)
+            deriv = np.where(grad_2 == 0, np.nan, deriv)
+        else:
+            # Same formula as sertit.rasters.hillshade (GDAL algorithm)
+            alt_rad = (90 - zenith) * DEG_2_RAD
+            deriv = (
+                np.sin(alt_rad)
+                + np.cos(alt_rad)
+                * np.sqrt(grad_2)
+                * np.sin(np.arctan2(dz_dy, dz_dx) - azimuth * DEG_2_RAD)
+            ) / np.sqrt(1 + grad_2)
+            deriv = np.where(deriv <= 0, 1.0, 254.0 * deriv + 1)
+
+        out[idx, 1:-1, 1:-1] = deriv
+
+    return out
+
+
+def _terrain_block_with_angles(
+    dem: np.ndarray, azimuth: np.ndarray, zenith: np.ndarray, **kwargs
+) -> np.ndarray:
+    """Compute the terrain derivatives of a DEM block lit by per-pixel angles (see :py:func:`_terrain_block`)"""
+    return _terrain_block(dem, azimuth=azimuth, zenith=zenith, **kwargs)
+
+
+def compute_terrain(
+    dem_xda: xr.DataArray,
+    derivatives: list,
+    azimuth: float | xr.DataArray = None,
+    zenith: float | xr.DataArray = None,
+) -> dict:
+    """
+    Compute several terrain derivatives of a DEM in one pass (chunk by chunk with dask arrays).
+
+    The pixels on the border of the DEM are set to NaN.
+
+    .. code-block:: python
+
+        >>> dem = utils.read("dem.tif")
+        >>> terrain = compute_terrain(dem, ["slope", "hillshade"], azimuth=150, zenith=40)
+        >>> terrain[TerrainDerivative.SLOPE]
+
+    Args:
+        dem_xda (xr.DataArray): DEM, with shape (1, height, width) (its nodata as NaN)
+        derivatives (list): Derivatives to compute (:py:class:`TerrainDerivative` or their names)
+        azimuth (float | xr.DataArray): Azimuth of the light in degrees, needed for the hillshade (or per-pixel, on the same grid as the DEM)
+        zenith (float | xr.DataArray): Zenith angle of the light in degrees, needed for the hillshade (or per-pixel, on the same grid as the DEM)
+
+    Returns:
+        dict: Derivatives {TerrainDerivative: xr.DataArray}
+    """
+    derivatives = TerrainDerivative.convert_from(derivatives)
+    if TerrainDerivative.HILLSHADE in derivatives and (
+        azimuth is None or zenith is None
+    ):
+        raise ValueError("Azimuth and zenith angles are needed to compute hillshade.")
+
+    if dem_xda.ndim == 2:
+        dem_xda = dem_xda.expand_dims(dim="band")
+
+    res = np.abs(dem_xda.rio.resolution())
+    kwargs = {
+        "res": res,
+        "derivatives": derivatives,
+    }
+
+    # Per-pixel angles are processed as the DEM, the constant ones are given to every block
+    angles = [
+        angle.data.reshape(dem_xda.shape)
+        for angle in [azimuth, zenith]
+        if isinstance(angle, xr.DataArray)
+    ]
+    if not angles:
+        kwargs.update({"azimuth": azimuth, "zenith": zenith})
+    elif len(angles) != 2:
+        raise ValueError(
+            "Azimuth and zenith angles should be both per-pixel or both constant."
+        )
+
+    LOGGER.debug(
+        f"Computing {[derivative.value for derivative in derivatives]} from the DEM"
+    )
+    if dem_xda.chunks is not None:
+        import dask.array as da
+
+        # Process each chunk with a one-pixel halo
+        depth = {0: 0, 1: 1, 2: 1}
+        dem_arr = dem_xda.data.rechunk({0: -1})
+        arrays = [
+            da.overlap.overlap(
+                da.asarray(arr).rechunk(dem_arr.chunks), depth=depth, boundary=np.nan
+            )
+            for arr in [dem_arr] + angles
+        ]
+        terrain_arr = da.map_blocks(
+            _terrain_block_with_angles if angles else _terrain_block,
+            *arrays,
+            chunks=((len(derivatives),),) + arrays[0].chunks[1:],
+            dtype=np.float32,
+            **kwargs,
+        )
+        terrain_arr = da.overlap.trim_internal(terrain_arr, depth, boundary=np.nan)
+    elif angles:
+        terrain_arr = _terrain_block_with_angles(
+            dem_xda.data, *[np.asarray(angle) for angle in angles], **kwargs
+        )
+    else:
+        terrain_arr = _terrain_block(dem_xda.data, **kwargs)
+
+    terrain = {}
+    for idx, derivative in enumerate(derivatives):
+        deriv_xda = dem_xda.copy(data=terrain_arr[idx : idx + 1]).rename(
+            derivative.value
+        )
+        deriv_xda.attrs["long_name"] = derivative.value
+        terrain[derivative] = deriv_xda
+
+    return terrain
@@ -16,13 +16,15 @@
 """Utils: mostly getting directories relative to the project"""
 
 import contextlib
+import json
 import logging
 import os
 import platform
 import warnings
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable
 
+import affine
 import numpy as np
 import pandas as pd
 import geopandas as gpd
@@ -30,14 +32,17 @@ import rasterio
 import xarray as xr
 from lxml import etree
 from rasterio import errors
+from rasterio.crs import CRS
 from rasterio.enums import Resampling
 from rasterio.errors import NotGeoreferencedWarning
 from rasterio.rpc import RPC
+from rasterio.windows import Window
 from sertit import AnyPath, files, geometry, path, rasters, misc, vectors
 from sertit.snap import SU_MAX_CORE
 from sertit.types import AnyPathStrType, AnyPathType, AnyXrDataStructure
 
 from eoreader import EOREADER_NAME, cache
+from eoreader.archive_index import get_archive_index, get_subfile_path
 from eoreader.bands import is_index, is_sat_band, to_str
 from eoreader.env_vars import (
     NOF_BANDS_IN_CHUNKS,
@@ -134,6 +139,33 @@ def use_dask():
     return _use_dask
 
 
+def get_default_chunks() -> dict | str | None:
+    """
+    Get the default chunks used by EOReader, according to :code:`EOREADER_TILE_SIZE` and :code:`EOREADER_NOF_BANDS_IN_CHUNKS`.
+
+    Returns:
+        dict | str | None: Chunks (None if dask is not used)
+    """
+    tile_size = os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE)
+    nof_bands_in_chunks = os.getenv(NOF_BANDS_IN_CHUNKS, DEFAULT_NOF_BANDS_IN_CHUNKS)
+
+    if use_dask():
+        if tile_size in [True, "auto", "True", "true"]:
+            chunks = "auto"
+        else:
+            chunks = {
+                "band": nof_bands_in_chunks,
+                "x": int(tile_size),
+                "y": int(tile_size),
+            }
+        # LOGGER.debug(f"Current chunking: {chunks}")
+    else:
+        # LOGGER.debug("Dask use is not enabled. No chunk will be used, but you may encounter memory overflow errors.")
+        chunks = None
+
+    return chunks
+
+
 def read(
     raster_path: AnyPathStrType,
     pixel_size: tuple | list | float = None,
@@ -171,28 +203,17 @@ def read(
     window = kwargs.get("window")
 
     # Always use chunks
-    tile_size = os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE)
-    nof_bands_in_chunks = os.getenv(NOF_BANDS_IN_CHUNKS, DEFAULT_NOF_BANDS_IN_CHUNKS)
-
-    if use_dask():
-        if tile_size in [True, "auto", "True", "true"]:
-            chunks = kwargs.get("chunks", "auto")
-        else:
-            chunks = kwargs.get(
-                "chunks",
-                {"band": nof_bands_in_chunks, "x": int(tile_size), "y": int(tile_size)},
-            )
-        # LOGGER.debug(f"Current chunking: {chunks}")
-    else:
-        # LOGGER.debug("Dask use is not enabled. No chunk will be used, but you may encounter memory overflow errors.")
-        chunks = None
+    chunks = get_default_chunks()
+    if chunks is not None:
+        chunks = kwargs.get("chunks", chunks)
 
     try:
         # Disable georef warnings here as the SAR/Sentinel-3 products are not georeferenced
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NotGeoreferencedWarning)
+            # Open the uncompressed members of local tars by offset (but keep their /vsitar/ path in the attributes)
             arr = rasters.read(
-                raster_path,
+                get_subfile_path(raster_path),
                 resolution=pixel_size if size is None else None,
                 resampling=resampling,
                 masked=masked,
@@ -239,7 +260,7 @@ def read(
             raise
 
 
-def write(xds: xr.DataArray, filepath: AnyPathStrType, **kwargs) -> None:
+def write(xds: xr.DataArray, filepath: AnyPathStrType, **kwargs):
     """
     Overload of :code:`sertit.rasters.write()` managing DASK in EOReader's way.
 
@@ -258,7 +279,11 @@ def write(xds: xr.DataArray, filepath: AnyPathStrType, **kwargs) -> None:
     Args:
         xds (xr.DataArray): Path to the raster or a rasterio dataset or a xarray
         filepath (AnyPathStrType): Path where to save it (directories should be existing)
-        **kwargs: Overloading metadata, ie :code:`nodata=255` or :code:`dtype=np.uint8`
+        **kwargs: Overloading metadata, ie :code:`nodata=255` or :code:`dtype=np.uint8`.
+            Use :code:`compute=False` to get a dask Delayed object writing the chunked data later (i.e. to write several rasters with :code:`dask.compute`).
+
+    Returns:
+        Delayed object writing the data if :code:`compute=False` and the data is chunked, None otherwise
     """
     # Reset the long name as a list to write it down
     previous_long_name = xds.attrs.get("long_name")
@@ -286,7 +311,7 @@ def write(xds: xr.DataArray, filepath: AnyPathStrType, **kwargs) -> None:
         and misc.compare_version("numpy", "2.1", "<")
     )
 
-    rasters.write(
+    delayed = rasters.write(
         xds,
         output_path=filepath,
         driver=get_driver(kwargs),
@@ -298,6 +323,91 @@ def write(xds: xr.DataArray, filepath: AnyPathStrType, **kwargs) -> None:
     if previous_long_name and xds.rio.count > 1:
         xds.attrs["long_name"] = previous_long_name
 
+    return delayed
+
+
+def _ffill_block(arr: np.ndarray, axis: int) -> np.ndarray:
+    """Forward-fill the NaNs of a numpy array along the given axis"""
+    shape = [1] * arr.ndim
+    shape[axis] = arr.shape[axis]
+    idx = np.where(np.isnan(arr), 0, np.arange(arr.shape[axis]).reshape(shape))
+    np.maximum.accumulate(idx, axis=axis, out=idx)
+    return np.take_along_axis(arr, idx, axis=axis)
+
+
+def _fill_with_last(last: np.ndarray, block: np.ndarray) -> np.ndarray:
+    """Fill the leading NaNs of a forward-filled block with the last value of the previous block"""
+    return np.where(np.isnan(block), last, block)
+
+
+def _ffill(arr, axis: int, reverse: bool = False):
+    """
+    Forward-fill (or backward-fill if reverse) the NaNs of a numpy or dask array along the given axis.
+    With dask, the last valid value of each chunk is carried to the next one, so the result doesn't depend on the chunking.
+    """
+    if reverse:
+        arr = np.flip(arr, axis=axis)
+
+    if isinstance(arr, np.ndarray):
+        filled = _ffill_block(arr, axis)
+    else:
+        from dask.array.reductions import cumreduction
+
+        filled = cumreduction(
+            _ffill_block, _fill_with_last, np.nan, arr, axis=axis, dtype=arr.dtype
+        )
+
+    if reverse:
+        filled = np.flip(filled, axis=axis)
+    return filled
+
+
+def interpolate_na(xda: xr.DataArray, dim: str, limit: int = 10) -> xr.DataArray:
+    """
+    Linearly interpolate the NaNs of a DataArray along one dimension, filling at most :code:`limit` consecutive NaNs per gap.
+
+    Gives the same results as :code:`xarray.DataArray.interpolate_na(dim=dim, limit=limit)`
+    (the limit being counted along the increasing coordinates, as xarray only interpolates along monotonically increasing indexes),
+    but works chunk by chunk on dask arrays instead of loading the whole array:
+    the previous and next valid values of every pixel are propagated across the chunks, and the interpolation is then done pixel-wise.
+
+    Args:
+        xda (xr.DataArray): Array to interpolate
+        dim (str): Dimension along which to interpolate
+        limit (int): Maximum number of consecutive NaNs to fill
+
+    Returns:
+        xr.DataArray: Interpolated array
+    """
+    axis = xda.get_axis_num(dim)
+    arr = xda.data
+    if not np.issubdtype(arr.dtype, np.floating):
+        return xda
+
+    # xarray counts the limit from the beginning of the gap along the increasing coordinates
+    reverse = dim in xda.indexes and xda.indexes[dim].is_monotonic_decreasing
+
+    shape = [1] * xda.ndim
+    shape[axis] = xda.shape[axis]
+    pos = np.arange(xda.shape[axis], dtype=arr.dtype).reshape(shape)
+    is_nan = np.isnan(arr)
+    valid_pos = np.where(is_nan, np.nan, pos)
+
+    # Previous and next valid values and their positions
+    prev_val = _ffill(arr, axis)
+    prev_pos = _ffill(valid_pos, axis)
+    next_val = _ffill(arr, axis, reverse=True)
+    next_pos = _ffill(valid_pos, axis, reverse=True)
+
+    # Same computation as np.interp (NaN if there is no valid value on one side)
+    slope = (next_val - prev_val) / (next_pos - prev_pos)
+    interp = slope * (pos - prev_pos) + prev_val
+
+    dist = next_pos - pos if reverse else pos - prev_pos
+    interp = np.where(is_nan & (dist <= limit), interp, arr)
+
+    return xda.copy(data=interp)
+
 
 def quick_xml_to_dict(element: etree._Element) -> tuple:
     """
@@ -388,6 +498,102 @@ def open_rpc_file(rpc_path: AnyPathType) -> RPC:
         raise KeyError(f"Invalid RPC file, missing key: {msg}")
 
 
+def shift_rpcs(rpcs: RPC, row_off: int, col_off: int) -> RPC:
+    """
+    Shift RPCs so that they apply to a subset of the image starting at the given offsets.
+
+    Args:
+        rpcs (RPC): RPCs of the whole image
+        row_off (int): Row offset of the subset
+        col_off (int): Column offset of the subset
+
+    Returns:
+        RPC: RPCs of the subset
+    """
+    rpc_dict = rpcs.to_dict()
+    rpc_dict["line_off"] = rpcs.line_off - row_off
+    rpc_dict["samp_off"] = rpcs.samp_off - col_off
+    return RPC(**rpc_dict)
+
+
+def get_rpc_window(
+    rpcs: RPC,
+    bounds: tuple | list,
+    crs,
+    width: int,
+    height: int,
+    margin: int = 8,
+) -> Window | None:
+    """
+    Get the window of the raw image (georeferenced with RPCs) needed to orthorectify the given bounds,
+    computed through the inverse RPC model over the whole height range of the RPCs.
+
+    Args:
+        rpcs (RPC): RPCs of the raw image
+        bounds (tuple | list): Bounds (left, bottom, right, top) to orthorectify
+        crs: CRS of the bounds
+        width (int): Width of the raw image
+        height (int): Height of the raw image
+        margin (int): Margin (in pixels) added around the window, for the resampling
+
+    Returns:
+        Window | None: Window of the raw image, None if the bounds don't intersect it
+    """
+    from rasterio.transform import RPCTransformer
+    from rasterio.warp import transform
+
+    # Sample the bounds with a grid to take the distortions into account
+    xs, ys = np.meshgrid(
+        np.linspace(bounds[0], bounds[2], 11), np.linspace(bounds[1], bounds[3], 11)
+    )
+    lons, lats = transform(crs, "EPSG:4326", xs.ravel(), ys.ravel())
+
+    rows = []
+    cols = []
+    with RPCTransformer(rpcs) as transformer:
+        for z in [
+            rpcs.height_off - rpcs.height_scale,
+            rpcs.height_off + rpcs.height_scale,
+        ]:
+            z_rows, z_cols = transformer.rowcol(lons, lats, zs=z, op=float)
+            rows += list(z_rows)
+            cols += list(z_cols)
+
+    row_start = max(int(np.floor(np.min(rows))) - margin, 0)
+    row_stop = min(int(np.ceil(np.max(rows))) + margin, height)
+    col_start = max(int(np.floor(np.min(cols))) - margin, 0)
+    col_stop = min(int(np.ceil(np.max(cols))) + margin, width)
+
+    if row_start >= row_stop or col_start >= col_stop:
+        return None
+
+    return Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+
+def get_window_bounds(window, crs, transform=None) -> tuple:
+    """
+    Get the bounds of any window (as accepted by :code:`sertit.rasters.read`) in the given CRS.
+
+    Args:
+        window: Window (GeoDataFrame, vector path, bounds or rasterio Window)
+        crs: CRS of the wanted bounds
+        transform: Transform of the raster, only used to convert rasterio windows
+
+    Returns:
+        tuple: Bounds (left, bottom, right, top)
+    """
+    if isinstance(window, Window):
+        from rasterio.windows import bounds
+
+        return bounds(window, transform)
+    elif isinstance(window, gpd.GeoDataFrame):
+        return tuple(window.to_crs(crs).total_bounds)
+    elif path.is_path(window):
+        return tuple(vectors.read(window).to_crs(crs).total_bounds)
+    else:
+        return tuple(window)
+
+
 def simplify(footprint_fct: Callable):
     """
     Simplify footprint decorator
@@ -572,20 +778,111 @@ def get_dim_img_path(dim_path: AnyPathStrType, img_name: str = "*") -> list:
     return get_dim_img_path(dim_path, img_name, get_list=True)
 
 
-def load_np(path_to_load: AnyPathStrType, output: AnyPathStrType) -> np.ndarray:
+def _get_np_header_path(np_path: AnyPathStrType) -> AnyPathType:
+    """Get the path of the header of a numpy pickle"""
+    return AnyPath(np_path).with_suffix(".json")
+
+
+def save_np(
+    arr: np.ndarray | xr.DataArray,
+    path_to_save: AnyPathStrType,
+    transform: affine.Affine = None,
+    crs: Any = None,
+) -> None:
+    """
+    Save a numpy pickle (:code:`.npy`) along with a small header (shape, dtype, transform and CRS) stored next to it (:code:`.json`),
+    so that it can be validated before being reused (see :py:func:`is_valid_np`).
+
+    Args:
+        arr (np.ndarray | xr.DataArray): Array to save
+        path_to_save (AnyPathStrType): Pickle path
+        transform (affine.Affine): Transform of the array, if georeferenced
+        crs (Any): CRS of the array, if georeferenced
+    """
+    arr = np.asarray(arr)
+    np.save(str(path_to_save), arr)
+
+    header = {
+        "shape": list(arr.shape),
+        "dtype": str(arr.dtype),
+        "transform": list(transform)[:6] if transform is not None else None,
+        "crs": CRS.from_user_input(crs).to_wkt() if crs is not None else None,
+    }
+    _get_np_header_path(path_to_save).write_text(json.dumps(header))
+
+
+def is_valid_np(
+    path_to_check: AnyPathStrType,
+    shape: tuple = None,
+    transform: affine.Affine = None,
+    crs: Any = None,
+) -> bool:
+    """
+    Check if a numpy pickle saved with :py:func:`save_np` can be reused, i.e. if its header corresponds to the given shape, transform and CRS.
+    Pickles without header are not considered as valid.
+
+    Args:
+        path_to_check (AnyPathStrType): Pickle path
+        shape (tuple): Expected shape (of the last dimensions of the array)
+        transform (affine.Affine): Expected transform
+        crs (Any): Expected CRS
+
+    Returns:
+        bool: True if the pickle can be reused
+    """
+    try:
+        header = json.loads(_get_np_header_path(path_to_check).read_text())
+    except (FileNotFoundError, OSError, ValueError):
+        return False
+
+    if shape is not None and tuple(header["shape"][-len(shape) :]) != tuple(shape):
+        return False
+
+    if transform is not None and (
+        header["transform"] is None
+        or not affine.Affine(*header["transform"]).almost_equals(transform)
+    ):
+        return False
+
+    if crs is not None and (
+        header["crs"] is None or CRS.from_wkt(header["crs"]) != CRS.from_user_input(crs)
+    ):
+        return False
+
+    return True
+
+
+def load_np(
+    path_to_load: AnyPathStrType, output: AnyPathStrType, mmap_mode: str = "r"
+) -> np.ndarray:
     """
     Load numpy pickles, with a handling of cloud-stored files.
 
+    The pickles are memory-mapped (read-only by default) and returned as chunked dask arrays
+    (if dask is used, see :py:func:`get_default_chunks`), so they are never fully loaded in memory.
+
     Args:
         path_to_load (AnyPathStrType): Pickle path
         output (AnyPathStrType): Where to download the pickle if it's stored on the cloud
+        mmap_mode (str): Memory-map the file with this mode (see :code:`np.load`)
 
     Returns:
-        np.ndarray: Numpy array
+        np.ndarray: Numpy array (or dask array)
     """
     if path.is_cloud_path(path_to_load):
         path_to_load = path_to_load.download_to(output)
-    return np.load(str(path_to_load))
+    arr = np.load(str(path_to_load), mmap_mode=mmap_mode)
+
+    chunks = get_default_chunks()
+    if chunks is not None and mmap_mode is not None and arr.ndim > 0:
+        import dask.array as da
+
+        if isinstance(chunks, dict):
+            chunks = [-1] * (arr.ndim - 2) + [chunks["y"], chunks["x"]]
+            chunks = tuple(chunks[-arr.ndim :])
+        arr = da.from_array(arr, chunks=chunks)
+
+    return arr
 
 
 def get_max_cores():
@@ -615,14 +912,14 @@ def convert_glob_to_regex(glob_str: str) -> str:
     return regex
 
 
-@cache
 def get_archived_file_list(archive_path: AnyPathStrType):
     """
     Overload of sertit.path.get_archived_file_list to cache its retrieval:
     this operation is expensive when done with large archives stored on the cloud (and thus better done only once)
+
+    The list is retrieved from the archive index, persisted between processes (see :py:mod:`eoreader.archive_index`).
     """
-    file_list = path.get_archived_file_list(archive_path=archive_path)
-    return file_list
+    return list(get_archive_index(archive_path).names)
 
 
 @cache
@@ -680,7 +977,14 @@ def get_archived_path(
     """
     Overload of sertit.path.get_archived_path to cache its reading:
     this operation is expensive when done with large archives (especially tars) stored on the cloud (and thus better done only once)
+
+    If no file list is given, the archive index is used (see :py:mod:`eoreader.archive_index`).
     """
+    if file_list is None:
+        return get_archive_index(archive_path).get_path(
+            regex, as_list=as_list, case_sensitive=case_sensitive
+        )
+
     file_list = path.get_archived_path(
         archive_path=archive_path,
         regex=regex,
@@ -699,9 +1003,14 @@ def get_archived_rio_path(
     file_list: list = None,
 ) -> list | AnyPathType:
     """
-    Overload of sertit.path.get_archived_path to cache its reading:
+    Overload of sertit.path.get_archived_rio_path to cache its reading:
     this operation is expensive when done with large archives (especially tars) stored on the cloud (and thus better done only once)
+
+    If no file list is given, the archive index is used (see :py:mod:`eoreader.archive_index`).
     """
+    if file_list is None:
+        return get_archive_index(archive_path).get_rio_path(regex, as_list=as_list)
+
     file_list = path.get_archived_rio_path(
         archive_path=archive_path,
         regex=regex,